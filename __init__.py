@@ -5,6 +5,10 @@ from .constants import (
     TREE_DATA,
     BAR_DATA,
     GEM_DATA,
+    GEM_DROP_CHANCE,
+    ORE_DROP_TABLES,
+    TREE_DROP_TABLES,
+    LOOT_CONTENT_VERSION,
     CRAFTING_DATA,
     ORE_IMAGES,
     TREE_IMAGES,
@@ -21,19 +25,16 @@ import os
 import datetime
 from .logic_pure import (
     calculate_probability_with_level,
-    pick_gem,
-    can_smelt_any_bar_pure,
-    create_soft_clay_pure,
+    soft_clay_delta_pure,
     has_crafting_materials_pure,
-    can_craft_item_pure,
-    apply_crafting_pure,
-    apply_smelt_pure,
-    apply_woodcutting_pure,
-    apply_mining_pure,
+    crafting_delta_pure,
+    smelt_delta_pure,
+    woodcutting_delta_pure,
+    mining_delta_pure,
     can_mine_ore_pure,
     can_cut_tree_pure,
 )
-from .logic import level_up_check, check_achievements, calculate_woodcutting_probability, calculate_mining_probability
+from .logic import level_up_check, check_achievements, skill_availability, calculate_woodcutting_probability, calculate_mining_probability
 from .ui import (
     ExpPopup,
     show_error_message,
@@ -53,7 +54,15 @@ from .injectors import inject_reviewer_floating_button as _inject_reviewer_float
 from .injectors import inject_overview_floating_button as _inject_overview_floating_button
 from .injectors import register_deck_browser_button as _register_deck_browser_button
 from .injectors import force_deck_browser_refresh as _force_deck_browser_refresh
-from .storage import load_player_data as storage_load_player_data, save_player_data as storage_save_player_data
+from .injectors import register_web_assets as _register_web_assets
+from .bridge import ROUTER as _BRIDGE
+from .settings import SETTINGS
+from .menu_pure import SKILLS
+from .storage import load_player_data as storage_load_player_data
+from .storage import schedule_save as storage_schedule_save, flush_pending_save as storage_flush_pending_save
+from .storage import record_award as storage_record_award, close_journal as storage_close_journal
+from .storage import begin_award as storage_begin_award, end_award as storage_end_award
+from .deferred import PostAnswerQueue, LatencyTracker, PRIORITY_AWARD, PRIORITY_UI, UI_REFRESH
 
 global card_turned, exp_awarded, answer_shown
 
@@ -77,6 +86,10 @@ except Exception:
 _ANKISCAPE_HOOKS_REGISTERED = False
 _LAST_MENU_OPEN_TS = 0.0
 
+# Game logic for answered cards runs here, after the reviewer has moved on
+_POST_ANSWER_QUEUE = PostAnswerQueue()
+_ANSWER_LATENCY = LatencyTracker()
+
 def show_review_popup():
     ui.show_review_popup()
 
@@ -85,7 +98,17 @@ def show_review_popup():
 
 
 def save_player_data():
-    storage_save_player_data(player_data, current_skill)
+    """Queue a coalesced save; the write happens on the write-behind timer or a flush point."""
+    storage_schedule_save(player_data, current_skill)
+
+
+def flush_player_data(*_args, **_kwargs):
+    """Run pending award jobs and write player data now (profile close, reviewer exit, before sync)."""
+    try:
+        _POST_ANSWER_QUEUE.drain()
+    except Exception:
+        pass
+    storage_flush_pending_save()
 
 
 def load_player_data():
@@ -121,45 +144,79 @@ def _initialize_debug_from_config():
 
 # --- Small helpers to reduce duplication ---
 def _show_exp(exp_gained) -> None:
-    """Ensure the ExpPopup exists and display exp."""
+    """Queue exp for the floating popup and mark the HUD dirty; both render once per frame."""
+    global _PENDING_TOAST_EXP
     try:
         # Respect user setting for floating XP (default True)
-        show_xp = True
-        try:
-            if mw and getattr(mw, 'col', None):
-                show_xp = bool(mw.col.get_config("ankiscape_floating_xp_enabled", True))
-        except Exception:
-            show_xp = True
-        if show_xp:
-            if not hasattr(mw, 'exp_popup'):
-                mw.exp_popup = ExpPopup(mw)
-            mw.exp_popup.show_exp(exp_gained)
-        # Keep HUD progress in sync with new XP
-        try:
-            update_review_hud(player_data, current_skill)
-        except Exception:
-            pass
+        if SETTINGS.floating_xp_enabled:
+            _PENDING_TOAST_EXP += exp_gained
+            UI_REFRESH.invalidate("toast")
+        # Keep HUD progress (and an open menu's stats) in sync with new XP
+        UI_REFRESH.invalidate("hud", "menu")
     except Exception:
         pass
 
 
-def _refresh_skill_availability() -> None:
-    """Recompute and refresh Smithing/Crafting availability in the menu."""
+def _refresh_skill_availability(items=None, stats=None) -> None:
+    """Update the availability index with the changed items/level fields and
+    mark the menu's Smithing/Crafting availability dirty."""
     try:
-        can_craft_any = any(
-            can_craft_item_pure(
-                player_data.get("crafting_level", 1),
-                player_data.get("inventory", {}),
-                item_name,
-                CRAFTING_DATA,
-            )
-            for item_name in CRAFTING_DATA.keys()
-        )
-        refresh_skill_availability(can_smelt_any_bar(), can_craft_any)
+        skill_availability(player_data, items, stats)
+        UI_REFRESH.invalidate("availability", "menu")
     except Exception:
         pass
 
 
+# --- Refresh regions: invalidated by game logic, rendered once per event-loop turn ---
+_PENDING_TOAST_EXP = 0
+
+
+def _in_review() -> bool:
+    return getattr(mw, "state", None) == "review"
+
+
+def _render_hud() -> None:
+    # Awards drained at reviewer end must not bring the HUD back on the Overview
+    if SETTINGS.review_hud_enabled and _in_review():
+        ensure_review_hud()
+        update_review_hud(player_data, current_skill)
+    else:
+        hide_review_hud()
+
+
+def _render_availability() -> None:
+    index = skill_availability(player_data)
+    refresh_skill_availability(index.can_smelt_any, index.can_craft_any)
+
+
+def _render_menu() -> None:
+    # A hidden kept-alive menu catches up when it is reopened
+    if is_main_menu_open():
+        ui.refresh_main_menu(current_skill)
+
+
+def _render_toast() -> None:
+    global _PENDING_TOAST_EXP
+    # Several awards in one frame show as a single combined popup
+    exp, _PENDING_TOAST_EXP = _PENDING_TOAST_EXP, 0
+    if exp and _in_review():
+        popup = _ensure_exp_popup()
+        if popup is not None:
+            popup.show_exp(exp)
+
+
+UI_REFRESH.register("hud", _render_hud)
+UI_REFRESH.register("availability", _render_availability)
+UI_REFRESH.register("menu", _render_menu)
+UI_REFRESH.register("toast", _render_toast)
+
+
+def _availability() -> tuple:
+    """(can smelt any bar, can craft any item) for the main menu."""
+    index = skill_availability(player_data)
+    return index.can_smelt_any, index.can_craft_any
+
+
 def show_skill_selection():
     global current_skill
     selected = ui.show_skill_selection_dialog(current_skill, can_smelt_any_bar())
@@ -179,11 +236,10 @@ def save_skill(skill, dialog):
             mw.col.set_config("ankiscape_current_skill", current_skill)
         except Exception:
             pass
-        # Update the HUD immediately so users see the new skill progress without waiting for XP
-        try:
-            update_review_hud(player_data, current_skill)
-        except Exception:
-            pass
+        # Keep any pending write-behind save in step with the new skill
+        save_player_data()
+        # Update the HUD so users see the new skill progress without waiting for XP
+        UI_REFRESH.invalidate("hud", "menu")
         if dialog:
             dialog.accept()
 
@@ -216,31 +272,23 @@ def on_crafting_answer():
         show_error_message("Insufficient materials", f"You don't have enough materials to craft {item}.")
         return
 
-    # Apply crafting via pure function (handles Soft clay and crafted items)
-    new_inv, exp_gained, ok = apply_crafting_pure(item, player_data["inventory"], CRAFTING_DATA)
+    # Build the crafting delta via pure function (handles Soft clay and crafted items)
+    delta, exp_gained, ok = crafting_delta_pure(item, player_data["inventory"], CRAFTING_DATA)
     if not ok:
         show_error_message("Insufficient materials", f"You don't have enough materials to craft {item}.")
         return
 
     # Update player data and UI
-    player_data["inventory"] = new_inv
+    delta.commit(player_data["inventory"])
     player_data["crafting_exp"] += exp_gained
     level_up_check("Crafting", player_data)
-    check_achievements(player_data)
+    check_achievements(player_data, items=delta.keys(), stats=("crafting_level", "crafting_exp"))
     save_player_data()
 
     # Refresh availability for Crafting/Smithing in the open menu (enables, never auto-selects)
-    try:
-        can_craft_any = any(
-            can_craft_item_pure(player_data.get("crafting_level", 1), player_data.get("inventory", {}), item_name, CRAFTING_DATA)
-            for item_name in CRAFTING_DATA.keys()
-        )
-        refresh_skill_availability(can_smelt_any_bar(), can_craft_any)
-    except Exception:
-        pass
-
-    _refresh_skill_availability()
-    _show_exp(exp_gained)
+    _POST_ANSWER_QUEUE.submit(_refresh_skill_availability, delta.keys(), ("crafting_level",), priority=PRIORITY_UI)
+    _POST_ANSWER_QUEUE.submit(_show_exp, exp_gained, priority=PRIORITY_UI)
+    return exp_gained, delta
 
 def show_bar_selection():
     selected = ui.show_bar_selection_dialog(
@@ -278,12 +326,13 @@ def show_ore_selection():
 
 
 
-def _on_main_menu():
-    def _set_floating_enabled(val: bool):
-        try:
-            mw.col.set_config("ankiscape_floating_enabled", bool(val))
-        except Exception:
-            pass
+def _load_settings():
+    SETTINGS.load(mw.col)
+
+
+def _on_setting_changed(name, _value) -> None:
+    """React to SETTINGS.set(): re-inject the floating button, re-render the HUD."""
+    if name in ("floating_enabled", "floating_position"):
         # Re-inject on current screens for immediate effect
         try:
             _inject_reviewer_floating_button()
@@ -293,28 +342,26 @@ def _on_main_menu():
             _inject_overview_floating_button()
         except Exception:
             pass
+    elif name == "review_hud_enabled":
+        UI_REFRESH.invalidate("hud")
+
+
+SETTINGS.subscribe(_on_setting_changed)
+
+
+def _on_main_menu():
+    def _set_floating_enabled(val: bool):
+        SETTINGS.set("floating_enabled", val)
 
     def _set_floating_position(pos: str):
-        try:
-            if pos not in ("left", "right"):
-                pos = "right"
-            mw.col.set_config("ankiscape_floating_position", pos)
-        except Exception:
-            pass
-        try:
-            _inject_reviewer_floating_button()
-        except Exception:
-            pass
-        try:
-            _inject_overview_floating_button()
-        except Exception:
-            pass
+        SETTINGS.set("floating_position", pos)
 
     ui.show_main_menu(
         player_data,
         current_skill,
         can_smelt_any_bar(),
         on_save_skill=lambda skill: save_skill(skill, None),
+        availability=_availability,
         on_set_ore=lambda ore: _set_value("current_ore", ore),
         on_set_tree=lambda tree: _set_value("current_tree", tree),
         on_set_bar=lambda bar: _set_value("current_bar", bar),
@@ -327,6 +374,7 @@ def _on_main_menu():
 def _set_value(key: str, value):
     player_data[key] = value
     save_player_data()
+    UI_REFRESH.invalidate("menu")
 
 
 def initialize_menu():
@@ -352,8 +400,8 @@ def on_smithing_answer():
         show_error_message("Insufficient level", f"You need level {bar_spec['level']} Smithing to smelt {bar}.")
         return
 
-    # Use pure smelt application
-    new_inv, exp_gained, ok = apply_smelt_pure(bar, player_data["inventory"], BAR_DATA)
+    # Use pure smelt delta
+    delta, exp_gained, ok = smelt_delta_pure(bar, player_data["inventory"], BAR_DATA)
     if not ok:
         # Find first missing ore to provide a helpful message
         for ore, amount in bar_spec["ore_required"].items():
@@ -362,24 +410,16 @@ def on_smithing_answer():
                 break
         return
 
-    player_data["inventory"] = new_inv
+    delta.commit(player_data["inventory"])
     player_data["smithing_exp"] += exp_gained
     level_up_check("Smithing", player_data)
-    check_achievements(player_data)
+    check_achievements(player_data, items=delta.keys(), stats=("smithing_level", "smithing_exp"))
     save_player_data()
 
     # Refresh availability for Crafting/Smithing in the open menu after smelting
-    try:
-        can_craft_any = any(
-            can_craft_item_pure(player_data.get("crafting_level", 1), player_data.get("inventory", {}), item_name, CRAFTING_DATA)
-            for item_name in CRAFTING_DATA.keys()
-        )
-        refresh_skill_availability(can_smelt_any_bar(), can_craft_any)
-    except Exception:
-        pass
-
-    _refresh_skill_availability()
-    _show_exp(exp_gained)
+    _POST_ANSWER_QUEUE.submit(_refresh_skill_availability, delta.keys(), ("smithing_level",), priority=PRIORITY_UI)
+    _POST_ANSWER_QUEUE.submit(_show_exp, exp_gained, priority=PRIORITY_UI)
+    return exp_gained, delta
 from .logic import calculate_woodcutting_probability, calculate_mining_probability
 
 
@@ -390,18 +430,25 @@ def on_woodcutting_answer():
 
     woodcutting_probability = calculate_woodcutting_probability(player_level, spec["probability"])
     r_action = random.random()
-    new_inv, exp_gained, ok = apply_woodcutting_pure(tree, player_data["inventory"], TREE_DATA, r_action, woodcutting_probability)
+    drop_table = TREE_DROP_TABLES.get(tree)
+    r_drop = random.random() if drop_table else None
+    delta, exp_gained, ok = woodcutting_delta_pure(
+        tree, TREE_DATA, r_action, woodcutting_probability, drop_table, r_drop, loot_version=LOOT_CONTENT_VERSION
+    )
     if ok:
         if "logs_cut_today" not in player_data:
             player_data["logs_cut_today"] = 0
         player_data["logs_cut_today"] += 1
-        player_data["inventory"] = new_inv
+        delta.commit(player_data["inventory"])
         player_data["woodcutting_exp"] += exp_gained
         level_up_check("Woodcutting", player_data)
-        check_achievements(player_data)
+        check_achievements(player_data, items=delta.keys(), stats=("woodcutting_level", "woodcutting_exp"))
         save_player_data()
+        _POST_ANSWER_QUEUE.submit(_refresh_skill_availability, delta.keys(), priority=PRIORITY_UI)
 
-    _show_exp(exp_gained)
+    _POST_ANSWER_QUEUE.submit(_show_exp, exp_gained, priority=PRIORITY_UI)
+    if ok:
+        return exp_gained, delta
 
 
 from .logic import calculate_woodcutting_probability, calculate_mining_probability
@@ -411,61 +458,97 @@ def on_good_answer():
     global current_skill, exp_awarded
     if exp_awarded:
         return
-    if current_skill == "Mining":
-        ore = player_data["current_ore"]
-        ore_spec = ORE_DATA[ore]
-        player_level = player_data["mining_level"]
-
-        mining_probability = calculate_mining_probability(player_level, ore_spec["probability"])
-        r_action = random.random()
-        r_gem_chance = random.random()
-        r_gem_pick = random.random()
-
-        new_inv, exp_gained, ok, gem = apply_mining_pure(
-            ore,
-            player_data["inventory"],
-            ORE_DATA,
-            GEM_DATA,
-            r_action,
-            mining_probability,
-            r_gem_chance,
-            r_gem_pick,
-            gem_drop_chance=1/256,
-        )
-        if ok:
-            if "ores_mined_today" not in player_data:
-                player_data["ores_mined_today"] = 0
-            player_data["ores_mined_today"] += 1
-            player_data["inventory"] = new_inv
-            player_data["mining_exp"] += exp_gained
-            level_up_check("Mining", player_data)
-            check_achievements(player_data)
-            save_player_data()
-
-            # If the main menu is open, auto-enable Smithing/Crafting when they become possible.
-            _refresh_skill_availability()
-            _show_exp(exp_gained)
-
-    elif current_skill == "Woodcutting":
-        on_woodcutting_answer()
-
-    elif current_skill == "Smithing":
-        on_smithing_answer()
-
-    elif current_skill == "Crafting":
-        on_crafting_answer()
-
+    _award_for_skill(current_skill)
     exp_awarded = True
 
 
-## Removed roll_gem wrapper; mining uses apply_mining_pure directly.
+# Fields an award sets besides exp and inventory (journaled as absolute values)
+_AWARD_FIELDS = {
+    "Mining": ("mining_level", "ores_mined_today"),
+    "Woodcutting": ("woodcutting_level", "logs_cut_today"),
+    "Smithing": ("smithing_level",),
+    "Crafting": ("crafting_level",),
+}
+
+
+def _award_for_skill(skill, card_id=None):
+    """Apply the game logic for one good answer in skill (runs from the post-answer queue)."""
+    completed_before = len(player_data.get("completed_achievements", []))
+    result = None
+    # Level-up/achievement popups run a nested event loop; a journal snapshot taken
+    # there would already include this award, so snapshots wait for its event
+    storage_begin_award()
+    try:
+        if skill == "Mining":
+            result = _award_mining()
+        elif skill == "Woodcutting":
+            result = on_woodcutting_answer()
+        elif skill == "Smithing":
+            result = on_smithing_answer()
+        elif skill == "Crafting":
+            result = on_crafting_answer()
+        if result:
+            exp_gained, delta = result
+            storage_record_award(
+                skill,
+                exp_gained,
+                delta.changes,
+                card_id,
+                {key: player_data[key] for key in _AWARD_FIELDS[skill] if key in player_data},
+                player_data.get("completed_achievements", [])[completed_before:],
+            )
+    finally:
+        storage_end_award()
+
+
+def _award_mining():
+    ore = player_data["current_ore"]
+    ore_spec = ORE_DATA[ore]
+    player_level = player_data["mining_level"]
+
+    mining_probability = calculate_mining_probability(player_level, ore_spec["probability"])
+    r_action = random.random()
+    r_gem_chance = random.random()
+    r_gem_pick = random.random()
+
+    delta, exp_gained, ok, gem = mining_delta_pure(
+        ore,
+        ORE_DATA,
+        ORE_DROP_TABLES.get(ore, GEM_DATA),
+        r_action,
+        mining_probability,
+        r_gem_chance,
+        r_gem_pick,
+        gem_drop_chance=GEM_DROP_CHANCE,
+        loot_version=LOOT_CONTENT_VERSION,
+    )
+    if ok:
+        if "ores_mined_today" not in player_data:
+            player_data["ores_mined_today"] = 0
+        player_data["ores_mined_today"] += 1
+        delta.commit(player_data["inventory"])
+        player_data["mining_exp"] += exp_gained
+        level_up_check("Mining", player_data)
+        check_achievements(player_data, items=delta.keys(), stats=("mining_level", "mining_exp"))
+        save_player_data()
+
+        # If the main menu is open, auto-enable Smithing/Crafting when they become possible.
+        _POST_ANSWER_QUEUE.submit(_refresh_skill_availability, delta.keys(), priority=PRIORITY_UI)
+        _POST_ANSWER_QUEUE.submit(_show_exp, exp_gained, priority=PRIORITY_UI)
+        return exp_gained, delta
+
+
+## Removed roll_gem wrapper; mining uses mining_delta_pure directly.
 
 
 def on_answer_card(self, ease, _old):
     global card_turned, exp_awarded, answer_shown
+    _ANSWER_LATENCY.start()
     if ease > 1 and current_skill in ["Mining", "Woodcutting",
                                       "Smithing", "Crafting"] and card_turned and not exp_awarded and answer_shown:
-        on_good_answer()
+        # Record the award only; the game logic runs after the next card is shown
+        card_id = getattr(getattr(self, "card", None), "id", None)
+        _POST_ANSWER_QUEUE.submit(_award_for_skill, current_skill, card_id, priority=PRIORITY_AWARD, label="award")
         exp_awarded = True
     card_turned = False
     answer_shown = False  # Reset for the next card
@@ -478,62 +561,57 @@ def on_card_did_show(card):
     exp_awarded = False
     answer_shown = False
     # Ensure/update HUD when a review card is shown
-    try:
-        ensure_review_hud()
-        update_review_hud(player_data, current_skill)
-    except Exception:
-        pass
+    UI_REFRESH.invalidate("hud")
 
 
 def on_show_answer(reviewer):
     global answer_shown
     answer_shown = True
     # Keep HUD in sync when flipping
-    try:
-        update_review_hud(player_data, current_skill)
-    except Exception:
-        pass
+    UI_REFRESH.invalidate("hud")
 
 
 ## show_error_message now provided by ui.show_error_message
 
 
 def can_smelt_any_bar():
-    return can_smelt_any_bar_pure(player_data["inventory"], player_data["smithing_level"], BAR_DATA)
+    return skill_availability(player_data).can_smelt_any
 
 def create_soft_clay():
-    new_inv, ok = create_soft_clay_pure(player_data["inventory"]) 
+    delta, ok = soft_clay_delta_pure(player_data["inventory"])
     if ok:
-        player_data["inventory"] = new_inv
+        delta.commit(player_data["inventory"])
+        skill_availability(player_data, delta.keys())
     return ok
 
 # Removed legacy safe_deduct_from_inventory; use utils.safe_deduct_from_inventory where needed.
 
 # Initialization and hooks
+def _ensure_exp_popup():
+    # Resolve ExpPopup at call time so it can be swapped (tests, reloads)
+    return ui.ensure_exp_popup(lambda parent: ExpPopup(parent), mw)
+
+
 def initialize_exp_popup():
-    mw.exp_popup = ExpPopup(mw)
+    # New profile: sweep stray overlays once on the next HUD ensure
+    ui.reset_overlay_sweep()
+    _ensure_exp_popup()
 
 
 # Flexible wrappers to handle version differences in hook signatures
 def _on_rev_show_question(*_args, **_kwargs):
-    _inject_reviewer_floating_button()
     try:
-        from .ui import get_config_bool  # type: ignore
-        if get_config_bool("ankiscape_review_hud_enabled", True):
-            ensure_review_hud()
-            update_review_hud(player_data, current_skill)
+        ms = _ANSWER_LATENCY.stop()
+        if ms is not None:
+            debug_log(f"latency: answer->next question {ms:.1f} ms (mean {_ANSWER_LATENCY.mean_ms:.1f}, max {_ANSWER_LATENCY.max_ms:.1f})")
     except Exception:
         pass
+    _inject_reviewer_floating_button()
+    UI_REFRESH.invalidate("hud")
 
 def _on_rev_show_answer(*_args, **_kwargs):
     _inject_reviewer_floating_button()
-    try:
-        from .ui import get_config_bool  # type: ignore
-        if get_config_bool("ankiscape_review_hud_enabled", True):
-            ensure_review_hud()
-            update_review_hud(player_data, current_skill)
-    except Exception:
-        pass
+    UI_REFRESH.invalidate("hud")
 
 # Ensure the floating button is injected on the deck Overview as it refreshes
 def _on_overview_did_refresh(overview):
@@ -541,7 +619,10 @@ def _on_overview_did_refresh(overview):
         _inject_overview_floating_button(overview)
     except Exception:
         pass
-    # Hide HUD off the review screen
+    # Hide HUD off the review screen, dropping refreshes queued by the last answers
+    global _PENDING_TOAST_EXP
+    _PENDING_TOAST_EXP = 0
+    UI_REFRESH.discard("hud", "toast")
     try:
         hide_review_hud()
     except Exception:
@@ -558,12 +639,16 @@ try:
                 initialize_skill,
                 _initialize_debug_from_config,
                 migrate_legacy_settings,
+                _load_settings,
                 initialize_menu,
                 (lambda: _register_deck_browser_button()),
             ],
             "reviewer_question": [on_card_did_show, _on_rev_show_question],
             "reviewer_answer": [on_card_did_show, on_show_answer, _on_rev_show_answer],
             "answer_wrapper": on_answer_card,
+            "profile_will_close": [flush_player_data, storage_close_journal, ui.release_main_menu, SETTINGS.unload],
+            "reviewer_will_end": [flush_player_data],
+            "sync_will_start": [flush_player_data],
         }
     )
     # Overview: inject after refresh so the icon is always present on the Study Now screen
@@ -605,6 +690,7 @@ except Exception:
         addHook("profileLoaded", initialize_exp_popup)
         addHook("profileLoaded", initialize_skill)
         addHook("profileLoaded", migrate_legacy_settings)
+        addHook("profileLoaded", _load_settings)
         addHook("profileLoaded", initialize_menu)
         addHook("profileLoaded", lambda: _register_deck_browser_button())
     except Exception:
@@ -616,6 +702,17 @@ except Exception:
         gui_hooks.reviewer_did_show_question.append(_on_rev_show_question)
         gui_hooks.reviewer_did_show_answer.append(_on_rev_show_answer)
         Reviewer._answerCard = wrap(Reviewer._answerCard, on_answer_card, "around")
+        for _flush_hook in ("profile_will_close", "reviewer_will_end", "sync_will_start"):
+            try:
+                getattr(gui_hooks, _flush_hook).append(flush_player_data)
+            except Exception:
+                pass
+        try:
+            gui_hooks.profile_will_close.append(storage_close_journal)
+            gui_hooks.profile_will_close.append(ui.release_main_menu)
+            gui_hooks.profile_will_close.append(SETTINGS.unload)
+        except Exception:
+            pass
         # Overview: inject after refresh so the icon is always present on the Study Now screen
         try:
             try:
@@ -628,74 +725,75 @@ except Exception:
     except Exception:
         pass
 
+# Button script/styles are served as web exports and loaded once per page
+try:
+    _register_web_assets()
+except Exception:
+    pass
+
 # Menu is created on profile load via initialize_menu
 
-    # --- Handle JS bridge messages from injected buttons ---
-    def _on_js_message(handled, message, context):  # type: ignore[no-redef]
-        """Respond to messages sent via pycmd() in injected JS."""
+# --- Webview commands ---
+# injectors registers bridge.ROUTER on webview_did_receive_js_message; the
+# button scripts send ankiscape_open_menu (legacy form of "open_menu").
+
+# Choices a webview can select directly: kind -> (player_data key, level key, data)
+_BRIDGE_SELECTIONS = {
+    "ore": ("current_ore", "mining_level", ORE_DATA),
+    "tree": ("current_tree", "woodcutting_level", TREE_DATA),
+    "bar": ("current_bar", "smithing_level", BAR_DATA),
+    "craft": ("current_craft", "crafting_level", CRAFTING_DATA),
+}
+
+
+def _bridge_open_menu(_args=None, _context=None):
+    global _LAST_MENU_OPEN_TS
+    now = time.time()
+    if is_main_menu_open():
+        debug_log("bridge: menu already open; focusing")
         try:
-            if isinstance(message, str):
-                if message == "ankiscape_open_menu":
-                    debug_log("bridge: ankiscape_open_menu received")
-                    global _LAST_MENU_OPEN_TS
-                    now = time.time()
-                    if is_main_menu_open():
-                        debug_log("bridge: menu already open; focusing")
-                        try:
-                            focus_main_menu_if_open()
-                        except Exception:
-                            pass
-                    elif now - _LAST_MENU_OPEN_TS > 0.4:  # debounce
-                        _LAST_MENU_OPEN_TS = now
-                        debug_log("bridge: opening main menu via _on_main_menu")
-                        try:
-                            try:
-                                from aqt.qt import QTimer  # type: ignore
-                            except Exception:
-                                QTimer = None  # type: ignore
-                            if QTimer is not None:
-                                QTimer.singleShot(0, _on_main_menu)
-                                debug_log("bridge: scheduled _on_main_menu with QTimer")
-                            else:
-                                _on_main_menu()
-                                debug_log("bridge: called _on_main_menu directly (no QTimer)")
-                        except Exception:
-                            debug_log("bridge: _on_main_menu raised; swallowed")
-                            pass
-                    return (True, message)
-                if message.startswith("ankiscape_log:"):
-                    try:
-                        debug_log(f"js: {message[len('ankiscape_log:'):]}")
-                    except Exception:
-                        pass
-                    # Not handled; allow default processing to continue
-                    return (handled, message)
-                # Hardening: do not intercept native Anki navigation messages
-                try:
-                    low = message.lower()
-                except Exception:
-                    low = ""
-                if (
-                    low.startswith("open:")
-                    or low in ("decks", "add", "browse", "stats", "sync")
-                    or low == "study" or low == "review" or low == "start"
-                    or low.startswith("study") or low.startswith("review") or low.startswith("start")
-                    or low in ("preview", "previewer", "card-info", "addcards")
-                ):
-                    return (False, message)
+            focus_main_menu_if_open()
         except Exception:
-            debug_log("bridge: exception in _on_js_message")
             pass
-        # Default: do not intercept messages we don't recognize
+    elif now - _LAST_MENU_OPEN_TS > 0.4:  # debounce
+        _LAST_MENU_OPEN_TS = now
+        debug_log("bridge: opening main menu via _on_main_menu")
         try:
-            if isinstance(message, str):
-                return (False, message)
+            from aqt.qt import QTimer  # type: ignore
         except Exception:
-            pass
-        return (handled, message)
+            QTimer = None  # type: ignore
+        try:
+            if QTimer is not None:
+                QTimer.singleShot(0, _on_main_menu)
+            else:
+                _on_main_menu()
+        except Exception:
+            debug_log("bridge: _on_main_menu raised; swallowed")
+
+
+def _bridge_select_skill(args, _context=None) -> bool:
+    """args: skill name. Returns whether it is now the current skill."""
+    if args not in SKILLS:
+        return False
+    save_skill(args, None)
+    return current_skill == args
+
+
+def _bridge_select(args, _context=None) -> bool:
+    """args: {"kind": "ore"|"tree"|"bar"|"craft", "name": ...}. Unknown or locked choices are refused."""
+    if not isinstance(args, dict) or args.get("kind") not in _BRIDGE_SELECTIONS:
+        return False
+    key, level_key, data = _BRIDGE_SELECTIONS[args["kind"]]
+    name = args.get("name")
+    if name not in data or player_data.get(level_key, 1) < data[name].get("level", 1):
+        return False
+    _set_value(key, name)
+    return True
+
 
-    # Note: JS bridge hook is registered in injectors.register_deck_browser_button
-    # to keep one consistent handler and predictable order.
+_BRIDGE.register("open_menu", _bridge_open_menu)
+_BRIDGE.register("select_skill", _bridge_select_skill)
+_BRIDGE.register("select", _bridge_select)
 
 # --- Deck Browser bottom button integration ---
 
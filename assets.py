@@ -0,0 +1,155 @@
+"""assets.py - Size-specific icon variants built by optimize_assets.py (no Anki deps).
+
+The item PNGs are ~100 KB each but are only ever shown at 28-48 px. The
+optimizer writes downscaled 1x/2x copies (optionally packed into one atlas per
+size) under assets/ together with assets/index.json; AssetIndex resolves an
+original image path plus display size and device pixel ratio to the best
+variant. Without an index (development checkouts) every lookup falls back to
+the original file.
+
+Index layout (INDEX_VERSION 1):
+    {"version": 1,
+     "variants": {"ores/Copper ore.png": {"28@2": "ores/Copper ore@28@2x.png", ...}},
+     "atlases": {"28@2": {"file": "atlas_28@2x.png",
+                          "rects": {"ores/Copper ore.png": [x, y, w, h]}}}}
+All paths are relative to the add-on folder (variants) or assets/ (atlases), with "/".
+"""
+import json
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+ASSET_DIR = os.path.join(current_dir, "assets")
+INDEX_NAME = "index.json"
+INDEX_VERSION = 1
+
+# Image folders the optimizer processes and the display sizes the UI uses
+SOURCE_FOLDERS = ("ores", "trees", "bars", "gems", "crafteditems")
+ICON_SIZES = (28, 32, 40, 48)
+SCALES = (1, 2)
+
+
+def variant_key(size: int, scale: int) -> str:
+    return f"{size}@{scale}"
+
+
+def variant_name(rel_path: str, size: int, scale: int) -> str:
+    """Relative output name for a variant, e.g. "ores/Clay.png" -> "ores/Clay@28@2x.png"."""
+    stem, ext = os.path.splitext(rel_path)
+    suffix = f"@{size}" if scale == 1 else f"@{size}@{scale}x"
+    return f"{stem}{suffix}{ext or '.png'}"
+
+
+def pick_variant(available, size: int, dpr: float = 1.0):
+    """Choose (size, scale) from available (size, scale) pairs for a size x size icon at dpr.
+
+    Picks the variant with the fewest pixels that still covers size * dpr device
+    pixels (never upscaling), preferring 2x on high-DPI screens and 1x otherwise
+    when two variants have the same pixel size. Returns None when no variant is
+    large enough, meaning the original should be used.
+    """
+    need = size * max(dpr, 1.0)
+    preferred = 2 if dpr > 1.0 else 1
+    fitting = sorted((s * sc, sc != preferred, s, sc) for s, sc in available if s * sc >= need)
+    if not fitting:
+        return None
+    _, _, s, sc = fitting[0]
+    return s, sc
+
+
+def pack_atlas(sizes: dict, max_width: int = 1024, padding: int = 1) -> tuple:
+    """Shelf-pack {name: (w, h)} into one sheet.
+
+    Returns (width, height, {name: (x, y, w, h)}). Images are placed tallest
+    first, left to right, starting a new shelf when the row is full.
+    """
+    rects = {}
+    x = y = shelf_h = width = 0
+    for name, (w, h) in sorted(sizes.items(), key=lambda kv: (-kv[1][1], kv[0])):
+        if x and x + w > max_width:
+            y += shelf_h + padding
+            x = shelf_h = 0
+        rects[name] = (x, y, w, h)
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+        width = max(width, x - padding)
+    height = y + shelf_h
+    return width, height, rects
+
+
+def relative_asset_path(path: str, base_dir: str = current_dir):
+    """path relative to the add-on folder with "/" separators, or None if outside it."""
+    try:
+        rel = os.path.relpath(os.path.abspath(path), base_dir)
+    except ValueError:
+        return None
+    if rel.startswith(".."):
+        return None
+    return rel.replace(os.sep, "/")
+
+
+class AssetIndex:
+    """Reads assets/index.json once and answers variant lookups."""
+
+    def __init__(self, asset_dir: str = ASSET_DIR, base_dir: str = current_dir):
+        self.asset_dir = asset_dir
+        self.base_dir = base_dir
+        self._variants = None
+        self._atlases = {}
+
+    def _load(self) -> None:
+        self._variants = {}
+        self._atlases = {}
+        try:
+            with open(os.path.join(self.asset_dir, INDEX_NAME), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            return
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return
+        self._variants = data.get("variants") or {}
+        self._atlases = data.get("atlases") or {}
+
+    def reload(self) -> None:
+        self._variants = None
+
+    @property
+    def empty(self) -> bool:
+        if self._variants is None:
+            self._load()
+        return not self._variants and not self._atlases
+
+    def _available(self, rel: str):
+        pairs = []
+        for key in self._variants.get(rel, {}):
+            pairs.append(tuple(int(p) for p in key.split("@")))
+        for key, atlas in self._atlases.items():
+            if rel in atlas.get("rects", {}):
+                pairs.append(tuple(int(p) for p in key.split("@")))
+        return pairs
+
+    def lookup(self, path: str, size: int, dpr: float = 1.0):
+        """Best source for showing path at size x size logical px.
+
+        Returns ("file", abs_path), ("atlas", abs_atlas_path, (x, y, w, h)) or
+        ("file", path) for the original when no variant fits.
+        """
+        if not path or self.empty:
+            return ("file", path)
+        rel = relative_asset_path(path, self.base_dir)
+        if rel is None:
+            return ("file", path)
+        choice = pick_variant(self._available(rel), size, dpr)
+        if choice is None:
+            return ("file", path)
+        key = variant_key(*choice)
+        name = self._variants.get(rel, {}).get(key)
+        if name:
+            return ("file", os.path.join(self.base_dir, *name.split("/")))
+        atlas = self._atlases.get(key)
+        if atlas:
+            return ("atlas", os.path.join(self.asset_dir, atlas["file"]), tuple(atlas["rects"][rel]))
+        return ("file", path)
+
+
+ASSETS = AssetIndex()
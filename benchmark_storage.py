@@ -0,0 +1,57 @@
+"""benchmark_storage.py - Size and speed of the stored player data blob (development tool).
+
+Compares the plain dict form (config version 2) with the packed form written
+since config version 3 (storage_pure.PlayerDataCodec) for a new player and a
+late-game player holding every item.
+
+Usage:
+    python3 benchmark_storage.py [--runs 20000]
+"""
+import argparse
+import json
+import random
+import timeit
+
+from constants import ACHIEVEMENTS, CODEC_ACHIEVEMENTS, CODEC_ITEMS, ORE_DATA
+from storage_pure import PlayerDataCodec, default_player_data, migrate_loaded_data, pack_player_data, unpack_stored_data
+
+
+def _late_game_player(seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    data = default_player_data(ORE_DATA)
+    for skill in ("mining", "woodcutting", "smithing", "crafting"):
+        data[f"{skill}_level"] = rng.randint(60, 99)
+        data[f"{skill}_exp"] = sum(rng.choice((5.0, 6.2, 17.5, 25)) for _ in range(20000))
+    for item in CODEC_ITEMS:
+        data["inventory"][item] = rng.randint(1, 20000)
+    data["completed_achievements"] = list(ACHIEVEMENTS)[:60]
+    return data
+
+
+def _per_call_us(fn, runs: int) -> float:
+    return min(timeit.repeat(fn, number=runs, repeat=3)) / runs * 1e6
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20000, help="calls per timing (default 20000)")
+    args = parser.parse_args(argv)
+
+    codec = PlayerDataCodec(CODEC_ITEMS, CODEC_ACHIEVEMENTS)
+    print(f"{'profile':<10} {'dict B':>8} {'packed B':>9} {'ratio':>6} "
+          f"{'json enc us':>12} {'pack us':>8} {'json dec us':>12} {'unpack us':>10}")
+    for name, data in (("new", default_player_data(ORE_DATA)), ("late", _late_game_player())):
+        plain = json.dumps(data)
+        stored = pack_player_data(data, codec)
+        packed = json.dumps(stored)
+        json_enc = _per_call_us(lambda: json.dumps(data), args.runs)
+        pack = _per_call_us(lambda: pack_player_data(data, codec), args.runs)
+        json_dec = _per_call_us(lambda: migrate_loaded_data(json.loads(plain), ORE_DATA), args.runs)
+        unpack = _per_call_us(lambda: migrate_loaded_data(unpack_stored_data(stored, codec), ORE_DATA), args.runs)
+        print(f"{name:<10} {len(plain):>8} {len(packed):>9} {len(plain) / len(packed):>6.1f} "
+              f"{json_enc:>12.1f} {pack:>8.1f} {json_dec:>12.1f} {unpack:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,99 @@
+"""bridge.py - One router for pycmd() messages from AnkiScape's webview scripts.
+
+Anki hands every webview message (including its own navigation traffic) to
+each webview_did_receive_js_message hook. ROUTER is our only hook: anything
+that does not start with "ankiscape" is returned untouched after a single
+prefix check.
+
+Wire format:
+    ankiscape:{"cmd": "select", "args": {...}}   structured command (JSON)
+    ankiscape_<cmd>[:<payload>]                  legacy form; args is the raw payload
+e.g. ankiscape_open_menu, ankiscape_log:<msg>, ankiscape_logbatch:<json>.
+
+Handlers are registered by command name and called as handler(args, context).
+Commands registered with marks_handled=True return (True, result) so the
+message is not passed on; a handler returning None answers with the message
+itself. Log-style commands use marks_handled=False and keep the incoming flag.
+"""
+from __future__ import annotations
+
+import json
+from typing import Callable, Dict, Optional, Tuple
+
+try:
+    from .debug import debug_log as _debug_log  # type: ignore
+except Exception:
+    try:
+        from debug import debug_log as _debug_log  # type: ignore
+    except Exception:
+        def _debug_log(msg: str) -> None:
+            pass
+
+PREFIX = "ankiscape"
+_STRUCTURED = PREFIX + ":"
+_LEGACY = PREFIX + "_"
+
+
+def parse_message(message: str) -> Optional[Tuple[str, object]]:
+    """(cmd, args) for an ankiscape message, or None when it is malformed."""
+    if message.startswith(_STRUCTURED):
+        try:
+            data = json.loads(message[len(_STRUCTURED):])
+        except Exception:
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get("cmd"), str):
+            return None
+        return data["cmd"], data.get("args")
+    if message.startswith(_LEGACY):
+        cmd, sep, payload = message[len(_LEGACY):].partition(":")
+        if not cmd:
+            return None
+        return cmd, (payload if sep else None)
+    return None
+
+
+def build_message(cmd: str, args=None) -> str:
+    """The structured message for cmd, as a webview script would send it."""
+    return _STRUCTURED + json.dumps({"cmd": cmd, "args": args}, separators=(",", ":"))
+
+
+class BridgeRouter:
+    """webview_did_receive_js_message handler dispatching ankiscape commands."""
+
+    def __init__(self):
+        self._handlers: Dict[str, Tuple[Callable, bool]] = {}
+
+    def register(self, cmd: str, handler: Callable, *, marks_handled: bool = True) -> None:
+        self._handlers[cmd] = (handler, marks_handled)
+
+    def unregister(self, cmd: str) -> None:
+        self._handlers.pop(cmd, None)
+
+    def commands(self) -> list:
+        return sorted(self._handlers)
+
+    def __call__(self, handled, message, context=None):
+        if type(message) is not str or not message.startswith(PREFIX):
+            return (handled, message)
+        parsed = parse_message(message)
+        if parsed is None:
+            _debug_log(f"bridge: malformed message {message[:80]!r}")
+            return (handled, message)
+        cmd, args = parsed
+        entry = self._handlers.get(cmd)
+        if entry is None:
+            _debug_log(f"bridge: unknown command {cmd!r}")
+            return (handled, message)
+        handler, marks_handled = entry
+        try:
+            result = handler(args, context)
+        except Exception as e:
+            _debug_log(f"bridge: {cmd} raised: {e}")
+            return (handled, message)
+        if not marks_handled:
+            return (handled, message)
+        return (True, message if result is None else result)
+
+
+# The add-on's single router; injectors registers it with Anki
+ROUTER = BridgeRouter()
@@ -114,6 +114,16 @@ GEM_DATA = {
     "Uncut diamond": {"probability": 1 / 64, "exp": 107.5},
 }
 
+# Drop tables (compiled to alias tables by loot_pure.get_loot_table).
+# A successful mining action rolls GEM_DROP_CHANCE, then the ore's gem table
+# (GEM_DATA unless overridden in ORE_DROP_TABLES). TREE_DROP_TABLES entries are
+# absolute per-action probabilities; the remaining mass drops nothing.
+# Bump LOOT_CONTENT_VERSION whenever a drop table is changed in place.
+GEM_DROP_CHANCE = 1 / 256
+ORE_DROP_TABLES = {}
+TREE_DROP_TABLES = {}
+LOOT_CONTENT_VERSION = 1
+
 BAR_DATA = {
     "Bronze bar": {"level": 1, "exp": 6.2, "ore_required": {"Copper ore": 1, "Tin ore": 1}},
     "Iron bar": {"level": 15, "exp": 12.5, "ore_required": {"Iron ore": 1}},
@@ -125,6 +135,19 @@ BAR_DATA = {
     "Runite bar": {"level": 85, "exp": 50.0, "ore_required": {"Runite ore": 1, "Coal": 8}},
 }
 
+# Bank categories (filters in the Bank and Stats views), in display order
+ITEM_CATEGORIES = {
+    "Ores": tuple(ORE_DATA),
+    "Gems": tuple(GEM_DATA),
+    "Logs": tuple(TREE_DATA),
+    "Bars": tuple(BAR_DATA),
+    "Crafted": tuple(CRAFTING_DATA),
+}
+ITEM_CATEGORY = {item: category for category, items in ITEM_CATEGORIES.items() for item in items}
+
+# One image lookup for any inventory item (ores win over other tables on name clashes)
+ITEM_IMAGES = {**CRAFTED_ITEM_IMAGES, **GEM_IMAGES, **BAR_IMAGES, **TREE_IMAGES, **ORE_IMAGES}
+
 # Experience table
 EXP_TABLE = [
     0, 83, 174, 276, 388, 512, 650, 801, 969, 1154, 1358, 1584, 1833, 2107, 2411, 2746, 3115, 3523, 3973, 4470,
@@ -136,202 +159,254 @@ EXP_TABLE = [
     5346332, 5902831, 6517253, 7195629, 7944614, 8771558, 9684577, 10692629, 11805606, 13034431
 ]
 
+# Achievement requirements are declarative: each names a metric, the keys it reads and a threshold.
+# - "total": sum of inventory counts over keys
+# - "each": smallest inventory count over keys (every item must reach the threshold)
+# - "stat": a player_data field such as "mining_level" or "mining_exp"
+# - "completed": number of completed achievements
+# logic_pure.AchievementIndex compiles these so only achievements watching changed keys are checked.
+def _total(items, threshold):
+    return {"metric": "total", "keys": tuple(items), "threshold": threshold}
+
+
+def _each(items, threshold):
+    return {"metric": "each", "keys": tuple(items), "threshold": threshold}
+
+
+def _stat(field, threshold):
+    return {"metric": "stat", "keys": (field,), "threshold": threshold}
+
+
+def _completed(threshold):
+    return {"metric": "completed", "keys": ("completed_achievements",), "threshold": threshold}
+
+
 # Achievements dictionary
 ACHIEVEMENTS = {
     # Easy Achievements
     "First Steps": {"description": "Mine your first ore", "difficulty": "Easy",
-                    "condition": lambda player: sum(player["inventory"].get(ore, 0) for ore in ORE_DATA) > 0},
+                    "requires": [_total(ORE_DATA, 1)]},
     "Novice Miner": {"description": "Reach Mining level 10", "difficulty": "Easy",
-                     "condition": lambda player: player["mining_level"] >= 10},
+                     "requires": [_stat("mining_level", 10)]},
     "Ore Collector": {"description": "Collect 100 total ores", "difficulty": "Easy",
-                      "condition": lambda player: sum(player["inventory"].get(ore, 0) for ore in ORE_DATA) >= 100},
+                      "requires": [_total(ORE_DATA, 100)]},
     "Jack of All Ores": {"description": "Mine at least one of each ore type", "difficulty": "Easy",
-                         "condition": lambda player: all(player["inventory"].get(ore, 0) > 0 for ore in ORE_DATA)},
+                         "requires": [_each(ORE_DATA, 1)]},
     "Rune Essence Enthusiast": {"description": "Mine 500 Rune Essence", "difficulty": "Easy",
-                                "condition": lambda player: player["inventory"]["Rune essence"] >= 500},
+                                "requires": [_total(["Rune essence"], 500)]},
     "Clay Modeler": {"description": "Mine 500 Clay", "difficulty": "Easy",
-                     "condition": lambda player: player["inventory"]["Clay"] >= 500},
+                     "requires": [_total(["Clay"], 500)]},
     "Copper Collector": {"description": "Mine 250 Copper ore", "difficulty": "Easy",
-                         "condition": lambda player: player["inventory"]["Copper ore"] >= 250},
+                         "requires": [_total(["Copper ore"], 250)]},
     "Tin Trader": {"description": "Mine 250 Tin ore", "difficulty": "Easy",
-                   "condition": lambda player: player["inventory"]["Tin ore"] >= 250},
+                   "requires": [_total(["Tin ore"], 250)]},
     "Iron Initiate": {"description": "Mine 100 Iron ore", "difficulty": "Easy",
-                      "condition": lambda player: player["inventory"]["Iron ore"] >= 100},
+                      "requires": [_total(["Iron ore"], 100)]},
     "Silver Seeker": {"description": "Mine 50 Silver ore", "difficulty": "Easy",
-                      "condition": lambda player: player["inventory"]["Silver ore"] >= 50},
+                      "requires": [_total(["Silver ore"], 50)]},
 
     # Moderate Achievements
     "Intermediate Miner": {"description": "Reach Mining level 30", "difficulty": "Moderate",
-                           "condition": lambda player: player["mining_level"] >= 30},
+                           "requires": [_stat("mining_level", 30)]},
     "Ore Hoarder": {"description": "Collect 1,000 total ores", "difficulty": "Moderate",
-                    "condition": lambda player: sum(player["inventory"].get(ore, 0) for ore in ORE_DATA) >= 1000},
+                    "requires": [_total(ORE_DATA, 1000)]},
     "Coal Connoisseur": {"description": "Mine 500 Coal", "difficulty": "Moderate",
-                         "condition": lambda player: player["inventory"]["Coal"] >= 500},
+                         "requires": [_total(["Coal"], 500)]},
     "Golden Touch": {"description": "Mine 100 Gold ore", "difficulty": "Moderate",
-                     "condition": lambda player: player["inventory"]["Gold ore"] >= 100},
+                     "requires": [_total(["Gold ore"], 100)]},
     "Mithril Mastery": {"description": "Mine 250 Mithril ore", "difficulty": "Moderate",
-                        "condition": lambda player: player["inventory"]["Mithril ore"] >= 250},
+                        "requires": [_total(["Mithril ore"], 250)]},
     "Adamantite Adept": {"description": "Mine 100 Adamantite ore", "difficulty": "Moderate",
-                         "condition": lambda player: player["inventory"]["Adamantite ore"] >= 100},
+                         "requires": [_total(["Adamantite ore"], 100)]},
     "Runite Rookie": {"description": "Mine 50 Runite ore", "difficulty": "Moderate",
-                      "condition": lambda player: player["inventory"]["Runite ore"] >= 50},
+                      "requires": [_total(["Runite ore"], 50)]},
     "Diverse Miner": {"description": "Mine 100 of each ore type", "difficulty": "Moderate",
-                      "condition": lambda player: all(player["inventory"].get(ore, 0) >= 100 for ore in ORE_DATA)},
+                      "requires": [_each(ORE_DATA, 100)]},
     "XP Chaser": {"description": "Gain 100,000 total Mining experience", "difficulty": "Moderate",
-                  "condition": lambda player: player["mining_exp"] >= 100000},
+                  "requires": [_stat("mining_exp", 100000)]},
 
     # Difficult Achievements
     "Expert Miner": {"description": "Reach Mining level 60", "difficulty": "Difficult",
-                     "condition": lambda player: player["mining_level"] >= 60},
+                     "requires": [_stat("mining_level", 60)]},
     "Ore Magnate": {"description": "Collect 10,000 total ores", "difficulty": "Difficult",
-                    "condition": lambda player: sum(player["inventory"].get(ore, 0) for ore in ORE_DATA) >= 10000},
+                    "requires": [_total(ORE_DATA, 10000)]},
     "Rune Essence Baron": {"description": "Mine 10,000 Rune Essence", "difficulty": "Difficult",
-                           "condition": lambda player: player["inventory"]["Rune essence"] >= 10000},
+                           "requires": [_total(["Rune essence"], 10000)]},
     "Clay Empire": {"description": "Mine 10,000 Clay", "difficulty": "Difficult",
-                    "condition": lambda player: player["inventory"]["Clay"] >= 10000},
+                    "requires": [_total(["Clay"], 10000)]},
     "Copper King": {"description": "Mine 5,000 Copper ore", "difficulty": "Difficult",
-                    "condition": lambda player: player["inventory"]["Copper ore"] >= 5000},
+                    "requires": [_total(["Copper ore"], 5000)]},
     "Tin Tycoon": {"description": "Mine 5,000 Tin ore", "difficulty": "Difficult",
-                   "condition": lambda player: player["inventory"]["Tin ore"] >= 5000},
+                   "requires": [_total(["Tin ore"], 5000)]},
     "Iron Imperator": {"description": "Mine 2,500 Iron ore", "difficulty": "Difficult",
-                       "condition": lambda player: player["inventory"]["Iron ore"] >= 2500},
+                       "requires": [_total(["Iron ore"], 2500)]},
     "Silver Sovereign": {"description": "Mine 1,000 Silver ore", "difficulty": "Difficult",
-                         "condition": lambda player: player["inventory"]["Silver ore"] >= 1000},
+                         "requires": [_total(["Silver ore"], 1000)]},
     "Coal Commander": {"description": "Mine 5,000 Coal", "difficulty": "Difficult",
-                       "condition": lambda player: player["inventory"]["Coal"] >= 5000},
+                       "requires": [_total(["Coal"], 5000)]},
     "Golden Empire": {"description": "Mine 1,000 Gold ore", "difficulty": "Difficult",
-                      "condition": lambda player: player["inventory"]["Gold ore"] >= 1000},
+                      "requires": [_total(["Gold ore"], 1000)]},
 
     # Very Challenging Achievements
     "Master Miner": {"description": "Reach Mining level 99", "difficulty": "Very Challenging",
-                     "condition": lambda player: player["mining_level"] >= 99},
+                     "requires": [_stat("mining_level", 99)]},
     "Ore Tycoon": {"description": "Collect 100,000 total ores", "difficulty": "Very Challenging",
-                   "condition": lambda player: sum(player["inventory"].get(ore, 0) for ore in ORE_DATA) >= 100000},
+                   "requires": [_total(ORE_DATA, 100000)]},
     "Mithril Monarch": {"description": "Mine 10,000 Mithril ore", "difficulty": "Very Challenging",
-                        "condition": lambda player: player["inventory"]["Mithril ore"] >= 10000},
+                        "requires": [_total(["Mithril ore"], 10000)]},
     "Adamantite Overlord": {"description": "Mine 5,000 Adamantite ore", "difficulty": "Very Challenging",
-                            "condition": lambda player: player["inventory"]["Adamantite ore"] >= 5000},
+                            "requires": [_total(["Adamantite ore"], 5000)]},
     "Runite Ruler": {"description": "Mine 2,500 Runite ore", "difficulty": "Very Challenging",
-                     "condition": lambda player: player["inventory"]["Runite ore"] >= 2500},
+                     "requires": [_total(["Runite ore"], 2500)]},
     "Ore Completionist": {"description": "Mine 10,000 of each ore type", "difficulty": "Very Challenging",
-                          "condition": lambda player: all(
-                              player["inventory"].get(ore, 0) >= 10000 for ore in ORE_DATA)},
+                          "requires": [_each(ORE_DATA, 10000)]},
     "XP Master": {"description": "Gain 1,000,000 total Mining experience", "difficulty": "Very Challenging",
-                  "condition": lambda player: player["mining_exp"] >= 1000000},
+                  "requires": [_stat("mining_exp", 1000000)]},
 
     # New Woodcutting Achievements
     "First Chop": {"description": "Cut your first log", "difficulty": "Easy",
-                   "condition": lambda player: any(player["inventory"].get(tree, 0) > 0 for tree in TREE_DATA)},
+                   "requires": [_total(TREE_DATA, 1)]},
     "Novice Woodcutter": {"description": "Reach Woodcutting level 10", "difficulty": "Easy",
-                          "condition": lambda player: player["woodcutting_level"] >= 10},
+                          "requires": [_stat("woodcutting_level", 10)]},
     "Log Collector": {"description": "Collect 100 total logs", "difficulty": "Easy",
-                      "condition": lambda player: sum(player["inventory"].get(tree, 0) for tree in TREE_DATA) >= 100},
+                      "requires": [_total(TREE_DATA, 100)]},
     "Jack of All Trees": {"description": "Cut at least one log from each tree type", "difficulty": "Easy",
-                          "condition": lambda player: all(player["inventory"].get(tree, 0) > 0 for tree in TREE_DATA)},
+                          "requires": [_each(TREE_DATA, 1)]},
     "Oak Enthusiast": {"description": "Cut 500 Oak logs", "difficulty": "Easy",
-                       "condition": lambda player: player["inventory"].get("Oak", 0) >= 500},
+                       "requires": [_total(["Oak"], 500)]},
     "Willow Whisperer": {"description": "Cut 500 Willow logs", "difficulty": "Easy",
-                         "condition": lambda player: player["inventory"].get("Willow", 0) >= 500},
+                         "requires": [_total(["Willow"], 500)]},
 
     "Intermediate Woodcutter": {"description": "Reach Woodcutting level 30", "difficulty": "Moderate",
-                                "condition": lambda player: player["woodcutting_level"] >= 30},
+                                "requires": [_stat("woodcutting_level", 30)]},
     "Log Hoarder": {"description": "Collect 1,000 total logs", "difficulty": "Moderate",
-                    "condition": lambda player: sum(player["inventory"].get(tree, 0) for tree in TREE_DATA) >= 1000},
+                    "requires": [_total(TREE_DATA, 1000)]},
     "Maple Master": {"description": "Cut 500 Maple logs", "difficulty": "Moderate",
-                     "condition": lambda player: player["inventory"].get("Maple", 0) >= 500},
+                     "requires": [_total(["Maple"], 500)]},
     "Yew Yeoman": {"description": "Cut 250 Yew logs", "difficulty": "Moderate",
-                   "condition": lambda player: player["inventory"].get("Yew", 0) >= 250},
+                   "requires": [_total(["Yew"], 250)]},
 
     "Expert Woodcutter": {"description": "Reach Woodcutting level 60", "difficulty": "Difficult",
-                          "condition": lambda player: player["woodcutting_level"] >= 60},
+                          "requires": [_stat("woodcutting_level", 60)]},
     "Log Magnate": {"description": "Collect 10,000 total logs", "difficulty": "Difficult",
-                    "condition": lambda player: sum(player["inventory"].get(tree, 0) for tree in TREE_DATA) >= 10000},
+                    "requires": [_total(TREE_DATA, 10000)]},
     "Magic Logger": {"description": "Cut 1,000 Magic logs", "difficulty": "Difficult",
-                     "condition": lambda player: player["inventory"].get("Magic", 0) >= 1000},
+                     "requires": [_total(["Magic"], 1000)]},
 
     "Master Woodcutter": {"description": "Reach Woodcutting level 99", "difficulty": "Very Challenging",
-                          "condition": lambda player: player["woodcutting_level"] >= 99},
+                          "requires": [_stat("woodcutting_level", 99)]},
     "Redwood Ruler": {"description": "Cut 2,500 Redwood logs", "difficulty": "Very Challenging",
-                      "condition": lambda player: player["inventory"].get("Redwood", 0) >= 2500},
+                      "requires": [_total(["Redwood"], 2500)]},
 
     # Combined Achievements
     "Jack of Two Trades": {"description": "Reach level 50 in both Mining and Woodcutting", "difficulty": "Moderate",
-                           "condition": lambda player: player["mining_level"] >= 50 and player[
-                               "woodcutting_level"] >= 50},
+                           "requires": [_stat("mining_level", 50), _stat("woodcutting_level", 50)]},
     "Resource Baron": {"description": "Collect 10,000 total ores and 10,000 total logs", "difficulty": "Difficult",
-                       "condition": lambda player: sum(
-                           player["inventory"].get(ore, 0) for ore in ORE_DATA) >= 10000 and sum(
-                           player["inventory"].get(tree, 0) for tree in TREE_DATA) >= 10000},
+                       "requires": [_total(ORE_DATA, 10000), _total(TREE_DATA, 10000)]},
     "Skilling Prodigy": {"description": "Reach level 80 in both Mining and Woodcutting",
                          "difficulty": "Very Challenging",
-                         "condition": lambda player: player["mining_level"] >= 80 and player[
-                             "woodcutting_level"] >= 80},
+                         "requires": [_stat("mining_level", 80), _stat("woodcutting_level", 80)]},
     "Master of Resources": {"description": "Reach level 99 in both Mining and Woodcutting",
                             "difficulty": "Very Challenging",
-                            "condition": lambda player: player["mining_level"] >= 99 and player[
-                                "woodcutting_level"] >= 99},
+                            "requires": [_stat("mining_level", 99), _stat("woodcutting_level", 99)]},
 
     # Update the "Living Legend" achievement to include all new achievements
+    # (threshold is filled in below once every achievement has been added)
     "Living Legend": {"description": "Complete all other achievements", "difficulty": "Very Challenging",
-                      "condition": lambda player: len(player["completed_achievements"]) >= len(ACHIEVEMENTS) - 1}
+                      "requires": []}
 }
 
 ACHIEVEMENTS.update({
     "Gem Finder": {
         "description": "Mine your first gem",
         "difficulty": "Easy",
-        "condition": lambda player: any(player["inventory"].get(gem, 0) > 0 for gem in GEM_DATA)
+        "requires": [_total(GEM_DATA, 1)],
     },
     "Sapphire Collector": {
         "description": "Mine 10 uncut sapphires",
         "difficulty": "Moderate",
-        "condition": lambda player: player["inventory"].get("Uncut sapphire", 0) >= 10
+        "requires": [_total(["Uncut sapphire"], 10)],
     },
     "Emerald Hunter": {
         "description": "Mine 10 uncut emeralds",
         "difficulty": "Moderate",
-        "condition": lambda player: player["inventory"].get("Uncut emerald", 0) >= 10
+        "requires": [_total(["Uncut emerald"], 10)],
     },
     "Ruby Seeker": {
         "description": "Mine 10 uncut rubies",
         "difficulty": "Difficult",
-        "condition": lambda player: player["inventory"].get("Uncut ruby", 0) >= 10
+        "requires": [_total(["Uncut ruby"], 10)],
     },
     "Diamond Prospector": {
         "description": "Mine 10 uncut diamonds",
         "difficulty": "Very Challenging",
-        "condition": lambda player: player["inventory"].get("Uncut diamond", 0) >= 10
+        "requires": [_total(["Uncut diamond"], 10)],
     },
     "Gem Master": {
         "description": "Mine 100 gems in total",
         "difficulty": "Very Challenging",
-        "condition": lambda player: sum(player["inventory"].get(gem, 0) for gem in GEM_DATA) >= 100
+        "requires": [_total(GEM_DATA, 100)],
     },
 })
 
 ACHIEVEMENTS.update({
     "Novice Smith": {"description": "Smelt your first bar", "difficulty": "Easy",
-                     "condition": lambda player: any(player["inventory"].get(bar, 0) > 0 for bar in BAR_DATA)},
+                     "requires": [_total(BAR_DATA, 1)]},
     "Bronze Master": {"description": "Smelt 100 Bronze bars", "difficulty": "Easy",
-                      "condition": lambda player: player["inventory"].get("Bronze bar", 0) >= 100},
+                      "requires": [_total(["Bronze bar"], 100)]},
     "Iron Forger": {"description": "Smelt 500 Iron bars", "difficulty": "Moderate",
-                    "condition": lambda player: player["inventory"].get("Iron bar", 0) >= 500},
+                    "requires": [_total(["Iron bar"], 500)]},
     "Steel Specialist": {"description": "Smelt 1000 Steel bars", "difficulty": "Moderate",
-                         "condition": lambda player: player["inventory"].get("Steel bar", 0) >= 1000},
+                         "requires": [_total(["Steel bar"], 1000)]},
     "Mithril Maestro": {"description": "Smelt 500 Mithril bars", "difficulty": "Difficult",
-                        "condition": lambda player: player["inventory"].get("Mithril bar", 0) >= 500},
+                        "requires": [_total(["Mithril bar"], 500)]},
     "Adamantite Artisan": {"description": "Smelt 250 Adamantite bars", "difficulty": "Very Challenging",
-                           "condition": lambda player: player["inventory"].get("Adamantite bar", 0) >= 250},
+                           "requires": [_total(["Adamantite bar"], 250)]},
     "Runite Refiner": {"description": "Smelt 100 Runite bars", "difficulty": "Very Challenging",
-                       "condition": lambda player: player["inventory"].get("Runite bar", 0) >= 100},
+                       "requires": [_total(["Runite bar"], 100)]},
 })
 
 
 # Add new Crafting achievements
 ACHIEVEMENTS.update({
-    "Novice Crafter": {"description": "Reach level 2 in Crafting", "difficulty": "Easy", "condition": lambda player: player["crafting_level"] > 1},
-    "Pottery Apprentice": {"description": "Craft 100 pots", "difficulty": "Easy", "condition": lambda player: player["inventory"].get("Pot", 0) >= 100},
-    "Jewelry Novice": {"description": "Craft 50 gold rings", "difficulty": "Moderate", "condition": lambda player: player["inventory"].get("Gold ring", 0) >= 50},
-    "Gem Cutter": {"description": "Cut 10 of each gem type", "difficulty": "Difficult", "condition": lambda player: all(player["inventory"].get(gem, 0) >= 10 for gem in ["Sapphire", "Emerald", "Ruby", "Diamond"])},
-    "Master Crafter": {"description": "Reach Crafting level 99", "difficulty": "Very Challenging", "condition": lambda player: player["crafting_level"] >= 99},
+    "Novice Crafter": {"description": "Reach level 2 in Crafting", "difficulty": "Easy", "requires": [_stat("crafting_level", 2)]},
+    "Pottery Apprentice": {"description": "Craft 100 pots", "difficulty": "Easy", "requires": [_total(["Pot"], 100)]},
+    "Jewelry Novice": {"description": "Craft 50 gold rings", "difficulty": "Moderate", "requires": [_total(["Gold ring"], 50)]},
+    "Gem Cutter": {"description": "Cut 10 of each gem type", "difficulty": "Difficult", "requires": [_each(["Sapphire", "Emerald", "Ruby", "Diamond"], 10)]},
+    "Master Crafter": {"description": "Reach Crafting level 99", "difficulty": "Very Challenging", "requires": [_stat("crafting_level", 99)]},
 })
+
+# Living Legend: every other achievement completed
+ACHIEVEMENTS["Living Legend"]["requires"] = [_completed(len(ACHIEVEMENTS) - 1)]
+
+
+# Stable ids for the compact player data codec (storage_pure.PlayerDataCodec).
+# Append only: an entry's position is its id in saved data, so never reorder or remove.
+CODEC_ITEMS = (
+    "Rune essence", "Clay", "Copper ore", "Tin ore", "Iron ore", "Silver ore", "Coal", "Gold ore",
+    "Mithril ore", "Adamantite ore", "Runite ore", "Uncut sapphire", "Uncut emerald", "Uncut ruby",
+    "Uncut diamond", "Tree", "Oak", "Willow", "Teak", "Maple", "Mahogany", "Yew", "Magic",
+    "Redwood", "Bronze bar", "Iron bar", "Silver bar", "Steel bar", "Gold bar", "Mithril bar",
+    "Adamantite bar", "Runite bar", "Soft clay", "Unfired pot", "Pot", "Pie dish", "Bowl",
+    "Gold ring", "Gold necklace", "Unfired pie dish", "Unfired bowl", "Unstrung symbol",
+    "Sapphire ring", "Sapphire", "Sapphire necklace", "Tiara", "Emerald", "Emerald ring",
+    "Emerald necklace", "Ruby ring", "Ruby", "Ruby necklace", "Diamond ring", "Diamond",
+    "Diamond necklace",
+)
+CODEC_ACHIEVEMENTS = (
+    "First Steps", "Novice Miner", "Ore Collector", "Jack of All Ores", "Rune Essence Enthusiast",
+    "Clay Modeler", "Copper Collector", "Tin Trader", "Iron Initiate", "Silver Seeker",
+    "Intermediate Miner", "Ore Hoarder", "Coal Connoisseur", "Golden Touch", "Mithril Mastery",
+    "Adamantite Adept", "Runite Rookie", "Diverse Miner", "XP Chaser", "Expert Miner",
+    "Ore Magnate", "Rune Essence Baron", "Clay Empire", "Copper King", "Tin Tycoon",
+    "Iron Imperator", "Silver Sovereign", "Coal Commander", "Golden Empire", "Master Miner",
+    "Ore Tycoon", "Mithril Monarch", "Adamantite Overlord", "Runite Ruler", "Ore Completionist",
+    "XP Master", "First Chop", "Novice Woodcutter", "Log Collector", "Jack of All Trees",
+    "Oak Enthusiast", "Willow Whisperer", "Intermediate Woodcutter", "Log Hoarder", "Maple Master",
+    "Yew Yeoman", "Expert Woodcutter", "Log Magnate", "Magic Logger", "Master Woodcutter",
+    "Redwood Ruler", "Jack of Two Trades", "Resource Baron", "Skilling Prodigy",
+    "Master of Resources", "Living Legend", "Gem Finder", "Sapphire Collector", "Emerald Hunter",
+    "Ruby Seeker", "Diamond Prospector", "Gem Master", "Novice Smith", "Bronze Master",
+    "Iron Forger", "Steel Specialist", "Mithril Maestro", "Adamantite Artisan", "Runite Refiner",
+    "Novice Crafter", "Pottery Apprentice", "Jewelry Novice", "Gem Cutter", "Master Crafter",
+)
@@ -82,3 +82,24 @@ def debug_log(msg: str) -> None:
     except Exception:
         # Never raise from debug logging
         pass
+
+
+def debug_log_many(lines) -> None:
+    """Write several lines in one pass (e.g. a batch of webview log entries)."""
+    if not _enabled:
+        return
+    lines = [str(line) for line in lines]
+    if not lines:
+        return
+    try:
+        logger = _ensure_logger()
+        if logger is not None and logger.handlers:
+            for line in lines:
+                logger.info(line)
+            return
+        stamp = datetime.datetime.now().isoformat()
+        with open(DEBUG_LOG_FILE, "a", encoding="utf-8") as f:
+            f.write("".join(f"{stamp} | {line}\n" for line in lines))
+    except Exception:
+        # Never raise from debug logging
+        pass
@@ -31,8 +31,9 @@ class DeckBrowserContent:
     tree: Optional[str] = None
 
 
-def ankiscape_button_html() -> str:
-    icon = _get_icon_data_uri()
+def ankiscape_button_html(icon_src: Optional[str] = None) -> str:
+    """Button markup; icon_src is the web-export URL of the icon when available (else a data URI)."""
+    icon = icon_src or _get_icon_data_uri()
     if icon:
         return (
             '<span id="ankiscape-btn-wrap" style="margin-left:8px">'
@@ -51,11 +52,11 @@ def ankiscape_button_html() -> str:
         )
 
 
-def inject_into_deck_browser_content(content: DeckBrowserContent) -> DeckBrowserContent:
+def inject_into_deck_browser_content(content: DeckBrowserContent, icon_src: Optional[str] = None) -> DeckBrowserContent:
     """Append ankiscape button HTML to the bottom links area only (idempotent).
     We intentionally avoid stats/tree to prevent overlap with Heatmap or deck list.
     """
     if content.links is not None and "ankiscape-btn" not in content.links:
-        content.links = (content.links or "") + ankiscape_button_html()
+        content.links = (content.links or "") + ankiscape_button_html(icon_src)
         return content
     return content
@@ -0,0 +1,218 @@
+"""deferred.py - Run post-answer work on the Qt event loop, off the answer critical path.
+
+The reviewer answer wrapper only records an award event; the game logic
+(rolls, level-ups, achievements, saves, UI refresh) is submitted here and runs
+after Anki has moved on to the next card.
+
+Ordering: jobs run by priority, then in submission order, so award events are
+processed in the order the cards were answered. Without a Qt event loop
+(tests, early startup) submitted jobs run immediately.
+
+RefreshScheduler coalesces UI refreshes: components mark regions dirty and
+one flush per event-loop turn renders each dirty region once.
+"""
+import heapq
+import itertools
+import time
+
+try:
+    from .debug import debug_log as _debug_log  # type: ignore
+except Exception:
+    try:
+        from debug import debug_log as _debug_log  # type: ignore
+    except Exception:
+        def _debug_log(msg: str) -> None:
+            pass
+
+PRIORITY_AWARD = 0
+PRIORITY_PERSIST = 10
+PRIORITY_UI = 20
+
+# Run jobs for at most this long per event-loop turn before yielding
+SLICE_SECONDS = 0.008
+
+
+def _qt_scheduler(callback) -> bool:
+    """Schedule callback on the next event-loop turn; returns False when Qt is unavailable."""
+    try:
+        from aqt.qt import QTimer  # type: ignore
+    except Exception:
+        return False
+    try:
+        QTimer.singleShot(0, callback)
+        return True
+    except Exception:
+        return False
+
+
+class PostAnswerQueue:
+    """Priority queue of deferred jobs drained on the event loop.
+
+    scheduler(callback) -> bool arms a later call of callback; the default uses
+    QTimer.singleShot(0). When it returns False the queue drains synchronously.
+    """
+
+    def __init__(self, scheduler=None, slice_seconds=SLICE_SECONDS):
+        self._heap = []
+        self._seq = itertools.count()
+        self._scheduler = scheduler or _qt_scheduler
+        self._slice = slice_seconds
+        self._scheduled = False
+        self._running = False
+
+    def __len__(self):
+        return len(self._heap)
+
+    def submit(self, fn, *args, priority=PRIORITY_AWARD, label=None) -> None:
+        heapq.heappush(self._heap, (priority, next(self._seq), fn, args, label or getattr(fn, "__name__", "job")))
+        if self._running or self._scheduled:
+            return
+        if self._scheduler(self.run_pending):
+            self._scheduled = True
+        else:
+            self.drain()
+
+    def run_pending(self) -> None:
+        """Run jobs for up to one time slice, then yield back to the event loop."""
+        self._scheduled = False
+        deadline = time.perf_counter() + self._slice
+        self._run(deadline)
+        if self._heap and not self._scheduled:
+            if self._scheduler(self.run_pending):
+                self._scheduled = True
+            else:
+                self.drain()
+
+    def drain(self, *_args, **_kwargs) -> int:
+        """Run every pending job now (e.g. on profile close). Returns the number run.
+        Accepts and ignores hook arguments so it can be registered on any Anki hook.
+        """
+        return self._run(None)
+
+    def _run(self, deadline) -> int:
+        if self._running:
+            return 0
+        self._running = True
+        ran = 0
+        try:
+            while self._heap:
+                _, _, fn, args, label = heapq.heappop(self._heap)
+                try:
+                    fn(*args)
+                except Exception as e:
+                    _debug_log(f"deferred: job {label} failed: {e}")
+                ran += 1
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+        finally:
+            self._running = False
+        return ran
+
+
+class RefreshScheduler:
+    """Frame-coalesced UI invalidation.
+
+    Renderers are registered per region ("hud", "availability", "toast", "position")
+    and flushed in registration order. Any number of invalidate() calls within one
+    event-loop turn result in a single QTimer.singleShot(0) flush that renders each
+    dirty region once. Without Qt the flush happens immediately.
+    """
+
+    # Regions invalidated while flushing are re-flushed at most this many times synchronously
+    _MAX_SYNC_PASSES = 3
+
+    def __init__(self, scheduler=None):
+        self._renderers = {}
+        self._order = []
+        self._dirty = set()
+        self._scheduler = scheduler or _qt_scheduler
+        self._scheduled = False
+        self._flushing = False
+        self.flushes = 0
+
+    def register(self, region, renderer) -> None:
+        """Set the renderer for region (replacing any previous one, e.g. after reload)."""
+        if region not in self._renderers:
+            self._order.append(region)
+        self._renderers[region] = renderer
+
+    def is_dirty(self, region) -> bool:
+        return region in self._dirty
+
+    def discard(self, *regions) -> None:
+        """Drop pending refreshes of regions (e.g. review-only regions after leaving review)."""
+        self._dirty.difference_update(regions)
+
+    def invalidate(self, *regions) -> None:
+        self._dirty.update(regions)
+        if self._scheduled or self._flushing:
+            return
+        if self._scheduler(self.flush):
+            self._scheduled = True
+        else:
+            self.flush()
+
+    def flush(self) -> None:
+        """Render every dirty region once, in registration order."""
+        self._scheduled = False
+        if self._flushing:
+            return
+        self._flushing = True
+        try:
+            for _ in range(self._MAX_SYNC_PASSES):
+                if not self._dirty:
+                    break
+                dirty, self._dirty = self._dirty, set()
+                self.flushes += 1
+                for region in self._order:
+                    if region not in dirty:
+                        continue
+                    try:
+                        self._renderers[region]()
+                    except Exception as e:
+                        _debug_log(f"deferred: refresh of {region} failed: {e}")
+                if self._dirty and self._scheduler(self.flush):
+                    # Regions dirtied while rendering go to the next turn
+                    self._scheduled = True
+                    break
+            if self._dirty and not self._scheduled:
+                # No event loop to come back on: drop regions that keep re-dirtying themselves
+                _debug_log(f"deferred: dropping regions still dirty after {self._MAX_SYNC_PASSES} passes: "
+                           f"{sorted(self._dirty)}")
+                self._dirty.clear()
+        finally:
+            self._flushing = False
+
+
+# Shared by ui.py and the add-on entry point so all regions flush together
+UI_REFRESH = RefreshScheduler()
+
+
+class LatencyTracker:
+    """Measures answer keypress -> next question shown, keeping simple running stats."""
+
+    def __init__(self):
+        self._started = None
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = None
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+
+    def stop(self):
+        """Finish a measurement; returns the elapsed ms or None if none was started."""
+        if self._started is None:
+            return None
+        ms = (time.perf_counter() - self._started) * 1000.0
+        self._started = None
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.last_ms = ms
+        return ms
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
@@ -20,6 +20,9 @@ class HookCallbacks(TypedDict, total=False):
     reviewer_question: List[Callable]
     reviewer_answer: List[Callable]
     answer_wrapper: Callable
+    profile_will_close: List[Callable]
+    reviewer_will_end: List[Callable]
+    sync_will_start: List[Callable]
 
 
 _REGISTERED = False
@@ -32,6 +35,9 @@ def build_registration_plan(callbacks: HookCallbacks) -> Dict[str, int]:
         "reviewer_did_show_question": len(callbacks.get("reviewer_question", [])),
         "reviewer_did_show_answer": len(callbacks.get("reviewer_answer", [])),
         "wrap_reviewer_answerCard": 1 if callbacks.get("answer_wrapper") else 0,
+        "profile_will_close": len(callbacks.get("profile_will_close", [])),
+        "reviewer_will_end": len(callbacks.get("reviewer_will_end", [])),
+        "sync_will_start": len(callbacks.get("sync_will_start", [])),
     }
 
 
@@ -76,5 +82,17 @@ def register_hooks(callbacks: HookCallbacks, *, dry_run: bool = False) -> Dict[s
         except Exception:
             pass
 
+    # flush points (profile close, leaving review, before sync)
+    for key, hook_name in (
+        ("profile_will_close", "profile_will_close"),
+        ("reviewer_will_end", "reviewer_will_end"),
+        ("sync_will_start", "sync_will_start"),
+    ):
+        for cb in callbacks.get(key, []):
+            try:
+                getattr(gui_hooks, hook_name).append(cb)  # type: ignore[attr-defined]
+            except Exception:
+                pass
+
     _REGISTERED = True
     return plan
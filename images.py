@@ -0,0 +1,218 @@
+"""images.py - Shared image service: off-thread decoding and an LRU pixmap cache.
+
+Dialogs ask for (path, size, dpr). A cached pixmap is returned immediately;
+otherwise the caller shows a transparent placeholder and a QThreadPool job
+decodes the image at its display size with QImageReader.setScaledSize (from
+the best prebuilt variant, see assets.py). Finished images go into one
+process-wide cache bounded by a byte budget, so opening a dialog again decodes
+nothing. Existence checks are memoised, including misses.
+
+LRUByteCache and path_exists have no Qt dependency; ImageService needs Qt.
+"""
+import os
+from collections import OrderedDict
+
+try:
+    from aqt.qt import (  # type: ignore
+        Qt,
+        QObject,
+        QRunnable,
+        QThreadPool,
+        QImageReader,
+        QPixmap,
+        QRect,
+        QSize,
+        pyqtSignal,
+    )
+    HAS_QT = True
+except Exception:
+    HAS_QT = False
+
+try:
+    from .assets import ASSETS
+except Exception:
+    from assets import ASSETS  # type: ignore
+
+try:
+    from .debug import debug_log as _debug_log  # type: ignore
+except Exception:
+    try:
+        from debug import debug_log as _debug_log  # type: ignore
+    except Exception:
+        def _debug_log(msg: str) -> None:
+            pass
+
+# Decoded pixmaps kept across dialog opens (ARGB32: 4 bytes per device pixel)
+DEFAULT_BUDGET_BYTES = 24 * 1024 * 1024
+
+
+class LRUByteCache:
+    """Least-recently-used cache bounded by the total size of its values in bytes."""
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.budget = budget_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value, nbytes: int) -> None:
+        old = self._data.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        if nbytes > self.budget:
+            # Never cache something that would flush the whole cache
+            return
+        self._data[key] = (value, nbytes)
+        self.bytes += nbytes
+        while self.bytes > self.budget:
+            _, (_, evicted) = self._data.popitem(last=False)
+            self.bytes -= evicted
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.bytes = 0
+
+
+_EXISTS = {}
+
+
+def path_exists(path: str) -> bool:
+    """os.path.exists, memoised for the session (misses too: item images do not appear at runtime)."""
+    hit = _EXISTS.get(path)
+    if hit is None:
+        hit = _EXISTS[path] = bool(path) and os.path.exists(path)
+    return hit
+
+
+def cache_key(path: str, size: int, dpr: float) -> tuple:
+    return (path, int(size), round(float(dpr), 2))
+
+
+if HAS_QT:
+    def _decode(path: str, size: int, dpr: float):
+        """Decode path (or its best variant) straight to size * dpr device pixels; QImage or None."""
+        source = ASSETS.lookup(path, size, dpr)
+        reader = QImageReader(source[1])
+        full = reader.size()
+        if source[0] == "atlas":
+            x, y, w, h = source[2]
+            reader.setClipRect(QRect(x, y, w, h))
+            full = QSize(w, h)
+        px = max(1, int(round(size * dpr)))
+        if full.isValid() and (full.width() > px or full.height() > px):
+            reader.setScaledSize(full.scaled(px, px, Qt.AspectRatioMode.KeepAspectRatio))
+        image = reader.read()
+        return None if image.isNull() else image
+
+    class _DecodeSignals(QObject):
+        done = pyqtSignal(object, object)
+
+    class _DecodeJob(QRunnable):
+        def __init__(self, key, signals):
+            super().__init__()
+            self.key = key
+            self.signals = signals
+
+        def run(self):
+            image = None
+            try:
+                image = _decode(*self.key)
+            except Exception:
+                pass
+            self.signals.done.emit(self.key, image)
+
+    class ImageService:
+        """Process-wide image loader. Create and use on the GUI thread only."""
+
+        def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+            self.cache = LRUByteCache(budget_bytes)
+            self._pending = {}
+            self._placeholders = {}
+            self._signals = None
+
+        def _to_pixmap(self, key, image):
+            pm = QPixmap.fromImage(image)
+            try:
+                pm.setDevicePixelRatio(key[2])
+            except Exception:
+                pass
+            self.cache.put(key, pm, pm.width() * pm.height() * 4)
+            return pm
+
+        def cached(self, path: str, size: int, dpr: float = 1.0):
+            return self.cache.get(cache_key(path, size, dpr))
+
+        def load(self, path: str, size: int, dpr: float = 1.0):
+            """Synchronous variant for small always-visible images (e.g. the HUD icon)."""
+            key = cache_key(path, size, dpr)
+            pm = self.cache.get(key)
+            if pm is None:
+                image = _decode(*key) if path_exists(path) else None
+                pm = self._to_pixmap(key, image) if image is not None else QPixmap()
+            return pm
+
+        def request(self, path: str, size: int, dpr: float, callback):
+            """Return the cached pixmap, or None and call callback(pixmap) once it is decoded.
+            Missing files return None without a callback."""
+            key = cache_key(path, size, dpr)
+            pm = self.cache.get(key)
+            if pm is not None or not path_exists(path):
+                return pm
+            waiters = self._pending.get(key)
+            if waiters is not None:
+                waiters.append(callback)
+                return None
+            self._pending[key] = [callback]
+            if self._signals is None:
+                self._signals = _DecodeSignals()
+                self._signals.done.connect(self._on_done)
+            QThreadPool.globalInstance().start(_DecodeJob(key, self._signals))
+            return None
+
+        def placeholder(self, size: int, dpr: float = 1.0):
+            """Transparent pixmap of the final size so layouts do not jump when images arrive."""
+            key = cache_key("", size, dpr)
+            pm = self._placeholders.get(key)
+            if pm is None:
+                px = max(1, int(round(size * dpr)))
+                pm = QPixmap(px, px)
+                pm.fill(Qt.GlobalColor.transparent)
+                try:
+                    pm.setDevicePixelRatio(dpr)
+                except Exception:
+                    pass
+                self._placeholders[key] = pm
+            return pm
+
+        def _on_done(self, key, image):
+            callbacks = self._pending.pop(key, [])
+            if image is None:
+                _debug_log(f"images: failed to decode {key[0]}")
+                return
+            pm = self._to_pixmap(key, image)
+            for callback in callbacks:
+                try:
+                    callback(pm)
+                except Exception:
+                    # Target widget was closed before the image arrived
+                    pass
+
+    IMAGES = ImageService()
+else:
+    IMAGES = None
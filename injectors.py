@@ -2,6 +2,7 @@
 from __future__ import annotations
 import os
 import datetime
+import json
 from typing import Optional
 
 try:
@@ -15,19 +16,125 @@ except Exception:
 
 # Central debug logger (no cycle; support both package and flat import in tests)
 try:
-    from .debug import debug_log as _debug_log  # type: ignore
+    from .debug import debug_log as _debug_log, debug_log_many as _debug_log_many, is_debug_enabled  # type: ignore
 except Exception:
     try:
-        from debug import debug_log as _debug_log  # type: ignore
+        from debug import debug_log as _debug_log, debug_log_many as _debug_log_many, is_debug_enabled  # type: ignore
     except Exception:
         def _debug_log(msg: str) -> None:  # fallback no-op
             pass
 
+        def _debug_log_many(lines) -> None:  # fallback no-op
+            pass
+
+        def is_debug_enabled() -> bool:
+            return False
+
+try:
+    from .bridge import ROUTER  # type: ignore
+    from .settings import SETTINGS  # type: ignore
+except Exception:
+    from bridge import ROUTER  # type: ignore
+    from settings import SETTINGS  # type: ignore
+
+
+# --- Web assets: loaded once per page, then driven by ankiscape.apply() ---
+
+# Files served to webviews under /_addons/<addon folder>/
+WEB_EXPORTS_PATTERN = r"(web|icon)/.*\.(css|js|png)"
+WEB_JS = "web/ankiscape.js"
+WEB_CSS = "web/ankiscape.css"
+WEB_ICON = "icon/stats_icon.png"
+
+
+def build_apply_js(page: str, position: str, enabled: bool, debug: bool = False) -> str:
+    """The per-state call into web/ankiscape.js (a few dozen bytes instead of the full script).
+    debug turns on the script's batched log channel (developer mode)."""
+    pos = position if position in ("left", "right") else "right"
+    state = {"page": page, "pos": pos, "enabled": bool(enabled)}
+    if debug:
+        state["debug"] = True
+    state = json.dumps(state, separators=(",", ":"))
+    return f"window.ankiscape&&ankiscape.apply({state});"
+
+
+class AppliedStates:
+    """Last state applied per page, so unchanged card flips send nothing.
+    A page forgets its state when its content is reloaded."""
+
+    def __init__(self):
+        self._states = {}
+
+    def needs_apply(self, page: str, state) -> bool:
+        if self._states.get(page) == state:
+            return False
+        self._states[page] = state
+        return True
+
+    def forget(self, page: Optional[str] = None) -> None:
+        if page is None:
+            self._states.clear()
+        else:
+            self._states.pop(page, None)
+
+
+# Webview log commands: single entries from the inline scripts, batches from web/ankiscape.js
+LOG_BATCH_MAX = 200
+
+
+def parse_log_batch(payload) -> list:
+    """Turn an ankiscape_logbatch payload ([[ms, msg], ...], as JSON text or decoded) into log lines.
+    Times are shown relative to the first entry; malformed payloads yield []."""
+    if isinstance(payload, str):
+        try:
+            entries = json.loads(payload)
+        except Exception:
+            return []
+    else:
+        entries = payload
+    if not isinstance(entries, list):
+        return []
+    lines = []
+    start = None
+    for entry in entries[:LOG_BATCH_MAX]:
+        if isinstance(entry, (list, tuple)) and len(entry) == 2 and isinstance(entry[0], (int, float)):
+            ts, msg = entry
+            if start is None:
+                start = ts
+            lines.append(f"js: +{int(ts - start)}ms {msg}")
+        elif isinstance(entry, str):
+            lines.append(f"js: {entry}")
+    if len(entries) > LOG_BATCH_MAX:
+        lines.append(f"js: ({len(entries) - LOG_BATCH_MAX} more entries dropped)")
+    return lines
+
+
+def _log_command(args, _context=None) -> None:
+    _debug_log(f"js: {args}")
+
+
+def _log_batch_command(args, _context=None) -> None:
+    _debug_log_many(parse_log_batch(args))
+
+
+# Logging never marks a message handled
+ROUTER.register("log", _log_command, marks_handled=False)
+ROUTER.register("logbatch", _log_batch_command, marks_handled=False)
+
 
 # --- Pure JS builders (testable) ---
+# Full scripts with the icon inlined; used when web exports are unavailable.
+
+def _js_log_fn(debug: bool) -> str:
+    """ankiscapeLog() for the inline scripts: a no-op unless developer mode was on when injected."""
+    if not debug:
+        return "var ankiscapeLog = function(){};"
+    return "var ankiscapeLog = function(m){ try { pycmd('ankiscape_log:' + m); } catch(e){} };"
+
 
 def should_force_pass_through(message: object) -> bool:
     """Return True if a JS bridge message must never be marked handled.
+    bridge.ROUTER returns such messages untouched since they lack the ankiscape prefix.
 
     Pure helper so unit tests can validate the allowlist contract.
     """
@@ -51,10 +158,11 @@ def should_force_pass_through(message: object) -> bool:
         return True
     return False
 
-def build_reviewer_js(position: str, icon_data_uri: str) -> str:
+def build_reviewer_js(position: str, icon_data_uri: str, debug: bool = False) -> str:
     pos = position if position in ("left", "right") else "right"
     js = r"""
         (function(){
+            __LOG_FN__
             try{
                 var wrap = document.getElementById('ankiscape-float');
                 if (!wrap) {
@@ -112,37 +220,38 @@ def build_reviewer_js(position: str, icon_data_uri: str) -> str:
             try { img.style.transform = 'scale(1.15)'; img.style.filter = 'none'; } catch(_){}
                         btn.style.background = 'rgba(76, 175, 80, 0.15)';
                         btn.style.boxShadow = '0 2px 8px rgba(0,0,0,0.2)';
-                        try { pycmd('ankiscape_log:hover_enter_reviewer'); } catch(e){}
+                        try { ankiscapeLog('hover_enter_reviewer'); } catch(e){}
                     });
                     btn.addEventListener('mouseleave', function(){
             try { img.style.transform = 'scale(1)'; img.style.filter = 'drop-shadow(0 1px 1px rgba(0,0,0,0.25))'; } catch(_){}
                         btn.style.background = 'transparent';
                         btn.style.boxShadow = 'none';
-                        try { pycmd('ankiscape_log:hover_leave_reviewer'); } catch(e){}
+                        try { ankiscapeLog('hover_leave_reviewer'); } catch(e){}
                     });
                     btn.dataset.ankiscapeHoverBound = '1';
                 }
         if (!btn.dataset.ankiscapeBound) {
                     btn.addEventListener('click', function(ev){
                         ev.preventDefault();
-            try { pycmd('ankiscape_log:click_reviewer'); } catch(e){}
+            try { ankiscapeLog('click_reviewer'); } catch(e){}
                         try { pycmd('ankiscape_open_menu'); } catch(e){}
                         return false;
                     });
                     btn.dataset.ankiscapeBound = '1';
                 }
                 if (btn.parentElement !== wrap) { wrap.appendChild(btn); }
-                try { pycmd('ankiscape_log:review_floating_inserted'); } catch(e){}
-            } catch(e) { try { pycmd('ankiscape_log:review_js_error'); } catch(_){} }
+                try { ankiscapeLog('review_floating_inserted'); } catch(e){}
+            } catch(e) { try { ankiscapeLog('review_js_error'); } catch(_){} }
         })();
     """
-    return js.replace("__POS__", pos).replace("__ICON_DATA_URI__", icon_data_uri or '')
+    return js.replace("__POS__", pos).replace("__ICON_DATA_URI__", icon_data_uri or '').replace("__LOG_FN__", _js_log_fn(debug))
 
 
-def build_overview_js(position: str, icon_data_uri: str) -> str:
+def build_overview_js(position: str, icon_data_uri: str, debug: bool = False) -> str:
     pos = position if position in ("left", "right") else "right"
     js = r"""
         (function(){
+            __LOG_FN__
             try{
                 var wrap = document.getElementById('ankiscape-float');
                 if (!wrap) {
@@ -197,37 +306,38 @@ def build_overview_js(position: str, icon_data_uri: str) -> str:
             try { img.style.transform = 'scale(1.15)'; img.style.filter = 'none'; } catch(_){}
                         btn.style.background = 'rgba(76, 175, 80, 0.15)';
                         btn.style.boxShadow = '0 2px 8px rgba(0,0,0,0.2)';
-                        try { pycmd('ankiscape_log:hover_enter_overview'); } catch(e){}
+                        try { ankiscapeLog('hover_enter_overview'); } catch(e){}
                     });
                     btn.addEventListener('mouseleave', function(){
             try { img.style.transform = 'scale(1)'; img.style.filter = 'drop-shadow(0 1px 1px rgba(0,0,0,0.25))'; } catch(_){}
                         btn.style.background = 'transparent';
                         btn.style.boxShadow = 'none';
-                        try { pycmd('ankiscape_log:hover_leave_overview'); } catch(e){}
+                        try { ankiscapeLog('hover_leave_overview'); } catch(e){}
                     });
                     btn.dataset.ankiscapeHoverBound = '1';
                 }
         if (!btn.dataset.ankiscapeBound) {
                     btn.addEventListener('click', function(ev){
                         ev.preventDefault();
-            try { pycmd('ankiscape_log:click_overview'); } catch(e){}
+            try { ankiscapeLog('click_overview'); } catch(e){}
                         try { pycmd('ankiscape_open_menu'); } catch(e){}
                         return false;
                     });
                     btn.dataset.ankiscapeBound = '1';
                 }
                 if (btn.parentElement !== wrap) { wrap.appendChild(btn); }
-                try { pycmd('ankiscape_log:overview_floating_inserted'); } catch(e){}
-            } catch(e) { try { pycmd('ankiscape_log:overview_js_error'); } catch(_){} }
+                try { ankiscapeLog('overview_floating_inserted'); } catch(e){}
+            } catch(e) { try { ankiscapeLog('overview_js_error'); } catch(_){} }
         })();
     """
-    return js.replace("__POS__", pos).replace("__ICON_DATA_URI__", icon_data_uri or '')
+    return js.replace("__POS__", pos).replace("__ICON_DATA_URI__", icon_data_uri or '').replace("__LOG_FN__", _js_log_fn(debug))
 
 
-def build_deck_browser_js(enable_floating: bool, position: str, icon_data_uri: str) -> str:
+def build_deck_browser_js(enable_floating: bool, position: str, icon_data_uri: str, debug: bool = False) -> str:
     pos = position if position in ("left", "right") else "right"
     js = r"""
             (function(){
+                __LOG_FN__
                 try {
             function attachHover(a){
                         try {
@@ -247,13 +357,13 @@ def build_deck_browser_js(enable_floating: bool, position: str, icon_data_uri: s
                 try { if (img) { img.style.transform = 'scale(1.15)'; img.style.filter = 'none'; } } catch(_){ }
                                 a.style.background = 'rgba(76, 175, 80, 0.15)';
                                 a.style.boxShadow = '0 2px 8px rgba(0,0,0,0.2)';
-                                try { pycmd('ankiscape_log:hover_enter_deckbrowser'); } catch(e){}
+                                try { ankiscapeLog('hover_enter_deckbrowser'); } catch(e){}
                             });
                             a.addEventListener('mouseleave', function(){
                 try { if (img) { img.style.transform = 'scale(1)'; img.style.filter = 'drop-shadow(0 1px 1px rgba(0,0,0,0.25))'; } } catch(_){ }
                                 a.style.background = 'transparent';
                                 a.style.boxShadow = 'none';
-                                try { pycmd('ankiscape_log:hover_leave_deckbrowser'); } catch(e){}
+                                try { ankiscapeLog('hover_leave_deckbrowser'); } catch(e){}
                             });
                             a.dataset.ankiscapeHoverBound = '1';
                         } catch(_){}
@@ -291,7 +401,7 @@ def build_deck_browser_js(enable_floating: bool, position: str, icon_data_uri: s
                         if (!a.dataset.ankiscapeBound) {
                             a.addEventListener('click', function(ev){
                                 ev.preventDefault();
-                                try { pycmd('ankiscape_log:click_deckbrowser'); } catch(e){}
+                                try { ankiscapeLog('click_deckbrowser'); } catch(e){}
                                 try { pycmd('ankiscape_open_menu'); } catch(e){}
                                 return false;
                             });
@@ -320,7 +430,7 @@ def build_deck_browser_js(enable_floating: bool, position: str, icon_data_uri: s
                         if (last.parentElement) {
                             if (last.nextSibling) { last.parentElement.insertBefore(btn, last.nextSibling); }
                             else { last.parentElement.appendChild(btn); }
-                            try { pycmd('ankiscape_log:after_last_action(' + actions.length + ')'); } catch(e){}
+                            try { ankiscapeLog('after_last_action(' + actions.length + ')'); } catch(e){}
                             return;
                         }
                     }
@@ -343,7 +453,7 @@ def build_deck_browser_js(enable_floating: bool, position: str, icon_data_uri: s
                         if (rightmost.parentElement) {
                             if (rightmost.nextSibling) { rightmost.parentElement.insertBefore(btn2, rightmost.nextSibling); }
                             else { rightmost.parentElement.appendChild(btn2); }
-                            try { pycmd('ankiscape_log:inserted_topnav(' + topAnchors.length + ')'); } catch(e){}
+                            try { ankiscapeLog('inserted_topnav(' + topAnchors.length + ')'); } catch(e){}
                             return;
                         }
                     }
@@ -360,7 +470,7 @@ def build_deck_browser_js(enable_floating: bool, position: str, icon_data_uri: s
                         }
                         attachHover(btn3);
                         footer.appendChild(btn3);
-                        try { pycmd('ankiscape_log:inserted_selector'); } catch(e){}
+                        try { ankiscapeLog('inserted_selector'); } catch(e){}
                         return;
                     }
 
@@ -390,34 +500,105 @@ def build_deck_browser_js(enable_floating: bool, position: str, icon_data_uri: s
                         }
                         attachHover(btn);
                         if (btn.parentElement !== wrap) { wrap.appendChild(btn); } else if (!document.getElementById('ankiscape-btn')) { wrap.appendChild(btn); }
-                        try { pycmd('ankiscape_log:inserted_floating'); } catch(e){}
+                        try { ankiscapeLog('inserted_floating'); } catch(e){}
                     }
                 } catch (e) {
-                    try { pycmd('ankiscape_log:js_error'); } catch(_){ }
+                    try { ankiscapeLog('js_error'); } catch(_){ }
                 }
             })();
     """
     js = js.replace("__ENABLE_FLOATING__", "true" if enable_floating else "false")
     js = js.replace("__POS__", pos)
     js = js.replace("__ICON_DATA_URI__", icon_data_uri or '')
+    js = js.replace("__LOG_FN__", _js_log_fn(debug))
     return js
 
 
 # --- Runtime functions ---
 
-def inject_reviewer_floating_button(_=None) -> None:
-    if not HAS_ANKI:
+# "/_addons/<addon folder>" once the web assets are registered; None means use the full-script fallback
+_WEB_BASE: Optional[str] = None
+_APPLIED = AppliedStates()
+
+
+def web_asset_url(rel_path: str) -> Optional[str]:
+    return f"{_WEB_BASE}/{rel_path}" if _WEB_BASE else None
+
+
+def _floating_config() -> tuple:
+    """(enabled, position) of the floating button from the cached settings."""
+    return SETTINGS.floating_enabled, SETTINGS.floating_position
+
+
+def _page_for_context(context) -> Optional[str]:
+    try:
+        from aqt.reviewer import Reviewer  # type: ignore
+        from aqt.overview import Overview  # type: ignore
+        from aqt.deckbrowser import DeckBrowser  # type: ignore
+    except Exception:
+        return None
+    if isinstance(context, Reviewer):
+        return "reviewer"
+    if isinstance(context, Overview):
+        return "overview"
+    if isinstance(context, DeckBrowser):
+        return "deckbrowser"
+    return None
+
+
+def _on_webview_will_set_content(web_content, context) -> None:
+    page = _page_for_context(context)
+    if page is None or _WEB_BASE is None:
         return
     try:
-        enabled = True
-        pos = "right"
+        web_content.css.append(web_asset_url(WEB_CSS))
+        web_content.js.append(web_asset_url(WEB_JS))
+        # New document: the next apply() must run even if the state is unchanged
+        _APPLIED.forget(page)
+    except Exception as e:
+        _debug_log(f"web assets: could not add to {page}: {e}")
+
+
+def register_web_assets() -> bool:
+    """Export web/ and icon/ to webviews and load the button script into our pages.
+    Returns False (keeping the inline-script fallback) when the running Anki lacks support."""
+    global _WEB_BASE
+    if not HAS_ANKI:
+        return False
+    try:
+        mw.addonManager.setWebExports(__name__, WEB_EXPORTS_PATTERN)
+        folder = mw.addonManager.addonFromModule(__name__)
         try:
-            enabled = bool(mw.col.get_config("ankiscape_floating_enabled", True))
-            pos = mw.col.get_config("ankiscape_floating_position", "right")
-            if pos not in ("left", "right"):
-                pos = "right"
+            _hooks.webview_will_set_content.remove(_on_webview_will_set_content)
         except Exception:
             pass
+        _hooks.webview_will_set_content.append(_on_webview_will_set_content)
+        _WEB_BASE = f"/_addons/{folder}"
+        _APPLIED.forget()
+        _debug_log(f"web assets: registered at {_WEB_BASE}")
+    except Exception as e:
+        _WEB_BASE = None
+        _debug_log(f"web assets: unavailable, using inline scripts: {e}")
+    return _WEB_BASE is not None
+
+
+def _apply_web_state(web, page: str, enabled: bool, pos: str) -> None:
+    """Send ankiscape.apply() for page when its state changed; nothing otherwise."""
+    debug = is_debug_enabled()
+    if not _APPLIED.needs_apply(page, (enabled, pos, debug)):
+        return
+    _debug_log(f"{page}: apply enabled={enabled} pos={pos}")
+    web.eval(build_apply_js(page, pos, enabled, debug))
+
+
+def inject_reviewer_floating_button(_=None) -> None:
+    if not HAS_ANKI:
+        return
+    try:
+        enabled, pos = _floating_config()
+        if _WEB_BASE is not None:
+            _apply_web_state(mw.reviewer.web, "reviewer", enabled, pos)
+            return
         if not enabled:
             js_remove = r"""
             (function(){ var el = document.getElementById('ankiscape-float'); if (el && el.parentElement){ el.parentElement.removeChild(el);} })();
@@ -430,7 +611,7 @@ def inject_reviewer_floating_button(_=None) -> None:
             icon_uri = _get_icon_data_uri() or ''
         except Exception:
             icon_uri = ''
-        js = build_reviewer_js(pos, icon_uri)
+        js = build_reviewer_js(pos, icon_uri, is_debug_enabled())
         _debug_log("inject_reviewer_floating_button: eval")
         mw.reviewer.web.eval(js)
     except Exception:
@@ -449,15 +630,10 @@ def inject_overview_floating_button(overview=None, content=None) -> None:
         if not web:
             _debug_log("inject_overview_floating_button: no web")
             return
-        enabled = True
-        pos = "right"
-        try:
-            enabled = bool(mw.col.get_config("ankiscape_floating_enabled", True))
-            pos = mw.col.get_config("ankiscape_floating_position", "right")
-            if pos not in ("left", "right"):
-                pos = "right"
-        except Exception:
-            pass
+        enabled, pos = _floating_config()
+        if _WEB_BASE is not None:
+            _apply_web_state(web, "overview", enabled, pos)
+            return
         if not enabled:
             js_remove = r"""
             (function(){ var el = document.getElementById('ankiscape-float'); if (el && el.parentElement){ el.parentElement.removeChild(el);} })();
@@ -470,7 +646,7 @@ def inject_overview_floating_button(overview=None, content=None) -> None:
             icon_uri = _get_icon_data_uri() or ''
         except Exception:
             icon_uri = ''
-        js = build_overview_js(pos, icon_uri)
+        js = build_overview_js(pos, icon_uri, is_debug_enabled())
         _debug_log("inject_overview_floating_button: eval")
         web.eval(js)
     except Exception:
@@ -494,7 +670,7 @@ def register_deck_browser_button() -> None:
                 tree=getattr(content, "tree", None),
             )
             before_links, before_stats, before_tree = db_content.links, db_content.stats, db_content.tree
-            db_content = inject_into_deck_browser_content(db_content)
+            db_content = inject_into_deck_browser_content(db_content, web_asset_url(WEB_ICON))
             if db_content.links != before_links:
                 if hasattr(content, "links"):
                     content.links = db_content.links
@@ -506,78 +682,6 @@ def register_deck_browser_button() -> None:
         except Exception as e:
             _debug_log(f"_add_button: error {e}")
 
-    def _on_js_message(handled, message, context):  # type: ignore[no-redef]
-        _debug_log(f"_on_js_message: {message}")
-        try:
-            if isinstance(message, str):
-                if message == "ankiscape_open_menu":
-                    # Handle directly here to avoid relying on separate registration order.
-                    try:
-                        from .ui import is_main_menu_open, focus_main_menu_if_open  # type: ignore
-                        if is_main_menu_open():
-                            _debug_log("injectors.bridge: menu open; focusing")
-                            try:
-                                focus_main_menu_if_open()
-                            except Exception:
-                                pass
-                        else:
-                            # Resolve the package module reliably and call its _on_main_menu on the UI thread.
-                            _debug_log("injectors.bridge: opening via package._on_main_menu")
-                            try:
-                                import sys
-                                from aqt.qt import QTimer  # type: ignore
-                            except Exception:
-                                QTimer = None  # type: ignore
-
-                            pkg = None
-                            try:
-                                pkg = sys.modules.get(__package__)
-                            except Exception:
-                                pkg = None
-                            if pkg is None:
-                                _debug_log("injectors.bridge: package module not found in sys.modules")
-                            else:
-                                open_cb = getattr(pkg, "_on_main_menu", None)
-                                if callable(open_cb):
-                                    def _do_open():
-                                        try:
-                                            open_cb()  # type: ignore[misc]
-                                        except Exception as e:
-                                            _debug_log(f"injectors.bridge: _on_main_menu raised: {e}")
-
-                                    try:
-                                        if QTimer is not None:
-                                            QTimer.singleShot(0, _do_open)
-                                            _debug_log("injectors.bridge: scheduled _on_main_menu with QTimer")
-                                        else:
-                                            _do_open()
-                                            _debug_log("injectors.bridge: called _on_main_menu directly (no QTimer)")
-                                    except Exception as e:
-                                        _debug_log(f"injectors.bridge: failed to dispatch open: {e}")
-                                else:
-                                    _debug_log("injectors.bridge: _on_main_menu not found on package module")
-                        # We handled this custom message; signal handled
-                        return (True, message)
-                    except Exception as e:
-                        _debug_log(f"injectors.bridge: error handling open_menu: {e}")
-                        return (handled, message)
-                if message.startswith("ankiscape_log:"):
-                    _debug_log(f"js: {message[len('ankiscape_log:'):]}")
-                    # Not handled; allow default processing to continue
-                    return (handled, message)
-                # Hardening: ensure native navigation/study messages pass through unhandled
-                if should_force_pass_through(message):
-                    return (False, message)
-        except Exception as e:
-            _debug_log(f"injectors.bridge: handler exception: {e}")
-        # Default: do not intercept messages we don't recognize
-        try:
-            if isinstance(message, str):
-                return (False, message)
-        except Exception:
-            pass
-        return (handled, message)
-
     def _did_render(deck_browser):  # type: ignore[no-redef]
         try:
             try:
@@ -585,20 +689,16 @@ def register_deck_browser_button() -> None:
                 hide_review_hud()
             except Exception:
                 pass
-            enable_floating = True
-            float_pos = 'right'
-            try:
-                enable_floating = bool(mw.col.get_config('ankiscape_floating_enabled', True))
-                p = mw.col.get_config('ankiscape_floating_position', 'right')
-                float_pos = p if p in ('left','right') else 'right'
-            except Exception:
-                pass
+            enable_floating, float_pos = _floating_config()
+            if _WEB_BASE is not None:
+                _apply_web_state(deck_browser.web, "deckbrowser", enable_floating, float_pos)
+                return
             try:
                 from .deck_injection_pure import _get_icon_data_uri  # type: ignore
                 _icon_uri = _get_icon_data_uri() or ''
             except Exception:
                 _icon_uri = ''
-            js = build_deck_browser_js(enable_floating, float_pos, _icon_uri)
+            js = build_deck_browser_js(enable_floating, float_pos, _icon_uri, is_debug_enabled())
             deck_browser.web.eval(js)
             _debug_log("_did_render: eval injected fallback button if absent")
         except Exception:
@@ -624,10 +724,11 @@ def register_deck_browser_button() -> None:
         _debug_log(f"register failed: deck_browser_did_render: {e}")
     try:
         try:
-            _hooks.webview_did_receive_js_message.remove(_on_js_message)
+            _hooks.webview_did_receive_js_message.remove(ROUTER)
         except Exception:
             pass
-        _hooks.webview_did_receive_js_message.append(_on_js_message)
+        # One router for all webview commands (see bridge.py)
+        _hooks.webview_did_receive_js_message.append(ROUTER)
         _debug_log("registered: webview_did_receive_js_message")
     except Exception as e:
         _debug_log(f"register failed: webview_did_receive_js_message: {e}")
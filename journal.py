@@ -0,0 +1,268 @@
+"""journal.py - Optional sidecar SQLite journal for player state (no Anki deps).
+
+Enabled with the collection config key ankiscape_storage_backend = "journal".
+The database lives in the profile folder next to the collection, in WAL mode:
+
+- events: one row per award (ts, card_id, skill, xp, inventory delta, and the
+  absolute values of the few other fields the award changed). Events are kept
+  as history; writing a snapshot only deletes events older than
+  EVENT_RETENTION_SECONDS that every kept snapshot already includes.
+- snapshots: the full player state plus the id of the last event it includes.
+  The newest SNAPSHOTS_KEPT are kept, so the older one can still be replayed
+  with its later events if the newest turns out to be unreadable.
+
+Loading reads the latest snapshot and replays the events after it. A snapshot
+requested while an award is in progress (begin_award/end_award) is held until
+the award's event has been appended, so replay never counts that award twice.
+Appends are queued and written by a background thread in batched transactions,
+so an award costs a queue put on the UI thread and a crash loses at most the
+unwritten batch.
+"""
+from __future__ import annotations
+
+import json
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+try:
+    from .debug import debug_log as _debug_log  # type: ignore
+except Exception:
+    try:
+        from debug import debug_log as _debug_log  # type: ignore
+    except Exception:
+        def _debug_log(msg: str) -> None:
+            pass
+
+JOURNAL_FILENAME = "ankiscape_journal.sqlite3"
+BACKEND_CONFIG = "config"
+BACKEND_JOURNAL = "journal"
+
+# Writer batching: one transaction per BATCH_MAX events or BATCH_WAIT_SECONDS
+BATCH_MAX = 256
+BATCH_WAIT_SECONDS = 0.25
+# Snapshots to keep (the newest is used; one older one is kept for safety)
+SNAPSHOTS_KEPT = 2
+# Events stay in the journal for at least this long, even once a snapshot covers them
+EVENT_RETENTION_SECONDS = 30 * 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    card_id INTEGER,
+    skill TEXT,
+    xp REAL NOT NULL DEFAULT 0,
+    delta TEXT,
+    fields TEXT
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    last_event INTEGER NOT NULL,
+    current_skill TEXT,
+    data TEXT NOT NULL
+);
+"""
+
+
+def make_event(skill: str, xp: float, delta: Optional[Dict[str, int]] = None, card_id: Optional[int] = None,
+               fields: Optional[Dict[str, Any]] = None, achievements: Iterable[str] = (),
+               ts: Optional[float] = None) -> tuple:
+    """Row for one award: inventory delta is relative, fields are absolute values,
+    achievements lists the ones the award completed."""
+    extra = dict(fields or {})
+    achievements = list(achievements)
+    if achievements:
+        extra["completed_achievements"] = achievements
+    return (
+        time.time() if ts is None else float(ts),
+        card_id,
+        skill,
+        float(xp or 0),
+        json.dumps(delta, separators=(",", ":")) if delta else None,
+        json.dumps(extra, separators=(",", ":")) if extra else None,
+    )
+
+
+def apply_event(player_data: Dict[str, Any], skill: Optional[str], xp: float,
+                delta: Optional[str], fields: Optional[str]) -> None:
+    """Replay one event row onto player_data in place."""
+    if skill and xp:
+        exp_key = f"{skill.lower()}_exp"
+        player_data[exp_key] = player_data.get(exp_key, 0) + xp
+    if delta:
+        inventory = player_data.setdefault("inventory", {})
+        for item, amount in json.loads(delta).items():
+            inventory[item] = inventory.get(item, 0) + amount
+    if fields:
+        extra = json.loads(fields)
+        completed = extra.pop("completed_achievements", ())
+        player_data.update(extra)
+        done = player_data.setdefault("completed_achievements", [])
+        for name in completed:
+            if name not in done:
+                done.append(name)
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+class Journal:
+    """Event journal at path. With threaded=False writes happen on the caller's thread."""
+
+    def __init__(self, path: str, threaded: bool = True, retention_seconds: float = EVENT_RETENTION_SECONDS):
+        self.path = path
+        self.retention_seconds = retention_seconds
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self.events_since_snapshot = 0
+        self._award_depth = 0
+        self._held_snapshot = None  # (player_data, current_skill) requested during an award
+        if threaded:
+            self._thread = threading.Thread(target=self._run, name="ankiscape-journal", daemon=True)
+            self._thread.start()
+        else:
+            self._conn = _connect(path)
+
+    # --- Reading ---
+
+    def load(self) -> Optional[Tuple[Dict[str, Any], str, float]]:
+        """(player_data, current_skill, ts of the newest entry) or None when the journal is empty."""
+        conn = _connect(self.path)
+        try:
+            row = conn.execute(
+                "SELECT ts, last_event, current_skill, data FROM snapshots ORDER BY id DESC LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            ts, last_event, current_skill, data = row
+            player_data = json.loads(data)
+            count = 0
+            for ev_ts, skill, xp, delta, fields in conn.execute(
+                "SELECT ts, skill, xp, delta, fields FROM events WHERE id > ? ORDER BY id", (last_event,)
+            ):
+                apply_event(player_data, skill, xp, delta, fields)
+                ts = max(ts, ev_ts)
+                count += 1
+            self.events_since_snapshot = count
+            _debug_log(f"journal: loaded snapshot + {count} events")
+            return player_data, current_skill, ts
+        finally:
+            conn.close()
+
+    # --- Writing ---
+
+    def append(self, event: tuple) -> None:
+        """Queue an event row from make_event()."""
+        self.events_since_snapshot += 1
+        self._submit(("event", event))
+
+    def begin_award(self) -> None:
+        """Start an award: player data may already include changes whose event is not appended yet."""
+        self._award_depth += 1
+
+    def end_award(self) -> None:
+        """Finish an award; a snapshot held meanwhile is queued now, after the award's event."""
+        self._award_depth = max(0, self._award_depth - 1)
+        if self._award_depth == 0 and self._held_snapshot is not None:
+            held, self._held_snapshot = self._held_snapshot, None
+            self.snapshot(*held)
+
+    def snapshot(self, player_data: Dict[str, Any], current_skill: str) -> None:
+        """Queue a snapshot of player_data; it covers every event appended before it."""
+        if self._award_depth:
+            # Serialised at end_award(), so it also has whatever the award changes after this point
+            self._held_snapshot = (player_data, current_skill)
+            return
+        data = json.dumps(player_data, separators=(",", ":"))
+        self.events_since_snapshot = 0
+        self._submit(("snapshot", (time.time(), current_skill, data)))
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until everything queued so far is written."""
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        if self._thread is not None:
+            self._queue.put(("close", None))
+            self._thread.join(timeout)
+            self._thread = None
+        elif self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _submit(self, item) -> None:
+        if self._thread is not None:
+            self._queue.put(item)
+        elif self._conn is not None:
+            self._write(self._conn, [item])
+
+    def _write(self, conn: sqlite3.Connection, items) -> None:
+        with conn:
+            for kind, payload in items:
+                if kind == "event":
+                    conn.execute(
+                        "INSERT INTO events (ts, card_id, skill, xp, delta, fields) VALUES (?, ?, ?, ?, ?, ?)",
+                        payload,
+                    )
+                elif kind == "snapshot":
+                    ts, current_skill, data = payload
+                    last_event = conn.execute("SELECT COALESCE(MAX(id), 0) FROM events").fetchone()[0]
+                    conn.execute(
+                        "INSERT INTO snapshots (ts, last_event, current_skill, data) VALUES (?, ?, ?, ?)",
+                        (ts, last_event, current_skill, data),
+                    )
+                    conn.execute(
+                        "DELETE FROM snapshots WHERE id NOT IN (SELECT id FROM snapshots ORDER BY id DESC LIMIT ?)",
+                        (SNAPSHOTS_KEPT,),
+                    )
+                    # Compact: only events past retention that the oldest kept snapshot includes
+                    covered = conn.execute("SELECT MIN(last_event) FROM snapshots").fetchone()[0]
+                    conn.execute(
+                        "DELETE FROM events WHERE id <= ? AND ts < ?",
+                        (covered, ts - self.retention_seconds),
+                    )
+
+    def _run(self) -> None:
+        try:
+            conn = _connect(self.path)
+        except Exception as e:
+            _debug_log(f"journal: could not open {self.path}: {e}")
+            return
+        closing = False
+        while not closing:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + BATCH_WAIT_SECONDS
+            while len(batch) < BATCH_MAX and batch[-1][0] == "event":
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            writes = [item for item in batch if item[0] in ("event", "snapshot")]
+            try:
+                if writes:
+                    self._write(conn, writes)
+            except Exception as e:
+                _debug_log(f"journal: write failed ({len(writes)} entries): {e}")
+            for kind, payload in batch:
+                if kind == "flush":
+                    payload.set()
+                elif kind == "close":
+                    closing = True
+        conn.close()
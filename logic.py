@@ -1,5 +1,7 @@
 from .constants import (
     ORE_DATA,
+    BAR_DATA,
+    CRAFTING_DATA,
     EXP_TABLE,
     ACHIEVEMENTS,
     BASE_WOODCUTTING_PROBABILITY,
@@ -7,16 +9,14 @@ from .constants import (
     LEVEL_BONUS_FACTOR,
 )
 from .ui import show_level_up_dialog, show_achievement_dialog
+from .settings import SETTINGS
 
 """Anki-aware game logic orchestrators (no direct persistence here)."""
 
-def get_exp_to_next_level(player_data, EXP_TABLE):
-    current_level = player_data["mining_level"]
-    if current_level >= 99:
-        return 0
-    return EXP_TABLE[current_level] - player_data["total_exp"]
+from .logic_pure import calculate_new_level, calculate_probability_with_level, get_level_curve
 
-from .logic_pure import calculate_new_level, calculate_probability_with_level
+def get_exp_to_next_level(player_data, EXP_TABLE):
+    return get_level_curve(EXP_TABLE).xp_to_next(player_data["mining_level"], player_data["total_exp"])
 
 def level_up_check(skill, player_data):
     skill_map = {
@@ -33,30 +33,42 @@ def level_up_check(skill, player_data):
             for lvl in range(old_level + 1, new_level + 1):
                 player_data[level_key] = lvl
                 # Respect user setting for popups
-                try:
-                    from aqt import mw  # type: ignore
-                    enabled = bool(mw.col.get_config("ankiscape_popups_enabled", True)) if getattr(mw, 'col', None) else True
-                except Exception:
-                    enabled = True
-                if enabled:
+                if SETTINGS.popups_enabled:
                     show_level_up_dialog(skill)
 
-from .logic_pure import get_newly_completed_achievements
+from .logic_pure import AchievementIndex, AvailabilityIndex
+
+_ACHIEVEMENT_INDEX = AchievementIndex(ACHIEVEMENTS)
 
-def check_achievements(player_data):
-    newly_completed = get_newly_completed_achievements(player_data, ACHIEVEMENTS)
+def check_achievements(player_data, items=None, stats=None):
+    """Record and announce newly completed achievements.
+    With no items/stats a full evaluation runs; otherwise only achievements
+    watching the changed inventory items / player fields are re-checked.
+    """
+    if items is None and stats is None:
+        newly_completed = _ACHIEVEMENT_INDEX.sync(player_data)
+    else:
+        newly_completed = _ACHIEVEMENT_INDEX.update(player_data, items or (), stats or ())
     for achievement in newly_completed:
         player_data["completed_achievements"].append(achievement)
         # Respect user setting for popups
-        try:
-            from aqt import mw  # type: ignore
-            enabled = bool(mw.col.get_config("ankiscape_popups_enabled", True)) if getattr(mw, 'col', None) else True
-        except Exception:
-            enabled = True
-        if enabled:
+        if SETTINGS.popups_enabled:
             show_achievement_dialog(achievement, ACHIEVEMENTS[achievement])
 
 
+_AVAILABILITY_INDEX = AvailabilityIndex(BAR_DATA, CRAFTING_DATA)
+
+def skill_availability(player_data, items=None, stats=None):
+    """Return the shared AvailabilityIndex, updated for the given changes.
+    With no items/stats it only (re)binds when player_data is a different object.
+    """
+    if not _AVAILABILITY_INDEX.is_bound(player_data):
+        return _AVAILABILITY_INDEX.sync(player_data)
+    if items is None and stats is None:
+        return _AVAILABILITY_INDEX
+    return _AVAILABILITY_INDEX.update(player_data, items or (), stats or ())
+
+
 def calculate_woodcutting_probability(player_level: int, tree_probability: float) -> float:
     return calculate_probability_with_level(
         player_level,
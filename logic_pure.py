@@ -1,3 +1,10 @@
+from bisect import bisect_right
+
+try:
+    from .loot_pure import get_loot_table
+except Exception:
+    from loot_pure import get_loot_table  # type: ignore
+
 # logic_pure.py - Pure logic functions for AnkiScape (no Anki dependencies)
 
 def get_exp_to_next_level(player_data, EXP_TABLE):
@@ -8,17 +15,13 @@ def get_exp_to_next_level(player_data, EXP_TABLE):
     current_level = player_data.get("mining_level", player_data.get("level", 1))
     if current_level >= 99:
         return 0
+    skill_exp = player_data.get("mining_exp", player_data.get("total_exp", 0))
+    if not isinstance(EXP_TABLE, dict):
+        return get_level_curve(EXP_TABLE).xp_to_next(current_level, skill_exp)
     # Determine threshold for next level from EXP_TABLE
-    if isinstance(EXP_TABLE, dict):
-        threshold = EXP_TABLE.get(current_level)
-    else:
-        try:
-            threshold = EXP_TABLE[current_level]
-        except (IndexError, TypeError):
-            threshold = None
+    threshold = EXP_TABLE.get(current_level)
     if threshold is None:
         return 0
-    skill_exp = player_data.get("mining_exp", player_data.get("total_exp", 0))
     needed = threshold - skill_exp
     return needed if needed > 0 else 0
 
@@ -28,34 +31,390 @@ def calculate_new_level(skill_exp, current_level, EXP_TABLE):
     Supports EXP_TABLE as a dict (level -> threshold) or a list where index (level-1) stores threshold.
     Returns the new level (int).
     """
+    if not isinstance(EXP_TABLE, dict):
+        if current_level >= 99:
+            return current_level
+        return max(current_level, min(99, get_level_curve(EXP_TABLE).level_for_xp(skill_exp)))
     new_level = current_level
     while new_level < 99:
         # Determine threshold to reach next level (new_level+1)
-        if isinstance(EXP_TABLE, dict):
-            threshold = EXP_TABLE.get(new_level + 1)
-        else:
-            try:
-                # In list form, index equals current level (new_level) for threshold to reach next level
-                threshold = EXP_TABLE[new_level]
-            except (IndexError, TypeError):
-                threshold = None
-
+        threshold = EXP_TABLE.get(new_level + 1)
         if threshold is None or skill_exp < threshold:
             break
         new_level += 1
     return new_level
 
+
+class LevelCurve:
+    """Precomputed level thresholds for a list EXP_TABLE (index = level - 1).
+
+    Threshold and per-level span lookups are O(1); level_for_xp is a bisect.
+    Levels are capped at max_level (99) or the end of the table, whichever is lower.
+    """
+
+    def __init__(self, exp_table, max_level=99):
+        self._table = tuple(exp_table)
+        self.thresholds = tuple(float(t) for t in self._table)
+        self.max_level = max(1, min(max_level, len(self.thresholds)))
+        self.spans = tuple(
+            self.thresholds[i] - self.thresholds[i - 1] for i in range(1, len(self.thresholds))
+        )
+
+    def xp_for_level(self, level):
+        """Total XP needed to reach level."""
+        level = max(1, min(int(level), len(self.thresholds)))
+        return self.thresholds[level - 1]
+
+    def level_for_xp(self, xp):
+        """Highest level whose threshold is <= xp."""
+        level = bisect_right(self.thresholds, float(xp or 0))
+        return max(1, min(self.max_level, level))
+
+    def xp_to_next(self, level, xp):
+        """XP remaining until level + 1, or 0 at max level (in the table's own number type)."""
+        if level >= self.max_level or level < 1:
+            return 0
+        needed = self._table[level] - (xp or 0)
+        return needed if needed > 0 else 0
+
+    def xp_between(self, from_level, to_level):
+        """XP needed to go from from_level to to_level (negative if to_level is lower)."""
+        return self.xp_for_level(to_level) - self.xp_for_level(from_level)
+
+    def progress(self, level, xp):
+        """Return (percent, xp_remaining, target_level) for a progress bar.
+        At max_level, always returns 100% and 0 remaining.
+        """
+        lvl = max(1, int(level))
+        xp = float(xp or 0)
+        if lvl >= self.max_level:
+            return 100, 0.0, self.max_level
+        span = self.spans[lvl - 1]
+        if span <= 0:
+            return 100, 0.0, self.max_level
+        nxt = self.thresholds[lvl]
+        if xp >= nxt:
+            pct, remain = 100, 0.0
+        else:
+            pct = int(max(0.0, min(100.0, (xp - self.thresholds[lvl - 1]) / span * 100.0)))
+            remain = max(0.0, nxt - xp)
+        return pct, remain, min(lvl + 1, self.max_level)
+
+
+_LEVEL_CURVES = {}
+
+def get_level_curve(exp_table):
+    """Return the shared LevelCurve for exp_table, building it on first use."""
+    entry = _LEVEL_CURVES.get(id(exp_table))
+    if entry is None or entry[0] is not exp_table:
+        # Keep a reference to the table so its id cannot be reused while cached
+        entry = (exp_table, LevelCurve(exp_table))
+        _LEVEL_CURVES[id(exp_table)] = entry
+    return entry[1]
+
+def requirement_value(player_data, requirement):
+    """Return the current value of a declarative achievement requirement's metric.
+    See constants.py for the metric vocabulary ("total", "each", "stat", "completed").
+    """
+    metric = requirement["metric"]
+    keys = requirement.get("keys", ())
+    if metric == "total":
+        inv = player_data.get("inventory", {})
+        return sum(inv.get(k, 0) for k in keys)
+    if metric == "each":
+        inv = player_data.get("inventory", {})
+        return min((inv.get(k, 0) for k in keys), default=0)
+    if metric == "stat":
+        return player_data.get(keys[0], 0) if keys else 0
+    if metric == "completed":
+        return len(player_data.get("completed_achievements", []))
+    raise ValueError(f"Unknown achievement metric: {metric}")
+
+def achievement_met(player_data, data):
+    """Return True if an achievement's requirements hold for player_data.
+    Accepts declarative "requires" specs or a legacy "condition" callable.
+    """
+    if "condition" in data:
+        return bool(data["condition"](player_data))
+    return all(requirement_value(player_data, req) >= req["threshold"] for req in data.get("requires", ()))
+
+def achievement_progress(player_data, data):
+    """Return (value, target) of an achievement's least-complete requirement, value capped at target.
+    None for legacy "condition" achievements, whose progress is unknown.
+    """
+    if "condition" in data or not data.get("requires"):
+        return None
+    best = None
+    for req in data["requires"]:
+        target = req["threshold"]
+        value = min(requirement_value(player_data, req), target)
+        if best is None or value * max(best[1], 1) < best[0] * max(target, 1):
+            best = (value, target)
+    return best
+
 def get_newly_completed_achievements(player_data, ACHIEVEMENTS):
     """
     Returns a list of achievement names that are newly completed (not yet in player_data["completed_achievements"])
+    Full scan over every achievement; AchievementIndex is the incremental equivalent.
     """
     completed = set(player_data.get("completed_achievements", []))
     newly_completed = []
     for name, data in ACHIEVEMENTS.items():
-        if name not in completed and data["condition"](player_data):
+        if name not in completed and achievement_met(player_data, data):
             newly_completed.append(name)
     return newly_completed
 
+
+class _Metric:
+    """One compiled metric: its current value plus thresholds sorted ascending with a next-unmet pointer."""
+    __slots__ = ("kind", "keys", "entries", "next_unmet", "value", "partial")
+
+    def __init__(self, kind, keys):
+        self.kind = kind
+        self.keys = keys
+        self.entries = []  # (threshold, achievement name), sorted by threshold
+        self.next_unmet = 0
+        self.value = 0
+        self.partial = set()  # multi-requirement achievements passed here but not yet complete
+
+
+class AchievementIndex:
+    """Dependency-indexed, incremental achievement evaluator.
+
+    Declarative requirements are compiled into metrics shared between achievements.
+    Each metric watches the inventory items or player fields it reads and keeps its
+    thresholds sorted with a "next unmet" pointer, so an update only touches metrics
+    whose keys changed and only looks at thresholds that were just crossed.
+    Achievements still using a legacy "condition" callable are evaluated on every call.
+
+    Usage: sync(player_data) once (full evaluation), then update(player_data, items, stats)
+    after each change. Both return newly completed names in definition order; the caller
+    records them in player_data["completed_achievements"].
+    """
+
+    def __init__(self, achievements):
+        self._order = {name: i for i, name in enumerate(achievements)}
+        self._requires = {}
+        self._legacy = []
+        self._metrics = {}
+        self._item_watchers = {}
+        self._stat_watchers = {}
+        self._completed_metrics = []
+        for name, data in achievements.items():
+            if "condition" in data or "requires" not in data:
+                self._legacy.append((name, data))
+                continue
+            reqs = []
+            for req in data["requires"]:
+                key = (req["metric"], tuple(req.get("keys", ())))
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = self._compile_metric(*key)
+                metric.entries.append((req["threshold"], name))
+                reqs.append((metric, req["threshold"]))
+            self._requires[name] = reqs
+        for metric in self._metrics.values():
+            metric.entries.sort(key=lambda e: e[0])
+        self._player = None
+        self._completed = set()
+        self._seen_items = {}
+
+    def _compile_metric(self, kind, keys):
+        if kind not in ("total", "each", "stat", "completed"):
+            raise ValueError(f"Unknown achievement metric: {kind}")
+        metric = _Metric(kind, keys)
+        self._metrics[(kind, keys)] = metric
+        if kind in ("total", "each"):
+            for k in keys:
+                self._item_watchers.setdefault(k, []).append(metric)
+        elif kind == "stat":
+            for k in keys:
+                self._stat_watchers.setdefault(k, []).append(metric)
+        else:
+            self._completed_metrics.append(metric)
+        return metric
+
+    def next_threshold(self, metric, keys):
+        """Return the smallest unmet threshold for a metric, or None when all are met/unknown."""
+        m = self._metrics.get((metric, tuple(keys)))
+        if m is None or m.next_unmet >= len(m.entries):
+            return None
+        return m.entries[m.next_unmet][0]
+
+    def sync(self, player_data):
+        """Fully evaluate every metric for player_data and bind the index to it."""
+        self._player = player_data
+        self._completed = set(player_data.get("completed_achievements", []))
+        inv = player_data.get("inventory", {})
+        self._seen_items = {k: inv.get(k, 0) for k in self._item_watchers}
+        for metric in self._metrics.values():
+            metric.next_unmet = 0
+            metric.partial = set()
+            metric.value = self._full_value(metric, player_data)
+        return self._advance(list(self._metrics.values()), player_data)
+
+    def update(self, player_data, items=(), stats=()):
+        """Re-check only achievements watching the changed inventory items / player fields.
+        Rebinds with a full sync when given a different player_data object.
+        """
+        if player_data is not self._player:
+            return self.sync(player_data)
+        touched = {}
+        inv = player_data.get("inventory", {})
+        for item in items:
+            watchers = self._item_watchers.get(item)
+            if not watchers:
+                continue
+            new = inv.get(item, 0)
+            old = self._seen_items.get(item, 0)
+            if new == old:
+                continue
+            self._seen_items[item] = new
+            for metric in watchers:
+                if metric.kind == "total":
+                    metric.value += new - old
+                touched[id(metric)] = metric
+        for field in stats:
+            for metric in self._stat_watchers.get(field, ()):
+                metric.value = player_data.get(field, 0)
+                touched[id(metric)] = metric
+        for metric in touched.values():
+            if metric.kind == "each":
+                metric.value = self._full_value(metric, player_data)
+        return self._advance(list(touched.values()), player_data)
+
+    def _full_value(self, metric, player_data):
+        if metric.kind == "completed":
+            return len(self._completed)
+        return requirement_value(player_data, {"metric": metric.kind, "keys": metric.keys})
+
+    def _advance(self, metrics, player_data):
+        newly = []
+        while True:
+            candidates = set()
+            for metric in metrics:
+                entries = metric.entries
+                while metric.next_unmet < len(entries) and entries[metric.next_unmet][0] <= metric.value:
+                    candidates.add(entries[metric.next_unmet][1])
+                    metric.next_unmet += 1
+                candidates.update(metric.partial)
+            found = []
+            for name in candidates:
+                if name in self._completed:
+                    continue
+                reqs = self._requires[name]
+                if all(m.value >= threshold for m, threshold in reqs):
+                    found.append(name)
+                    for m, _ in reqs:
+                        m.partial.discard(name)
+                elif len(reqs) > 1:
+                    for m, threshold in reqs:
+                        if m.value >= threshold:
+                            m.partial.add(name)
+            for name, data in self._legacy:
+                if name not in self._completed and name not in found and achievement_met(player_data, data):
+                    found.append(name)
+            if not found:
+                break
+            self._completed.update(found)
+            newly.extend(found)
+            # Completing achievements can satisfy "completed" metrics (e.g. Living Legend)
+            metrics = self._completed_metrics
+            for metric in metrics:
+                metric.value = len(self._completed)
+        newly.sort(key=lambda n: self._order.get(n, 0))
+        return newly
+
+class AvailabilityIndex:
+    """Incremental "can smelt any bar" / "can craft any item" index.
+
+    Each material maps to the recipes it feeds. For every recipe the index keeps how
+    many of its material requirements are satisfied and whether the skill level is
+    high enough, plus a per-skill count of ready recipes, so can_smelt_any and
+    can_craft_any are O(1) reads. Call sync(player_data) once, then
+    update(player_data, items, stats) with the inventory keys / level fields that changed.
+    """
+
+    _LEVEL_FIELDS = {"Smithing": "smithing_level", "Crafting": "crafting_level"}
+
+    def __init__(self, bar_data, crafting_data):
+        self._recipes = {}  # (skill, name) -> (level required, {material: amount})
+        for name, spec in bar_data.items():
+            self._recipes[("Smithing", name)] = (spec.get("level", 0), dict(spec.get("ore_required", {})))
+        for name, spec in crafting_data.items():
+            self._recipes[("Crafting", name)] = (spec.get("level", 1), dict(spec.get("requirements", {})))
+        self._feeds = {}
+        for key, (_, requirements) in self._recipes.items():
+            for material in requirements:
+                self._feeds.setdefault(material, []).append(key)
+        self._player = None
+        self._have = {}  # (recipe key, material) -> requirement satisfied
+        self._satisfied = {}
+        self._level_ok = {}
+        self._ready = {"Smithing": 0, "Crafting": 0}
+
+    @property
+    def can_smelt_any(self):
+        return self._ready["Smithing"] > 0
+
+    @property
+    def can_craft_any(self):
+        return self._ready["Crafting"] > 0
+
+    def is_ready(self, skill, name):
+        key = (skill, name)
+        return key in self._recipes and self._is_ready(key)
+
+    def is_bound(self, player_data):
+        return player_data is self._player
+
+    def _is_ready(self, key):
+        return self._level_ok.get(key, False) and self._satisfied.get(key, 0) == len(self._recipes[key][1])
+
+    def sync(self, player_data):
+        """Recompute every recipe for player_data and bind the index to it."""
+        self._player = player_data
+        inv = player_data.get("inventory", {})
+        self._ready = {"Smithing": 0, "Crafting": 0}
+        for key, (level_req, requirements) in self._recipes.items():
+            count = 0
+            for material, amount in requirements.items():
+                have = inv.get(material, 0) >= amount
+                self._have[(key, material)] = have
+                count += have
+            self._satisfied[key] = count
+            self._level_ok[key] = player_data.get(self._LEVEL_FIELDS[key[0]], 1) >= level_req
+            if self._is_ready(key):
+                self._ready[key[0]] += 1
+        return self
+
+    def update(self, player_data, items=(), stats=()):
+        """Re-check only recipes fed by the changed items or gated by the changed level fields."""
+        if player_data is not self._player:
+            return self.sync(player_data)
+        inv = player_data.get("inventory", {})
+        for material in items:
+            for key in self._feeds.get(material, ()):
+                have = inv.get(material, 0) >= self._recipes[key][1][material]
+                if have == self._have[(key, material)]:
+                    continue
+                was_ready = self._is_ready(key)
+                self._have[(key, material)] = have
+                self._satisfied[key] += 1 if have else -1
+                self._ready[key[0]] += self._is_ready(key) - was_ready
+        for skill, field in self._LEVEL_FIELDS.items():
+            if field not in stats:
+                continue
+            level = player_data.get(field, 1)
+            for key, (level_req, _) in self._recipes.items():
+                if key[0] != skill:
+                    continue
+                was_ready = self._is_ready(key)
+                self._level_ok[key] = level >= level_req
+                self._ready[skill] += self._is_ready(key) - was_ready
+        return self
+
+
 def calculate_probability_with_level(player_level, base_probability, level_bonus_factor, source_probability, cap=0.95):
     """
     Compute success probability given a player's level and base probabilities.
@@ -69,6 +428,7 @@ def pick_gem(gem_data, r):
     Deterministically pick a gem given gem_data and a random draw r in [0, 1).
     gem_data: { name: { "probability": float }, ... }
     Returns the gem name, or None if r exceeds the total probability mass.
+    Reference cumulative walk; actions sample through loot_pure alias tables instead.
     """
     cumulative = 0.0
     for gem, data in gem_data.items():
@@ -88,18 +448,82 @@ def can_smelt_any_bar_pure(inventory, smithing_level, bar_data):
                 return True
     return False
 
+class InventoryDelta:
+    """A small set of inventory count changes that can be applied in place.
+
+    Actions build a delta instead of copying the whole inventory; commit() validates
+    the result (no negative counts) and applies it atomically, rollback() undoes the
+    last commit. keys() tells persistence and achievement checks what changed.
+    """
+    __slots__ = ("changes", "_previous")
+
+    def __init__(self, changes=None):
+        self.changes = dict(changes) if changes else {}
+        self._previous = None
+
+    def add(self, item, amount=1):
+        """Record amount (may be negative) for item. Returns self for chaining."""
+        self.changes[item] = self.changes.get(item, 0) + amount
+        return self
+
+    def keys(self):
+        return tuple(self.changes)
+
+    def __bool__(self):
+        return any(self.changes.values())
+
+    def __repr__(self):
+        return f"InventoryDelta({self.changes!r})"
+
+    def commit(self, inventory):
+        """Apply the delta to inventory in place and return it.
+        Raises ValueError (leaving inventory untouched) if any count would go negative.
+        """
+        for item, amount in self.changes.items():
+            if inventory.get(item, 0) + amount < 0:
+                raise ValueError(f"Insufficient {item}: have {inventory.get(item, 0)}, need {-amount}")
+        previous = {}
+        for item, amount in self.changes.items():
+            previous[item] = inventory.get(item)
+            inventory[item] = inventory.get(item, 0) + amount
+        self._previous = previous
+        return inventory
+
+    def rollback(self, inventory):
+        """Restore the counts inventory had before the last commit."""
+        if self._previous is None:
+            return inventory
+        for item, old in self._previous.items():
+            if old is None:
+                inventory.pop(item, None)
+            else:
+                inventory[item] = old
+        self._previous = None
+        return inventory
+
+
+def _apply_delta_copy(inventory, delta):
+    """Return a copy of inventory with delta applied (input untouched)."""
+    return delta.commit(dict(inventory))
+
+def soft_clay_delta_pure(inventory):
+    """
+    Delta turning 1 "Clay" into 1 "Soft clay" if possible.
+    Returns (delta, success: bool). Reads inventory only.
+    """
+    if inventory.get("Clay", 0) > 0:
+        return InventoryDelta({"Clay": -1, "Soft clay": 1}), True
+    return InventoryDelta(), False
+
 def create_soft_clay_pure(inventory):
     """
     Deduct 1 "Clay" and add 1 "Soft clay" if possible.
     Returns (new_inventory, success: bool). Does not mutate input.
     """
-    current_clay = inventory.get("Clay", 0)
-    if current_clay > 0:
-        new_inv = dict(inventory)
-        new_inv["Clay"] = current_clay - 1
-        new_inv["Soft clay"] = new_inv.get("Soft clay", 0) + 1
-        return new_inv, True
-    return inventory, False
+    delta, ok = soft_clay_delta_pure(inventory)
+    if not ok:
+        return inventory, False
+    return _apply_delta_copy(inventory, delta), True
 
 def has_crafting_materials_pure(item, inventory, crafting_data):
     """Return True if inventory satisfies crafting requirements for the given item.
@@ -114,56 +538,87 @@ def has_crafting_materials_pure(item, inventory, crafting_data):
             return False
     return True
 
+def crafting_delta_pure(item, inventory, crafting_data):
+    """If inventory meets requirements, return (delta, exp, True) consuming inputs and adding item.
+    Reads inventory only. Unknown items or missing materials return (empty delta, 0, False).
+    """
+    spec = crafting_data.get(item)
+    if not spec or not has_crafting_materials_pure(item, inventory, crafting_data):
+        return InventoryDelta(), 0, False
+    delta = InventoryDelta()
+    for material, amount in spec.get("requirements", {}).items():
+        delta.add(material, -amount)
+    delta.add(item, 1)
+    return delta, spec.get("exp", 0), True
+
 def apply_crafting_pure(item, inventory, crafting_data):
     """If inventory meets requirements, deduct inputs and return (new_inventory, exp, success).
     Does not mutate input inventory. Unknown items return (inventory, 0, False).
     """
-    spec = crafting_data.get(item)
-    if not spec or not has_crafting_materials_pure(item, inventory, crafting_data):
+    delta, exp, ok = crafting_delta_pure(item, inventory, crafting_data)
+    if not ok:
         return inventory, 0, False
-    new_inv = dict(inventory)
-    for material, amount in spec.get("requirements", {}).items():
-        new_inv[material] = new_inv.get(material, 0) - amount
-    new_inv[item] = new_inv.get(item, 0) + 1
-    exp = spec.get("exp", 0)
-    return new_inv, exp, True
+    return _apply_delta_copy(inventory, delta), exp, True
 
-def apply_smelt_pure(bar_name, inventory, bar_data):
+def smelt_delta_pure(bar_name, inventory, bar_data):
     """
-    Attempt to smelt a specific bar. Returns (new_inventory, exp, success).
-    Does not mutate input inventory. Only checks materials; level checks should be handled by caller.
-    bar_data format: { bar_name: {"exp": float, "ore_required": {ore: amount}} }
+    Delta for smelting a specific bar. Returns (delta, exp, success).
+    Reads inventory only. Only checks materials; level checks should be handled by caller.
     """
     spec = bar_data.get(bar_name)
     if not spec:
-        return inventory, 0, False
+        return InventoryDelta(), 0, False
     requirements = spec.get("ore_required", {})
-    # Check materials
     if not all(inventory.get(ore, 0) >= amount for ore, amount in requirements.items()):
-        return inventory, 0, False
-    # Deduct and add bar
-    new_inv = dict(inventory)
+        return InventoryDelta(), 0, False
+    delta = InventoryDelta()
     for ore, amount in requirements.items():
-        new_inv[ore] = new_inv.get(ore, 0) - amount
-    new_inv[bar_name] = new_inv.get(bar_name, 0) + 1
-    return new_inv, spec.get("exp", 0), True
+        delta.add(ore, -amount)
+    delta.add(bar_name, 1)
+    return delta, spec.get("exp", 0), True
+
+def apply_smelt_pure(bar_name, inventory, bar_data):
+    """
+    Attempt to smelt a specific bar. Returns (new_inventory, exp, success).
+    Does not mutate input inventory. Only checks materials; level checks should be handled by caller.
+    bar_data format: { bar_name: {"exp": float, "ore_required": {ore: amount}} }
+    """
+    delta, exp, ok = smelt_delta_pure(bar_name, inventory, bar_data)
+    if not ok:
+        return inventory, 0, False
+    return _apply_delta_copy(inventory, delta), exp, True
+
+def woodcutting_delta_pure(tree_name, tree_data, r_action, success_probability, drop_table=None, r_drop=None,
+                           loot_version=0):
+    """
+    Delta for a woodcutting action. Returns (delta, exp_gained, success).
+    The caller provides a random draw and success probability.
+    drop_table (optional): per-tree drop table sampled with r_drop on success.
+    """
+    if not r_action < success_probability:
+        return InventoryDelta(), 0, False
+    delta = InventoryDelta({tree_name: 1})
+    exp = tree_data[tree_name].get("exp", 0)
+    if drop_table and r_drop is not None:
+        drop = get_loot_table(drop_table, loot_version).sample(r_drop)
+        if drop:
+            delta.add(drop, 1)
+            spec = drop_table[drop]
+            exp += spec.get("exp", 0) if isinstance(spec, dict) else 0
+    return delta, exp, True
 
 def apply_woodcutting_pure(tree_name, inventory, tree_data, r_action, success_probability):
     """
     Attempt a woodcutting action. Returns (new_inventory, exp_gained, success).
     Does not mutate input inventory. The caller provides a random draw and success probability.
     """
-    success = r_action < success_probability
-    if not success:
+    delta, exp, ok = woodcutting_delta_pure(tree_name, tree_data, r_action, success_probability)
+    if not ok:
         return inventory, 0, False
-    new_inv = dict(inventory)
-    new_inv[tree_name] = new_inv.get(tree_name, 0) + 1
-    exp = tree_data[tree_name].get("exp", 0)
-    return new_inv, exp, True
+    return _apply_delta_copy(inventory, delta), exp, True
 
-def apply_mining_pure(
+def mining_delta_pure(
     ore_name,
-    inventory,
     ore_data,
     gem_data,
     r_action,
@@ -171,26 +626,48 @@ def apply_mining_pure(
     r_gem_chance=None,
     r_gem_pick=None,
     gem_drop_chance=1/256,
+    loot_version=0,
 ):
     """
-    Attempt a mining action. Returns (new_inventory, exp_gained, success, gem_name).
-    If success, may also award a gem using provided randoms and gem_drop_chance.
-    Does not mutate input inventory.
+    Delta for a mining action. Returns (delta, exp_gained, success, gem_name).
+    If success, may also award a gem using provided randoms and gem_drop_chance;
+    gem_data is sampled through its cached alias table (see loot_pure).
     """
-    success = r_action < success_probability
-    if not success:
-        return inventory, 0, False, None
-    new_inv = dict(inventory)
-    new_inv[ore_name] = new_inv.get(ore_name, 0) + 1
+    if not r_action < success_probability:
+        return InventoryDelta(), 0, False, None
+    delta = InventoryDelta({ore_name: 1})
     exp = ore_data[ore_name].get("exp", 0)
 
     gem_name = None
     if r_gem_chance is not None and r_gem_pick is not None and r_gem_chance < gem_drop_chance:
-        gem_name = pick_gem(gem_data, r_gem_pick)
+        gem_name = get_loot_table(gem_data, loot_version).sample(r_gem_pick)
         if gem_name:
-            new_inv[gem_name] = new_inv.get(gem_name, 0) + 1
+            delta.add(gem_name, 1)
             exp += gem_data[gem_name].get("exp", 0)
-    return new_inv, exp, True, gem_name
+    return delta, exp, True, gem_name
+
+def apply_mining_pure(
+    ore_name,
+    inventory,
+    ore_data,
+    gem_data,
+    r_action,
+    success_probability,
+    r_gem_chance=None,
+    r_gem_pick=None,
+    gem_drop_chance=1/256,
+):
+    """
+    Attempt a mining action. Returns (new_inventory, exp_gained, success, gem_name).
+    If success, may also award a gem using provided randoms and gem_drop_chance.
+    Does not mutate input inventory.
+    """
+    delta, exp, ok, gem_name = mining_delta_pure(
+        ore_name, ore_data, gem_data, r_action, success_probability, r_gem_chance, r_gem_pick, gem_drop_chance
+    )
+    if not ok:
+        return inventory, 0, False, None
+    return _apply_delta_copy(inventory, delta), exp, True, gem_name
 
 
 def can_mine_ore_pure(mining_level, ore_name, ore_data):
@@ -0,0 +1,139 @@
+"""loot_pure.py - Weighted drop tables compiled to alias tables (no Anki deps).
+
+compile_loot_table turns a drop table into a Walker/Vose AliasTable, so a roll
+costs O(1) whatever the table size. Probability mass not covered by the
+entries becomes a "nothing" outcome (None).
+
+A drop table maps name -> probability, or name -> {"probability": p, ...}
+like GEM_DATA. The remaining spec fields (e.g. "exp") stay available on
+AliasTable.specs.
+"""
+try:
+    import numpy as np  # type: ignore
+    HAS_NUMPY = True
+except Exception:
+    np = None  # type: ignore
+    HAS_NUMPY = False
+
+
+def _weight(spec):
+    if isinstance(spec, dict):
+        return float(spec.get("probability", 0.0))
+    return float(spec)
+
+
+class AliasTable:
+    """Alias table over outcomes; None is the "nothing" outcome.
+
+    sample(u) maps one uniform draw u in [0, 1) to an outcome: the integer part
+    of u * n picks a column, the fractional part picks the column's own outcome
+    or its alias. The distribution matches the cumulative walk in pick_gem;
+    the mapping of individual u values does not.
+    """
+    __slots__ = ("outcomes", "prob", "alias", "specs", "_np_prob", "_np_alias")
+
+    def __init__(self, weights, specs=None):
+        """weights: list of (outcome, weight) with weight > 0."""
+        weights = [(o, float(w)) for o, w in weights if w > 0]
+        if not weights:
+            weights = [(None, 1.0)]
+        total = sum(w for _, w in weights)
+        n = len(weights)
+        self.outcomes = [o for o, _ in weights]
+        self.specs = specs or {}
+        scaled = [w * n / total for _, w in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = g
+            scaled[g] = (scaled[g] + scaled[s]) - 1.0
+            (small if scaled[g] < 1.0 else large).append(g)
+        # Leftovers are 1.0 up to rounding error
+        self.prob = prob
+        self.alias = alias
+        self._np_prob = None
+        self._np_alias = None
+
+    def __len__(self):
+        return len(self.outcomes)
+
+    def sample_index(self, u):
+        n = len(self.prob)
+        x = u * n
+        i = int(x)
+        if i >= n:
+            i = n - 1
+        return i if (x - i) < self.prob[i] else self.alias[i]
+
+    def sample(self, u):
+        """Return the outcome for one uniform draw u in [0, 1)."""
+        return self.outcomes[self.sample_index(u)]
+
+    def sample_indices(self, us):
+        """Vectorised sample_index over a NumPy array of draws; returns an int array."""
+        if not HAS_NUMPY:
+            raise RuntimeError("NumPy is not available")
+        if self._np_prob is None:
+            self._np_prob = np.asarray(self.prob)
+            self._np_alias = np.asarray(self.alias)
+        n = len(self.prob)
+        x = np.asarray(us, dtype=float) * n
+        i = np.minimum(x.astype(np.int64), n - 1)
+        return np.where((x - i) < self._np_prob[i], i, self._np_alias[i])
+
+    def sample_many(self, us):
+        """Return the outcomes for a sequence (or NumPy array) of draws."""
+        if HAS_NUMPY and isinstance(us, np.ndarray):
+            outcomes = self.outcomes
+            return [outcomes[k] for k in self.sample_indices(us)]
+        return [self.sample(u) for u in us]
+
+    def counts(self, us):
+        """Return {outcome: count} over the draws, leaving out the "nothing" outcome."""
+        result = {}
+        if HAS_NUMPY and isinstance(us, np.ndarray):
+            hits = np.bincount(self.sample_indices(us), minlength=len(self.outcomes))
+            for outcome, count in zip(self.outcomes, hits):
+                if outcome is not None and count:
+                    result[outcome] = int(count)
+            return result
+        for u in us:
+            outcome = self.sample(u)
+            if outcome is not None:
+                result[outcome] = result.get(outcome, 0) + 1
+        return result
+
+
+def compile_loot_table(table, total=1.0):
+    """Compile a drop table into an AliasTable.
+    Entries are probabilities out of total; any shortfall is the "nothing" outcome.
+    If the entries add up to more than total they are normalised instead.
+    """
+    weights = [(name, _weight(spec)) for name, spec in table.items()]
+    mass = sum(w for _, w in weights if w > 0)
+    if mass < total - 1e-12:
+        weights.append((None, total - mass))
+    return AliasTable(weights, specs=dict(table))
+
+
+_COMPILED = {}
+_MAX_COMPILED = 128
+
+
+def get_loot_table(table, version=0):
+    """Return the compiled AliasTable for table, compiling at most once per content version.
+    Bump version when a table's contents change in place.
+    """
+    entry = _COMPILED.get(id(table))
+    if entry is None or entry[0] is not table or entry[1] != version:
+        if len(_COMPILED) >= _MAX_COMPILED:
+            _COMPILED.clear()
+        # Keep a reference to the table so its id cannot be reused while cached
+        entry = (table, version, compile_loot_table(table))
+        _COMPILED[id(table)] = entry
+    return entry[2]
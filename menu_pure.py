@@ -0,0 +1,104 @@
+"""menu_pure.py - View model for the persistent main menu (no Anki deps).
+
+The main menu window is kept alive between opens. MenuViewModel remembers the
+player state the window last displayed; update() compares it with the current
+state and returns the menu sections whose widgets need a targeted refresh, so
+reopening or refreshing the menu only touches what changed.
+"""
+
+SKILLS = ("Mining", "Woodcutting", "Smithing", "Crafting")
+
+# Menu sections (one per tab, plus the skill selector on the Skills tab)
+SECTION_SKILLS = "skills"
+SECTION_MINING = "mining"
+SECTION_WOODCUTTING = "woodcutting"
+SECTION_SMITHING = "smithing"
+SECTION_CRAFTING = "crafting"
+SECTION_BANK = "bank"
+SECTION_STATS = "stats"
+SECTION_ACHIEVEMENTS = "achievements"
+
+ALL_SECTIONS = frozenset((
+    SECTION_SKILLS,
+    SECTION_MINING,
+    SECTION_WOODCUTTING,
+    SECTION_SMITHING,
+    SECTION_CRAFTING,
+    SECTION_BANK,
+    SECTION_STATS,
+    SECTION_ACHIEVEMENTS,
+))
+
+# Which sections display each skill's level (gating, tooltips, achievement progress)
+_LEVEL_SECTIONS = {
+    "Mining": (SECTION_MINING, SECTION_STATS, SECTION_ACHIEVEMENTS),
+    "Woodcutting": (SECTION_WOODCUTTING, SECTION_STATS, SECTION_ACHIEVEMENTS),
+    "Smithing": (SECTION_SMITHING, SECTION_STATS, SECTION_SKILLS, SECTION_ACHIEVEMENTS),
+    "Crafting": (SECTION_CRAFTING, SECTION_STATS, SECTION_SKILLS, SECTION_ACHIEVEMENTS),
+}
+
+# Selected source per list section
+_SELECTION_KEYS = {
+    "current_ore": SECTION_MINING,
+    "current_tree": SECTION_WOODCUTTING,
+    "current_bar": SECTION_SMITHING,
+    "current_craft": SECTION_CRAFTING,
+}
+
+
+def menu_snapshot(player_data: dict, current_skill: str) -> dict:
+    """The parts of player state the menu displays, copied so later mutation is detectable."""
+    snap = {
+        "current_skill": current_skill,
+        "inventory": {k: v for k, v in player_data.get("inventory", {}).items() if v},
+        "completed": frozenset(player_data.get("completed_achievements", [])),
+    }
+    for skill in SKILLS:
+        key = skill.lower()
+        snap[f"{key}_level"] = player_data.get(f"{key}_level", 1)
+        snap[f"{key}_exp"] = player_data.get(f"{key}_exp", 0)
+    for key in _SELECTION_KEYS:
+        snap[key] = player_data.get(key)
+    return snap
+
+
+def dirty_sections(old, new) -> set:
+    """Sections that differ between two snapshots (all of them when old is None)."""
+    if old is None:
+        return set(ALL_SECTIONS)
+    dirty = set()
+    if old["current_skill"] != new["current_skill"]:
+        dirty.add(SECTION_SKILLS)
+    if old["inventory"] != new["inventory"]:
+        # Counts in the Bank and achievement progress; materials in Smithing/Crafting tooltips and availability
+        dirty.update((SECTION_BANK, SECTION_SMITHING, SECTION_CRAFTING, SECTION_SKILLS, SECTION_ACHIEVEMENTS))
+    if old["completed"] != new["completed"]:
+        dirty.add(SECTION_ACHIEVEMENTS)
+    for skill, sections in _LEVEL_SECTIONS.items():
+        key = skill.lower()
+        if old[f"{key}_level"] != new[f"{key}_level"]:
+            dirty.update(sections)
+        elif old[f"{key}_exp"] != new[f"{key}_exp"]:
+            dirty.add(SECTION_STATS)
+    for key, section in _SELECTION_KEYS.items():
+        if old[key] != new[key]:
+            dirty.add(section)
+    return dirty
+
+
+class MenuViewModel:
+    """Tracks the state last shown by the menu and reports what changed since."""
+
+    def __init__(self):
+        self._shown = None
+
+    def update(self, player_data: dict, current_skill: str) -> set:
+        """Record the current state as shown; return the sections that need refreshing."""
+        snap = menu_snapshot(player_data, current_skill)
+        dirty = dirty_sections(self._shown, snap)
+        self._shown = snap
+        return dirty
+
+    def invalidate(self) -> None:
+        """Forget the shown state so the next update refreshes every section."""
+        self._shown = None
@@ -0,0 +1,126 @@
+"""optimize_assets.py - Build downscaled icon variants for the add-on (development tool).
+
+Writes 1x/2x PNGs for every image in the item folders at each UI icon size to
+assets/, plus assets/index.json which the add-on's AssetIndex (assets.py) reads
+at runtime. With --atlas the variants of each size are packed into one sheet
+per size/scale instead of individual files.
+
+Requires Pillow (pip install Pillow); the add-on itself does not.
+
+Usage:
+    python3 optimize_assets.py [--atlas] [--sizes 28 32 40 48] [--clean]
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+
+from assets import (
+    ASSET_DIR,
+    ICON_SIZES,
+    INDEX_NAME,
+    INDEX_VERSION,
+    SCALES,
+    SOURCE_FOLDERS,
+    pack_atlas,
+    variant_key,
+    variant_name,
+)
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def _source_images(root: str):
+    """Relative paths ("ores/Clay.png") of all source PNGs, in a stable order."""
+    out = []
+    for folder in SOURCE_FOLDERS:
+        path = os.path.join(root, folder)
+        if not os.path.isdir(path):
+            continue
+        for name in sorted(os.listdir(path)):
+            if name.lower().endswith(".png") and "@" not in name:
+                out.append(f"{folder}/{name}")
+    return out
+
+
+def _downscale(Image, src, size: int):
+    """Fit src into size x size (keeping aspect ratio) on a transparent square canvas."""
+    img = src.copy()
+    img.thumbnail((size, size), Image.LANCZOS)
+    canvas = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    canvas.paste(img, ((size - img.width) // 2, (size - img.height) // 2))
+    return canvas
+
+
+def build(root: str = ROOT, asset_dir: str = ASSET_DIR, sizes=ICON_SIZES, atlas: bool = False) -> dict:
+    """Generate variants (or atlases) and the index; returns the index dict."""
+    try:
+        from PIL import Image  # type: ignore
+    except ImportError:
+        raise SystemExit("optimize_assets.py needs Pillow: pip install Pillow")
+
+    os.makedirs(asset_dir, exist_ok=True)
+    index = {"version": INDEX_VERSION, "variants": {}, "atlases": {}}
+    sheets = {}
+    for rel in _source_images(root):
+        with Image.open(os.path.join(root, *rel.split("/"))) as src:
+            src = src.convert("RGBA")
+            for size in sizes:
+                for scale in SCALES:
+                    img = _downscale(Image, src, size * scale)
+                    key = variant_key(size, scale)
+                    if atlas:
+                        sheets.setdefault(key, {})[rel] = img
+                        continue
+                    name = variant_name(rel, size, scale)
+                    out = os.path.join(asset_dir, *name.split("/"))
+                    os.makedirs(os.path.dirname(out), exist_ok=True)
+                    img.save(out, optimize=True)
+                    rel_out = os.path.relpath(out, root).replace(os.sep, "/")
+                    index["variants"].setdefault(rel, {})[key] = rel_out
+
+    for key, images in sheets.items():
+        width, height, rects = pack_atlas({rel: img.size for rel, img in images.items()})
+        sheet = Image.new("RGBA", (max(1, width), max(1, height)), (0, 0, 0, 0))
+        for rel, (x, y, _, _) in rects.items():
+            sheet.paste(images[rel], (x, y))
+        size, scale = key.split("@")
+        file_name = f"atlas_{size}@{scale}x.png"
+        sheet.save(os.path.join(asset_dir, file_name), optimize=True)
+        index["atlases"][key] = {"file": file_name, "rects": {rel: list(r) for rel, r in rects.items()}}
+
+    with open(os.path.join(asset_dir, INDEX_NAME), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    return index
+
+
+def _size_of(path: str) -> int:
+    total = 0
+    for dirpath, _, files in os.walk(path):
+        for name in files:
+            total += os.path.getsize(os.path.join(dirpath, name))
+    return total
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--atlas", action="store_true", help="pack each size/scale into one atlas sheet")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(ICON_SIZES), help="logical icon sizes")
+    parser.add_argument("--clean", action="store_true", help="remove the existing assets/ folder first")
+    args = parser.parse_args(argv)
+
+    if args.clean and os.path.isdir(ASSET_DIR):
+        shutil.rmtree(ASSET_DIR)
+    build(sizes=tuple(args.sizes), atlas=args.atlas)
+    sources = sum(_size_of(os.path.join(ROOT, folder)) for folder in SOURCE_FOLDERS)
+    print(
+        f"{len(_source_images(ROOT))} images: sources {sources / 1024:.0f} KB -> "
+        f"assets {_size_of(ASSET_DIR) / 1024:.0f} KB",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
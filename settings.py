@@ -0,0 +1,99 @@
+"""settings.py - Cached add-on settings for the open profile (no Anki deps).
+
+SETTINGS is loaded from the collection config once on profile load; the review
+and answer paths read its attributes instead of calling col.get_config, which
+goes through Anki's backend. Changes go through SETTINGS.set(), which writes the
+config, updates the attribute and notifies subscribers (injectors, HUD).
+"""
+from typing import Any, Callable, Dict, List, Tuple
+
+try:
+    from .debug import debug_log as _debug_log  # type: ignore
+except Exception:
+    try:
+        from debug import debug_log as _debug_log  # type: ignore
+    except Exception:
+        def _debug_log(msg: str) -> None:
+            pass
+
+# attribute -> (config key, default)
+SETTING_KEYS: Dict[str, Tuple[str, Any]] = {
+    "review_hud_enabled": ("ankiscape_review_hud_enabled", True),
+    "floating_xp_enabled": ("ankiscape_floating_xp_enabled", True),
+    "popups_enabled": ("ankiscape_popups_enabled", True),
+    "floating_enabled": ("ankiscape_floating_enabled", True),
+    "floating_position": ("ankiscape_floating_position", "right"),
+}
+FLOATING_POSITIONS = ("left", "right")
+
+
+def _normalise(name: str, value: Any) -> Any:
+    if name == "floating_position":
+        return value if value in FLOATING_POSITIONS else "right"
+    return bool(value)
+
+
+class Settings:
+    """Typed snapshot of the add-on settings. Subscribers are called as fn(name, value)."""
+
+    review_hud_enabled: bool
+    floating_xp_enabled: bool
+    popups_enabled: bool
+    floating_enabled: bool
+    floating_position: str
+
+    def __init__(self):
+        self._col = None
+        self._subscribers: List[Callable[[str, Any], None]] = []
+        self._set_defaults()
+
+    def _set_defaults(self) -> None:
+        for name, (_key, default) in SETTING_KEYS.items():
+            setattr(self, name, default)
+
+    def load(self, col) -> None:
+        """Read every setting from col (one get_config per key) and keep col for writes."""
+        self._col = col
+        for name, (key, default) in SETTING_KEYS.items():
+            try:
+                value = col.get_config(key, default)
+            except Exception:
+                value = default
+            setattr(self, name, _normalise(name, value))
+
+    def unload(self, *_args, **_kwargs) -> None:
+        """Forget the profile (profile close); attributes fall back to defaults."""
+        self._col = None
+        self._set_defaults()
+
+    def set(self, name: str, value: Any) -> bool:
+        """Persist and apply one setting. Returns True if the value changed."""
+        key, _default = SETTING_KEYS[name]
+        value = _normalise(name, value)
+        if self._col is not None:
+            try:
+                self._col.set_config(key, value)
+            except Exception as e:
+                _debug_log(f"settings: could not write {key}: {e}")
+        if getattr(self, name) == value:
+            return False
+        setattr(self, name, value)
+        for fn in list(self._subscribers):
+            try:
+                fn(name, value)
+            except Exception as e:
+                _debug_log(f"settings: subscriber failed for {name}: {e}")
+        return True
+
+    def subscribe(self, fn: Callable[[str, Any], None]) -> None:
+        if fn not in self._subscribers:
+            self._subscribers.append(fn)
+
+    def unsubscribe(self, fn: Callable[[str, Any], None]) -> None:
+        try:
+            self._subscribers.remove(fn)
+        except ValueError:
+            pass
+
+
+SETTINGS = Settings()
@@ -0,0 +1,244 @@
+"""simulate_pure.py - Batch simulation of many skill actions (no Anki deps).
+
+simulate_batch runs N Mining or Woodcutting answers in one call, applying
+level-ups along the way, for bulk catch-up, balance analysis and benchmarks.
+
+- With NumPy available, all success/gem rolls are drawn in bulk and applied
+  one level segment at a time (cumsum + searchsorted to find each level-up);
+  gem picks (and tree drops) go through the source's compiled alias table (loot_pure).
+- Without NumPy (Anki does not bundle it) a scalar loop is used that replays
+  exactly what on_good_answer does: the same draws, in the same order, through
+  mining_delta_pure / woodcutting_delta_pure (including TREE_DROP_TABLES).
+
+Seed contract: for a given seed each path is deterministic. The scalar path
+draws from random.Random(seed), the NumPy path from numpy.random.default_rng(seed);
+the two agree statistically, not draw-for-draw.
+"""
+import random
+
+try:
+    import numpy as np  # type: ignore
+    HAS_NUMPY = True
+except Exception:
+    np = None  # type: ignore
+    HAS_NUMPY = False
+
+try:
+    from .constants import (
+        ORE_DATA,
+        TREE_DATA,
+        GEM_DATA,
+        GEM_DROP_CHANCE,
+        ORE_DROP_TABLES,
+        TREE_DROP_TABLES,
+        LOOT_CONTENT_VERSION,
+        EXP_TABLE,
+        BASE_MINING_PROBABILITY,
+        BASE_WOODCUTTING_PROBABILITY,
+        LEVEL_BONUS_FACTOR,
+    )
+    from .loot_pure import get_loot_table
+    from .logic_pure import (
+        InventoryDelta,
+        calculate_probability_with_level,
+        calculate_new_level,
+        get_level_curve,
+        mining_delta_pure,
+        woodcutting_delta_pure,
+    )
+except Exception:
+    # Fallback for direct module import in tests
+    from constants import (  # type: ignore
+        ORE_DATA,
+        TREE_DATA,
+        GEM_DATA,
+        GEM_DROP_CHANCE,
+        ORE_DROP_TABLES,
+        TREE_DROP_TABLES,
+        LOOT_CONTENT_VERSION,
+        EXP_TABLE,
+        BASE_MINING_PROBABILITY,
+        BASE_WOODCUTTING_PROBABILITY,
+        LEVEL_BONUS_FACTOR,
+    )
+    from loot_pure import get_loot_table  # type: ignore
+    from logic_pure import (  # type: ignore
+        InventoryDelta,
+        calculate_probability_with_level,
+        calculate_new_level,
+        get_level_curve,
+        mining_delta_pure,
+        woodcutting_delta_pure,
+    )
+
+_MAX_LEVEL = 99
+
+
+class BatchResult:
+    """Outcome of simulate_batch.
+
+    delta: InventoryDelta with every item gained (commit it to apply the batch)
+    xp / level: final skill XP and level
+    exp_gained: XP earned during the batch
+    successes: number of successful actions
+    trajectory: [(actions completed, level)] starting with (0, level_start) and
+        one entry per level-up
+    """
+    __slots__ = ("delta", "xp", "level", "exp_gained", "successes", "trajectory")
+
+    def __init__(self, delta, xp, level, exp_gained, successes, trajectory):
+        self.delta = delta
+        self.xp = xp
+        self.level = level
+        self.exp_gained = exp_gained
+        self.successes = successes
+        self.trajectory = trajectory
+
+    def __repr__(self):
+        return (
+            f"BatchResult(level={self.level}, xp={self.xp}, successes={self.successes}, "
+            f"delta={self.delta.changes!r})"
+        )
+
+
+def _skill_spec(skill, source):
+    if skill == "Mining":
+        return ORE_DATA[source], BASE_MINING_PROBABILITY
+    if skill == "Woodcutting":
+        return TREE_DATA[source], BASE_WOODCUTTING_PROBABILITY
+    raise ValueError(f"simulate_batch supports Mining and Woodcutting, not {skill!r}")
+
+
+def _success_probability(level, base, source_probability):
+    return calculate_probability_with_level(level, base, LEVEL_BONUS_FACTOR, source_probability, cap=0.95)
+
+
+def simulate_batch(skill, source, n, level_start=1, xp_start=0.0, seed=None, use_numpy=None,
+                   gem_drop_chance=GEM_DROP_CHANCE):
+    """Simulate n answers for skill ("Mining"/"Woodcutting") on source (ore/tree name).
+    use_numpy: None picks NumPy when available; False forces the scalar path.
+    """
+    n = int(n)
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    spec, base = _skill_spec(skill, source)
+    if use_numpy is None:
+        use_numpy = HAS_NUMPY
+    if use_numpy and not HAS_NUMPY:
+        raise RuntimeError("NumPy is not available")
+    if use_numpy:
+        return _simulate_numpy(skill, source, spec, base, n, level_start, xp_start, seed, gem_drop_chance)
+    return _simulate_scalar(skill, source, spec, base, n, level_start, xp_start, seed, gem_drop_chance)
+
+
+def _simulate_scalar(skill, source, spec, base, n, level, xp, seed, gem_drop_chance):
+    rng = random.Random(seed)
+    gem_data = ORE_DROP_TABLES.get(source, GEM_DATA)
+    tree_drops = TREE_DROP_TABLES.get(source) if skill == "Woodcutting" else None
+    total = InventoryDelta()
+    exp_gained = 0.0
+    successes = 0
+    trajectory = [(0, level)]
+    for i in range(n):
+        probability = _success_probability(level, base, spec["probability"])
+        # Same draw order as on_good_answer
+        if skill == "Mining":
+            r_action, r_gem_chance, r_gem_pick = rng.random(), rng.random(), rng.random()
+            delta, exp, ok, _ = mining_delta_pure(
+                source, ORE_DATA, gem_data, r_action, probability, r_gem_chance, r_gem_pick, gem_drop_chance,
+                loot_version=LOOT_CONTENT_VERSION,
+            )
+        else:
+            r_action = rng.random()
+            r_drop = rng.random() if tree_drops else None
+            delta, exp, ok = woodcutting_delta_pure(
+                source, TREE_DATA, r_action, probability, tree_drops, r_drop, loot_version=LOOT_CONTENT_VERSION
+            )
+        if not ok:
+            continue
+        successes += 1
+        for item, amount in delta.changes.items():
+            total.add(item, amount)
+        xp += exp
+        exp_gained += exp
+        new_level = calculate_new_level(xp, level, EXP_TABLE)
+        if new_level > level:
+            level = new_level
+            trajectory.append((i + 1, level))
+    return BatchResult(total, xp, level, exp_gained, successes, trajectory)
+
+
+def _drop_exp(spec) -> float:
+    return float(spec.get("exp", 0)) if isinstance(spec, dict) else 0.0
+
+
+def _simulate_numpy(skill, source, spec, base, n, level, xp, seed, gem_drop_chance):
+    rng = np.random.default_rng(seed)
+    curve = get_level_curve(EXP_TABLE)
+    thresholds = curve.thresholds
+    source_exp = float(spec.get("exp", 0))
+    gem_table = None
+    if skill == "Mining":
+        gem_data = ORE_DROP_TABLES.get(source, GEM_DATA)
+        gem_table = get_loot_table(gem_data, LOOT_CONTENT_VERSION)
+    elif TREE_DROP_TABLES.get(source):
+        gem_data = TREE_DROP_TABLES[source]
+        gem_table = get_loot_table(gem_data, LOOT_CONTENT_VERSION)
+    # Drop outcomes by alias-table index; index len(gem_names) means "no drop"
+    gem_names = list(gem_table.outcomes) if gem_table else []
+    gem_exp = np.array([_drop_exp(gem_data.get(g)) for g in gem_names] + [0.0]) if gem_names else None
+    gem_counts = np.zeros(len(gem_names) + 1, dtype=np.int64) if gem_names else None
+
+    done = 0
+    successes = 0
+    exp_gained = 0.0
+    trajectory = [(0, level)]
+    while done < n:
+        probability = _success_probability(level, base, spec["probability"])
+        remaining = n - done
+        if level >= _MAX_LEVEL or level >= len(thresholds) or probability <= 0:
+            chunk = remaining
+            next_threshold = None
+        else:
+            next_threshold = thresholds[level]
+            # Draw roughly enough rolls to reach the next level; unused rolls are discarded
+            per_action = max(probability * source_exp, 1e-9)
+            chunk = min(remaining, max(1, int((next_threshold - xp) / per_action * 1.25) + 64))
+        success = rng.random(chunk) < probability
+        if gem_names:
+            # Mining rolls the gem chance first; a tree drop is picked on every success
+            dropped = success
+            if skill == "Mining":
+                dropped = success & (rng.random(chunk) < gem_drop_chance)
+            gem_idx = gem_table.sample_indices(rng.random(chunk))
+            gem_idx = np.where(dropped, gem_idx, len(gem_names))
+            action_exp = success * source_exp + gem_exp[gem_idx]
+        else:
+            gem_idx = None
+            action_exp = success * source_exp
+        cum = xp + np.cumsum(action_exp)
+        take = chunk
+        if next_threshold is not None:
+            cross = int(np.searchsorted(cum, next_threshold, side="left"))
+            if cross < chunk:
+                take = cross + 1
+        if take:
+            xp = float(cum[take - 1])
+        gained = float(action_exp[:take].sum())
+        exp_gained += gained
+        successes += int(success[:take].sum())
+        if gem_names:
+            gem_counts += np.bincount(gem_idx[:take], minlength=len(gem_names) + 1)
+        done += take
+        new_level = calculate_new_level(xp, level, EXP_TABLE)
+        if new_level > level:
+            level = new_level
+            trajectory.append((done, level))
+
+    total = InventoryDelta()
+    if successes:
+        total.add(source, successes)
+    for i, gem in enumerate(gem_names):
+        if gem and gem_counts[i]:
+            total.add(gem, int(gem_counts[i]))
+    return BatchResult(total, xp, level, exp_gained, successes, trajectory)
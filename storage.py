@@ -2,25 +2,200 @@
 
 - player_data persists a 'config_version' which is updated to the
     CURRENT_CONFIG_VERSION on load via storage_pure.migrate_loaded_data.
+- Since config version 3 the blob is stored packed by storage_pure.PlayerDataCodec;
+    unpacked (version 1/2) blobs still load and are packed on the next save.
 - current_skill is stored separately under the 'ankiscape_current_skill' key.
+- Saves during review go through a write-behind layer (schedule_save) that
+    coalesces repeated saves into one config write per interval. Pending saves
+    are flushed explicitly on profile close, reviewer exit and before sync.
+- With ankiscape_storage_backend = "journal", awards are also appended to a
+    sidecar SQLite journal (journal.py). Write-behind timer flushes then only
+    snapshot the journal; the config blob is written at the explicit flush
+    points so sync still carries it.
 """
+import os
+import time
+
 from aqt import mw
-from .constants import ORE_DATA
-from .storage_pure import default_player_data, migrate_loaded_data
+from .constants import CODEC_ACHIEVEMENTS, CODEC_ITEMS, ORE_DATA
+from .storage_pure import default_player_data, migrate_loaded_data, WriteBehindState
+from .storage_pure import PlayerDataCodec, pack_player_data, unpack_stored_data
+from .journal import BACKEND_CONFIG, BACKEND_JOURNAL, JOURNAL_FILENAME, Journal, make_event
+
+try:
+    from .debug import debug_log as _debug_log  # type: ignore
+except Exception:
+    def _debug_log(msg: str) -> None:
+        pass
+
+
+_JOURNAL = None  # Journal when the journal backend is enabled for this profile
+_CODEC = PlayerDataCodec(CODEC_ITEMS, CODEC_ACHIEVEMENTS)
 
 
 def load_player_data():
-    """Load player data and current skill from Anki config."""
+    """Load player data and current skill from Anki config, or from the journal when it is newer."""
     loaded = mw.col.get_config("ankiscape_player_data")
     if loaded:
-        player_data = migrate_loaded_data(dict(loaded), ORE_DATA)
+        player_data = migrate_loaded_data(unpack_stored_data(loaded, _CODEC), ORE_DATA)
     else:
         player_data = default_player_data(ORE_DATA)
     current_skill = mw.col.get_config("ankiscape_current_skill", default="None")
+    if _open_journal():
+        try:
+            state = _JOURNAL.load()
+            saved_at = float(mw.col.get_config("ankiscape_saved_at", default=0) or 0)
+            if state is not None and state[2] >= saved_at:
+                player_data = migrate_loaded_data(state[0], ORE_DATA)
+                current_skill = state[1] or current_skill
+            else:
+                # First run (or config synced from elsewhere is newer): bring the blob in
+                _JOURNAL.snapshot(player_data, current_skill)
+        except Exception as e:
+            _debug_log(f"storage: journal load failed, using config: {e}")
     return player_data, current_skill
 
 
 def save_player_data(player_data: dict, current_skill: str) -> None:
-    """Persist player data and current skill to Anki config."""
-    mw.col.set_config("ankiscape_player_data", player_data)
+    """Persist player data (packed) and current skill to Anki config."""
+    mw.col.set_config("ankiscape_player_data", pack_player_data(player_data, _CODEC))
     mw.col.set_config("ankiscape_current_skill", current_skill)
+    mw.col.set_config("ankiscape_saved_at", time.time())
+    if _JOURNAL is not None:
+        _JOURNAL.snapshot(player_data, current_skill)
+
+
+# --- Journal backend ---
+
+def _open_journal() -> bool:
+    """Open (or close) the journal to match the profile's backend setting."""
+    global _JOURNAL
+    backend = mw.col.get_config("ankiscape_storage_backend", default=BACKEND_CONFIG)
+    if backend != BACKEND_JOURNAL:
+        close_journal()
+        return False
+    if _JOURNAL is None:
+        try:
+            path = os.path.join(mw.pm.profileFolder(), JOURNAL_FILENAME)
+            _JOURNAL = Journal(path)
+            _debug_log(f"storage: journal backend at {path}")
+        except Exception as e:
+            _debug_log(f"storage: journal unavailable: {e}")
+            _JOURNAL = None
+    return _JOURNAL is not None
+
+
+def record_award(skill: str, xp: float, delta=None, card_id=None, fields=None, achievements=()) -> None:
+    """Append one award to the journal (no-op with the config backend)."""
+    if _JOURNAL is None:
+        return
+    try:
+        _JOURNAL.append(make_event(skill, xp, delta, card_id, fields, achievements))
+    except Exception as e:
+        _debug_log(f"storage: journal append failed: {e}")
+
+
+def begin_award() -> None:
+    """Hold journal snapshots until the award's event is recorded (see Journal.begin_award)."""
+    if _JOURNAL is not None:
+        _JOURNAL.begin_award()
+
+
+def end_award() -> None:
+    if _JOURNAL is not None:
+        _JOURNAL.end_award()
+
+
+def close_journal(*_args, **_kwargs) -> None:
+    """Write out and close the journal (profile close). Accepts hook arguments."""
+    global _JOURNAL
+    journal, _JOURNAL = _JOURNAL, None
+    if journal is not None:
+        try:
+            journal.close()
+        except Exception:
+            _debug_log("storage: journal close failed")
+
+
+# --- Write-behind layer ---
+_WRITE_BEHIND = WriteBehindState()
+_PENDING = None  # (player_data, current_skill) of the most recent schedule_save call
+_TIMER_GEN = 0  # invalidates timers armed before a flush
+_CONFIG_STALE = False  # a timer flush went to the journal only
+
+
+def schedule_save(player_data: dict, current_skill: str) -> None:
+    """Mark player data dirty and persist it later, coalescing repeated saves.
+    Falls back to an immediate write when no Qt event loop is available.
+    """
+    global _PENDING
+    _PENDING = (player_data, current_skill)
+    if _WRITE_BEHIND.mark_dirty(time.monotonic()):
+        _arm_timer(_WRITE_BEHIND.interval)
+
+
+def has_pending_save() -> bool:
+    return _WRITE_BEHIND.dirty or _CONFIG_STALE
+
+
+def flush_pending_save(*_args, **_kwargs) -> bool:
+    """Write any pending player data now. Returns True if a write happened.
+    Accepts and ignores hook arguments so it can be registered on any Anki hook.
+    """
+    global _TIMER_GEN, _CONFIG_STALE
+    if not has_pending_save() or _PENDING is None:
+        return False
+    try:
+        save_player_data(*_PENDING)
+    except Exception:
+        # Keep the state dirty so the next flush point retries
+        _debug_log("storage: write-behind flush failed")
+        return False
+    _debug_log(f"storage: write-behind flush ({_WRITE_BEHIND.pending_saves} saves coalesced)")
+    _WRITE_BEHIND.mark_flushed()
+    _CONFIG_STALE = False
+    _TIMER_GEN += 1
+    return True
+
+
+def _flush_to_journal() -> None:
+    """Timer flush with the journal backend: snapshot locally, leave the config blob for the next flush point."""
+    global _CONFIG_STALE
+    try:
+        _JOURNAL.snapshot(*_PENDING)
+    except Exception:
+        _debug_log("storage: journal snapshot failed")
+        flush_pending_save()
+        return
+    _WRITE_BEHIND.mark_flushed()
+    _CONFIG_STALE = True
+
+
+def _arm_timer(delay_seconds: float) -> None:
+    global _TIMER_GEN
+    try:
+        from aqt.qt import QTimer  # type: ignore
+    except Exception:
+        QTimer = None  # type: ignore
+    if QTimer is None:
+        flush_pending_save()
+        return
+    _TIMER_GEN += 1
+    gen = _TIMER_GEN
+    try:
+        QTimer.singleShot(int(delay_seconds * 1000), lambda: _on_timer(gen))
+    except Exception:
+        flush_pending_save()
+
+
+def _on_timer(gen: int) -> None:
+    if gen != _TIMER_GEN or not _WRITE_BEHIND.dirty:
+        return
+    now = time.monotonic()
+    if _WRITE_BEHIND.due(now):
+        if _JOURNAL is not None and _PENDING is not None:
+            _flush_to_journal()
+        else:
+            flush_pending_save()
+    else:
+        _arm_timer(_WRITE_BEHIND.seconds_until_due(now))
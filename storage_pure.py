@@ -1,7 +1,10 @@
 # storage_pure.py - Pure helpers for migrating and defaulting player data (no Anki deps)
-from typing import Dict, Any
+import base64
+import json
+from typing import Dict, Any, Iterable, Tuple
 
-CURRENT_CONFIG_VERSION = 2
+# 3: the config blob is stored packed by PlayerDataCodec (see pack_player_data)
+CURRENT_CONFIG_VERSION = 3
 
 
 def default_player_data(ORE_DATA: Dict[str, Any]) -> Dict[str, Any]:
@@ -75,3 +78,238 @@ def migrate_loaded_data(loaded: Dict[str, Any], ORE_DATA: Dict[str, Any]) -> Dic
     # Bump version to current
     data["config_version"] = CURRENT_CONFIG_VERSION
     return data
+
+
+# Write-behind defaults: coalesce saves so config is written at most a few times per minute.
+WRITE_BEHIND_INTERVAL_SECONDS = 20.0
+
+
+class WriteBehindState:
+    """Pure bookkeeping for coalesced (write-behind) saves.
+
+    Callers mark the state dirty on every change; a flush is due once the oldest
+    unsaved change is at least `interval` seconds old. Time is passed in so the
+    policy can be unit-tested without timers.
+    """
+
+    def __init__(self, interval: float = WRITE_BEHIND_INTERVAL_SECONDS):
+        self.interval = float(interval)
+        self.dirty = False
+        self.dirty_since: float = 0.0
+        self.pending_saves = 0
+        self.flushes = 0
+
+    def mark_dirty(self, now: float) -> bool:
+        """Record a change. Returns True if this change made a clean state dirty."""
+        self.pending_saves += 1
+        if self.dirty:
+            return False
+        self.dirty = True
+        self.dirty_since = float(now)
+        return True
+
+    def due(self, now: float) -> bool:
+        """Return True if a dirty state has waited at least the coalescing interval."""
+        return self.dirty and (float(now) - self.dirty_since) >= self.interval
+
+    def seconds_until_due(self, now: float) -> float:
+        if not self.dirty:
+            return 0.0
+        return max(0.0, self.interval - (float(now) - self.dirty_since))
+
+    def mark_flushed(self) -> None:
+        self.dirty = False
+        self.dirty_since = 0.0
+        self.pending_saves = 0
+        self.flushes += 1
+
+
+# --- Compact codec for the stored config blob ---
+#
+# Layout (all integers are unsigned LEB128 varints):
+#   codec version byte
+#   level, exp * EXP_SCALE          for each of CODEC_SKILLS
+#   current ore/tree/bar/craft      name ref: item id + 1, or 0 + utf-8 length + bytes
+#   inventory                       count, then (item id gap, amount) pairs for non-zero
+#                                   known items, ordered by id
+#   completed achievements          bitset over achievement ids: byte length + bytes
+#   extras                          utf-8 length + JSON of everything else (unknown keys,
+#                                   unknown items/achievements, negative or fractional values)
+# progress_to_next and zero inventory counts are not stored; migrate_loaded_data restores them.
+
+CODEC_VERSION = 1
+CODEC_SKILLS = ("mining", "woodcutting", "smithing", "crafting")
+CODEC_SELECTIONS = ("current_ore", "current_tree", "current_bar", "current_craft")
+EXP_SCALE = 100  # exp is kept to 2 decimal places
+# Absolute slack for float noise in exp * EXP_SCALE; anything more needs the extras section
+_EXP_EPSILON = 1e-6
+_DROPPED_KEYS = ("config_version", "progress_to_next")
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buf: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _is_count(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+class PlayerDataCodec:
+    """Packs player data into a few dozen bytes using stable item and achievement ids.
+
+    items/achievements are append-only name tables (constants.CODEC_ITEMS /
+    CODEC_ACHIEVEMENTS); a name's position is its id in saved data.
+    """
+
+    def __init__(self, items: Iterable[str], achievements: Iterable[str]):
+        self.items = tuple(items)
+        self.achievements = tuple(achievements)
+        self._item_ids = {name: i for i, name in enumerate(self.items)}
+        self._achievement_ids = {name: i for i, name in enumerate(self.achievements)}
+
+    def encode(self, player_data: Dict[str, Any]) -> bytes:
+        out = bytearray([CODEC_VERSION])
+        extras: Dict[str, Any] = {}
+        for skill in CODEC_SKILLS:
+            level_key, exp_key = f"{skill}_level", f"{skill}_exp"
+            level = player_data.get(level_key, 1)
+            exp = player_data.get(exp_key, 0)
+            fixed = round(exp * EXP_SCALE) if isinstance(exp, (int, float)) and exp >= 0 else None
+            if not _is_count(level) or fixed is None or abs(fixed - exp * EXP_SCALE) > _EXP_EPSILON:
+                # Not representable: keep both values exact in extras
+                extras[level_key], extras[exp_key] = level, exp
+                level, fixed = 0, 0
+            _write_varint(out, level)
+            _write_varint(out, fixed)
+        for key in CODEC_SELECTIONS:
+            name = player_data.get(key, "")
+            if not isinstance(name, str):
+                extras[key] = name
+                name = ""
+            item_id = self._item_ids.get(name)
+            if item_id is not None:
+                _write_varint(out, item_id + 1)
+            else:
+                raw = name.encode("utf-8")
+                out.append(0)
+                _write_varint(out, len(raw))
+                out += raw
+
+        packed = []
+        unknown_items = {}
+        for name, amount in (player_data.get("inventory") or {}).items():
+            item_id = self._item_ids.get(name)
+            if amount == 0 and _is_count(amount):
+                continue
+            if item_id is None or not _is_count(amount):
+                unknown_items[name] = amount
+            else:
+                packed.append((item_id, amount))
+        packed.sort()
+        _write_varint(out, len(packed))
+        previous = 0
+        for item_id, amount in packed:
+            _write_varint(out, item_id - previous)
+            _write_varint(out, amount)
+            previous = item_id
+        if unknown_items:
+            extras["inventory"] = unknown_items
+
+        bits = bytearray((len(self.achievements) + 7) // 8)
+        unknown_achievements = []
+        for name in player_data.get("completed_achievements") or ():
+            achievement_id = self._achievement_ids.get(name)
+            if achievement_id is None:
+                unknown_achievements.append(name)
+            else:
+                bits[achievement_id >> 3] |= 1 << (achievement_id & 7)
+        while bits and bits[-1] == 0:
+            bits.pop()
+        _write_varint(out, len(bits))
+        out += bits
+        if unknown_achievements:
+            extras["completed_achievements"] = unknown_achievements
+
+        handled = {f"{skill}_{field}" for skill in CODEC_SKILLS for field in ("level", "exp")}
+        handled.update(CODEC_SELECTIONS, ("inventory", "completed_achievements"), _DROPPED_KEYS)
+        for key, value in player_data.items():
+            if key not in handled:
+                extras[key] = value
+        raw = json.dumps(extras, separators=(",", ":")).encode("utf-8") if extras else b""
+        _write_varint(out, len(raw))
+        out += raw
+        return bytes(out)
+
+    def decode(self, blob: bytes) -> Dict[str, Any]:
+        if not blob or blob[0] != CODEC_VERSION:
+            raise ValueError(f"unsupported player data codec version: {blob[:1]!r}")
+        pos = 1
+        data: Dict[str, Any] = {}
+        for skill in CODEC_SKILLS:
+            level, pos = _read_varint(blob, pos)
+            fixed, pos = _read_varint(blob, pos)
+            data[f"{skill}_level"] = level
+            data[f"{skill}_exp"] = fixed // EXP_SCALE if fixed % EXP_SCALE == 0 else fixed / EXP_SCALE
+        for key in CODEC_SELECTIONS:
+            ref, pos = _read_varint(blob, pos)
+            if ref:
+                data[key] = self.items[ref - 1]
+            else:
+                length, pos = _read_varint(blob, pos)
+                data[key] = blob[pos:pos + length].decode("utf-8")
+                pos += length
+
+        inventory: Dict[str, int] = {}
+        count, pos = _read_varint(blob, pos)
+        item_id = 0
+        for _ in range(count):
+            gap, pos = _read_varint(blob, pos)
+            amount, pos = _read_varint(blob, pos)
+            item_id += gap
+            inventory[self.items[item_id]] = amount
+        data["inventory"] = inventory
+
+        length, pos = _read_varint(blob, pos)
+        bits = blob[pos:pos + length]
+        pos += length
+        data["completed_achievements"] = [
+            name for i, name in enumerate(self.achievements) if i >> 3 < len(bits) and bits[i >> 3] >> (i & 7) & 1
+        ]
+
+        length, pos = _read_varint(blob, pos)
+        if length:
+            extras = json.loads(blob[pos:pos + length].decode("utf-8"))
+            inventory.update(extras.pop("inventory", {}))
+            data["completed_achievements"].extend(extras.pop("completed_achievements", []))
+            data.update(extras)
+        data["config_version"] = CURRENT_CONFIG_VERSION
+        return data
+
+
+def pack_player_data(player_data: Dict[str, Any], codec: PlayerDataCodec) -> Dict[str, Any]:
+    """The config value stored for player_data: {"config_version": 3, "packed": <base64>}."""
+    return {
+        "config_version": CURRENT_CONFIG_VERSION,
+        "packed": base64.b64encode(codec.encode(player_data)).decode("ascii"),
+    }
+
+
+def unpack_stored_data(stored: Dict[str, Any], codec: PlayerDataCodec) -> Dict[str, Any]:
+    """Player data dict from a stored config value; version 1/2 dicts are returned as they are."""
+    if isinstance(stored, dict) and "packed" in stored:
+        return codec.decode(base64.b64decode(stored["packed"]))
+    return dict(stored) if stored else {}
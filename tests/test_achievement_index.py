@@ -0,0 +1,104 @@
+import random
+import unittest
+
+from constants import ACHIEVEMENTS, ORE_DATA, TREE_DATA, BAR_DATA, CRAFTING_DATA
+from logic_pure import AchievementIndex, achievement_met, achievement_progress, get_newly_completed_achievements
+from storage_pure import default_player_data
+
+
+def _req(metric, keys, threshold):
+    return {"metric": metric, "keys": tuple(keys), "threshold": threshold}
+
+
+class TestAchievementIndex(unittest.TestCase):
+    def test_matches_full_scan_on_random_walk(self):
+        rng = random.Random(1234)
+        items = list(ORE_DATA) + list(TREE_DATA) + list(BAR_DATA) + list(CRAFTING_DATA)
+        fields = [f"{s}_level" for s in ("mining", "woodcutting", "smithing", "crafting")]
+        player = default_player_data(ORE_DATA)
+        reference = default_player_data(ORE_DATA)
+        index = AchievementIndex(ACHIEVEMENTS)
+        self.assertEqual(index.sync(player), [])
+        for _ in range(3000):
+            item = rng.choice(items)
+            delta = rng.choice([1, 1, 1, 5, 50, 400, -3])
+            for pd in (player, reference):
+                inv = pd["inventory"]
+                inv[item] = max(0, inv.get(item, 0) + delta)
+            changed_stats = ()
+            if rng.random() < 0.05:
+                field = rng.choice(fields)
+                player[field] = reference[field] = min(99, player.get(field, 1) + rng.randint(1, 10))
+                changed_stats = (field,)
+            expected = get_newly_completed_achievements(reference, ACHIEVEMENTS)
+            # Mirror check_achievements: completions feed back into "completed" requirements
+            while True:
+                reference["completed_achievements"].extend(expected)
+                more = get_newly_completed_achievements(reference, ACHIEVEMENTS)
+                if not more:
+                    break
+                expected = more
+            got = index.update(player, items=(item,), stats=changed_stats)
+            player["completed_achievements"].extend(got)
+            self.assertEqual(sorted(player["completed_achievements"]), sorted(reference["completed_achievements"]))
+        self.assertGreater(len(player["completed_achievements"]), 10)
+
+    def test_threshold_pointer_advances(self):
+        achievements = {
+            "A": {"requires": [_req("total", ["Clay"], 10)]},
+            "B": {"requires": [_req("total", ["Clay"], 20)]},
+        }
+        index = AchievementIndex(achievements)
+        player = {"inventory": {"Clay": 0}, "completed_achievements": []}
+        index.sync(player)
+        self.assertEqual(index.next_threshold("total", ["Clay"]), 10)
+        player["inventory"]["Clay"] = 25
+        self.assertEqual(index.update(player, items=["Clay"]), ["A", "B"])
+        self.assertIsNone(index.next_threshold("total", ["Clay"]))
+        # Items nothing watches are ignored
+        self.assertEqual(index.update(player, items=["Unknown"]), [])
+
+    def test_multi_requirement_needs_all_clauses_at_once(self):
+        achievements = {"Both": {"requires": [_req("total", ["Clay"], 5), _req("stat", ["mining_level"], 10)]}}
+        index = AchievementIndex(achievements)
+        player = {"inventory": {"Clay": 5}, "mining_level": 1, "completed_achievements": []}
+        self.assertEqual(index.sync(player), [])
+        player["inventory"]["Clay"] = 0
+        player["mining_level"] = 10
+        self.assertEqual(index.update(player, items=["Clay"], stats=["mining_level"]), [])
+        player["inventory"]["Clay"] = 5
+        self.assertEqual(index.update(player, items=["Clay"]), ["Both"])
+
+    def test_completed_metric_and_legacy_condition(self):
+        achievements = {
+            "A": {"requires": [_req("total", ["Clay"], 1)]},
+            "Legacy": {"condition": lambda p: p["inventory"].get("Clay", 0) >= 2},
+            "All": {"requires": [_req("completed", [], 2)]},
+        }
+        index = AchievementIndex(achievements)
+        player = {"inventory": {"Clay": 2}, "completed_achievements": []}
+        self.assertEqual(index.sync(player), ["A", "Legacy", "All"])
+        self.assertTrue(achievement_met(player, achievements["Legacy"]))
+
+    def test_rebinds_on_new_player_data(self):
+        achievements = {"A": {"requires": [_req("total", ["Clay"], 1)]}}
+        index = AchievementIndex(achievements)
+        index.sync({"inventory": {}, "completed_achievements": []})
+        other = {"inventory": {"Clay": 3}, "completed_achievements": []}
+        self.assertEqual(index.update(other, items=[]), ["A"])
+
+
+class TestAchievementProgress(unittest.TestCase):
+    def test_least_complete_requirement_capped_at_target(self):
+        data = {"requires": [_req("total", ["Clay"], 10), _req("stat", ["mining_level"], 50)]}
+        player = {"inventory": {"Clay": 25}, "mining_level": 5}
+        self.assertEqual(achievement_progress(player, data), (5, 50))
+        player["mining_level"] = 60
+        self.assertEqual(achievement_progress(player, data), (10, 10))
+
+    def test_legacy_condition_has_no_progress(self):
+        self.assertIsNone(achievement_progress({}, {"condition": lambda pd: True}))
+
+
+if __name__ == "__main__":
+    unittest.main()
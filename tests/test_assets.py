@@ -0,0 +1,111 @@
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+
+from assets import AssetIndex, INDEX_NAME, INDEX_VERSION, pack_atlas, pick_variant, variant_name
+
+HAS_PIL = importlib.util.find_spec("PIL") is not None
+
+
+ALL = [(s, sc) for s in (28, 32, 40, 48) for sc in (1, 2)]
+
+
+class TestPickVariant(unittest.TestCase):
+    def test_exact_size_per_dpr(self):
+        self.assertEqual(pick_variant(ALL, 28, 1.0), (28, 1))
+        self.assertEqual(pick_variant(ALL, 28, 2.0), (28, 2))
+        self.assertEqual(pick_variant(ALL, 30, 1.0), (32, 1))
+
+    def test_never_upscales(self):
+        # 64 px at 1x is covered by a 2x variant with enough pixels
+        self.assertEqual(pick_variant(ALL, 64, 1.0), (32, 2))
+        self.assertIsNone(pick_variant(ALL, 64, 2.0))
+        self.assertIsNone(pick_variant([], 28, 1.0))
+
+    def test_fractional_dpr_picks_fewest_covering_pixels(self):
+        # 28 px at 1.5x needs 42 device px: 48@1x beats 28@2x (56 px)
+        self.assertEqual(pick_variant(ALL, 28, 1.5), (48, 1))
+        self.assertEqual(pick_variant([(28, 1), (28, 2)], 28, 1.5), (28, 2))
+
+    def test_variant_name(self):
+        self.assertEqual(variant_name("ores/Copper ore.png", 28, 1), "ores/Copper ore@28.png")
+        self.assertEqual(variant_name("ores/Copper ore.png", 28, 2), "ores/Copper ore@28@2x.png")
+
+
+class TestPackAtlas(unittest.TestCase):
+    def test_rects_do_not_overlap_and_fit(self):
+        sizes = {f"img{i}": (56, 56) for i in range(40)}
+        width, height, rects = pack_atlas(sizes, max_width=512)
+        self.assertEqual(set(rects), set(sizes))
+        boxes = list(rects.values())
+        for i, (x, y, w, h) in enumerate(boxes):
+            self.assertLessEqual(x + w, width)
+            self.assertLessEqual(y + h, height)
+            for (x2, y2, w2, h2) in boxes[i + 1:]:
+                self.assertTrue(x + w <= x2 or x2 + w2 <= x or y + h <= y2 or y2 + h2 <= y)
+        self.assertLessEqual(width, 512)
+
+
+class TestAssetIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = self.tmp.name
+        self.asset_dir = os.path.join(self.base, "assets")
+        os.makedirs(self.asset_dir)
+        self.original = os.path.join(self.base, "ores", "Clay.png")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write_index(self, data):
+        with open(os.path.join(self.asset_dir, INDEX_NAME), "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def test_missing_index_falls_back_to_original(self):
+        index = AssetIndex(self.asset_dir, self.base)
+        self.assertEqual(index.lookup(self.original, 28, 2.0), ("file", self.original))
+
+    def test_file_and_atlas_variants(self):
+        self._write_index({
+            "version": INDEX_VERSION,
+            "variants": {"ores/Clay.png": {"28@1": "assets/ores/Clay@28.png"}},
+            "atlases": {"28@2": {"file": "atlas_28@2x.png", "rects": {"ores/Clay.png": [56, 0, 56, 56]}}},
+        })
+        index = AssetIndex(self.asset_dir, self.base)
+        self.assertEqual(index.lookup(self.original, 28, 1.0),
+                         ("file", os.path.join(self.base, "assets", "ores", "Clay@28.png")))
+        self.assertEqual(index.lookup(self.original, 28, 2.0),
+                         ("atlas", os.path.join(self.asset_dir, "atlas_28@2x.png"), (56, 0, 56, 56)))
+        # Too large for any variant, or outside the add-on folder
+        self.assertEqual(index.lookup(self.original, 48, 2.0), ("file", self.original))
+        outside = os.path.join(os.path.dirname(self.base), "x.png")
+        self.assertEqual(index.lookup(outside, 28, 1.0), ("file", outside))
+
+    def test_unknown_version_is_ignored(self):
+        self._write_index({"version": INDEX_VERSION + 1, "variants": {"ores/Clay.png": {"28@1": "a.png"}}})
+        index = AssetIndex(self.asset_dir, self.base)
+        self.assertTrue(index.empty)
+
+
+@unittest.skipUnless(HAS_PIL, "Pillow not installed")
+class TestOptimizeAssets(unittest.TestCase):
+    def test_build_writes_variants_and_index(self):
+        from PIL import Image  # type: ignore
+        import optimize_assets
+
+        with tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(root, "ores"))
+            Image.new("RGBA", (200, 100), (255, 0, 0, 255)).save(os.path.join(root, "ores", "Clay.png"))
+            asset_dir = os.path.join(root, "assets")
+            index = optimize_assets.build(root, asset_dir, sizes=(28,), atlas=False)
+            rel = index["variants"]["ores/Clay.png"]["28@2"]
+            with Image.open(os.path.join(root, *rel.split("/"))) as img:
+                self.assertEqual(img.size, (56, 56))
+            atlas_index = optimize_assets.build(root, asset_dir, sizes=(28,), atlas=True)
+            self.assertEqual(atlas_index["atlases"]["28@1"]["rects"]["ores/Clay.png"], [0, 0, 28, 28])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import random
+import unittest
+
+from constants import BAR_DATA, CRAFTING_DATA, ORE_DATA, GEM_DATA
+from logic_pure import AvailabilityIndex, can_smelt_any_bar_pure, can_craft_item_pure
+
+
+def _scan(player):
+    inv = player["inventory"]
+    can_smelt = can_smelt_any_bar_pure(inv, player["smithing_level"], BAR_DATA)
+    can_craft = any(can_craft_item_pure(player["crafting_level"], inv, item, CRAFTING_DATA) for item in CRAFTING_DATA)
+    return can_smelt, can_craft
+
+
+class TestAvailabilityIndex(unittest.TestCase):
+    def test_empty_inventory(self):
+        player = {"inventory": {}, "smithing_level": 1, "crafting_level": 1}
+        index = AvailabilityIndex(BAR_DATA, CRAFTING_DATA).sync(player)
+        self.assertFalse(index.can_smelt_any)
+        self.assertFalse(index.can_craft_any)
+
+    def test_updates_from_items_and_levels(self):
+        player = {"inventory": {}, "smithing_level": 1, "crafting_level": 1}
+        index = AvailabilityIndex(BAR_DATA, CRAFTING_DATA).sync(player)
+        player["inventory"].update({"Copper ore": 1, "Tin ore": 1})
+        index.update(player, items=["Copper ore", "Tin ore"])
+        self.assertTrue(index.can_smelt_any)
+        self.assertTrue(index.is_ready("Smithing", "Bronze bar"))
+        player["inventory"]["Tin ore"] = 0
+        index.update(player, items=["Tin ore"])
+        self.assertFalse(index.can_smelt_any)
+        gated = {"Gold bar": {"level": 40, "ore_required": {"Gold ore": 1}}}
+        low = {"inventory": {"Gold ore": 1}, "smithing_level": 1}
+        index = AvailabilityIndex(gated, {}).sync(low)
+        self.assertFalse(index.can_smelt_any)
+        low["smithing_level"] = 40
+        index.update(low, stats=["smithing_level"])
+        self.assertTrue(index.can_smelt_any)
+
+    def test_matches_scan_on_random_walk(self):
+        rng = random.Random(7)
+        materials = sorted({m for spec in BAR_DATA.values() for m in spec["ore_required"]}
+                           | {m for spec in CRAFTING_DATA.values() for m in spec["requirements"]}
+                           | set(ORE_DATA) | set(GEM_DATA))
+        player = {"inventory": {}, "smithing_level": 1, "crafting_level": 1}
+        index = AvailabilityIndex(BAR_DATA, CRAFTING_DATA).sync(player)
+        for _ in range(2000):
+            item = rng.choice(materials)
+            player["inventory"][item] = max(0, player["inventory"].get(item, 0) + rng.choice([-2, -1, 1, 1, 3]))
+            stats = ()
+            if rng.random() < 0.05:
+                field = rng.choice(["smithing_level", "crafting_level"])
+                player[field] = rng.randint(1, 99)
+                stats = (field,)
+            index.update(player, items=[item], stats=stats)
+            self.assertEqual((index.can_smelt_any, index.can_craft_any), _scan(player))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from bridge import BridgeRouter, build_message, parse_message
+
+
+class TestParseMessage(unittest.TestCase):
+    def test_structured_and_legacy_forms(self):
+        self.assertEqual(parse_message(build_message("select", {"kind": "ore", "name": "Iron ore"})),
+                         ("select", {"kind": "ore", "name": "Iron ore"}))
+        self.assertEqual(parse_message("ankiscape_open_menu"), ("open_menu", None))
+        self.assertEqual(parse_message("ankiscape_log:a:b"), ("log", "a:b"))
+        self.assertEqual(parse_message("ankiscape_logbatch:[]"), ("logbatch", "[]"))
+
+    def test_malformed(self):
+        for msg in ("ankiscape:", "ankiscape:{bad", 'ankiscape:{"args": 1}', "ankiscape_", "ankiscapeX"):
+            self.assertIsNone(parse_message(msg), msg)
+
+
+class TestBridgeRouter(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.router = BridgeRouter()
+        self.router.register("open_menu", lambda args, ctx: self.calls.append(("open_menu", args)))
+        self.router.register("echo", lambda args, ctx: args)
+        self.router.register("log", lambda args, ctx: self.calls.append(("log", args)), marks_handled=False)
+
+    def test_other_messages_pass_through_untouched(self):
+        for handled in (False, True):
+            for msg in ("browse", "open:add", "study", 42, None):
+                self.assertEqual(self.router(handled, msg, None), (handled, msg))
+        self.assertEqual(self.calls, [])
+
+    def test_commands_dispatch(self):
+        self.assertEqual(self.router(False, "ankiscape_open_menu", None), (True, "ankiscape_open_menu"))
+        self.assertEqual(self.router(False, build_message("echo", [1, 2])), (True, [1, 2]))
+        self.assertEqual(self.router(True, "ankiscape_log:hi", None), (True, "ankiscape_log:hi"))
+        self.assertEqual(self.router(False, "ankiscape_log:hi", None), (False, "ankiscape_log:hi"))
+        self.assertEqual(self.calls, [("open_menu", None), ("log", "hi"), ("log", "hi")])
+
+    def test_unknown_and_failing_commands_keep_incoming_flag(self):
+        def boom(args, ctx):
+            raise RuntimeError("boom")
+
+        self.router.register("boom", boom)
+        for msg in ("ankiscape_nope", "ankiscape:{bad", "ankiscape_boom"):
+            self.assertEqual(self.router(False, msg, None), (False, msg))
+        self.router.unregister("boom")
+        self.assertEqual(self.router.commands(), ["echo", "log", "open_menu"])
+
+
+if __name__ == "__main__":
+    unittest.main()
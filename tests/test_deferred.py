@@ -0,0 +1,166 @@
+import unittest
+
+from deferred import PostAnswerQueue, RefreshScheduler, LatencyTracker, PRIORITY_AWARD, PRIORITY_UI
+
+
+class _ManualScheduler:
+    """Collects scheduled callbacks so tests control when the 'event loop' runs."""
+    def __init__(self):
+        self.callbacks = []
+
+    def __call__(self, callback):
+        self.callbacks.append(callback)
+        return True
+
+    def tick(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for cb in callbacks:
+            cb()
+
+
+class TestPostAnswerQueue(unittest.TestCase):
+    def test_runs_synchronously_without_event_loop(self):
+        ran = []
+        q = PostAnswerQueue(scheduler=lambda _cb: False)
+        q.submit(ran.append, 1)
+        self.assertEqual(ran, [1])
+        self.assertEqual(len(q), 0)
+
+    def test_deferred_until_tick_and_ordered(self):
+        sched = _ManualScheduler()
+        q = PostAnswerQueue(scheduler=sched)
+        ran = []
+        q.submit(ran.append, "ui-1", priority=PRIORITY_UI)
+        q.submit(ran.append, "award-1", priority=PRIORITY_AWARD)
+        q.submit(ran.append, "award-2", priority=PRIORITY_AWARD)
+        self.assertEqual(ran, [])
+        self.assertEqual(len(sched.callbacks), 1)  # one timer for many jobs
+        sched.tick()
+        self.assertEqual(ran, ["award-1", "award-2", "ui-1"])
+
+    def test_jobs_submitted_by_jobs_run_in_same_drain(self):
+        sched = _ManualScheduler()
+        q = PostAnswerQueue(scheduler=sched)
+        ran = []
+        def award():
+            ran.append("award")
+            q.submit(ran.append, "popup", priority=PRIORITY_UI)
+        q.submit(award)
+        q.drain()
+        self.assertEqual(ran, ["award", "popup"])
+        # The stale timer callback is harmless
+        sched.tick()
+        self.assertEqual(ran, ["award", "popup"])
+
+    def test_time_slice_yields_and_reschedules(self):
+        sched = _ManualScheduler()
+        q = PostAnswerQueue(scheduler=sched, slice_seconds=0.0)
+        ran = []
+        for i in range(3):
+            q.submit(ran.append, i)
+        sched.tick()
+        self.assertEqual(ran, [0])
+        self.assertEqual(len(sched.callbacks), 1)
+        sched.tick()
+        sched.tick()
+        self.assertEqual(ran, [0, 1, 2])
+
+    def test_failing_job_does_not_block_queue(self):
+        q = PostAnswerQueue(scheduler=lambda _cb: False)
+        ran = []
+        q.submit(lambda: 1 / 0)
+        q.submit(ran.append, "next")
+        self.assertEqual(ran, ["next"])
+
+
+class TestLatencyTracker(unittest.TestCase):
+    def test_stop_without_start(self):
+        self.assertIsNone(LatencyTracker().stop())
+
+    def test_stats(self):
+        t = LatencyTracker()
+        t.start()
+        ms = t.stop()
+        self.assertGreaterEqual(ms, 0.0)
+        self.assertEqual(t.count, 1)
+        self.assertEqual(t.max_ms, ms)
+        self.assertIsNone(t.stop())
+
+
+class TestRefreshScheduler(unittest.TestCase):
+    def test_coalesces_invalidations_into_one_flush(self):
+        sched = _ManualScheduler()
+        rs = RefreshScheduler(scheduler=sched)
+        renders = []
+        rs.register("hud", lambda: renders.append("hud"))
+        rs.register("toast", lambda: renders.append("toast"))
+        for _ in range(5):
+            rs.invalidate("toast")
+            rs.invalidate("hud")
+        self.assertEqual(len(sched.callbacks), 1)
+        self.assertEqual(renders, [])
+        sched.tick()
+        # Each dirty region once, in registration order
+        self.assertEqual(renders, ["hud", "toast"])
+        self.assertEqual(rs.flushes, 1)
+
+    def test_discard_drops_pending_regions(self):
+        sched = _ManualScheduler()
+        rs = RefreshScheduler(scheduler=sched)
+        renders = []
+        rs.register("hud", lambda: renders.append("hud"))
+        rs.register("menu", lambda: renders.append("menu"))
+        rs.invalidate("hud", "menu")
+        rs.discard("hud")
+        sched.tick()
+        self.assertEqual(renders, ["menu"])
+
+    def test_flushes_synchronously_without_event_loop(self):
+        rs = RefreshScheduler(scheduler=lambda _cb: False)
+        renders = []
+        rs.register("hud", lambda: renders.append("hud"))
+        rs.invalidate("hud")
+        self.assertEqual(renders, ["hud"])
+        self.assertFalse(rs.is_dirty("hud"))
+
+    def test_self_invalidating_region_is_not_left_dirty_without_event_loop(self):
+        rs = RefreshScheduler(scheduler=lambda _cb: False)
+        renders = []
+
+        def render_hud():
+            renders.append("hud")
+            rs.invalidate("hud")
+
+        rs.register("hud", render_hud)
+        rs.invalidate("hud")
+        self.assertEqual(len(renders), RefreshScheduler._MAX_SYNC_PASSES)
+        self.assertFalse(rs.is_dirty("hud"))
+
+    def test_invalidate_during_flush_runs_next_tick(self):
+        sched = _ManualScheduler()
+        rs = RefreshScheduler(scheduler=sched)
+        renders = []
+
+        def render_hud():
+            renders.append("hud")
+            rs.invalidate("position")
+
+        rs.register("position", lambda: renders.append("position"))
+        rs.register("hud", render_hud)
+        rs.invalidate("hud")
+        sched.tick()
+        self.assertEqual(renders, ["hud"])
+        sched.tick()
+        self.assertEqual(renders, ["hud", "position"])
+
+    def test_failing_renderer_does_not_block_others(self):
+        rs = RefreshScheduler(scheduler=lambda _cb: False)
+        renders = []
+        rs.register("bad", lambda: 1 / 0)
+        rs.register("ok", lambda: renders.append("ok"))
+        rs.invalidate("bad", "ok")
+        self.assertEqual(renders, ["ok"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,12 +11,17 @@ class TestHooksRegistration(unittest.TestCase):
                 "reviewer_question": [lambda *_: None],
                 "reviewer_answer": [lambda *_: None, lambda *_: None],
                 "answer_wrapper": lambda self, ease, _old: _old(self, ease),
+                "profile_will_close": [lambda: None],
+                "sync_will_start": [lambda: None],
             }
         )
         self.assertEqual(plan["profileLoaded"], 2)
         self.assertEqual(plan["reviewer_did_show_question"], 1)
         self.assertEqual(plan["reviewer_did_show_answer"], 2)
         self.assertEqual(plan["wrap_reviewer_answerCard"], 1)
+        self.assertEqual(plan["profile_will_close"], 1)
+        self.assertEqual(plan["reviewer_will_end"], 0)
+        self.assertEqual(plan["sync_will_start"], 1)
 
     def test_register_hooks_dry_run(self):
         plan = register_hooks(
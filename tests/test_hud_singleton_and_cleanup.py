@@ -84,7 +84,7 @@ class TestHUDSingletonAndCleanup(unittest.TestCase):
         # Backup
         self._bak_HAS_QT = _ui.HAS_QT
         self._bak_mw = _ui.mw
-        self._bak_REVIEW_HUD = getattr(_ui, "_REVIEW_HUD", None)
+        self._bak_OVERLAYS = _ui._OVERLAYS
         self._bak_ReviewHUD = getattr(_ui, "ReviewHUD", None)
         # Install fake Qt into sys.modules where ui._cleanup_extra_huds imports from
         self.fake_qt = types.ModuleType("aqt.qt")
@@ -95,7 +95,7 @@ class TestHUDSingletonAndCleanup(unittest.TestCase):
         self.mw = FakeMainWindow()
         _ui.mw = self.mw
         _ui.HAS_QT = True
-        _ui._REVIEW_HUD = None
+        _ui._OVERLAYS = _ui.OverlayRegistry()
         _ui.ReviewHUD = FakeHUD  # ensure construction doesn't require real Qt
         # Prepare stray top-level HUD and duplicate child HUD
         self.stray_top = FakeHUD(None)
@@ -106,7 +106,7 @@ class TestHUDSingletonAndCleanup(unittest.TestCase):
         # Restore
         self.ui.HAS_QT = self._bak_HAS_QT
         self.ui.mw = self._bak_mw
-        self.ui._REVIEW_HUD = self._bak_REVIEW_HUD
+        self.ui._OVERLAYS = self._bak_OVERLAYS
         if self._bak_ReviewHUD is not None:
             self.ui.ReviewHUD = self._bak_ReviewHUD
         # Clean fake Qt
@@ -122,7 +122,7 @@ class TestHUDSingletonAndCleanup(unittest.TestCase):
         baseline = FakeHUD.created  # accounts for the two pre-created fakes in setUp
         self.ui.ensure_review_hud()
         self.ui.ensure_review_hud()
-        hud = self.ui._REVIEW_HUD
+        hud = self.ui.get_review_hud()
         self.assertIsNotNone(hud, "HUD should be created")
         self.assertIs(hud.parent(), self.mw, "HUD should be parented to mw")
         self.assertEqual(
@@ -136,6 +136,29 @@ class TestHUDSingletonAndCleanup(unittest.TestCase):
         # raise_ should have been called to keep HUD on top of its parent
         self.assertTrue(hud._raised, "HUD should be raised on ensure")
 
+    def test_sweep_runs_once_per_profile_load(self):
+        self.ui.ensure_review_hud()
+        hud = self.ui.get_review_hud()
+        # A stray created later is not found by per-card ensure calls (no tree walk)
+        late_stray = FakeHUD(self.mw)
+        self.ui.ensure_review_hud()
+        self.assertFalse(late_stray._deleted)
+        self.assertIs(self.ui.get_review_hud(), hud)
+        # The next profile load requests one more sweep, which keeps the registered HUD
+        self.ui.reset_overlay_sweep()
+        self.ui.ensure_review_hud()
+        self.assertTrue(late_stray._deleted)
+        self.assertFalse(hud._deleted)
+        self.assertIs(self.ui.get_review_hud(), hud)
+
+    def test_registry_drops_dead_widgets(self):
+        registry = self.ui.OverlayRegistry()
+        widget = FakeQWidget(None)
+        registry.set("hud", widget)
+        self.assertTrue(registry.owns(widget))
+        del widget
+        self.assertIsNone(registry.get("hud"))
+
 
 if __name__ == "__main__":
     unittest.main()
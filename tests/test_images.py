@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+
+import images
+from images import LRUByteCache, cache_key, path_exists
+
+
+class TestLRUByteCache(unittest.TestCase):
+    def test_evicts_least_recently_used_over_budget(self):
+        cache = LRUByteCache(budget_bytes=100)
+        cache.put("a", "A", 40)
+        cache.put("b", "B", 40)
+        self.assertEqual(cache.get("a"), "A")  # a is now most recent
+        cache.put("c", "C", 40)
+        self.assertNotIn("b", cache)
+        self.assertEqual((cache.get("a"), cache.get("c")), ("A", "C"))
+        self.assertEqual(cache.bytes, 80)
+
+    def test_replace_and_oversized_values(self):
+        cache = LRUByteCache(budget_bytes=100)
+        cache.put("a", "A", 40)
+        cache.put("a", "A2", 60)
+        self.assertEqual((cache.get("a"), cache.bytes, len(cache)), ("A2", 60, 1))
+        cache.put("huge", "H", 500)
+        self.assertNotIn("huge", cache)
+        self.assertIn("a", cache)
+
+    def test_hit_and_miss_counters(self):
+        cache = LRUByteCache(budget_bytes=10)
+        self.assertIsNone(cache.get("x"))
+        cache.put("x", 1, 1)
+        cache.get("x")
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        cache.clear()
+        self.assertEqual((len(cache), cache.bytes), (0, 0))
+
+    def test_cache_key_normalises_dpr(self):
+        self.assertEqual(cache_key("p.png", 28.0, 1.2500001), cache_key("p.png", 28, 1.25))
+
+
+class TestPathExists(unittest.TestCase):
+    def test_misses_are_memoised(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "late.png")
+            self.assertFalse(path_exists(path))
+            open(path, "wb").close()
+            # Still a miss: the answer is cached for the session
+            self.assertFalse(path_exists(path))
+            images._EXISTS.pop(path, None)
+            self.assertTrue(path_exists(path))
+        self.assertFalse(path_exists(""))
+
+
+if __name__ == "__main__":
+    unittest.main()
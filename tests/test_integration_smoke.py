@@ -22,7 +22,9 @@ class _FakeReviewer:
 class _DummyCol:
     def __init__(self, store=None):
         self._store = dict(store or {})
+        self.reads = 0
     def get_config(self, key, default=None):
+        self.reads += 1
         return self._store.get(key, default)
     def set_config(self, key, value):
         self._store[key] = value
@@ -30,6 +32,7 @@ class _DummyCol:
 class _DummyMW:
     def __init__(self, col):
         self.col = col
+        self.state = "review"
 
 
 def _install_runtime_fakes():
@@ -120,7 +123,7 @@ class TestIntegrationSmoke(unittest.TestCase):
             }
         )
         addon.mw = _DummyMW(col)
-        # Ensure ui.get_config_bool reads the same mw/col
+        # Ensure ui reads the same mw/col
         try:
             addon.ui.mw = addon.mw  # type: ignore[attr-defined]
         except Exception:
@@ -143,6 +146,9 @@ class TestIntegrationSmoke(unittest.TestCase):
             "current_craft": "",
         }
         addon.current_skill = "Mining"
+        # Profile load reads the settings once
+        addon._load_settings()
+        col.reads = 0
 
         # With Experience HUD ON, both question/answer events should ensure+update
         addon._on_rev_show_question()
@@ -153,17 +159,20 @@ class TestIntegrationSmoke(unittest.TestCase):
         # Floating XP ON => popup shows once
         addon._show_exp(10)
         self.assertEqual(calls["xp"], 1)
+        # Card flips and awards read the cached settings, not the collection config
+        self.assertEqual(col.reads, 0)
 
         # Disable Experience HUD: subsequent events should not update HUD
         prev_ensure, prev_update = calls["ensure"], calls["update"]
-        addon.mw.col.set_config("ankiscape_review_hud_enabled", False)
+        addon.SETTINGS.set("review_hud_enabled", False)
+        self.assertIs(col.get_config("ankiscape_review_hud_enabled"), False)
         addon._on_rev_show_question()
         addon._on_rev_show_answer()
         self.assertEqual(calls["ensure"], prev_ensure)
         self.assertEqual(calls["update"], prev_update)
 
         # Disable Floating XP: no additional popup
-        addon.mw.col.set_config("ankiscape_floating_xp_enabled", False)
+        addon.SETTINGS.set("floating_xp_enabled", False)
         addon._show_exp(5)
         self.assertEqual(calls["xp"], 1)
 
@@ -171,6 +180,46 @@ class TestIntegrationSmoke(unittest.TestCase):
         addon._on_overview_did_refresh(overview=None)
         self.assertGreaterEqual(calls["hide"], 1)
 
+    def test_last_answer_does_not_show_hud_on_overview(self):
+        addon = _load_addon_as_package()
+        calls = {"ensure": 0, "update": 0, "hide": 0, "xp": 0}
+
+        class FakeExpPopup:
+            def __init__(self, _mw):
+                pass
+
+            def show_exp(self, _n):
+                calls["xp"] += 1
+
+        addon.ensure_review_hud = lambda: calls.__setitem__("ensure", calls["ensure"] + 1)
+        addon.update_review_hud = lambda *_a: calls.__setitem__("update", calls["update"] + 1)
+        addon.hide_review_hud = lambda: calls.__setitem__("hide", calls["hide"] + 1)
+        addon.ExpPopup = FakeExpPopup
+        addon.mw = _DummyMW(_DummyCol())
+        addon.player_data = {}
+        addon.current_skill = "Mining"
+        # Flushes wait for the next event-loop turn, as with Qt
+        pending = []
+        addon.UI_REFRESH._scheduler = lambda fn: pending.append(fn) or True
+
+        def run_event_loop():
+            while pending:
+                pending.pop(0)()
+
+        # Answer -> reviewer_will_end drains the award, which marks the HUD/toast dirty
+        addon._show_exp(10)
+        # Anki moves to the Overview before the flush runs
+        addon.mw.state = "overview"
+        addon._on_overview_did_refresh(overview=None)
+        run_event_loop()
+        self.assertEqual((calls["ensure"], calls["update"], calls["xp"]), (0, 0, 0))
+        self.assertGreaterEqual(calls["hide"], 1)
+
+        # Even a flush that was already pending renders nothing off the review screen
+        addon._show_exp(10)
+        run_event_loop()
+        self.assertEqual((calls["ensure"], calls["update"], calls["xp"]), (0, 0, 0))
+
 
 if __name__ == "__main__":
     unittest.main()
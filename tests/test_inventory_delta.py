@@ -0,0 +1,78 @@
+import unittest
+
+from constants import ORE_DATA, GEM_DATA, BAR_DATA, CRAFTING_DATA, TREE_DATA
+from logic_pure import (
+    InventoryDelta,
+    mining_delta_pure,
+    woodcutting_delta_pure,
+    smelt_delta_pure,
+    crafting_delta_pure,
+    soft_clay_delta_pure,
+)
+
+
+class TestInventoryDelta(unittest.TestCase):
+    def test_commit_applies_in_place(self):
+        inv = {"Clay": 2}
+        delta = InventoryDelta().add("Clay", -1).add("Soft clay", 1)
+        result = delta.commit(inv)
+        self.assertIs(result, inv)
+        self.assertEqual(inv, {"Clay": 1, "Soft clay": 1})
+        self.assertEqual(delta.keys(), ("Clay", "Soft clay"))
+
+    def test_negative_result_rejected_without_partial_apply(self):
+        inv = {"Copper ore": 1, "Tin ore": 0}
+        delta = InventoryDelta({"Bronze bar": 1, "Copper ore": -1, "Tin ore": -1})
+        with self.assertRaises(ValueError):
+            delta.commit(inv)
+        self.assertEqual(inv, {"Copper ore": 1, "Tin ore": 0})
+
+    def test_rollback_restores_previous_state(self):
+        inv = {"Clay": 1}
+        delta = InventoryDelta({"Clay": -1, "Soft clay": 1})
+        delta.commit(inv)
+        delta.rollback(inv)
+        self.assertEqual(inv, {"Clay": 1})
+        # A second rollback is a no-op
+        delta.rollback(inv)
+        self.assertEqual(inv, {"Clay": 1})
+
+    def test_empty_delta_is_falsy(self):
+        self.assertFalse(InventoryDelta())
+        self.assertFalse(InventoryDelta({"Clay": 0}))
+        self.assertTrue(InventoryDelta({"Clay": 1}))
+
+
+class TestActionDeltas(unittest.TestCase):
+    def test_mining_delta_with_gem(self):
+        ore = next(iter(ORE_DATA))
+        delta, exp, ok, gem = mining_delta_pure(ore, ORE_DATA, GEM_DATA, 0.0, 1.0, 0.0, 0.0, gem_drop_chance=1.0)
+        self.assertTrue(ok)
+        self.assertIsNotNone(gem)
+        self.assertEqual(delta.changes, {ore: 1, gem: 1})
+        self.assertAlmostEqual(exp, ORE_DATA[ore]["exp"] + GEM_DATA[gem]["exp"])
+
+    def test_failed_actions_return_empty_deltas(self):
+        tree = next(iter(TREE_DATA))
+        delta, exp, ok = woodcutting_delta_pure(tree, TREE_DATA, 0.9, 0.5)
+        self.assertEqual((delta.changes, exp, ok), ({}, 0, False))
+        delta, exp, ok = smelt_delta_pure("Bronze bar", {}, BAR_DATA)
+        self.assertEqual((delta.changes, ok), ({}, False))
+        delta, ok = soft_clay_delta_pure({"Clay": 0})
+        self.assertEqual((delta.changes, ok), ({}, False))
+
+    def test_smelt_and_craft_deltas_consume_inputs(self):
+        inv = {"Copper ore": 1, "Tin ore": 1}
+        delta, _, ok = smelt_delta_pure("Bronze bar", inv, BAR_DATA)
+        self.assertTrue(ok)
+        delta.commit(inv)
+        self.assertEqual(inv, {"Copper ore": 0, "Tin ore": 0, "Bronze bar": 1})
+        inv = {"Soft clay": 1}
+        delta, _, ok = crafting_delta_pure("Unfired pot", inv, CRAFTING_DATA)
+        self.assertTrue(ok)
+        delta.commit(inv)
+        self.assertEqual(inv, {"Soft clay": 0, "Unfired pot": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from journal import JOURNAL_FILENAME, Journal, apply_event, make_event
+from storage_pure import default_player_data
+
+ORE_DATA = {"Copper ore": {}, "Tin ore": {}}
+
+
+class TestApplyEvent(unittest.TestCase):
+    def test_replay_updates_exp_inventory_and_fields(self):
+        pd = default_player_data(ORE_DATA)
+        _ts, _card, skill, xp, delta, fields = make_event(
+            "Mining", 17.5, {"Copper ore": 1, "Uncut ruby": 1}, 42,
+            {"mining_level": 2, "ores_mined_today": 1}, ["First Ore"],
+        )
+        apply_event(pd, skill, xp, delta, fields)
+        apply_event(pd, skill, xp, None, fields)
+        self.assertEqual(pd["mining_exp"], 35)
+        self.assertEqual(pd["inventory"]["Copper ore"], 1)
+        self.assertEqual(pd["inventory"]["Uncut ruby"], 1)
+        self.assertEqual(pd["mining_level"], 2)
+        self.assertEqual(pd["completed_achievements"], ["First Ore"])
+
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, JOURNAL_FILENAME)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _count(self, table):
+        conn = sqlite3.connect(self.path)
+        try:
+            return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_empty_journal_loads_none(self):
+        journal = Journal(self.path, threaded=False)
+        self.assertIsNone(journal.load())
+        journal.close()
+
+    def test_snapshot_then_replay(self):
+        journal = Journal(self.path, threaded=False)
+        pd = default_player_data(ORE_DATA)
+        journal.snapshot(pd, "Mining")
+        journal.append(make_event("Mining", 10, {"Tin ore": 2}, ts=2e9))
+        journal.append(make_event("Mining", 5, {"Tin ore": -1}))
+        journal.close()
+
+        loaded, skill, ts = Journal(self.path, threaded=False).load()
+        self.assertEqual(skill, "Mining")
+        self.assertEqual(loaded["mining_exp"], 15)
+        self.assertEqual(loaded["inventory"]["Tin ore"], 1)
+        self.assertGreaterEqual(ts, 2e9)
+        # The original dict is untouched by replay
+        self.assertEqual(pd["mining_exp"], 0)
+
+    def test_snapshot_keeps_recent_events_as_history(self):
+        journal = Journal(self.path, threaded=False)
+        pd = default_player_data(ORE_DATA)
+        for _ in range(3):
+            journal.append(make_event("Mining", 1, {"Copper ore": 1}))
+            pd["inventory"]["Copper ore"] += 1
+            pd["mining_exp"] += 1
+            journal.snapshot(pd, "Mining")
+        journal.append(make_event("Mining", 1, {"Copper ore": 1}))
+        self.assertEqual(self._count("events"), 4)
+        self.assertEqual(self._count("snapshots"), 2)
+        loaded, _skill, _ts = journal.load()
+        self.assertEqual(loaded["inventory"]["Copper ore"], 4)
+        self.assertEqual(journal.events_since_snapshot, 1)
+        journal.close()
+
+    def test_snapshot_compacts_old_events_covered_by_every_kept_snapshot(self):
+        journal = Journal(self.path, threaded=False, retention_seconds=60)
+        pd = default_player_data(ORE_DATA)
+        old = 1e9  # far past retention
+        journal.append(make_event("Mining", 1, {"Copper ore": 1}, ts=old))
+        journal.snapshot(pd, "Mining")  # covers event 1
+        journal.append(make_event("Mining", 1, {"Copper ore": 1}, ts=old))
+        journal.append(make_event("Mining", 1, {"Copper ore": 1}))
+        journal.snapshot(pd, "Mining")  # oldest kept snapshot still only covers event 1
+        self.assertEqual(self._count("events"), 2)
+        journal.snapshot(pd, "Mining")  # first snapshot dropped; events 2-3 now covered by both
+        # Event 2 is past retention; event 3 is recent and stays
+        self.assertEqual(self._count("events"), 1)
+        self.assertEqual(self._count("snapshots"), 2)
+        journal.close()
+
+    def test_snapshot_during_award_waits_for_its_event(self):
+        journal = Journal(self.path, threaded=False)
+        pd = default_player_data(ORE_DATA)
+        journal.snapshot(pd, "Mining")
+        journal.begin_award()
+        pd["mining_exp"] += 35
+        pd["inventory"]["Iron ore"] = 1
+        # e.g. the write-behind timer firing inside a level-up popup
+        journal.snapshot(pd, "Mining")
+        pd["completed_achievements"].append("Iron Initiate")
+        journal.append(make_event("Mining", 35, {"Iron ore": 1}, achievements=["Iron Initiate"]))
+        journal.end_award()
+        journal.close()
+
+        loaded, _skill, _ts = Journal(self.path, threaded=False).load()
+        self.assertEqual(loaded["mining_exp"], 35)
+        self.assertEqual(loaded["inventory"]["Iron ore"], 1)
+        self.assertEqual(loaded["completed_achievements"], ["Iron Initiate"])
+        self.assertEqual(self._count("events"), 1)
+
+    def test_background_writer_batches_and_flushes(self):
+        journal = Journal(self.path)
+        journal.snapshot(default_player_data(ORE_DATA), "Woodcutting")
+        for _ in range(100):
+            journal.append(make_event("Woodcutting", 2, {"Logs": 1}))
+        self.assertTrue(journal.flush())
+        self.assertEqual(self._count("events"), 100)
+        journal.close()
+        loaded, skill, _ts = Journal(self.path, threaded=False).load()
+        self.assertEqual(skill, "Woodcutting")
+        self.assertEqual(loaded["woodcutting_exp"], 200)
+        self.assertEqual(loaded["inventory"]["Logs"], 100)
+
+    def test_wal_mode(self):
+        Journal(self.path, threaded=False).close()
+        conn = sqlite3.connect(self.path)
+        try:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        finally:
+            conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
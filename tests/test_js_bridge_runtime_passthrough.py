@@ -92,6 +92,19 @@ class TestJSBridgeRuntimePassthrough(unittest.TestCase):
         handled, out = h(True, "ankiscape_log:foo", None)
         self.assertTrue(handled)
 
+    def test_select_commands_validate_choices(self):
+        h = self._get_js_handler()
+        addon = sys.modules["ankiscape_for_bridge_test"]
+        addon.player_data = {"mining_level": 1, "current_ore": "Rune essence"}
+        addon.save_player_data = lambda: None
+        handled, out = h(False, 'ankiscape:{"cmd":"select","args":{"kind":"ore","name":"Clay"}}', None)
+        self.assertEqual((handled, out), (True, True))
+        self.assertEqual(addon.player_data["current_ore"], "Clay")
+        # Locked or unknown choices are refused
+        handled, out = h(False, 'ankiscape:{"cmd":"select","args":{"kind":"ore","name":"Runite ore"}}', None)
+        self.assertEqual((handled, out), (True, False))
+        self.assertEqual(addon.player_data["current_ore"], "Clay")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from ui import LazyTabs
+
+
+class TestLazyTabs(unittest.TestCase):
+    def _tabs(self, n, likely=()):
+        built = []
+        lazy = LazyTabs(likely)
+        for i in range(1, n + 1):
+            lazy.add(i, lambda i=i: built.append(i))
+        return lazy, built
+
+    def test_builds_once_on_activation(self):
+        lazy, built = self._tabs(3)
+        self.assertTrue(lazy.ensure(2))
+        self.assertFalse(lazy.ensure(2))
+        self.assertFalse(lazy.ensure(0))  # eager tab, never registered
+        self.assertEqual(built, [2])
+        self.assertEqual(lazy.pending(), [1, 3])
+
+    def test_prefetch_prefers_likely_then_right_neighbour(self):
+        lazy, built = self._tabs(5, likely=[4])
+        self.assertEqual(lazy.next_prefetch(0), 4)
+        lazy.ensure(4)
+        self.assertEqual(lazy.next_prefetch(0), 1)
+        lazy.ensure(1)
+        self.assertIsNone(lazy.next_prefetch(0))
+        self.assertEqual(lazy.next_prefetch(2), 3)
+
+    def test_failing_build_is_not_retried(self):
+        calls = []
+
+        def boom():
+            calls.append(1)
+            raise RuntimeError("widget deleted")
+
+        lazy = LazyTabs()
+        lazy.add(1, boom)
+        self.assertTrue(lazy.ensure(1))
+        self.assertFalse(lazy.ensure(1))
+        self.assertEqual(calls, [1])
+        self.assertTrue(lazy.is_built(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
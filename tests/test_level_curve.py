@@ -0,0 +1,60 @@
+import unittest
+
+from constants import EXP_TABLE
+from logic_pure import LevelCurve, get_level_curve, calculate_new_level
+
+
+def _linear_level(xp, table):
+    level = 1
+    while level < 99 and level < len(table) and xp >= table[level]:
+        level += 1
+    return level
+
+
+class TestLevelCurve(unittest.TestCase):
+    def setUp(self):
+        self.curve = get_level_curve(EXP_TABLE)
+
+    def test_shared_instance_per_table(self):
+        self.assertIs(get_level_curve(EXP_TABLE), self.curve)
+        self.assertIsNot(get_level_curve(list(EXP_TABLE)), self.curve)
+
+    def test_level_for_xp_matches_linear_scan(self):
+        for level in range(1, len(EXP_TABLE)):
+            for xp in (EXP_TABLE[level - 1], EXP_TABLE[level - 1] + 0.5, EXP_TABLE[level] - 0.1):
+                self.assertEqual(self.curve.level_for_xp(xp), _linear_level(xp, EXP_TABLE))
+        self.assertEqual(self.curve.level_for_xp(-10), 1)
+        self.assertEqual(self.curve.level_for_xp(10 ** 9), 99)
+
+    def test_xp_to_next_and_between(self):
+        self.assertEqual(self.curve.xp_to_next(1, 0), EXP_TABLE[1])
+        self.assertEqual(self.curve.xp_to_next(5, EXP_TABLE[5] + 1), 0)
+        self.assertEqual(self.curve.xp_to_next(99, 0), 0)
+        self.assertEqual(self.curve.xp_between(1, 10), EXP_TABLE[9])
+        self.assertEqual(self.curve.xp_between(10, 20), EXP_TABLE[19] - EXP_TABLE[9])
+        # Integer tables and XP give an int, as the old table lookup did
+        self.assertIsInstance(LevelCurve([0, 100, 250]).xp_to_next(1, 40), int)
+        self.assertEqual(self.curve.spans[0], EXP_TABLE[1] - EXP_TABLE[0])
+
+    def test_progress_midpoint(self):
+        mid = (EXP_TABLE[9] + EXP_TABLE[10]) / 2
+        pct, remain, target = self.curve.progress(10, mid)
+        self.assertEqual(pct, 50)
+        self.assertAlmostEqual(remain, EXP_TABLE[10] - mid)
+        self.assertEqual(target, 11)
+
+    def test_short_table_caps_at_end(self):
+        curve = LevelCurve([0, 100, 250])
+        self.assertEqual(curve.level_for_xp(1000), 3)
+        self.assertEqual(curve.progress(3, 1000), (100, 0.0, 3))
+        self.assertEqual(curve.progress(2, 175), (50, 75.0, 3))
+
+    def test_calculate_new_level_uses_curve_for_lists(self):
+        self.assertEqual(calculate_new_level(EXP_TABLE[40], 1, EXP_TABLE), 41)
+        # Never goes down, even if XP is below the current level's threshold
+        self.assertEqual(calculate_new_level(0, 12, EXP_TABLE), 12)
+        self.assertEqual(calculate_new_level(10 ** 9, 98, EXP_TABLE), 99)
+
+
+if __name__ == "__main__":
+    unittest.main()
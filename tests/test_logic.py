@@ -24,6 +24,12 @@ class TestLogic(unittest.TestCase):
         result = get_exp_to_next_level(player_data, EXP_TABLE)
         self.assertEqual(result, 500)
 
+    def test_get_exp_to_next_level_list_table_stays_int(self):
+        player_data = {"mining_level": 2, "mining_exp": 40}
+        result = get_exp_to_next_level(player_data, [0, 83, 174])
+        self.assertEqual(result, 134)
+        self.assertIsInstance(result, int)
+
     def test_max_level(self):
         player_data = {"mining_level": 99, "total_exp": 200000}
         EXP_TABLE = {99: 200000}
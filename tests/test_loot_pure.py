@@ -0,0 +1,65 @@
+import random
+import unittest
+
+from constants import GEM_DATA
+from loot_pure import HAS_NUMPY, AliasTable, compile_loot_table, get_loot_table
+
+
+def _implied_distribution(table):
+    """Exact outcome probabilities encoded by an alias table's columns."""
+    n = len(table.prob)
+    dist = {}
+    for i in range(n):
+        own, alias = table.outcomes[i], table.outcomes[table.alias[i]]
+        dist[own] = dist.get(own, 0.0) + table.prob[i] / n
+        dist[alias] = dist.get(alias, 0.0) + (1.0 - table.prob[i]) / n
+    return dist
+
+
+class TestAliasTable(unittest.TestCase):
+    def test_encodes_gem_distribution_with_nothing_mass(self):
+        table = compile_loot_table(GEM_DATA)
+        dist = _implied_distribution(table)
+        for gem, spec in GEM_DATA.items():
+            self.assertAlmostEqual(dist[gem], spec["probability"])
+        self.assertAlmostEqual(dist[None], 1.0 - sum(s["probability"] for s in GEM_DATA.values()))
+        self.assertEqual(table.specs["Uncut ruby"]["exp"], 85)
+
+    def test_weights_over_total_are_normalised(self):
+        table = compile_loot_table({"a": 3, "b": 1})
+        dist = _implied_distribution(table)
+        self.assertNotIn(None, dist)
+        self.assertAlmostEqual(dist["a"], 0.75)
+
+    def test_sampling_matches_weights(self):
+        table = AliasTable([("a", 0.6), ("b", 0.3), ("c", 0.1)])
+        rng = random.Random(11)
+        counts = table.counts([rng.random() for _ in range(50000)])
+        self.assertAlmostEqual(counts["a"] / 50000, 0.6, delta=0.01)
+        self.assertAlmostEqual(counts["c"] / 50000, 0.1, delta=0.01)
+        self.assertEqual(table.sample_many([0.0, 0.999999]), [table.sample(0.0), table.sample(0.999999)])
+
+    def test_empty_and_zero_weight_tables_drop_nothing(self):
+        self.assertIsNone(compile_loot_table({}).sample(0.5))
+        self.assertEqual(compile_loot_table({"x": 0.0, "y": 1.0}).outcomes, ["y"])
+
+    def test_cache_is_keyed_by_table_and_version(self):
+        table = {"a": 0.5}
+        first = get_loot_table(table, version=1)
+        self.assertIs(get_loot_table(table, version=1), first)
+        table["b"] = 0.5
+        second = get_loot_table(table, version=2)
+        self.assertIsNot(second, first)
+        self.assertNotIn(None, second.outcomes)
+
+    @unittest.skipUnless(HAS_NUMPY, "NumPy not installed")
+    def test_numpy_batch_matches_scalar(self):
+        import numpy as np
+        table = compile_loot_table(GEM_DATA)
+        us = np.random.default_rng(0).random(1000)
+        self.assertEqual(table.sample_many(us), [table.sample(float(u)) for u in us])
+        self.assertEqual(table.counts(us), table.counts([float(u) for u in us]))
+
+
+if __name__ == "__main__":
+    unittest.main()
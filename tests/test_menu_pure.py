@@ -0,0 +1,76 @@
+import unittest
+
+from menu_pure import (
+    ALL_SECTIONS,
+    MenuViewModel,
+    SECTION_ACHIEVEMENTS,
+    SECTION_BANK,
+    SECTION_CRAFTING,
+    SECTION_MINING,
+    SECTION_SKILLS,
+    SECTION_SMITHING,
+    SECTION_STATS,
+)
+
+
+def _player():
+    return {
+        "mining_level": 5,
+        "mining_exp": 400,
+        "smithing_level": 1,
+        "smithing_exp": 0,
+        "inventory": {"Copper ore": 2, "Tin ore": 0},
+        "completed_achievements": [],
+        "current_ore": "Copper ore",
+    }
+
+
+class TestMenuViewModel(unittest.TestCase):
+    def test_first_update_refreshes_everything(self):
+        model = MenuViewModel()
+        self.assertEqual(model.update(_player(), "Mining"), set(ALL_SECTIONS))
+
+    def test_unchanged_state_refreshes_nothing(self):
+        pd = _player()
+        model = MenuViewModel()
+        model.update(pd, "Mining")
+        self.assertEqual(model.update(pd, "Mining"), set())
+        # Zero-count items are not shown, so they do not dirty the bank
+        pd["inventory"]["Iron ore"] = 0
+        self.assertEqual(model.update(pd, "Mining"), set())
+
+    def test_targeted_sections(self):
+        pd = _player()
+        model = MenuViewModel()
+        model.update(pd, "Mining")
+
+        pd["mining_exp"] += 10
+        self.assertEqual(model.update(pd, "Mining"), {SECTION_STATS})
+
+        pd["mining_level"] += 1
+        self.assertEqual(model.update(pd, "Mining"), {SECTION_MINING, SECTION_STATS, SECTION_ACHIEVEMENTS})
+
+        pd["inventory"]["Copper ore"] += 1
+        self.assertEqual(
+            model.update(pd, "Mining"),
+            {SECTION_BANK, SECTION_SMITHING, SECTION_CRAFTING, SECTION_SKILLS, SECTION_ACHIEVEMENTS},
+        )
+
+        pd["completed_achievements"].append("First Ore")
+        self.assertEqual(model.update(pd, "Mining"), {SECTION_ACHIEVEMENTS})
+
+        pd["current_ore"] = "Tin ore"
+        self.assertEqual(model.update(pd, "Mining"), {SECTION_MINING})
+
+        self.assertEqual(model.update(pd, "Smithing"), {SECTION_SKILLS})
+
+    def test_invalidate_forces_full_refresh(self):
+        pd = _player()
+        model = MenuViewModel()
+        model.update(pd, "Mining")
+        model.invalidate()
+        self.assertEqual(model.update(pd, "Mining"), set(ALL_SECTIONS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from ui import compute_level_progress
+from ui import compute_level_progress, hud_render_state, hud_texts, XpToastCounter, xp_toast_text, shadow_alpha_mask, nine_slice_rects
 from constants import EXP_TABLE
 
 class TestReviewHUDProgress(unittest.TestCase):
@@ -49,5 +49,79 @@ class TestReviewHUDProgress(unittest.TestCase):
         self.assertEqual(remain, 0.0)
         self.assertEqual(target, 99)
 
+
+class TestReviewHUDRenderState(unittest.TestCase):
+    def test_state_ignores_unrelated_changes(self):
+        pd = {"mining_level": 10, "mining_exp": EXP_TABLE[9] + 10, "inventory": {}}
+        before = hud_render_state(pd, "Mining", EXP_TABLE)
+        pd["inventory"]["Clay"] = 5
+        pd["woodcutting_exp"] = 999
+        self.assertEqual(hud_render_state(pd, "Mining", EXP_TABLE), before)
+
+    def test_state_changes_with_displayed_numbers(self):
+        pd = {"mining_level": 10, "mining_exp": EXP_TABLE[9]}
+        before = hud_render_state(pd, "Mining", EXP_TABLE)
+        pd["mining_exp"] += 25
+        self.assertNotEqual(hud_render_state(pd, "Mining", EXP_TABLE), before)
+        # Sub-XP changes that do not alter the displayed text compare equal
+        pd2 = {"mining_level": 10, "mining_exp": EXP_TABLE[9] + 0.1}
+        self.assertEqual(hud_render_state(pd2, "Mining", EXP_TABLE), before)
+
+    def test_placeholder_state_and_texts(self):
+        state = hud_render_state({}, "None", EXP_TABLE)
+        self.assertEqual(state, ("None", 0, 0, 0, 0))
+        self.assertEqual(hud_texts(state)[0], "No skill selected")
+        title, sub = hud_texts(("Mining", 10, 50, 1234, 11))
+        self.assertEqual(title, "Mining — Lv 10")
+        self.assertEqual(sub, "50% to Lv 11 • 1,234 XP to next")
+
+
+class TestXpToastCounter(unittest.TestCase):
+    def test_merges_gains_within_window(self):
+        counter = XpToastCounter(window=1.0)
+        self.assertEqual(counter.add(10, now=0.0), (10, 1))
+        self.assertEqual(counter.add(15, now=0.5), (25, 2))
+        # The window slides with each gain
+        self.assertEqual(counter.add(5, now=1.4), (30, 3))
+        self.assertEqual(xp_toast_text(30, 3), "+30 XP ×3")
+
+    def test_quiet_period_or_reset_starts_new_toast(self):
+        counter = XpToastCounter(window=1.0)
+        counter.add(10, now=0.0)
+        self.assertEqual(counter.add(7, now=2.5), (7, 1))
+        counter.reset()
+        self.assertEqual(counter.add(3, now=2.6), (3, 1))
+        self.assertEqual(xp_toast_text(3, 1), "+3 XP")
+
+
+class TestOverlayShadow(unittest.TestCase):
+    def test_mask_falls_off_from_panel_to_edge(self):
+        px, data = shadow_alpha_mask(radius=9, corner=10, dpr=1.0, peak=100)
+        self.assertEqual(px, 39)
+        self.assertEqual(len(data), px * px)
+        mid = px // 2
+        row = [data[mid * px + col] for col in range(px)]
+        self.assertEqual(row[mid], 100)
+        self.assertEqual(row[0], 0)
+        # Monotonic falloff from the panel edge outwards
+        left = row[: mid + 1]
+        self.assertEqual(left, sorted(left))
+
+    def test_mask_scales_with_device_pixel_ratio(self):
+        px1, _ = shadow_alpha_mask(9, 10, dpr=1.0)
+        px2, data2 = shadow_alpha_mask(9, 10, dpr=2.0)
+        self.assertEqual(px2, 2 * px1)
+        self.assertEqual(len(data2), px2 * px2)
+
+    def test_nine_slice_covers_target_exactly(self):
+        rects = nine_slice_rects(400, 60, 19)
+        self.assertEqual(len(rects), 9)
+        area = sum(dw * dh for _, (_, _, dw, dh) in rects)
+        self.assertEqual(area, 400 * 60)
+        # Corners are copied unscaled
+        self.assertEqual(rects[0], ((0, 0, 19, 19), (0, 0, 19, 19)))
+        self.assertEqual(rects[-1], ((20, 20, 19, 19), (381, 41, 19, 19)))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+
+from settings import SETTING_KEYS, Settings
+
+
+class DummyCol:
+    def __init__(self, store=None):
+        self._store = dict(store or {})
+        self.reads = 0
+
+    def get_config(self, key, default=None):
+        self.reads += 1
+        return self._store.get(key, default)
+
+    def set_config(self, key, val):
+        self._store[key] = val
+
+
+class TestSettings(unittest.TestCase):
+    def test_defaults_before_profile_load(self):
+        settings = Settings()
+        self.assertTrue(settings.review_hud_enabled)
+        self.assertTrue(settings.popups_enabled)
+        self.assertEqual(settings.floating_position, "right")
+
+    def test_load_reads_each_key_once_and_normalises(self):
+        col = DummyCol({"ankiscape_popups_enabled": 0, "ankiscape_floating_position": "top"})
+        settings = Settings()
+        settings.load(col)
+        self.assertEqual(col.reads, len(SETTING_KEYS))
+        self.assertIs(settings.popups_enabled, False)
+        self.assertEqual(settings.floating_position, "right")
+        for _ in range(10):
+            settings.popups_enabled, settings.floating_enabled
+        self.assertEqual(col.reads, len(SETTING_KEYS))
+
+    def test_notification_toggles_follow_profile(self):
+        col = DummyCol({"ankiscape_floating_xp_enabled": False})
+        settings = Settings()
+        settings.load(col)
+        self.assertFalse(settings.floating_xp_enabled)
+        self.assertTrue(settings.popups_enabled)
+        settings.set("popups_enabled", False)
+        settings.load(col)
+        self.assertFalse(settings.popups_enabled)
+
+    def test_set_persists_and_notifies_on_change(self):
+        col = DummyCol()
+        settings = Settings()
+        settings.load(col)
+        seen = []
+        settings.subscribe(lambda name, value: seen.append((name, value)))
+        self.assertTrue(settings.set("floating_position", "left"))
+        self.assertFalse(settings.set("floating_position", "left"))
+        self.assertEqual(col.get_config("ankiscape_floating_position"), "left")
+        self.assertEqual(settings.floating_position, "left")
+        self.assertEqual(seen, [("floating_position", "left")])
+
+    def test_failing_subscriber_does_not_block_others(self):
+        settings = Settings()
+        seen = []
+
+        def boom(_name, _value):
+            raise RuntimeError("boom")
+
+        settings.subscribe(boom)
+        settings.subscribe(lambda name, value: seen.append(name))
+        settings.set("review_hud_enabled", False)
+        self.assertEqual(seen, ["review_hud_enabled"])
+        settings.unsubscribe(boom)
+
+    def test_unload_restores_defaults(self):
+        settings = Settings()
+        settings.load(DummyCol({"ankiscape_review_hud_enabled": False}))
+        settings.unload()
+        self.assertTrue(settings.review_hud_enabled)
+
+
+if __name__ == "__main__":
+    unittest.main()
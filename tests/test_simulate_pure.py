@@ -0,0 +1,100 @@
+import random
+import unittest
+from unittest import mock
+
+import simulate_pure
+from constants import (ORE_DATA, GEM_DATA, TREE_DATA, EXP_TABLE, BASE_MINING_PROBABILITY,
+                       BASE_WOODCUTTING_PROBABILITY, LEVEL_BONUS_FACTOR, LOOT_CONTENT_VERSION)
+from logic_pure import (apply_mining_pure, calculate_new_level, calculate_probability_with_level, get_level_curve,
+                        woodcutting_delta_pure)
+from simulate_pure import HAS_NUMPY, simulate_batch
+
+
+class TestSimulateBatchScalar(unittest.TestCase):
+    def test_matches_step_by_step_apply_mining(self):
+        seed, n = 42, 400
+        result = simulate_batch("Mining", "Copper ore", n, seed=seed, use_numpy=False, gem_drop_chance=0.05)
+
+        rng = random.Random(seed)
+        inv, xp, level = {}, 0.0, 1
+        for _ in range(n):
+            p = calculate_probability_with_level(level, BASE_MINING_PROBABILITY, LEVEL_BONUS_FACTOR,
+                                                 ORE_DATA["Copper ore"]["probability"])
+            inv, exp, ok, _ = apply_mining_pure("Copper ore", inv, ORE_DATA, GEM_DATA, rng.random(), p,
+                                                rng.random(), rng.random(), gem_drop_chance=0.05)
+            if ok:
+                xp += exp
+                level = calculate_new_level(xp, level, EXP_TABLE)
+
+        self.assertEqual(result.delta.changes, inv)
+        self.assertAlmostEqual(result.xp, xp)
+        self.assertEqual(result.level, level)
+
+    def test_woodcutting_uses_tree_drop_table(self):
+        drops = {"Bird nest": {"probability": 0.25, "exp": 5}}
+        seed, n = 7, 400
+        with mock.patch.dict(simulate_pure.TREE_DROP_TABLES, {"Oak": drops}):
+            result = simulate_batch("Woodcutting", "Oak", n, level_start=15, xp_start=2411, seed=seed,
+                                    use_numpy=False)
+
+        # Same draws as on_woodcutting_answer: action roll, then the drop roll
+        rng = random.Random(seed)
+        inv, xp, level = {}, 2411.0, 15
+        for _ in range(n):
+            p = calculate_probability_with_level(level, BASE_WOODCUTTING_PROBABILITY, LEVEL_BONUS_FACTOR,
+                                                 TREE_DATA["Oak"]["probability"])
+            r_action = rng.random()
+            r_drop = rng.random()
+            delta, exp, ok = woodcutting_delta_pure("Oak", TREE_DATA, r_action, p, drops, r_drop,
+                                                    loot_version=LOOT_CONTENT_VERSION)
+            if ok:
+                for item, amount in delta.changes.items():
+                    inv[item] = inv.get(item, 0) + amount
+                xp += exp
+                level = calculate_new_level(xp, level, EXP_TABLE)
+
+        self.assertGreater(inv.get("Bird nest", 0), 0)
+        self.assertEqual(result.delta.changes, inv)
+        self.assertAlmostEqual(result.xp, xp)
+        self.assertEqual(result.level, level)
+
+    def test_same_seed_is_deterministic(self):
+        a = simulate_batch("Woodcutting", "Oak", 300, level_start=15, xp_start=2411, seed=3, use_numpy=False)
+        b = simulate_batch("Woodcutting", "Oak", 300, level_start=15, xp_start=2411, seed=3, use_numpy=False)
+        self.assertEqual(a.delta.changes, b.delta.changes)
+        self.assertEqual(a.trajectory, b.trajectory)
+
+    def test_trajectory_follows_level_curve(self):
+        result = simulate_batch("Mining", "Rune essence", 2000, seed=1, use_numpy=False)
+        curve = get_level_curve(EXP_TABLE)
+        self.assertEqual(result.trajectory[0], (0, 1))
+        levels = [lvl for _, lvl in result.trajectory]
+        self.assertEqual(levels, sorted(levels))
+        self.assertEqual(result.level, curve.level_for_xp(result.xp))
+
+    def test_zero_and_invalid(self):
+        result = simulate_batch("Mining", "Clay", 0, seed=1, use_numpy=False)
+        self.assertEqual((result.successes, result.xp, result.delta.changes), (0, 0.0, {}))
+        with self.assertRaises(ValueError):
+            simulate_batch("Smithing", "Bronze bar", 1)
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy not installed")
+class TestSimulateBatchNumpy(unittest.TestCase):
+    def test_statistically_matches_scalar(self):
+        n = 20000
+        vec = simulate_batch("Mining", "Iron ore", n, level_start=15, xp_start=2411, seed=5, use_numpy=True)
+        ref = simulate_batch("Mining", "Iron ore", n, level_start=15, xp_start=2411, seed=5, use_numpy=False)
+        self.assertAlmostEqual(vec.successes / n, ref.successes / n, delta=0.02)
+        self.assertLessEqual(abs(vec.level - ref.level), 1)
+
+    def test_level_ups_recorded(self):
+        result = simulate_batch("Woodcutting", "Tree", 5000, seed=9, use_numpy=True)
+        curve = get_level_curve(EXP_TABLE)
+        self.assertGreater(len(result.trajectory), 1)
+        self.assertEqual(result.level, curve.level_for_xp(result.xp))
+        self.assertEqual(result.delta.changes.get("Tree", 0), result.successes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import json
+import random
+import unittest
+
+from constants import ACHIEVEMENTS, CODEC_ACHIEVEMENTS, CODEC_ITEMS, ITEM_CATEGORY, ORE_DATA
+from storage_pure import (
+    CURRENT_CONFIG_VERSION,
+    PlayerDataCodec,
+    default_player_data,
+    migrate_loaded_data,
+    pack_player_data,
+    unpack_stored_data,
+)
+
+CODEC = PlayerDataCodec(CODEC_ITEMS, CODEC_ACHIEVEMENTS)
+
+
+def _late_game_player(seed=7):
+    rng = random.Random(seed)
+    data = default_player_data(ORE_DATA)
+    for skill in ("mining", "woodcutting", "smithing", "crafting"):
+        data[f"{skill}_level"] = rng.randint(1, 99)
+        data[f"{skill}_exp"] = sum(rng.choice((5.0, 6.2, 17.5, 25)) for _ in range(2000))
+    for item in CODEC_ITEMS:
+        data["inventory"][item] = rng.choice((0, 1, 7, 300, 12000))
+    data["completed_achievements"] = rng.sample(list(ACHIEVEMENTS), 40)
+    data["ores_mined_today"] = 12
+    return data
+
+
+def _normalised(data):
+    """The dict form as it looks after a load: zero counts dropped, achievements as a set."""
+    out = dict(data)
+    out.pop("progress_to_next", None)
+    out["inventory"] = {k: v for k, v in data["inventory"].items() if v}
+    out["completed_achievements"] = set(data["completed_achievements"])
+    for key in list(out):
+        if key.endswith("_exp"):
+            out[key] = round(out[key], 2)
+    return out
+
+
+class TestCodecTables(unittest.TestCase):
+    def test_tables_cover_every_item_and_achievement(self):
+        self.assertEqual(set(ITEM_CATEGORY) - set(CODEC_ITEMS), set())
+        self.assertEqual(set(ACHIEVEMENTS) - set(CODEC_ACHIEVEMENTS), set())
+        self.assertEqual(len(set(CODEC_ITEMS)), len(CODEC_ITEMS))
+        self.assertEqual(len(set(CODEC_ACHIEVEMENTS)), len(CODEC_ACHIEVEMENTS))
+
+
+class TestPlayerDataCodec(unittest.TestCase):
+    def test_round_trip_default(self):
+        data = default_player_data(ORE_DATA)
+        decoded = CODEC.decode(CODEC.encode(data))
+        self.assertEqual(_normalised(decoded), _normalised(data))
+        # A load restores what the blob leaves out
+        self.assertEqual(migrate_loaded_data(decoded, ORE_DATA), data)
+
+    def test_round_trip_late_game(self):
+        data = _late_game_player()
+        decoded = CODEC.decode(CODEC.encode(data))
+        self.assertEqual(_normalised(decoded), _normalised(data))
+        self.assertEqual(decoded["ores_mined_today"], 12)
+
+    def test_unknown_and_unusual_values_survive_in_extras(self):
+        data = default_player_data(ORE_DATA)
+        data["inventory"]["Dragon scale"] = 3
+        data["inventory"]["Copper ore"] = -2
+        data["completed_achievements"] = ["First Steps", "Retired achievement"]
+        data["current_tree"] = "Elder"
+        data["mining_exp"] = 0.125
+        data["custom"] = {"a": [1, 2]}
+        decoded = CODEC.decode(CODEC.encode(data))
+        self.assertEqual(decoded["inventory"]["Dragon scale"], 3)
+        self.assertEqual(decoded["inventory"]["Copper ore"], -2)
+        self.assertEqual(set(decoded["completed_achievements"]), {"First Steps", "Retired achievement"})
+        self.assertEqual(decoded["current_tree"], "Elder")
+        self.assertEqual(decoded["mining_exp"], 0.125)
+        self.assertEqual(decoded["custom"], {"a": [1, 2]})
+
+    def test_large_exp_with_extra_decimals_is_exact(self):
+        data = default_player_data(ORE_DATA)
+        data["mining_exp"] = 6000.125
+        data["woodcutting_exp"] = 50000.001
+        data["smithing_exp"] = 13034431.25
+        decoded = CODEC.decode(CODEC.encode(data))
+        self.assertEqual(decoded["mining_exp"], 6000.125)
+        self.assertEqual(decoded["woodcutting_exp"], 50000.001)
+        self.assertEqual(decoded["smithing_exp"], 13034431.25)
+
+    def test_rejects_unknown_codec_version(self):
+        with self.assertRaises(ValueError):
+            CODEC.decode(b"\x7f")
+
+    def test_stored_blob_is_much_smaller(self):
+        def sizes(data):
+            return len(json.dumps(pack_player_data(data, CODEC))), len(json.dumps(data))
+
+        packed, plain = sizes(default_player_data(ORE_DATA))
+        self.assertLess(packed * 8, plain, (packed, plain))
+        # Every item held in large amounts is the worst case for the sparse inventory
+        packed, plain = sizes(_late_game_player())
+        self.assertLess(packed * 5, plain, (packed, plain))
+
+
+class TestMigrationToPacked(unittest.TestCase):
+    def test_version_2_blob_loads_and_repacks(self):
+        v2 = _late_game_player()
+        v2["config_version"] = 2
+        loaded = migrate_loaded_data(unpack_stored_data(v2, CODEC), ORE_DATA)
+        self.assertEqual(loaded["config_version"], CURRENT_CONFIG_VERSION)
+        stored = pack_player_data(loaded, CODEC)
+        self.assertEqual(stored["config_version"], 3)
+        reloaded = migrate_loaded_data(unpack_stored_data(stored, CODEC), ORE_DATA)
+        self.assertEqual(_normalised(reloaded), _normalised(loaded))
+        self.assertEqual(reloaded["config_version"], CURRENT_CONFIG_VERSION)
+
+    def test_empty_stored_value(self):
+        self.assertEqual(unpack_stored_data(None, CODEC), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ from storage_pure import (
     default_player_data,
     migrate_loaded_data,
     CURRENT_CONFIG_VERSION,
+    WriteBehindState,
 )
 from constants import ORE_DATA
 
@@ -74,5 +75,31 @@ class TestStoragePure(unittest.TestCase):
             self.assertIn(ore, migrated["inventory"])  # seeded
 
 
+class TestWriteBehindState(unittest.TestCase):
+    def test_repeated_saves_coalesce_until_interval(self):
+        state = WriteBehindState(interval=20.0)
+        self.assertTrue(state.mark_dirty(100.0))  # first change arms a flush
+        for t in range(101, 119):
+            self.assertFalse(state.mark_dirty(float(t)))
+        self.assertFalse(state.due(119.0))
+        self.assertTrue(state.due(120.0))
+        self.assertEqual(state.pending_saves, 19)
+        state.mark_flushed()
+        self.assertFalse(state.dirty)
+        self.assertEqual(state.flushes, 1)
+
+    def test_seconds_until_due_measures_from_oldest_change(self):
+        state = WriteBehindState(interval=10.0)
+        self.assertEqual(state.seconds_until_due(5.0), 0.0)
+        state.mark_dirty(5.0)
+        state.mark_dirty(9.0)
+        self.assertAlmostEqual(state.seconds_until_due(12.0), 3.0)
+        self.assertEqual(state.seconds_until_due(50.0), 0.0)
+
+    def test_clean_state_is_never_due(self):
+        state = WriteBehindState(interval=0.0)
+        self.assertFalse(state.due(1e9))
+
+
 if __name__ == "__main__":
     unittest.main()
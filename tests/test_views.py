@@ -0,0 +1,78 @@
+import unittest
+
+from constants import ACHIEVEMENTS, ITEM_CATEGORIES, ITEM_CATEGORY, ITEM_IMAGES, ORE_IMAGES
+from views import ACHIEVEMENT_DIFFICULTIES, AchievementRows, InventoryRows, achievement_groups, item_category
+
+
+class TestInventoryRows(unittest.TestCase):
+    def test_initial_sync_sorts_held_items(self):
+        rows = InventoryRows()
+        ops = rows.sync({"Tin ore": 2, "Clay": 1, "Coal": 0})
+        self.assertEqual(rows.names, ["Clay", "Tin ore"])
+        self.assertEqual([op for op, _ in ops], ["insert", "insert"])
+
+    def test_row_operations(self):
+        inv = {"Clay": 1, "Tin ore": 2}
+        rows = InventoryRows()
+        rows.sync(inv)
+
+        inv["Tin ore"] = 5
+        self.assertEqual(rows.sync(inv, ["Tin ore"]), [("change", 1)])
+
+        inv["Coal"] = 3
+        self.assertEqual(rows.sync(inv, ["Coal"]), [("insert", 1)])
+        self.assertEqual(rows.names, ["Clay", "Coal", "Tin ore"])
+
+        inv["Clay"] = 0
+        self.assertEqual(rows.sync(inv), [("remove", 0)])
+        self.assertEqual(rows.names, ["Coal", "Tin ore"])
+        self.assertEqual(rows.counts, {"Coal": 3, "Tin ore": 5})
+
+        # Unchanged keys produce no work
+        self.assertEqual(rows.sync(inv, ["Coal", "Iron ore"]), [])
+
+    def test_callbacks_wrap_each_mutation(self):
+        rows = InventoryRows()
+        calls = []
+        rows.sync(
+            {"Clay": 1},
+            before=lambda op, row: calls.append(("before", op, row, len(rows))),
+            after=lambda op, row: calls.append(("after", op, row, len(rows))),
+        )
+        self.assertEqual(calls, [("before", "insert", 0, 0), ("after", "insert", 0, 1)])
+
+
+class TestItemCategories(unittest.TestCase):
+    def test_every_item_has_one_category(self):
+        total = sum(len(items) for items in ITEM_CATEGORIES.values())
+        self.assertEqual(len(ITEM_CATEGORY), total)
+        self.assertEqual(item_category("Copper ore"), "Ores")
+        self.assertEqual(item_category("Uncut ruby"), "Gems")
+        self.assertEqual(item_category("Mystery box"), "Other")
+
+    def test_item_images_prefer_ore_images(self):
+        for name, path in ORE_IMAGES.items():
+            self.assertEqual(ITEM_IMAGES[name], path)
+
+
+class TestAchievementRows(unittest.TestCase):
+    def test_groups_cover_every_achievement_once(self):
+        groups = achievement_groups(ACHIEVEMENTS)
+        self.assertIs(groups, achievement_groups(ACHIEVEMENTS))
+        self.assertEqual(tuple(groups)[:len(ACHIEVEMENT_DIFFICULTIES)], ACHIEVEMENT_DIFFICULTIES)
+        names = [n for group in groups.values() for n in group]
+        self.assertEqual(sorted(names), sorted(ACHIEVEMENTS))
+        for difficulty, group in groups.items():
+            for name in group:
+                self.assertEqual(ACHIEVEMENTS[name]["difficulty"], difficulty)
+
+    def test_completion_touches_one_row(self):
+        rows = AchievementRows(["A", "B", "C"])
+        self.assertEqual(rows.sync(["B", "Elsewhere"]), [1])
+        self.assertEqual(rows.sync(["B"]), [])
+        self.assertEqual(rows.sync(["B", "C"]), [2])
+        self.assertEqual(rows.completed, {"B", "C"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import json
+import os
+import re
+import unittest
+
+from injectors import (
+    LOG_BATCH_MAX,
+    WEB_CSS,
+    WEB_EXPORTS_PATTERN,
+    WEB_ICON,
+    WEB_JS,
+    AppliedStates,
+    build_apply_js,
+    build_deck_browser_js,
+    build_overview_js,
+    build_reviewer_js,
+    parse_log_batch,
+)
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+
+class TestWebAssets(unittest.TestCase):
+    def test_assets_exist_and_are_exported(self):
+        for rel in (WEB_JS, WEB_CSS, WEB_ICON):
+            self.assertTrue(os.path.exists(os.path.join(ROOT, *rel.split("/"))), rel)
+            self.assertTrue(re.fullmatch(WEB_EXPORTS_PATTERN, rel), rel)
+
+    def test_script_contract(self):
+        with open(os.path.join(ROOT, *WEB_JS.split("/")), encoding="utf-8") as f:
+            js = f.read()
+        self.assertIn("ankiscape_open_menu", js)
+        self.assertIn("window.ankiscape = { apply: apply, command: command }", js)
+        # The icon is derived from the script URL, so it must match WEB_ICON
+        self.assertIn(WEB_ICON, js)
+
+    def test_apply_call_is_small_and_sanitised(self):
+        js = build_apply_js("reviewer", "top", True)
+        self.assertLess(len(js), 100)
+        state = json.loads(js[js.index("(") + 1:js.rindex(")")])
+        self.assertEqual(state, {"page": "reviewer", "pos": "right", "enabled": True})
+        self.assertTrue(js.startswith("window.ankiscape&&"))
+
+    def test_apply_call_enables_logging_only_in_debug(self):
+        js = build_apply_js("overview", "left", False, debug=True)
+        state = json.loads(js[js.index("(") + 1:js.rindex(")")])
+        self.assertIs(state["debug"], True)
+
+
+class TestLogChannel(unittest.TestCase):
+    def test_inline_scripts_send_no_logs_outside_debug(self):
+        builders = (
+            lambda debug: build_reviewer_js("right", "", debug),
+            lambda debug: build_overview_js("right", "", debug),
+            lambda debug: build_deck_browser_js(True, "right", "", debug),
+        )
+        for build in builders:
+            quiet = build(False)
+            self.assertNotIn("ankiscape_log", quiet)
+            self.assertIn("ankiscape_open_menu", quiet)
+            self.assertIn("ankiscape_log:", build(True))
+
+    def test_parse_log_batch(self):
+        payload = json.dumps([[1000, "hover_enter"], [1250, "click"], "plain"])
+        self.assertEqual(parse_log_batch(payload), ["js: +0ms hover_enter", "js: +250ms click", "js: plain"])
+
+    def test_parse_log_batch_rejects_malformed_payloads(self):
+        self.assertEqual(parse_log_batch("not json"), [])
+        self.assertEqual(parse_log_batch('{"a": 1}'), [])
+        self.assertEqual(parse_log_batch("[[1, 2, 3], null]"), [])
+
+    def test_parse_log_batch_is_capped(self):
+        payload = json.dumps([[i, "x"] for i in range(LOG_BATCH_MAX + 5)])
+        lines = parse_log_batch(payload)
+        self.assertEqual(len(lines), LOG_BATCH_MAX + 1)
+        self.assertIn("5 more", lines[-1])
+
+
+class TestAppliedStates(unittest.TestCase):
+    def test_unchanged_state_is_skipped_until_page_reloads(self):
+        applied = AppliedStates()
+        self.assertTrue(applied.needs_apply("reviewer", (True, "right")))
+        self.assertFalse(applied.needs_apply("reviewer", (True, "right")))
+        self.assertTrue(applied.needs_apply("overview", (True, "right")))
+        self.assertTrue(applied.needs_apply("reviewer", (True, "left")))
+        applied.forget("reviewer")
+        self.assertTrue(applied.needs_apply("reviewer", (True, "left")))
+        self.assertFalse(applied.needs_apply("overview", (True, "right")))
+        applied.forget()
+        self.assertTrue(applied.needs_apply("overview", (True, "right")))
+
+
+if __name__ == "__main__":
+    unittest.main()
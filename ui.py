@@ -1,6 +1,8 @@
 # ui.py - UI components and dialogs for AnkiScape
 
 import os
+import time
+import weakref
 from typing import Optional
 import datetime
 
@@ -20,8 +22,13 @@ try:
         QPushButton,
         QListWidget,
         QListWidgetItem,
-        QGraphicsOpacityEffect,
         QPropertyAnimation,
+        QVariantAnimation,
+        QTimer,
+        QPainter,
+        QColor,
+        QImage,
+        QRectF,
         QEasingCurve,
         QPoint,
         QMessageBox,
@@ -51,13 +58,12 @@ try:
         ORE_DATA,
         TREE_DATA,
         BAR_DATA,
-        GEM_DATA,
         CRAFTING_DATA,
         ORE_IMAGES,
         TREE_IMAGES,
         BAR_IMAGES,
-        GEM_IMAGES,
         CRAFTED_ITEM_IMAGES,
+        ITEM_CATEGORIES,
         ACHIEVEMENTS,
         current_dir,
     )
@@ -68,20 +74,52 @@ except Exception:
         ORE_DATA,
         TREE_DATA,
         BAR_DATA,
-        GEM_DATA,
         CRAFTING_DATA,
         ORE_IMAGES,
         TREE_IMAGES,
         BAR_IMAGES,
-        GEM_IMAGES,
         CRAFTED_ITEM_IMAGES,
+        ITEM_CATEGORIES,
         ACHIEVEMENTS,
         current_dir,
     )
 try:
-    from .logic_pure import can_cut_tree_pure, can_mine_ore_pure, can_craft_item_pure, can_smelt_any_bar_pure
+    from .logic_pure import can_cut_tree_pure, can_mine_ore_pure, can_craft_item_pure, can_smelt_any_bar_pure, get_level_curve
 except Exception:
-    from logic_pure import can_cut_tree_pure, can_mine_ore_pure, can_craft_item_pure, can_smelt_any_bar_pure  # type: ignore
+    from logic_pure import can_cut_tree_pure, can_mine_ore_pure, can_craft_item_pure, can_smelt_any_bar_pure, get_level_curve  # type: ignore
+
+try:
+    from .deferred import UI_REFRESH
+    from .images import IMAGES, path_exists
+    from . import views
+    from .settings import SETTINGS
+    from .menu_pure import (
+        MenuViewModel,
+        SECTION_SKILLS,
+        SECTION_MINING,
+        SECTION_WOODCUTTING,
+        SECTION_SMITHING,
+        SECTION_CRAFTING,
+        SECTION_BANK,
+        SECTION_STATS,
+        SECTION_ACHIEVEMENTS,
+    )
+except Exception:
+    from deferred import UI_REFRESH  # type: ignore
+    from images import IMAGES, path_exists  # type: ignore
+    import views  # type: ignore
+    from settings import SETTINGS  # type: ignore
+    from menu_pure import (  # type: ignore
+        MenuViewModel,
+        SECTION_SKILLS,
+        SECTION_MINING,
+        SECTION_WOODCUTTING,
+        SECTION_SMITHING,
+        SECTION_CRAFTING,
+        SECTION_BANK,
+        SECTION_STATS,
+        SECTION_ACHIEVEMENTS,
+    )
 
 # Central debug logger (support both package and flat import in tests)
 try:
@@ -94,26 +132,10 @@ except Exception:
             pass
 
 # Lightweight context for the open Main Menu to allow dynamic UI refreshes
-_MAIN_MENU_CTX = {"dialog": None, "smith_btn": None, "craft_btn": None, "warn_label": None}
+_MAIN_MENU_CTX = {"dialog": None, "smith_btn": None, "craft_btn": None, "warn_label": None, "menu": None}
 
-def get_config_bool(key: str, default: bool = True) -> bool:
-    """Safely read a boolean config from Anki's profile; fallback to default when unavailable.
-    This helper avoids importing aqt in callers and is easy to monkeypatch in tests.
-    """
-    try:
-        if mw and getattr(mw, 'col', None):
-            return bool(mw.col.get_config(key, default))
-    except Exception:
-        pass
-    return bool(default)
-
-def is_floating_xp_enabled() -> bool:
-    """Return True if floating XP popups are enabled (default True)."""
-    return get_config_bool("ankiscape_floating_xp_enabled", True)
-
-def is_popups_enabled() -> bool:
-    """Return True if achievement/level-up popups are enabled (default True)."""
-    return get_config_bool("ankiscape_popups_enabled", True)
+# A closed main menu is kept (hidden) for reopening; it is destroyed after this long unused
+MENU_IDLE_RELEASE_MS = 10 * 60 * 1000
 
 def migrate_legacy_settings() -> None:
     """One-time migration from legacy setting keys to the current schema.
@@ -160,6 +182,48 @@ def focus_main_menu_if_open() -> bool:
         pass
     return False
 
+def refresh_main_menu(current_skill=None) -> set:
+    """Update the kept-alive main menu in place and return the sections that were refreshed.
+    Only sections whose data changed since the menu last showed it are touched; tabs that
+    were never opened are skipped, since they are built from live data on first activation.
+    """
+    menu = _MAIN_MENU_CTX.get("menu")
+    if not menu:
+        return set()
+    state = menu["state"]
+    if current_skill is not None:
+        state["current_skill"] = current_skill
+    dirty = menu["model"].update(menu["player_data"], state["current_skill"])
+    for section in sorted(dirty):
+        refresh = menu["refreshers"].get(section)
+        if refresh is None:
+            continue
+        try:
+            refresh()
+        except Exception as e:
+            _debug_log(f"ui: refreshing menu section {section} failed: {e}")
+    return dirty
+
+def release_main_menu(*_args, **_kwargs) -> None:
+    """Destroy the kept-alive main menu (profile close, or after sitting hidden for a while).
+    Accepts and ignores hook arguments so it can be registered on any Anki hook.
+    """
+    menu = _MAIN_MENU_CTX.get("menu")
+    _MAIN_MENU_CTX.update({"dialog": None, "smith_btn": None, "craft_btn": None, "warn_label": None, "menu": None})
+    if not menu:
+        return
+    try:
+        menu["release_timer"].stop()
+    except Exception:
+        pass
+    try:
+        dlg = menu["dialog"]
+        dlg.hide()
+        dlg.deleteLater()
+    except Exception:
+        pass
+    _debug_log("ui: main menu released")
+
 def refresh_skill_availability(can_smelt_any_bar: bool, can_craft_any_item: bool):
     """Auto-enable Smithing/Crafting buttons when they become available while the menu is open.
     Never auto-selects the skill; users must choose it explicitly. Only enables; does not disable.
@@ -184,41 +248,61 @@ def refresh_skill_availability(can_smelt_any_bar: bool, can_craft_any_item: bool
         pass
 
 
+# Delay before building a likely-next menu tab, so the visible tab paints first
+MENU_PREFETCH_DELAY_MS = 120
+
+
+class LazyTabs:
+    """Builds tab pages on first activation instead of when the window opens.
+
+    add(index, build) registers a page; ensure(index) runs its build once.
+    next_prefetch(current) picks the unbuilt page to build during idle time:
+    the caller's likely tabs first (e.g. the active skill's), then the tab to
+    the right of the current one.
+    """
+
+    def __init__(self, likely=()):
+        self._builders = {}
+        self.built = set()
+        self.likely = list(likely)
+
+    def add(self, index: int, build) -> None:
+        self._builders[index] = build
+
+    def is_built(self, index: int) -> bool:
+        return index in self.built
+
+    def ensure(self, index: int) -> bool:
+        """Build the page at index if needed; returns True when it was built now."""
+        build = self._builders.get(index)
+        if build is None or index in self.built:
+            return False
+        # Mark first so a failing or re-entrant build never runs twice
+        self.built.add(index)
+        try:
+            build()
+        except Exception as e:
+            _debug_log(f"ui: building tab {index} failed: {e}")
+        return True
+
+    def pending(self) -> list:
+        return sorted(i for i in self._builders if i not in self.built)
+
+    def next_prefetch(self, current: int):
+        for index in list(self.likely) + [current + 1]:
+            if index in self._builders and index not in self.built:
+                return index
+        return None
+
+
 def compute_level_progress(level: int, exp: float, exp_table: list) -> tuple[int, float, int]:
     """Pure helper for computing percent, remaining XP, and target level.
     Returns (percent, xp_remaining, target_level). Clamps values sensibly.
     - At max level (99 or end of table), always return 100% and 0 remaining.
+    Delegates to the shared LevelCurve for exp_table.
     """
     try:
-        lvl = max(1, int(level))
-        xp = float(exp or 0)
-        table_len = len(exp_table)
-
-        # If at or above the maximum supported level, treat progress as complete.
-        # Many games cap at 99; also guard when lvl maps to the last index of the table.
-        if lvl >= 99 or lvl >= table_len:
-            return 100, 0.0, 99
-
-        # Compute thresholds for the current level segment
-        prev = float(exp_table[lvl - 1]) if (lvl - 1) < table_len else 0.0
-        nxt = float(exp_table[lvl]) if lvl < table_len else prev
-
-        # If thresholds are degenerate (e.g., at end), treat as maxed
-        if nxt <= prev:
-            return 100, 0.0, 99
-
-        # Clamp percent to [0, 100] and remaining to >= 0
-        span = nxt - prev
-        pct_float = ((xp - prev) / span) * 100.0
-        if xp >= nxt:
-            pct = 100
-            remain = 0.0
-        else:
-            pct = int(max(0.0, min(100.0, pct_float)))
-            remain = max(0.0, nxt - xp)
-
-        target_lv = min(lvl + 1, 99)
-        return pct, remain, target_lv
+        return get_level_curve(exp_table).progress(level, exp)
     except Exception:
         # Fallback on error: show safe defaults and a reasonable next target
         try:
@@ -228,13 +312,199 @@ def compute_level_progress(level: int, exp: float, exp_table: list) -> tuple[int
         return 0, 0.0, min(safe_lvl + 1, 99)
 
 
+_HUD_SKILLS = ("Mining", "Woodcutting", "Smithing", "Crafting")
+
+
+def hud_render_state(player_data: dict, skill: str, exp_table: list) -> tuple:
+    """Everything the Review HUD displays, as a comparable tuple:
+    (skill, level, percent, xp_remaining, target_level). Equal states render identically.
+    """
+    if skill not in _HUD_SKILLS:
+        return ("None", 0, 0, 0, 0)
+    level = int(player_data.get(f"{skill.lower()}_level", 1) or 1)
+    exp = float(player_data.get(f"{skill.lower()}_exp", 0) or 0)
+    pct, remain, target_lv = compute_level_progress(level, exp, exp_table)
+    # Remaining XP is displayed without decimals; round so sub-1 XP changes compare equal
+    return (skill, level, pct, int(round(remain)), target_lv)
+
+
+def hud_texts(state: tuple) -> tuple:
+    """(title, subtitle) for a hud_render_state tuple."""
+    skill, level, pct, remain, target_lv = state
+    if skill == "None":
+        return "No skill selected", "Open AnkiScape menu to choose a skill"
+    return f"{skill} — Lv {level}", f"{pct}% to Lv {target_lv} • {remain:,} XP to next"
+
+
+# XP arriving within this window of the previous gain merges into the visible toast
+XP_TOAST_MERGE_SECONDS = 1.2
+
+
+class XpToastCounter:
+    """Merges XP gains that arrive close together into one "+N XP" toast.
+
+    add() returns (total XP, number of gains) for the toast to display; a gain
+    after a quiet period of more than window seconds starts a new toast.
+    """
+
+    def __init__(self, window: float = XP_TOAST_MERGE_SECONDS):
+        self.window = window
+        self.total = 0
+        self.count = 0
+        self._last = None
+
+    def add(self, exp, now: float) -> tuple:
+        if self._last is None or now - self._last > self.window:
+            self.total = 0
+            self.count = 0
+        self.total += exp
+        self.count += 1
+        self._last = now
+        return self.total, self.count
+
+    def reset(self) -> None:
+        self.total = 0
+        self.count = 0
+        self._last = None
+
+
+def xp_toast_text(total, count: int) -> str:
+    if count > 1:
+        return f"+{int(total)} XP ×{count}"
+    return f"+{int(total)} XP"
+
+
+# Overlay look: panel corner radius and a soft drop shadow below it
+OVERLAY_CORNER = 10
+OVERLAY_SHADOW_RADIUS = 9
+OVERLAY_SHADOW_OFFSET = 2
+OVERLAY_SHADOW_ALPHA = 110
+
+
+def shadow_alpha_mask(radius: int, corner: int, dpr: float = 1.0, peak: int = OVERLAY_SHADOW_ALPHA) -> tuple:
+    """Alpha-only image of a rounded panel's soft shadow, for nine-slice drawing.
+
+    The mask covers (2 * (radius + corner) + 1) logical pixels square at device
+    pixel ratio dpr; the panel occupies the middle with radius pixels of falloff
+    around it. Returns (side in device pixels, bytes with one alpha per pixel).
+    """
+    border = radius + corner
+    side = 2 * border + 1
+    px = max(1, int(-(-side * dpr // 1)))
+    half = side / 2.0
+    inner = half - radius - corner
+    data = bytearray(px * px)
+    for row in range(px):
+        qy = abs((row + 0.5) / dpr - half) - inner
+        for col in range(px):
+            qx = abs((col + 0.5) / dpr - half) - inner
+            # Signed distance to the rounded panel edge (negative inside)
+            outside = (max(qx, 0.0) ** 2 + max(qy, 0.0) ** 2) ** 0.5
+            dist = outside + min(max(qx, qy), 0.0) - corner
+            if dist <= 0:
+                alpha = peak
+            elif dist >= radius:
+                alpha = 0
+            else:
+                t = 1.0 - dist / radius
+                alpha = int(peak * t * t + 0.5)
+            data[row * px + col] = alpha
+    return px, bytes(data)
+
+
+def nine_slice_rects(width: float, height: float, border: float) -> list:
+    """Source/target rect pairs ((x, y, w, h), (x, y, w, h)) that stretch a
+    (2 * border + 1) square image over width x height, keeping the corners intact.
+    """
+    src_spans = [(0, border), (border, 1), (border + 1, border)]
+    dst_x = [(0, border), (border, width - 2 * border), (width - border, border)]
+    dst_y = [(0, border), (border, height - 2 * border), (height - border, border)]
+    rects = []
+    for (sy, sh), (dy, dh) in zip(src_spans, dst_y):
+        for (sx, sw), (dx, dw) in zip(src_spans, dst_x):
+            if dw > 0 and dh > 0:
+                rects.append(((sx, sy, sw, sh), (dx, dy, dw, dh)))
+    return rects
+
+
+# Generated shadow masks, per device pixel ratio
+_SHADOW_CACHE = {}
+
+# Memoised os.path.exists (misses included) shared with the image service
+_path_exists = path_exists
+
+
+def scaled_pixmap(path: str, size: int, dpr: float = 1.0):
+    """Return a QPixmap of path scaled to size x size logical pixels at device pixel ratio dpr.
+    Decoded synchronously once, then served from the shared image cache.
+    """
+    return IMAGES.load(path, size, dpr)
+
+
+def _screen_dpr() -> float:
+    try:
+        return float(mw.devicePixelRatioF())
+    except Exception:
+        return 1.0
+
+
+def set_label_image(label, path: str, size: int) -> None:
+    """Show path in label at size x size; decodes off the GUI thread on a cache miss."""
+    dpr = _screen_dpr()
+    pm = IMAGES.request(path, size, dpr, label.setPixmap)
+    label.setPixmap(pm if pm is not None else IMAGES.placeholder(size, dpr))
+
+
+def set_item_icon(item, path: str, size: int) -> None:
+    """Set a list item's icon to path at size x size; decodes off the GUI thread on a cache miss."""
+    dpr = _screen_dpr()
+    pm = IMAGES.request(path, size, dpr, lambda loaded: item.setIcon(QIcon(loaded)))
+    item.setIcon(QIcon(pm if pm is not None else IMAGES.placeholder(size, dpr)))
+
+
 # UI Classes
 if HAS_QT:
     # Shared HUD theme
     _HUD_ACCENT = "#4CAF50"  # Material green
-    _HUD_BG = "rgba(20, 20, 20, 180)"
+    _HUD_BG = (20, 20, 20, 180)
     _HUD_BORDER = "rgba(255, 255, 255, 60)"
 
+    # Space around the HUD panel that the shadow paints into
+    _SHADOW_MARGIN = OVERLAY_SHADOW_RADIUS
+
+    def _shadow_pixmap(dpr: float):
+        """Shadow mask as a QPixmap, generated once per device pixel ratio."""
+        key = (OVERLAY_SHADOW_RADIUS, OVERLAY_CORNER, dpr)
+        pm = _SHADOW_CACHE.get(key)
+        if pm is None:
+            px, data = shadow_alpha_mask(OVERLAY_SHADOW_RADIUS, OVERLAY_CORNER, dpr)
+            img = QImage(data, px, px, px, QImage.Format.Format_Alpha8).copy()
+            pm = _SHADOW_CACHE[key] = QPixmap.fromImage(img)
+        return pm
+
+    def _paint_overlay_panel(painter, panel: "QRectF", dpr: float, shadow: bool = True) -> None:
+        """Paint the shared overlay look: cached nine-slice shadow, then the rounded panel."""
+        if shadow:
+            pm = _shadow_pixmap(dpr)
+            r = OVERLAY_SHADOW_RADIUS
+            area = panel.adjusted(-r, -r, r, r).translated(0, OVERLAY_SHADOW_OFFSET)
+            scale = pm.width() / (2 * (r + OVERLAY_CORNER) + 1)
+            for (sx, sy, sw, sh), (dx, dy, dw, dh) in nine_slice_rects(area.width(), area.height(), r + OVERLAY_CORNER):
+                painter.drawPixmap(
+                    QRectF(area.x() + dx, area.y() + dy, dw, dh),
+                    pm,
+                    QRectF(sx * scale, sy * scale, sw * scale, sh * scale),
+                )
+        painter.setPen(QColor(255, 255, 255, 60))
+        painter.setBrush(QColor(*_HUD_BG))
+        painter.drawRoundedRect(panel.adjusted(0.5, 0.5, -0.5, -0.5), OVERLAY_CORNER, OVERLAY_CORNER)
+
+    def _device_pixel_ratio(widget) -> float:
+        try:
+            return float(widget.devicePixelRatioF())
+        except Exception:
+            return 1.0
+
     class ReviewHUD(QWidget):
         """A compact overlay shown on the review screen (lower center).
         Displays current skill (icon + name), level, and progress to next level.
@@ -254,7 +524,8 @@ if HAS_QT:
 
             # Layout
             root = QHBoxLayout(self)
-            root.setContentsMargins(12, 10, 12, 10)
+            m = _SHADOW_MARGIN
+            root.setContentsMargins(12 + m, 10 + m, 12 + m, 10 + m + OVERLAY_SHADOW_OFFSET)
             root.setSpacing(10)
 
             self.icon_lbl = QLabel()
@@ -295,27 +566,7 @@ if HAS_QT:
 
             root.addLayout(info, 1)
 
-            # Aesthetic container style
-            self.setStyleSheet(
-                f"""
-                QWidget#AnkiScapeReviewHUD {{
-                    background: {_HUD_BG};
-                    border: 1px solid {_HUD_BORDER};
-                    border-radius: 10px;
-                }}
-                """
-            )
-
-            # Shadow for better contrast if available
-            try:
-                from aqt.qt import QGraphicsDropShadowEffect  # type: ignore
-                shadow = QGraphicsDropShadowEffect(self)
-                shadow.setBlurRadius(18)
-                shadow.setOffset(0, 2)
-                shadow.setColor(Qt.GlobalColor.black)
-                self.setGraphicsEffect(shadow)
-            except Exception:
-                pass
+            # Background and shadow are painted in paintEvent (no QGraphicsEffect offscreen pass)
 
             # Track parent resize/move to keep position
             try:
@@ -324,6 +575,9 @@ if HAS_QT:
             except Exception:
                 pass
 
+            # Last rendered hud_render_state and text width (for diffing)
+            self._state = None
+            self._text_width = None
             self.hide()
 
         def _skill_icon_path(self, skill: str) -> Optional[str]:
@@ -337,65 +591,48 @@ if HAS_QT:
             if not fname:
                 return None
             p = os.path.join(current_dir, "icon", fname)
-            return p if os.path.exists(p) else None
+            return p if _path_exists(p) else None
 
         def _placeholder_icon_path(self) -> Optional[str]:
             p = os.path.join(current_dir, "crafteditems", "None.png")
-            return p if os.path.exists(p) else None
+            return p if _path_exists(p) else None
 
         def set_data(self, player_data: dict, skill: str) -> None:
-            """Update HUD content from player data and currently active skill."""
-            skill = skill or "None"
-            if skill not in ("Mining", "Woodcutting", "Smithing", "Crafting"):
-                # No skill selected: show placeholder state
-                ip = self._placeholder_icon_path()
+            """Update HUD content from player data and currently active skill.
+            Skips all Qt work when the displayed state is unchanged.
+            """
+            state = hud_render_state(player_data, skill or "None", EXP_TABLE)
+            if state == self._state:
+                if not self.isVisible():
+                    self.show()
+                return
+            previous, self._state = self._state, state
+
+            # Icon (only when the skill changes)
+            if previous is None or previous[0] != state[0]:
+                ip = self._skill_icon_path(state[0]) if state[0] != "None" else self._placeholder_icon_path()
                 if ip:
-                    pm = QPixmap(ip)
-                    self.icon_lbl.setPixmap(pm.scaled(28, 28, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+                    self.icon_lbl.setPixmap(scaled_pixmap(ip, 28, _device_pixel_ratio(self)))
                 else:
                     self.icon_lbl.clear()
-                self.title_lbl.setText("No skill selected")
-                self.progress.setValue(0)
-                self.sub_lbl.setText("Open AnkiScape menu to choose a skill")
-                # Always show progress/subtext when HUD is enabled
-                try:
-                    self.progress.setVisible(True)
-                    self.sub_lbl.setVisible(True)
-                except Exception:
-                    pass
-                self.adjustSize()
-                self._reposition()
-                self.show()
-                return
-
-            # Icon
-            ip = self._skill_icon_path(skill)
-            if ip:
-                pm = QPixmap(ip)
-                self.icon_lbl.setPixmap(pm.scaled(28, 28, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-            else:
-                self.icon_lbl.clear()
 
-            level_key = f"{skill.lower()}_level"
-            exp_key = f"{skill.lower()}_exp"
-            level = int(player_data.get(level_key, 1) or 1)
-            exp = float(player_data.get(exp_key, 0) or 0)
-            self.title_lbl.setText(f"{skill} — Lv {level}")
+            title, sub = hud_texts(state)
+            self.title_lbl.setText(title)
+            self.progress.setValue(state[2])
+            self.sub_lbl.setText(sub)
 
-            # Compute progress within current level via pure helper
-            pct, remain, target_lv = compute_level_progress(level, exp, EXP_TABLE)
-            self.progress.setValue(pct)
-            self.sub_lbl.setText(f"{pct}% to Lv {target_lv} • {remain:,.0f} XP to next")
-
-            # Always show progress/subtext when HUD is enabled
+            # Relayout only when the text needs a different width
             try:
-                self.progress.setVisible(True)
-                self.sub_lbl.setVisible(True)
+                text_width = max(
+                    self.title_lbl.fontMetrics().horizontalAdvance(title),
+                    self.sub_lbl.fontMetrics().horizontalAdvance(sub),
+                )
             except Exception:
-                pass
-
-            self.adjustSize()
-            self._reposition()
+                text_width = None
+            if text_width is None or text_width != self._text_width:
+                self._text_width = text_width
+                self.adjustSize()
+                self._reposition()
             self.show()
 
         def _reposition(self) -> None:
@@ -406,21 +643,38 @@ if HAS_QT:
                 pw = par.width()
                 ph = par.height()
                 self.adjustSize()
-                w = min(max(self.width(), 360), 520)
+                m = _SHADOW_MARGIN
+                # Clamp the visible panel; the widget adds the shadow margin around it
+                w = min(max(self.width() - 2 * m, 360), 520) + 2 * m
                 h = self.height()
                 x = int((pw - w) / 2)
-                # Keep clear of bottom actions/status; give more breathing room
-                y = int(ph - h - 72)
+                # Keep the panel clear of bottom actions/status; give more breathing room
+                y = int(ph - h - 72 + m + OVERLAY_SHADOW_OFFSET)
                 self.setFixedWidth(w)
                 self.move(x, y)
             except Exception:
                 pass
 
+        def panel_top(self) -> int:
+            """y of the visible panel in parent coordinates."""
+            return self.y() + _SHADOW_MARGIN
+
+        def paintEvent(self, event):  # type: ignore[override]
+            painter = QPainter(self)
+            try:
+                painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+                m = _SHADOW_MARGIN
+                panel = QRectF(self.rect()).adjusted(m, m, -m, -(m + OVERLAY_SHADOW_OFFSET))
+                _paint_overlay_panel(painter, panel, _device_pixel_ratio(self))
+            finally:
+                painter.end()
+
         def eventFilter(self, obj, event):  # type: ignore[override]
             try:
                 et = event.type()
                 if et in (QEvent.Type.Resize, QEvent.Type.Move, QEvent.Type.Show):
-                    self._reposition()
+                    # A window drag/resize fires many events; reposition once per frame
+                    UI_REFRESH.invalidate("position")
             except Exception:
                 pass
             return False
@@ -429,59 +683,76 @@ if HAS_QT:
         """Floating XP indicator that fades and floats above the HUD (lower center)."""
         def __init__(self, parent):
             super().__init__(parent)
-            self.setStyleSheet(
-                f"""
-                QLabel {{
-                    background: {_HUD_BG};
-                    color: white;
-                    border: 1px solid {_HUD_BORDER};
-                    border-radius: 10px;
-                    padding: 6px 10px;
-                    font-weight: 700;
-                }}
-                """
-            )
+            # Painted in paintEvent; the label only provides text and size hints
+            self.setContentsMargins(10, 6, 10, 6)
+            font = self.font()
+            font.setBold(True)
+            self.setFont(font)
+            self.setObjectName("AnkiScapeExpPopup")
             self.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+            self._counter = XpToastCounter()
+
+            # One pair of animations for the popup's lifetime; opacity is applied as painter alpha
+            self._opacity = 1.0
+            self.fade_animation = QVariantAnimation(self)
+            self.fade_animation.valueChanged.connect(self._set_opacity)
+            self.fade_animation.setDuration(1800)
+            self.fade_animation.setStartValue(1.0)
+            self.fade_animation.setEndValue(0.0)
+            self.fade_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+            self.fade_animation.finished.connect(self._on_fade_finished)
+
+            self.float_animation = QPropertyAnimation(self, b"pos", self)
+            self.float_animation.setDuration(1800)
+            self.float_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
             self.hide()
 
         def show_exp(self, exp):
-            # Format like +25 XP, color accent via left border
-            self.setText(f"+{int(exp)} XP")
+            total, count = self._counter.add(exp, time.monotonic())
+            self.setText(xp_toast_text(total, count))
             self.adjustSize()
-            self.show()
 
             # Position: centered horizontally, just above the HUD
             try:
                 par = self.parent() if self.parent() is not None else mw
-                hud = _REVIEW_HUD
-                base_y = (hud.y() - 14) if (hud and hud.isVisible()) else (par.height() - 140)
+                hud = get_review_hud()
+                base_y = (hud.panel_top() - 14) if (hud and hud.isVisible()) else (par.height() - 140)
                 x = int((par.width() - self.width()) / 2)
-                y = int(base_y)
-                self.move(x, y)
+                start_pos = QPoint(x, int(base_y))
             except Exception:
                 # Fallback to lower center
-                self.move(max(10, int((self.parent().width() - self.width()) / 2)), self.parent().height() - 140)
-
-            # Animations
-            self.opacity_effect = QGraphicsOpacityEffect(self)
-            self.setGraphicsEffect(self.opacity_effect)
-            self.fade_animation = QPropertyAnimation(self.opacity_effect, b"opacity")
-            self.fade_animation.setDuration(1800)
-            self.fade_animation.setStartValue(1.0)
-            self.fade_animation.setEndValue(0.0)
-            self.fade_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-            self.fade_animation.finished.connect(self.hide)
+                start_pos = QPoint(max(10, int((self.parent().width() - self.width()) / 2)), self.parent().height() - 140)
+            self.move(start_pos)
+            self.show()
 
-            self.float_animation = QPropertyAnimation(self, b"pos")
-            self.float_animation.setDuration(1800)
-            start_pos = self.pos()
-            end_pos = start_pos - QPoint(0, 36)
+            # Restart the pooled animations from the top instead of allocating new ones
+            self.fade_animation.stop()
+            self.float_animation.stop()
             self.float_animation.setStartValue(start_pos)
-            self.float_animation.setEndValue(end_pos)
-            self.float_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+            self.float_animation.setEndValue(start_pos - QPoint(0, 36))
             self.fade_animation.start()
             self.float_animation.start()
+
+        def _set_opacity(self, value):
+            self._opacity = float(value)
+            self.update()
+
+        def paintEvent(self, event):  # type: ignore[override]
+            painter = QPainter(self)
+            try:
+                painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+                painter.setOpacity(self._opacity)
+                _paint_overlay_panel(painter, QRectF(self.rect()), _device_pixel_ratio(self), shadow=False)
+                painter.setPen(QColor(255, 255, 255))
+                painter.drawText(self.contentsRect(), Qt.AlignmentFlag.AlignCenter, self.text())
+            finally:
+                painter.end()
+
+        def _on_fade_finished(self):
+            self.hide()
+            self._counter.reset()
+
 else:
     # Minimal placeholder to keep references safe during tests
     class ExpPopup:
@@ -502,102 +773,161 @@ else:
 # Move all dialog, popup, and menu functions here from __init__.py
 
 # --- Review HUD management ---
-_REVIEW_HUD = None  # type: ignore
+class OverlayRegistry:
+    """Weak references to the single ReviewHUD and ExpPopup.
+
+    Widgets are owned by their Qt parent; a dead reference means the widget was
+    deleted and must be recreated. The stray-widget sweep (leftovers from reloads
+    or older versions) runs once after each profile load or add-on reload instead
+    of on every card.
+    """
+
+    def __init__(self):
+        self._refs = {}
+        self.sweep_needed = True
+
+    def get(self, key):
+        ref = self._refs.get(key)
+        obj = ref() if ref is not None else None
+        if obj is None and ref is not None:
+            del self._refs[key]
+        return obj
+
+    def set(self, key, widget) -> None:
+        self._refs[key] = weakref.ref(widget)
+
+    def discard(self, key) -> None:
+        self._refs.pop(key, None)
+
+    def owns(self, widget) -> bool:
+        return any(ref() is widget for ref in self._refs.values())
+
+
+_OVERLAYS = OverlayRegistry()
+_OVERLAY_OBJECT_NAMES = ("AnkiScapeReviewHUD", "AnkiScapeExpPopup")
+
+
+def get_review_hud():
+    """Return the live Review HUD, or None if it has not been created (or was deleted)."""
+    return _OVERLAYS.get("hud")
+
+
+def reset_overlay_sweep(*_args, **_kwargs) -> None:
+    """Request one stray-overlay sweep on the next ensure (call on profile load)."""
+    _OVERLAYS.sweep_needed = True
+
 
 def _cleanup_extra_huds() -> None:
-    """Hide and delete any stray HUD widgets from prior versions or reloads.
-    Ensures only a single child HUD exists under mw and no top-level HUDs remain.
+    """Hide and delete any stray HUD/XP popup widgets from prior versions or reloads.
+    Ensures only the registered overlays exist under mw and no top-level ones remain.
+    Walks the widget tree, so callers run it only when a sweep is needed.
     """
     if not HAS_QT:
         return
+    _OVERLAYS.sweep_needed = False
+
+    def _remove(w):
+        try:
+            w.hide()
+        except Exception:
+            pass
+        try:
+            w.deleteLater()
+        except Exception:
+            pass
+
     try:
         try:
             from aqt.qt import QApplication  # type: ignore
         except Exception:
             QApplication = None  # type: ignore
-        # Remove top-level HUDs that may have been created with ToolTip flags
+        # Remove top-level overlays that may have been created with ToolTip flags
         if QApplication is not None:
             for w in QApplication.topLevelWidgets():
                 try:
-                    if getattr(w, "objectName", lambda: "")() == "AnkiScapeReviewHUD":
-                        if _REVIEW_HUD is None or w is not _REVIEW_HUD:
-                            try:
-                                w.hide()
-                            except Exception:
-                                pass
-                            try:
-                                w.deleteLater()
-                            except Exception:
-                                pass
+                    if getattr(w, "objectName", lambda: "")() in _OVERLAY_OBJECT_NAMES and not _OVERLAYS.owns(w):
+                        _remove(w)
                 except Exception:
                     pass
         # Also remove duplicate children under mw
         par = mw
         if par is not None:
             from aqt.qt import QWidget as _QW  # type: ignore
-            for child in par.findChildren(_QW, "AnkiScapeReviewHUD"):
-                if _REVIEW_HUD is None or child is not _REVIEW_HUD:
-                    try:
-                        child.hide()
-                    except Exception:
-                        pass
-                    try:
-                        child.deleteLater()
-                    except Exception:
-                        pass
+            for name in _OVERLAY_OBJECT_NAMES:
+                for child in par.findChildren(_QW, name):
+                    if not _OVERLAYS.owns(child):
+                        _remove(child)
     except Exception:
         pass
 
 def ensure_review_hud() -> None:
     """Create the Review HUD if missing and attach to mw."""
-    global _REVIEW_HUD
     try:
         if not HAS_QT:
             return
-        # Proactively clean up any leftover HUD windows from previous runs
-        _cleanup_extra_huds()
-        if _REVIEW_HUD is None:
+        # Clean up leftover HUD windows from previous runs once per profile load/reload
+        if _OVERLAYS.sweep_needed:
+            _cleanup_extra_huds()
+        hud = _OVERLAYS.get("hud")
+        if hud is None:
             parent = mw
             if parent is None:
                 return
-            _REVIEW_HUD = ReviewHUD(parent)
+            hud = ReviewHUD(parent)
             try:
                 # Ensure correct parenting in case older instances detached
-                _REVIEW_HUD.setParent(parent)
+                hud.setParent(parent)
             except Exception:
                 pass
+            _OVERLAYS.set("hud", hud)
         # ensure on top and visible (content set by update call)
         try:
-            _REVIEW_HUD.raise_()
+            hud.raise_()
         except Exception:
             pass
     except Exception:
         pass
 
+def ensure_exp_popup(factory, parent):
+    """Return the registered XP popup, creating it with factory(parent) if missing."""
+    popup = _OVERLAYS.get("exp_popup")
+    if popup is None and parent is not None:
+        popup = factory(parent)
+        try:
+            _OVERLAYS.set("exp_popup", popup)
+        except TypeError:
+            pass
+    return popup
+
 def update_review_hud(player_data: dict, current_skill: str) -> None:
     """Update and show the Review HUD based on current data."""
     try:
         if not HAS_QT:
             return
         # Respect setting to fully disable the review HUD visuals
-        if not get_config_bool("ankiscape_review_hud_enabled", True):
-            try:
-                if _REVIEW_HUD is not None and hasattr(_REVIEW_HUD, "hide"):
-                    _REVIEW_HUD.hide()
-            except Exception:
-                pass
+        if not SETTINGS.review_hud_enabled:
+            hide_review_hud()
             return
         ensure_review_hud()
-        if _REVIEW_HUD is not None:
-            _REVIEW_HUD.set_data(player_data, current_skill)
+        hud = _OVERLAYS.get("hud")
+        if hud is not None:
+            hud.set_data(player_data, current_skill)
     except Exception:
         pass
 
+def _render_hud_position() -> None:
+    hud = _OVERLAYS.get("hud")
+    if hud is not None and hasattr(hud, "_reposition"):
+        hud._reposition()
+
+UI_REFRESH.register("position", _render_hud_position)
+
 def hide_review_hud() -> None:
     """Hide the HUD if it exists (used outside of review screens)."""
     try:
-        if _REVIEW_HUD is not None and hasattr(_REVIEW_HUD, "hide"):
-            _REVIEW_HUD.hide()
+        hud = _OVERLAYS.get("hud")
+        if hud is not None and hasattr(hud, "hide"):
+            hud.hide()
     except Exception:
         pass
 
@@ -704,12 +1034,52 @@ def show_main_menu(
     on_set_craft,
     on_set_floating_enabled=None,
     on_set_floating_position=None,
+    availability=None,
 ):
     """Show a consolidated window with tabs for Skills, Mining, Woodcutting, Smithing, Crafting,
     and quick access buttons for Stats and Achievements.
     Callbacks apply changes and handle persistence in the caller.
+    availability: optional callable returning (can_smelt_any, can_craft_any), e.g. backed by
+    the caller's AvailabilityIndex; without it the bar/crafting tables are scanned.
     """
     _debug_log("ui.show_main_menu: enter")
+
+    # Reopen the kept-alive window, refreshing only what changed since it was last shown
+    menu = _MAIN_MENU_CTX.get("menu")
+    if menu is not None:
+        if menu["player_data"] is player_data:
+            try:
+                menu["release_timer"].stop()
+                refresh_main_menu(current_skill)
+                dlg = menu["dialog"]
+                dlg.show()
+                dlg.raise_()
+                dlg.activateWindow()
+                _debug_log("ui.show_main_menu: reused open menu")
+                return
+            except Exception:
+                # Window was destroyed underneath us; build a fresh one
+                pass
+        release_main_menu()
+
+    def _availability() -> tuple:
+        if availability is not None:
+            try:
+                return tuple(availability())
+            except Exception:
+                pass
+        inv = player_data.get("inventory", {})
+        can_smelt = can_smelt_any_bar_pure(inv, player_data.get("smithing_level", 1), BAR_DATA)
+        can_craft = any(
+            can_craft_item_pure(player_data.get("crafting_level", 1), inv, item_name, CRAFTING_DATA)
+            for item_name in CRAFTING_DATA.keys()
+        )
+        return can_smelt, can_craft
+
+    can_smelt_any_bar, can_craft_any_item = _availability()
+    # Section name -> in-place refresh, registered by each tab as it is built
+    refreshers = {}
+    state = {"current_skill": current_skill}
     dialog = QDialog(mw)
     dialog.setWindowTitle("AnkiScape Menu")
     dialog.setMinimumWidth(720)
@@ -750,7 +1120,8 @@ def show_main_menu(
         ("Crafting", os.path.join(current_dir, "icon", "crafting_icon.png")),
     ]
 
-    btn_group = QButtonGroup()
+    # Parented: the window outlives this function now that it is kept between opens
+    btn_group = QButtonGroup(skills_tab)
     btn_group.setExclusive(True)
     name_to_btn = {}
     prev_skill = current_skill
@@ -776,63 +1147,56 @@ def show_main_menu(
             QToolButton:checked { border: 2px solid #4CAF50; background-color: #e8f5e9; }
             """
         )
-        # Disable Smithing if no bars can be smelted; store reference for dynamic enable
-        if name == "Smithing" and not can_smelt_any_bar:
-            btn.setEnabled(False)
-            btn.setToolTip("Smithing is unavailable: you can't smelt any bars yet. Mine ores first.")
-            _MAIN_MENU_CTX["smith_btn"] = btn
-        elif name == "Smithing":
-            _MAIN_MENU_CTX["smith_btn"] = btn
-        # Disable Crafting if no craftable items; store reference for dynamic enable
-        if name == "Crafting":
-            # Basic check: either current selected craft is craftable or any item is craftable
-            player_level = player_data.get("crafting_level", 1)
-            inv = player_data.get("inventory", {})
-            can_any = False
-            try:
-                # Quick check over data set
-                for item_name, spec in CRAFTING_DATA.items():
-                    if can_craft_item_pure(player_level, inv, item_name, CRAFTING_DATA):
-                        can_any = True
-                        break
-            except Exception:
-                can_any = False
-            if not can_any:
-                btn.setEnabled(False)
-                btn.setToolTip("Crafting is unavailable: you don't have materials or level to craft any item.")
-                _MAIN_MENU_CTX["craft_btn"] = btn
-            else:
-                _MAIN_MENU_CTX["craft_btn"] = btn
         btn_group.addButton(btn, idx)
         sel_layout.addWidget(btn)
         name_to_btn[name] = btn
         # Connect per-button to avoid fragile id/index coupling
         btn.clicked.connect(lambda _checked=False, n=name: _select_and_persist(n))
+    # Store references for dynamic enable
+    _MAIN_MENU_CTX["smith_btn"] = name_to_btn["Smithing"]
+    _MAIN_MENU_CTX["craft_btn"] = name_to_btn["Crafting"]
+
+    def _gate_skill_buttons(can_smelt: bool, can_craft: bool) -> None:
+        # Disable Smithing if no bars can be smelted, Crafting if no item can be crafted
+        s_btn = name_to_btn["Smithing"]
+        s_btn.setEnabled(can_smelt)
+        s_btn.setToolTip("Smithing" if can_smelt else "Smithing is unavailable: you can't smelt any bars yet. Mine ores first.")
+        c_btn = name_to_btn["Crafting"]
+        c_btn.setEnabled(can_craft)
+        c_btn.setToolTip("Crafting" if can_craft else "Crafting is unavailable: you don't have materials or level to craft any item.")
+    _gate_skill_buttons(can_smelt_any_bar, can_craft_any_item)
 
     def _select_and_persist(name: str):
         nonlocal prev_skill
-        if name == "Smithing" and not can_smelt_any_bar:
+        can_smelt, can_craft = _availability()
+        if name == "Smithing" and not can_smelt:
             warn.setText("You don't have enough ores to smelt any bars. Mine some ores first!")
             # revert selection
             if prev_skill in name_to_btn:
                 name_to_btn[prev_skill].setChecked(True)
             return
         if name == "Crafting":
-            # Re-evaluate quickly
-            player_level = player_data.get("crafting_level", 1)
-            inv = player_data.get("inventory", {})
-            can_any = any(
-                can_craft_item_pure(player_level, inv, item_name, CRAFTING_DATA) for item_name in CRAFTING_DATA.keys()
-            )
-            if not can_any:
+            if not can_craft:
                 warn.setText("You can't craft anything yet. Gather materials or level up first!")
                 if prev_skill in name_to_btn:
                     name_to_btn[prev_skill].setChecked(True)
                 return
         warn.setText("")
         prev_skill = name
+        state["current_skill"] = name
         on_save_skill(name)
 
+    def _refresh_skills():
+        nonlocal prev_skill
+        can_smelt, can_craft = _availability()
+        _gate_skill_buttons(can_smelt, can_craft)
+        btn = name_to_btn.get(state["current_skill"])
+        if btn is not None and btn.isEnabled():
+            btn.setChecked(True)
+            prev_skill = state["current_skill"]
+            warn.setText("")
+    refreshers[SECTION_SKILLS] = _refresh_skills
+
     # No group id handler; each button handles its own click
 
     # Initialize selection with edge-case handling (fallback if Smithing is disabled)
@@ -842,12 +1206,7 @@ def show_main_menu(
         initial_name = "None"
         warn.setText("Smithing is currently unavailable until you can smelt a bar.")
     if initial_name == "Crafting":
-        player_level = player_data.get("crafting_level", 1)
-        inv = player_data.get("inventory", {})
-        can_any = any(
-            can_craft_item_pure(player_level, inv, item_name, CRAFTING_DATA) for item_name in CRAFTING_DATA.keys()
-        )
-        if not can_any:
+        if not can_craft_any_item:
             initial_name = "None"
             warn.setText("Crafting is currently unavailable until you can craft at least one item.")
     if initial_name in name_to_btn:
@@ -858,9 +1217,13 @@ def show_main_menu(
     _MAIN_MENU_CTX["dialog"] = dialog
     _MAIN_MENU_CTX["warn_label"] = warn
 
-    # Clear context when dialog closes
+    # Closing only hides the window; it is released if it stays unused
+    release_timer = QTimer(dialog)
+    release_timer.setSingleShot(True)
+    release_timer.setInterval(MENU_IDLE_RELEASE_MS)
+    release_timer.timeout.connect(release_main_menu)
     try:
-        dialog.finished.connect(lambda _=None: (_MAIN_MENU_CTX.update({"dialog": None, "smith_btn": None, "warn_label": None})))
+        dialog.finished.connect(lambda _=None: release_timer.start())
     except Exception:
         pass
 
@@ -873,174 +1236,193 @@ def show_main_menu(
     def _refresh_on_tab(idx: int):
         try:
             if idx == skills_tab_index:
-                can_smelt = can_smelt_any_bar_pure(player_data.get("inventory", {}), player_data.get("smithing_level", 1), BAR_DATA)
-                can_craft = any(
-                    can_craft_item_pure(player_data.get("crafting_level", 1), player_data.get("inventory", {}), item, CRAFTING_DATA)
-                    for item, _ in CRAFTING_DATA.items()
-                )
-                refresh_skill_availability(can_smelt, can_craft)
+                refresh_skill_availability(*_availability())
         except Exception:
             pass
     tabs.currentChanged.connect(_refresh_on_tab)
 
+    # Other tabs are built on first activation; until then they hold a placeholder
+    lazy_tabs = LazyTabs()
+
+    def _add_lazy_tab(title: str, builder, icon_file, tooltip: str) -> int:
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        placeholder = QLabel("Loading…")
+        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        page_layout.addWidget(placeholder)
+        index = tabs.addTab(page, title)
+        if icon_file:
+            icon_path = os.path.join(current_dir, "icon", icon_file)
+            if _path_exists(icon_path):
+                tabs.setTabIcon(index, QIcon(icon_path))
+        tabs.setTabToolTip(index, tooltip)
+
+        def _build():
+            content = builder()
+            page_layout.removeWidget(placeholder)
+            placeholder.deleteLater()
+            page_layout.addWidget(content)
+        lazy_tabs.add(index, _build)
+        return index
+
+    def _prefetch_tab():
+        # Build one likely-next tab while the user is idle
+        try:
+            index = lazy_tabs.next_prefetch(tabs.currentIndex())
+            if index is not None:
+                lazy_tabs.ensure(index)
+        except Exception:
+            pass
+
+    def _on_tab_activated(idx: int):
+        try:
+            lazy_tabs.ensure(idx)
+            QTimer.singleShot(MENU_PREFETCH_DELAY_MS, _prefetch_tab)
+        except Exception:
+            pass
+    tabs.currentChanged.connect(_on_tab_activated)
+
+    def _set_item_enabled(item, enabled: bool) -> None:
+        flags = item.flags()
+        item.setFlags(flags | Qt.ItemFlag.ItemIsEnabled if enabled else flags & ~Qt.ItemFlag.ItemIsEnabled)
+
+    def _build_source_list(items: dict, rows, apply_state, selection_key: str, on_select) -> QListWidget:
+        """QListWidget of (name, label, image) rows; items collects name -> QListWidgetItem for refreshes."""
+        source_list = QListWidget()
+        source_list.setIconSize(QSize(28, 28))
+        source_list.setAlternatingRowColors(True)
+        for name, label, image in rows:
+            item = QListWidgetItem(label)
+            item.setData(Qt.ItemDataRole.UserRole, name)
+            if image and _path_exists(image):
+                set_item_icon(item, image, 28)
+            apply_state(item, name)
+            source_list.addItem(item)
+            items[name] = item
+        _select_current(source_list, items, selection_key)
+
+        def _on_selected(item: QListWidgetItem):
+            if item:
+                on_select(item.data(Qt.ItemDataRole.UserRole))
+        source_list.itemClicked.connect(_on_selected)
+        source_list.itemActivated.connect(_on_selected)
+        return source_list
+
+    def _select_current(source_list, items: dict, selection_key: str) -> None:
+        item = items.get(player_data.get(selection_key))
+        if item is not None and source_list.currentItem() is not item:
+            source_list.setCurrentItem(item)
+
+    def _materials_text(reqs: dict) -> tuple:
+        """(tooltip lines for the required materials, whether the player has them all)."""
+        inv = player_data.get('inventory', {})
+        mat_lines = []
+        materials_ok = True
+        for mat, amt in reqs.items():
+            have = inv.get(mat, 0)
+            if have < amt:
+                materials_ok = False
+            mat_lines.append(f"{mat} x{amt} (you have {have})")
+        return ("\n".join(mat_lines) if mat_lines else "No materials required"), materials_ok
+
     # Mining tab
-    mining_tab = QWidget()
-    m_layout = QVBoxLayout(mining_tab)
-    m_layout.setContentsMargins(12, 12, 12, 12)
-    m_layout.setSpacing(8)
-    m_layout.addWidget(QLabel("Select Ore to Mine"))
-    ore_list = QListWidget()
-    ore_list.setIconSize(QSize(28, 28))
-    ore_list.setAlternatingRowColors(True)
-    for ore, data in ORE_DATA.items():
-        item = QListWidgetItem(f"{ore} (Lvl {data['level']})")
-        item.setData(Qt.ItemDataRole.UserRole, ore)
-        # icon
-        icon_path = ORE_IMAGES.get(ore)
-        if icon_path and os.path.exists(icon_path):
-            item.setIcon(QIcon(icon_path))
-        # gating + tooltip
-        lvl_req = data.get('level', 1)
+    def _apply_ore_state(item, ore: str) -> None:
+        lvl_req = ORE_DATA[ore].get('level', 1)
         lvl_have = player_data.get("mining_level", 1)
-        if not can_mine_ore_pure(player_data.get("mining_level", 1), ore, ORE_DATA):
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
+        if not can_mine_ore_pure(lvl_have, ore, ORE_DATA):
+            _set_item_enabled(item, False)
             item.setToolTip(f"Requires Mining level {lvl_req}. You have {lvl_have}.")
         else:
+            _set_item_enabled(item, True)
             item.setToolTip(f"Mining level {lvl_req} required. You have {lvl_have}.")
-        ore_list.addItem(item)
-        if ore == player_data.get("current_ore"):
-            ore_list.setCurrentItem(item)
-    m_layout.addWidget(ore_list)
-    def _on_ore_selected(item: QListWidgetItem):
-        if item:
-            on_set_ore(item.data(Qt.ItemDataRole.UserRole))
-    ore_list.itemClicked.connect(_on_ore_selected)
-    ore_list.itemActivated.connect(_on_ore_selected)
-    tabs.addTab(mining_tab, "Mining")
-    # Tab icon and tooltip
-    mining_icon = os.path.join(current_dir, "icon", "mining_icon.png")
-    if os.path.exists(mining_icon):
-        tabs.setTabIcon(tabs.indexOf(mining_tab), QIcon(mining_icon))
-    tabs.setTabToolTip(tabs.indexOf(mining_tab), "Choose which ore to mine")
+
+    def _build_mining_tab() -> QWidget:
+        mining_tab = QWidget()
+        m_layout = QVBoxLayout(mining_tab)
+        m_layout.setContentsMargins(12, 12, 12, 12)
+        m_layout.setSpacing(8)
+        m_layout.addWidget(QLabel("Select Ore to Mine"))
+        ore_items = {}
+        rows = [(ore, f"{ore} (Lvl {data['level']})", ORE_IMAGES.get(ore)) for ore, data in ORE_DATA.items()]
+        ore_list = _build_source_list(ore_items, rows, _apply_ore_state, "current_ore", on_set_ore)
+        m_layout.addWidget(ore_list)
+
+        def _refresh():
+            for ore, item in ore_items.items():
+                _apply_ore_state(item, ore)
+            _select_current(ore_list, ore_items, "current_ore")
+        refreshers[SECTION_MINING] = _refresh
+        return mining_tab
+    mining_index = _add_lazy_tab("Mining", _build_mining_tab, "mining_icon.png", "Choose which ore to mine")
 
     # Woodcutting tab
-    wood_tab = QWidget()
-    w_layout = QVBoxLayout(wood_tab)
-    w_layout.setContentsMargins(12, 12, 12, 12)
-    w_layout.setSpacing(8)
-    w_layout.addWidget(QLabel("Select Tree to Cut"))
-    tree_list = QListWidget()
-    tree_list.setIconSize(QSize(28, 28))
-    tree_list.setAlternatingRowColors(True)
-    for tree, data in TREE_DATA.items():
-        item = QListWidgetItem(f"{tree} (Lvl {data['level']})")
-        item.setData(Qt.ItemDataRole.UserRole, tree)
-        # icon
-        t_icon = TREE_IMAGES.get(tree)
-        if t_icon and os.path.exists(t_icon):
-            item.setIcon(QIcon(t_icon))
-        # gating + tooltip
-        lvl_req = data.get('level', 1)
+    def _apply_tree_state(item, tree: str) -> None:
+        lvl_req = TREE_DATA[tree].get('level', 1)
         lvl_have = player_data.get("woodcutting_level", 1)
-        if not can_cut_tree_pure(player_data.get("woodcutting_level", 1), tree, TREE_DATA):
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
+        if not can_cut_tree_pure(lvl_have, tree, TREE_DATA):
+            _set_item_enabled(item, False)
             item.setToolTip(f"Requires Woodcutting level {lvl_req}. You have {lvl_have}.")
         else:
+            _set_item_enabled(item, True)
             item.setToolTip(f"Woodcutting level {lvl_req} required. You have {lvl_have}.")
-        tree_list.addItem(item)
-        if tree == player_data.get("current_tree"):
-            tree_list.setCurrentItem(item)
-    w_layout.addWidget(tree_list)
-    def _on_tree_selected(item: QListWidgetItem):
-        if item:
-            on_set_tree(item.data(Qt.ItemDataRole.UserRole))
-    tree_list.itemClicked.connect(_on_tree_selected)
-    tree_list.itemActivated.connect(_on_tree_selected)
-    tabs.addTab(wood_tab, "Woodcutting")
-    wood_icon = os.path.join(current_dir, "icon", "woodcutting_icon.png")
-    if os.path.exists(wood_icon):
-        tabs.setTabIcon(tabs.indexOf(wood_tab), QIcon(wood_icon))
-    tabs.setTabToolTip(tabs.indexOf(wood_tab), "Choose which tree to cut")
+
+    def _build_wood_tab() -> QWidget:
+        wood_tab = QWidget()
+        w_layout = QVBoxLayout(wood_tab)
+        w_layout.setContentsMargins(12, 12, 12, 12)
+        w_layout.setSpacing(8)
+        w_layout.addWidget(QLabel("Select Tree to Cut"))
+        tree_items = {}
+        rows = [(tree, f"{tree} (Lvl {data['level']})", TREE_IMAGES.get(tree)) for tree, data in TREE_DATA.items()]
+        tree_list = _build_source_list(tree_items, rows, _apply_tree_state, "current_tree", on_set_tree)
+        w_layout.addWidget(tree_list)
+
+        def _refresh():
+            for tree, item in tree_items.items():
+                _apply_tree_state(item, tree)
+            _select_current(tree_list, tree_items, "current_tree")
+        refreshers[SECTION_WOODCUTTING] = _refresh
+        return wood_tab
+    wood_index = _add_lazy_tab("Woodcutting", _build_wood_tab, "woodcutting_icon.png", "Choose which tree to cut")
 
     # Smithing tab
-    smith_tab = QWidget()
-    sm_layout = QVBoxLayout(smith_tab)
-    sm_layout.setContentsMargins(12, 12, 12, 12)
-    sm_layout.setSpacing(8)
-    sm_layout.addWidget(QLabel("Select Bar to Smelt"))
-    bar_list = QListWidget()
-    bar_list.setIconSize(QSize(28, 28))
-    bar_list.setAlternatingRowColors(True)
-    for bar, data in BAR_DATA.items():
-        item = QListWidgetItem(f"{bar} (Lvl {data['level']})")
-        item.setData(Qt.ItemDataRole.UserRole, bar)
-        # icon
-        b_icon = BAR_IMAGES.get(bar)
-        if b_icon and os.path.exists(b_icon):
-            item.setIcon(QIcon(b_icon))
-        # tooltip for materials and level
+    def _apply_bar_state(item, bar: str) -> None:
+        data = BAR_DATA[bar]
         lvl_req = data.get('level', 1)
         lvl_have = player_data.get("smithing_level", 1)
-        reqs = data.get('ore_required', {})
-        inv = player_data.get('inventory', {})
-        mat_lines = []
-        for ore_name, amt in reqs.items():
-            have = inv.get(ore_name, 0)
-            mat_lines.append(f"{ore_name} x{amt} (you have {have})")
-        mat_text = "\n".join(mat_lines) if mat_lines else "No materials required"
-        tooltip = f"Requires Smithing level {lvl_req}. You have {lvl_have}.\nMaterials:\n{mat_text}"
-        if data.get("level", 1) > player_data.get("smithing_level", 1):
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
-            item.setToolTip(tooltip)
-        else:
-            item.setToolTip(tooltip)
-        bar_list.addItem(item)
-        if bar == player_data.get("current_bar"):
-            bar_list.setCurrentItem(item)
-    sm_layout.addWidget(bar_list)
-    def _on_bar_selected(item: QListWidgetItem):
-        if item:
-            on_set_bar(item.data(Qt.ItemDataRole.UserRole))
-    bar_list.itemClicked.connect(_on_bar_selected)
-    bar_list.itemActivated.connect(_on_bar_selected)
-    tabs.addTab(smith_tab, "Smithing")
-    smith_icon = os.path.join(current_dir, "icon", "smithing_icon.png")
-    if os.path.exists(smith_icon):
-        tabs.setTabIcon(tabs.indexOf(smith_tab), QIcon(smith_icon))
-    tabs.setTabToolTip(tabs.indexOf(smith_tab), "Choose which bar to smelt")
+        mat_text, _ = _materials_text(data.get('ore_required', {}))
+        item.setToolTip(f"Requires Smithing level {lvl_req}. You have {lvl_have}.\nMaterials:\n{mat_text}")
+        _set_item_enabled(item, lvl_req <= lvl_have)
+
+    def _build_smith_tab() -> QWidget:
+        smith_tab = QWidget()
+        sm_layout = QVBoxLayout(smith_tab)
+        sm_layout.setContentsMargins(12, 12, 12, 12)
+        sm_layout.setSpacing(8)
+        sm_layout.addWidget(QLabel("Select Bar to Smelt"))
+        bar_items = {}
+        rows = [(bar, f"{bar} (Lvl {data['level']})", BAR_IMAGES.get(bar)) for bar, data in BAR_DATA.items()]
+        bar_list = _build_source_list(bar_items, rows, _apply_bar_state, "current_bar", on_set_bar)
+        sm_layout.addWidget(bar_list)
+
+        def _refresh():
+            for bar, item in bar_items.items():
+                _apply_bar_state(item, bar)
+            _select_current(bar_list, bar_items, "current_bar")
+        refreshers[SECTION_SMITHING] = _refresh
+        return smith_tab
+    smith_index = _add_lazy_tab("Smithing", _build_smith_tab, "smithing_icon.png", "Choose which bar to smelt")
 
     # Crafting tab
-    craft_tab = QWidget()
-    c_layout = QVBoxLayout(craft_tab)
-    c_layout.setContentsMargins(12, 12, 12, 12)
-    c_layout.setSpacing(8)
-    c_layout.addWidget(QLabel("Select Item to Craft"))
-    craft_list = QListWidget()
-    craft_list.setIconSize(QSize(28, 28))
-    craft_list.setAlternatingRowColors(True)
-    for item_name, spec in CRAFTING_DATA.items():
-        item = QListWidgetItem(f"{item_name} (Lvl {spec['level']})")
-        item.setData(Qt.ItemDataRole.UserRole, item_name)
-        # icon
-        c_icon = CRAFTED_ITEM_IMAGES.get(item_name)
-        if c_icon and os.path.exists(c_icon):
-            item.setIcon(QIcon(c_icon))
-        # tooltip with materials and level
+    def _apply_craft_state(item, item_name: str) -> None:
+        spec = CRAFTING_DATA[item_name]
         lvl_req = spec.get('level', 1)
         lvl_have = player_data.get("crafting_level", 1)
-        inv = player_data.get('inventory', {})
-        reqs = spec.get('requirements', {})
-        mat_lines = []
-        materials_ok = True
-        for mat, amt in reqs.items():
-            have = inv.get(mat, 0)
-            if have < amt:
-                materials_ok = False
-            mat_lines.append(f"{mat} x{amt} (you have {have})")
-        mat_text = "\n".join(mat_lines) if mat_lines else "No materials required"
+        mat_text, materials_ok = _materials_text(spec.get('requirements', {}))
         tooltip = f"Requires Crafting level {lvl_req}. You have {lvl_have}.\nMaterials:\n{mat_text}"
-        if not can_craft_item_pure(player_data.get("crafting_level", 1), player_data.get("inventory", {}), item_name, CRAFTING_DATA):
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
+        if not can_craft_item_pure(lvl_have, player_data.get("inventory", {}), item_name, CRAFTING_DATA):
+            _set_item_enabled(item, False)
             # Clarify reason if possible
             reason = []
             if lvl_have < lvl_req:
@@ -1049,583 +1431,556 @@ def show_main_menu(
                 reason.append("materials")
             if reason:
                 tooltip += "\nLocked due to: " + ", ".join(reason)
-            item.setToolTip(tooltip)
         else:
-            item.setToolTip(tooltip)
-        craft_list.addItem(item)
-        if item_name == player_data.get("current_craft"):
-            craft_list.setCurrentItem(item)
-    c_layout.addWidget(craft_list)
-    def _on_craft_selected(item: QListWidgetItem):
-        if item:
-            on_set_craft(item.data(Qt.ItemDataRole.UserRole))
-    craft_list.itemClicked.connect(_on_craft_selected)
-    craft_list.itemActivated.connect(_on_craft_selected)
-    tabs.addTab(craft_tab, "Crafting")
-    craft_icon = os.path.join(current_dir, "icon", "crafting_icon.png")
-    if os.path.exists(craft_icon):
-        tabs.setTabIcon(tabs.indexOf(craft_tab), QIcon(craft_icon))
-    tabs.setTabToolTip(tabs.indexOf(craft_tab), "Choose which item to craft")
+            _set_item_enabled(item, True)
+        item.setToolTip(tooltip)
+
+    def _build_craft_tab() -> QWidget:
+        craft_tab = QWidget()
+        c_layout = QVBoxLayout(craft_tab)
+        c_layout.setContentsMargins(12, 12, 12, 12)
+        c_layout.setSpacing(8)
+        c_layout.addWidget(QLabel("Select Item to Craft"))
+        craft_items = {}
+        rows = [
+            (item_name, f"{item_name} (Lvl {spec['level']})", CRAFTED_ITEM_IMAGES.get(item_name))
+            for item_name, spec in CRAFTING_DATA.items()
+        ]
+        craft_list = _build_source_list(craft_items, rows, _apply_craft_state, "current_craft", on_set_craft)
+        c_layout.addWidget(craft_list)
+
+        def _refresh():
+            for item_name, item in craft_items.items():
+                _apply_craft_state(item, item_name)
+            _select_current(craft_list, craft_items, "current_craft")
+        refreshers[SECTION_CRAFTING] = _refresh
+        return craft_tab
+    craft_index = _add_lazy_tab("Crafting", _build_craft_tab, "crafting_icon.png", "Choose which item to craft")
 
     # Stats tab (inline, single-skill view with icon selectors)
-    stats_tab = QWidget()
-    st_layout = QVBoxLayout(stats_tab)
-    st_layout.setContentsMargins(12, 12, 12, 12)
-    st_layout.setSpacing(8)
-
-    # Skill selectors with icons
-    selector = QWidget()
-    sel_layout = QHBoxLayout(selector)
-    sel_layout.setSpacing(12)
-    sel_layout.setContentsMargins(0, 0, 0, 0)
-
-    # Helper to create a details panel for a specific skill
-    def _mk_skill_details(skill_name: str) -> QWidget:
-        block = QWidget()
-        b_layout = QVBoxLayout(block)
-        b_layout.setSpacing(8)
-        title = QLabel(f"{skill_name} Stats")
-        title.setStyleSheet("font-size: 14px; font-weight: bold;")
-        b_layout.addWidget(title)
-        grid = QGridLayout()
-        grid.setColumnStretch(1, 1)
-        level = player_data.get(f"{skill_name.lower()}_level", 1)
-        exp = round(player_data.get(f"{skill_name.lower()}_exp", 0), 1)
-        grid.addWidget(QLabel(f"{skill_name} Level:"), 0, 0)
-        grid.addWidget(QLabel(str(level)), 0, 1)
-        grid.addWidget(QLabel("Total Experience:"), 1, 0)
-        grid.addWidget(QLabel(f"{exp:,}"), 1, 1)
-        if level < 99:
-            exp_to_next = round(max(0, EXP_TABLE[level] - exp), 1)
-            grid.addWidget(QLabel("Experience to Next Level:"), 2, 0)
-            grid.addWidget(QLabel(f"{exp_to_next:,}"), 2, 1)
-        prog = QProgressBar()
-        try:
-            progress_percentage = (exp - EXP_TABLE[level - 1]) / (EXP_TABLE[level] - EXP_TABLE[level - 1]) * 100
-            prog.setValue(int(max(0, min(100, progress_percentage))))
-        except Exception:
-            prog.setValue(0)
-        grid.addWidget(QLabel("Level Progress:"), 3, 0)
-        grid.addWidget(prog, 3, 1)
-        b_layout.addLayout(grid)
-        return block
-
-    # Details container (will switch based on selected skill)
-    details_container = QWidget()
-    details_layout = QVBoxLayout(details_container)
-    details_layout.setContentsMargins(0, 0, 0, 0)
-
-    # Create skill icon buttons
-    skills_info = [
-        ("Mining", os.path.join(current_dir, "icon", "mining_icon.png")),
-        ("Woodcutting", os.path.join(current_dir, "icon", "woodcutting_icon.png")),
-        ("Smithing", os.path.join(current_dir, "icon", "smithing_icon.png")),
-        ("Crafting", os.path.join(current_dir, "icon", "crafting_icon.png")),
-    ]
-
-    # Import here to keep headless safety for static analyzers
-    try:
-        from aqt.qt import QToolButton  # type: ignore
-    except Exception:
-        QToolButton = QPushButton  # fallback for typing
-
-    button_group = QButtonGroup()
-    button_group.setExclusive(True)
-    buttons = {}
-    for idx, (name, icon_path) in enumerate(skills_info):
-        btn = QToolButton()
-        btn.setCheckable(True)
-        btn.setToolTip(name)
-        if os.path.exists(icon_path):
-            btn.setIcon(QIcon(icon_path))
-        # Small label under icon
-        btn.setText(name)
-        if hasattr(btn, "setToolButtonStyle"):
+    def _build_stats_tab() -> QWidget:
+        stats_tab = QWidget()
+        st_layout = QVBoxLayout(stats_tab)
+        st_layout.setContentsMargins(12, 12, 12, 12)
+        st_layout.setSpacing(8)
+
+        # Skill selectors with icons
+        selector = QWidget()
+        sel_layout = QHBoxLayout(selector)
+        sel_layout.setSpacing(12)
+        sel_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Helper to create a details panel for a specific skill
+        def _mk_skill_details(skill_name: str) -> QWidget:
+            block = QWidget()
+            b_layout = QVBoxLayout(block)
+            b_layout.setSpacing(8)
+            title = QLabel(f"{skill_name} Stats")
+            title.setStyleSheet("font-size: 14px; font-weight: bold;")
+            b_layout.addWidget(title)
+            grid = QGridLayout()
+            grid.setColumnStretch(1, 1)
+            level = player_data.get(f"{skill_name.lower()}_level", 1)
+            exp = round(player_data.get(f"{skill_name.lower()}_exp", 0), 1)
+            grid.addWidget(QLabel(f"{skill_name} Level:"), 0, 0)
+            grid.addWidget(QLabel(str(level)), 0, 1)
+            grid.addWidget(QLabel("Total Experience:"), 1, 0)
+            grid.addWidget(QLabel(f"{exp:,}"), 1, 1)
+            curve = get_level_curve(EXP_TABLE)
+            if level < 99:
+                exp_to_next = round(curve.xp_to_next(level, exp), 1)
+                grid.addWidget(QLabel("Experience to Next Level:"), 2, 0)
+                grid.addWidget(QLabel(f"{exp_to_next:,}"), 2, 1)
+            prog = QProgressBar()
             try:
-                btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextUnderIcon)  # type: ignore[attr-defined]
+                prog.setValue(curve.progress(level, exp)[0])
             except Exception:
-                pass
-        btn.setIconSize(QSize(48, 48))
-        btn.setAutoRaise(True)
-        # Visual feedback styles
-        btn.setStyleSheet(
-            """
-            QToolButton { border: 1px solid #cccccc; border-radius: 8px; padding: 6px; }
-            QToolButton:hover { border-color: #999999; }
-            QToolButton:checked { border: 2px solid #4CAF50; background-color: #e8f5e9; }
-            """
-        )
-        button_group.addButton(btn, idx)
-        sel_layout.addWidget(btn)
-        buttons[name] = btn
-        # Connect per-button click to select and persist
-        btn.clicked.connect(lambda _checked=False, n=name: (
-            _select_skill(n),
-            (mw and getattr(mw, 'col', None) and mw.col.set_config("ankiscape_stats_selected_skill", n))
-        ))
-
-    st_layout.addWidget(selector)
-
-    # Update details when a skill is selected
-    def _select_skill(skill_name: str):
-        # Clear previous content
-        child = details_layout.takeAt(0)
-        while child:
-            if child.widget():
-                child.widget().deleteLater()
+                prog.setValue(0)
+            grid.addWidget(QLabel("Level Progress:"), 3, 0)
+            grid.addWidget(prog, 3, 1)
+            b_layout.addLayout(grid)
+            return block
+
+        # Details container (will switch based on selected skill)
+        details_container = QWidget()
+        details_layout = QVBoxLayout(details_container)
+        details_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Create skill icon buttons
+        skills_info = [
+            ("Mining", os.path.join(current_dir, "icon", "mining_icon.png")),
+            ("Woodcutting", os.path.join(current_dir, "icon", "woodcutting_icon.png")),
+            ("Smithing", os.path.join(current_dir, "icon", "smithing_icon.png")),
+            ("Crafting", os.path.join(current_dir, "icon", "crafting_icon.png")),
+        ]
+
+        # Import here to keep headless safety for static analyzers
+        try:
+            from aqt.qt import QToolButton  # type: ignore
+        except Exception:
+            QToolButton = QPushButton  # fallback for typing
+
+        button_group = QButtonGroup(stats_tab)
+        button_group.setExclusive(True)
+        buttons = {}
+        for idx, (name, icon_path) in enumerate(skills_info):
+            btn = QToolButton()
+            btn.setCheckable(True)
+            btn.setToolTip(name)
+            if os.path.exists(icon_path):
+                btn.setIcon(QIcon(icon_path))
+            # Small label under icon
+            btn.setText(name)
+            if hasattr(btn, "setToolButtonStyle"):
+                try:
+                    btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextUnderIcon)  # type: ignore[attr-defined]
+                except Exception:
+                    pass
+            btn.setIconSize(QSize(48, 48))
+            btn.setAutoRaise(True)
+            # Visual feedback styles
+            btn.setStyleSheet(
+                """
+                QToolButton { border: 1px solid #cccccc; border-radius: 8px; padding: 6px; }
+                QToolButton:hover { border-color: #999999; }
+                QToolButton:checked { border: 2px solid #4CAF50; background-color: #e8f5e9; }
+                """
+            )
+            button_group.addButton(btn, idx)
+            sel_layout.addWidget(btn)
+            buttons[name] = btn
+            # Connect per-button click to select and persist
+            btn.clicked.connect(lambda _checked=False, n=name: (
+                _select_skill(n),
+                (mw and getattr(mw, 'col', None) and mw.col.set_config("ankiscape_stats_selected_skill", n))
+            ))
+
+        st_layout.addWidget(selector)
+
+        # Update details when a skill is selected
+        def _select_skill(skill_name: str):
+            # Clear previous content
             child = details_layout.takeAt(0)
-        # Add new details
-        details_layout.addWidget(_mk_skill_details(skill_name))
+            while child:
+                if child.widget():
+                    child.widget().deleteLater()
+                child = details_layout.takeAt(0)
+            # Add new details
+            details_layout.addWidget(_mk_skill_details(skill_name))
 
-    # No idClicked usage; handled per-button above
+        # No idClicked usage; handled per-button above
 
-    # Initial selection
-    # Load persisted selection if available; fall back to current_skill then Mining
-    persisted = None
-    try:
-        if mw and getattr(mw, 'col', None):
-            persisted = mw.col.get_config("ankiscape_stats_selected_skill", None)
-    except Exception:
+        # Initial selection
+        # Load persisted selection if available; fall back to current_skill then Mining
         persisted = None
-    initial_skill = persisted if persisted in {n for n, _ in skills_info} else (current_skill if current_skill in {n for n, _ in skills_info} else "Mining")
-    initial_index = next((i for i, (n, _) in enumerate(skills_info) if n == initial_skill), 0)
-    button_group.button(initial_index).setChecked(True)
-    _select_skill(initial_skill)
+        try:
+            if mw and getattr(mw, 'col', None):
+                persisted = mw.col.get_config("ankiscape_stats_selected_skill", None)
+        except Exception:
+            persisted = None
+        initial_skill = persisted if persisted in {n for n, _ in skills_info} else (current_skill if current_skill in {n for n, _ in skills_info} else "Mining")
+        initial_index = next((i for i, (n, _) in enumerate(skills_info) if n == initial_skill), 0)
+        button_group.button(initial_index).setChecked(True)
+        _select_skill(initial_skill)
+
+        def _refresh():
+            checked = button_group.checkedButton()
+            if checked is not None:
+                _select_skill(checked.text())
+        refreshers[SECTION_STATS] = _refresh
 
-    st_layout.addWidget(details_container)
-    # Defer adding Stats tab until after Bank to satisfy desired ordering (Bank then Stats)
-    ach_icon_path = os.path.join(current_dir, "icon", "achievement_icon.png")
+        st_layout.addWidget(details_container)
+        return stats_tab
 
-    # Achievements tab
     # Bank tab (all inventory items)
-    bank_tab = QWidget()
-    bk_layout = QVBoxLayout(bank_tab)
-    bk_layout.setContentsMargins(12, 12, 12, 12)
-    bk_layout.setSpacing(8)
-    bank_list = QListWidget()
-    bank_list.setIconSize(QSize(28, 28))
-    bank_list.setAlternatingRowColors(True)
-    # Only show items with quantity > 0
-    inv = player_data.get("inventory", {})
-    for item_name in sorted(inv.keys()):
-        amount = inv.get(item_name, 0)
-        if amount and amount > 0:
-            text = f"{item_name} x{amount}"
-            li = QListWidgetItem(text)
-            icon_path = (
-                ORE_IMAGES.get(item_name)
-                or TREE_IMAGES.get(item_name)
-                or BAR_IMAGES.get(item_name)
-                or GEM_IMAGES.get(item_name)
-                or CRAFTED_ITEM_IMAGES.get(item_name)
-            )
-            if icon_path and os.path.exists(icon_path):
-                li.setIcon(QIcon(icon_path))
-            bank_list.addItem(li)
-    bk_layout.addWidget(bank_list)
-    tabs.addTab(bank_tab, "Bank")
-    tabs.setTabToolTip(tabs.indexOf(bank_tab), "View all your items")
-
-    # Now add the Stats tab (after Bank) and set its icon/tooltip
-    tabs.addTab(stats_tab, "Stats")
-    if os.path.exists(ach_icon_path):
-        tabs.setTabIcon(tabs.indexOf(stats_tab), QIcon(ach_icon_path))
-    tabs.setTabToolTip(tabs.indexOf(stats_tab), "View your skill stats")
+    def _build_bank_tab() -> QWidget:
+        bank_tab = QWidget()
+        bk_layout = QVBoxLayout(bank_tab)
+        bk_layout.setContentsMargins(12, 12, 12, 12)
+        bk_layout.setSpacing(8)
+        # Filter row: category + name search over a virtualized, delegate-painted list
+        filter_row = QWidget()
+        frl = QHBoxLayout(filter_row)
+        frl.setContentsMargins(0, 0, 0, 0)
+        frl.setSpacing(8)
+        category_box = QComboBox()
+        category_box.addItem("All items", "")
+        for category in ITEM_CATEGORIES:
+            category_box.addItem(category, category)
+        search = QLineEdit()
+        search.setPlaceholderText("Search items")
+        search.setClearButtonEnabled(True)
+        frl.addWidget(category_box)
+        frl.addWidget(search, 1)
+        bk_layout.addWidget(filter_row)
+
+        bank_model = views.BankModel(player_data, _screen_dpr(), bank_tab)
+        bank_view, bank_proxy = views.make_bank_view(bank_model, parent=bank_tab)
+        category_box.currentIndexChanged.connect(lambda _=None: bank_proxy.set_categories([category_box.currentData()]))
+        search.textChanged.connect(bank_proxy.set_text)
+        bk_layout.addWidget(bank_view)
+        # Counts change in place; rows are only inserted/removed when items appear or run out
+        refreshers[SECTION_BANK] = bank_model.refresh
+        return bank_tab
+    bank_index = _add_lazy_tab("Bank", _build_bank_tab, None, "View all your items")
+    _add_lazy_tab("Stats", _build_stats_tab, "achievement_icon.png", "View your skill stats")
 
     # Achievements tab (inline, themed)
-    ach_tab = QWidget()
-    a_layout = QVBoxLayout(ach_tab)
-    a_layout.setContentsMargins(12, 12, 12, 12)
-    a_layout.setSpacing(8)
-    a_tabs = QTabWidget()
-    a_tabs.setDocumentMode(True)
-
-    def _make_achievement_card(title: str, desc: str, completed: bool) -> QWidget:
-        card = QWidget()
-        card_layout = QHBoxLayout(card)
-        card_layout.setContentsMargins(10, 8, 10, 8)
-        card_layout.setSpacing(10)
-        # Icon
-        icon_label = QLabel()
-        icon_path = os.path.join(current_dir, "icon", f"{title.lower().replace(' ', '_')}.png")
-        pixmap = QPixmap(icon_path) if os.path.exists(icon_path) else QPixmap(os.path.join(current_dir, "icon", "achievement_icon.png"))
-        icon_label.setPixmap(pixmap.scaled(28, 28, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-        card_layout.addWidget(icon_label)
-        # Info
-        info = QWidget()
-        il = QVBoxLayout(info)
-        il.setContentsMargins(0, 0, 0, 0)
-        il.setSpacing(2)
-        name = QLabel(title)
-        name.setStyleSheet("font-weight: 600;")
-        desc_label = QLabel(desc)
-        desc_label.setWordWrap(True)
-        il.addWidget(name)
-        il.addWidget(desc_label)
-        card_layout.addWidget(info, 1)
-        # Status
-        status = QLabel("✓" if completed else "")
-        status.setStyleSheet("color: #4CAF50; font-size: 16px; font-weight: 700;")
-        card_layout.addWidget(status, 0, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        # Themed card style (palette-aware)
-        card.setStyleSheet(
-            "border: 1px solid palette(mid); border-radius: 6px; background-color: palette(base);"
-        )
-        return card
-
-    difficulties = ["Easy", "Moderate", "Difficult", "Very Challenging"]
-    for difficulty in difficulties:
-        tab = QWidget()
-        tab_layout = QVBoxLayout(tab)
-        tab_layout.setContentsMargins(0, 0, 0, 0)
-        tab_layout.setSpacing(0)
-        # Count per difficulty
-        items = [(n, d) for n, d in ACHIEVEMENTS.items() if d.get("difficulty") == difficulty]
-        done = sum(1 for n, _ in items if n in player_data.get("completed_achievements", []))
-        header = QLabel(f"{difficulty} • {done}/{len(items)} completed")
-        header.setStyleSheet("font-weight: 600; margin: 0 0 6px 0;")
-        tab_layout.addWidget(header)
-
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("border: none;")
-        content = QWidget()
-        cl = QVBoxLayout(content)
-        cl.setContentsMargins(0, 0, 0, 0)
-        cl.setSpacing(8)
-        for name, data in items:
-            card = _make_achievement_card(name, data.get("description", ""), name in player_data.get("completed_achievements", []))
-            cl.addWidget(card)
-        cl.addStretch(1)
-        scroll.setWidget(content)
-        tab_layout.addWidget(scroll)
-        a_tabs.addTab(tab, difficulty)
-
-    a_layout.addWidget(a_tabs)
-
-    completed_count = len(player_data.get("completed_achievements", []))
-    total_count = len(ACHIEVEMENTS)
-    progress_percentage = (completed_count / max(1, total_count)) * 100
-    progress_row = QWidget()
-    prl = QHBoxLayout(progress_row)
-    prl.setContentsMargins(0, 0, 0, 0)
-    prl.setSpacing(8)
-    progress_label = QLabel(f"Completed: {completed_count}/{total_count} ({progress_percentage:.1f}%)")
-    prl.addWidget(progress_label)
-    progress_bar = QProgressBar()
-    progress_bar.setValue(int(progress_percentage))
-    progress_bar.setTextVisible(False)
-    prl.addWidget(progress_bar, 1)
-    a_layout.addWidget(progress_row)
-
-    tabs.addTab(ach_tab, "Achievements")
-    if os.path.exists(ach_icon_path):
-        tabs.setTabIcon(tabs.indexOf(ach_tab), QIcon(ach_icon_path))
-    tabs.setTabToolTip(tabs.indexOf(ach_tab), "Review your achievements")
+    def _build_achievements_tab() -> QWidget:
+        ach_tab = QWidget()
+        a_layout = QVBoxLayout(ach_tab)
+        a_layout.setContentsMargins(12, 12, 12, 12)
+        a_layout.setSpacing(8)
+        a_tabs = QTabWidget()
+        a_tabs.setDocumentMode(True)
+
+        # One painted list per difficulty over the pre-grouped achievement index
+        dpr = _screen_dpr()
+        a_models = {}
+        headers = {}
+
+        def _header_text(difficulty: str) -> str:
+            model = a_models[difficulty]
+            return f"{difficulty} • {model.completed_count()}/{model.rowCount()} completed"
+
+        for difficulty, names in views.achievement_groups(ACHIEVEMENTS).items():
+            if not names:
+                continue
+            tab = QWidget()
+            tab_layout = QVBoxLayout(tab)
+            tab_layout.setContentsMargins(0, 0, 0, 0)
+            tab_layout.setSpacing(0)
+            model = a_models[difficulty] = views.AchievementModel(player_data, names, dpr, parent=tab)
+            header = headers[difficulty] = QLabel(_header_text(difficulty))
+            header.setStyleSheet("font-weight: 600; margin: 0 0 6px 0;")
+            tab_layout.addWidget(header)
+            tab_layout.addWidget(views.make_achievement_view(model, tab))
+            a_tabs.addTab(tab, difficulty)
+        a_layout.addWidget(a_tabs)
+
+        progress_row = QWidget()
+        prl = QHBoxLayout(progress_row)
+        prl.setContentsMargins(0, 0, 0, 0)
+        prl.setSpacing(8)
+        progress_label = QLabel()
+        prl.addWidget(progress_label)
+        progress_bar = QProgressBar()
+        progress_bar.setTextVisible(False)
+        prl.addWidget(progress_bar, 1)
+        a_layout.addWidget(progress_row)
+
+        def _show_progress():
+            completed_count = len(player_data.get("completed_achievements", []))
+            total_count = len(ACHIEVEMENTS)
+            progress_percentage = (completed_count / max(1, total_count)) * 100
+            progress_label.setText(f"Completed: {completed_count}/{total_count} ({progress_percentage:.1f}%)")
+            progress_bar.setValue(int(progress_percentage))
+        _show_progress()
+
+        def _refresh():
+            # Completed rows update individually; progress bars repaint for visible rows
+            for difficulty, model in a_models.items():
+                if model.refresh():
+                    headers[difficulty].setText(_header_text(difficulty))
+            _show_progress()
+        refreshers[SECTION_ACHIEVEMENTS] = _refresh
+        return ach_tab
+    _add_lazy_tab("Achievements", _build_achievements_tab, "achievement_icon.png", "Review your achievements")
 
     # Settings tab (controls)
-    settings_tab = QWidget()
-    set_layout = QVBoxLayout(settings_tab)
-    set_layout.setContentsMargins(12, 12, 12, 12)
-    set_layout.setSpacing(10)
-
-    # Load current settings (safe defaults if config unavailable)
-    floating_enabled = True
-    floating_position = "right"
-    floating_xp_enabled = True
-    popups_enabled = True
-    review_hud_enabled = True
-    try:
-        if mw and getattr(mw, 'col', None):
-            floating_enabled = bool(mw.col.get_config("ankiscape_floating_enabled", True))
-            pos = mw.col.get_config("ankiscape_floating_position", "right")
-            floating_position = pos if pos in ("left", "right") else "right"
-        floating_xp_enabled = get_config_bool("ankiscape_floating_xp_enabled", True)
-        popups_enabled = get_config_bool("ankiscape_popups_enabled", True)
-        review_hud_enabled = get_config_bool("ankiscape_review_hud_enabled", True)
-    except Exception:
-        pass
-
-    # Section header with icon: Widget
-    widget_hdr = QWidget()
-    whl = QHBoxLayout(widget_hdr)
-    whl.setContentsMargins(0, 0, 0, 0)
-    whl.setSpacing(6)
-    try:
-        settings_icon = os.path.join(current_dir, "icon", "settings_icon.png")
-        if os.path.exists(settings_icon):
-            lbl = QLabel()
-            lbl.setPixmap(QPixmap(settings_icon).scaled(18, 18, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-            whl.addWidget(lbl)
-    except Exception:
-        pass
-    hdr_lbl = QLabel("Widget")
-    hdr_lbl.setStyleSheet("font-weight: 600;")
-    whl.addWidget(hdr_lbl)
-    whl.addStretch(1)
-    set_layout.addWidget(widget_hdr)
-
-    enabled_cb = QCheckBox("Enable widget")
-    enabled_cb.setChecked(floating_enabled)
-    set_layout.addWidget(enabled_cb)
-
-    pos_row = QWidget()
-    prl = QHBoxLayout(pos_row)
-    prl.setContentsMargins(0, 0, 0, 0)
-    prl.setSpacing(12)
-    prl.addWidget(QLabel("Widget Position:"))
-    rb_group = QButtonGroup(pos_row)
-    rb_right = QRadioButton("Bottom right")
-    rb_left = QRadioButton("Bottom left")
-    rb_group.addButton(rb_right)
-    rb_group.addButton(rb_left)
-    rb_right.setChecked(floating_position == "right")
-    rb_left.setChecked(floating_position == "left")
-    prl.addWidget(rb_left)
-    prl.addWidget(rb_right)
-    prl.addStretch(1)
-    set_layout.addWidget(pos_row)
-
-    # Divider
-    try:
-        from aqt.qt import QFrame  # type: ignore
-    except Exception:
-        QFrame = None  # type: ignore
-    if QFrame is not None:
-        div1 = QFrame()
-        div1.setFrameShape(QFrame.Shape.HLine)
-        div1.setFrameShadow(QFrame.Shadow.Sunken)
-        set_layout.addWidget(div1)
-
-    # Disable/enable radio buttons based on checkbox
-    def _sync_pos_enabled():
-        rb_left.setEnabled(enabled_cb.isChecked())
-        rb_right.setEnabled(enabled_cb.isChecked())
-    _sync_pos_enabled()
-    enabled_cb.stateChanged.connect(lambda _=None: _sync_pos_enabled())
-
-    # Wire persistence through callbacks if provided
-    if callable(on_set_floating_enabled):
-        enabled_cb.stateChanged.connect(lambda _=None: on_set_floating_enabled(bool(enabled_cb.isChecked())))
-    if callable(on_set_floating_position):
-        rb_left.toggled.connect(lambda checked=False: checked and on_set_floating_position("left"))
-        rb_right.toggled.connect(lambda checked=False: checked and on_set_floating_position("right"))
-
-    # Section header: Experience
-    hud_hdr = QWidget()
-    hhl = QHBoxLayout(hud_hdr)
-    hhl.setContentsMargins(0, 0, 0, 0)
-    hhl.setSpacing(6)
-    try:
-        hud_icon = os.path.join(current_dir, "icon", "achievement_icon.png")
-        if os.path.exists(hud_icon):
-            lbl = QLabel()
-            lbl.setPixmap(QPixmap(hud_icon).scaled(18, 18, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-            hhl.addWidget(lbl)
-    except Exception:
-        pass
-    hud_lbl = QLabel("Experience")
-    hud_lbl.setStyleSheet("font-weight: 600;")
-    hhl.addWidget(hud_lbl)
-    hhl.addStretch(1)
-    set_layout.addWidget(hud_hdr)
-
-    review_hud_cb = QCheckBox("Enable experience HUD")
-    review_hud_cb.setChecked(review_hud_enabled)
-    set_layout.addWidget(review_hud_cb)
-
-    xp_cb = QCheckBox("Enable floating XP")
-    xp_cb.setChecked(floating_xp_enabled)
-    set_layout.addWidget(xp_cb)
-
-    # Divider
-    if QFrame is not None:
-        div2 = QFrame()
-        div2.setFrameShape(QFrame.Shape.HLine)
-        div2.setFrameShadow(QFrame.Shadow.Sunken)
-        set_layout.addWidget(div2)
-
-    # Section header: Notifications
-    notif_title = QLabel("Notifications")
-    notif_title.setStyleSheet("font-weight: 600;")
-    set_layout.addWidget(notif_title)
-
-    popups_cb = QCheckBox("Enable achievements and level up pop ups")
-    popups_cb.setChecked(popups_enabled)
-    set_layout.addWidget(popups_cb)
-
-    def _persist_bool(key: str, val: bool):
+    def _build_settings_tab() -> QWidget:
+        settings_tab = QWidget()
+        set_layout = QVBoxLayout(settings_tab)
+        set_layout.setContentsMargins(12, 12, 12, 12)
+        set_layout.setSpacing(10)
+
+        # Current settings from the profile's cached snapshot
+        floating_enabled = SETTINGS.floating_enabled
+        floating_position = SETTINGS.floating_position
+        floating_xp_enabled = SETTINGS.floating_xp_enabled
+        popups_enabled = SETTINGS.popups_enabled
+        review_hud_enabled = SETTINGS.review_hud_enabled
+
+        # Section header with icon: Widget
+        widget_hdr = QWidget()
+        whl = QHBoxLayout(widget_hdr)
+        whl.setContentsMargins(0, 0, 0, 0)
+        whl.setSpacing(6)
         try:
-            if mw and getattr(mw, 'col', None):
-                mw.col.set_config(key, bool(val))
+            settings_icon = os.path.join(current_dir, "icon", "settings_icon.png")
+            if os.path.exists(settings_icon):
+                lbl = QLabel()
+                lbl.setPixmap(QPixmap(settings_icon).scaled(18, 18, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+                whl.addWidget(lbl)
         except Exception:
             pass
-
-    def _apply_xp_enabled(flag: bool):
-        _persist_bool("ankiscape_floating_xp_enabled", flag)
-
-    def _apply_popups_enabled(flag: bool):
-        _persist_bool("ankiscape_popups_enabled", flag)
-
-    def _apply_review_hud_enabled(flag: bool):
-        _persist_bool("ankiscape_review_hud_enabled", flag)
+        hdr_lbl = QLabel("Widget")
+        hdr_lbl.setStyleSheet("font-weight: 600;")
+        whl.addWidget(hdr_lbl)
+        whl.addStretch(1)
+        set_layout.addWidget(widget_hdr)
+
+        enabled_cb = QCheckBox("Enable widget")
+        enabled_cb.setChecked(floating_enabled)
+        set_layout.addWidget(enabled_cb)
+
+        pos_row = QWidget()
+        prl = QHBoxLayout(pos_row)
+        prl.setContentsMargins(0, 0, 0, 0)
+        prl.setSpacing(12)
+        prl.addWidget(QLabel("Widget Position:"))
+        rb_group = QButtonGroup(pos_row)
+        rb_right = QRadioButton("Bottom right")
+        rb_left = QRadioButton("Bottom left")
+        rb_group.addButton(rb_right)
+        rb_group.addButton(rb_left)
+        rb_right.setChecked(floating_position == "right")
+        rb_left.setChecked(floating_position == "left")
+        prl.addWidget(rb_left)
+        prl.addWidget(rb_right)
+        prl.addStretch(1)
+        set_layout.addWidget(pos_row)
+
+        # Divider
         try:
-            if not flag:
-                if _REVIEW_HUD is not None and hasattr(_REVIEW_HUD, "hide"):
-                    _REVIEW_HUD.hide()
-            else:
-                # If enabled, attempt to refresh HUD position/visibility
-                if _REVIEW_HUD is not None and hasattr(_REVIEW_HUD, "show"):
-                    _REVIEW_HUD.show()
+            from aqt.qt import QFrame  # type: ignore
+        except Exception:
+            QFrame = None  # type: ignore
+        if QFrame is not None:
+            div1 = QFrame()
+            div1.setFrameShape(QFrame.Shape.HLine)
+            div1.setFrameShadow(QFrame.Shadow.Sunken)
+            set_layout.addWidget(div1)
+
+        # Disable/enable radio buttons based on checkbox
+        def _sync_pos_enabled():
+            rb_left.setEnabled(enabled_cb.isChecked())
+            rb_right.setEnabled(enabled_cb.isChecked())
+        _sync_pos_enabled()
+        enabled_cb.stateChanged.connect(lambda _=None: _sync_pos_enabled())
+
+        # Wire persistence through callbacks if provided
+        if callable(on_set_floating_enabled):
+            enabled_cb.stateChanged.connect(lambda _=None: on_set_floating_enabled(bool(enabled_cb.isChecked())))
+        if callable(on_set_floating_position):
+            rb_left.toggled.connect(lambda checked=False: checked and on_set_floating_position("left"))
+            rb_right.toggled.connect(lambda checked=False: checked and on_set_floating_position("right"))
+
+        # Section header: Experience
+        hud_hdr = QWidget()
+        hhl = QHBoxLayout(hud_hdr)
+        hhl.setContentsMargins(0, 0, 0, 0)
+        hhl.setSpacing(6)
+        try:
+            hud_icon = os.path.join(current_dir, "icon", "achievement_icon.png")
+            if os.path.exists(hud_icon):
+                lbl = QLabel()
+                lbl.setPixmap(QPixmap(hud_icon).scaled(18, 18, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+                hhl.addWidget(lbl)
         except Exception:
             pass
+        hud_lbl = QLabel("Experience")
+        hud_lbl.setStyleSheet("font-weight: 600;")
+        hhl.addWidget(hud_lbl)
+        hhl.addStretch(1)
+        set_layout.addWidget(hud_hdr)
+
+        review_hud_cb = QCheckBox("Enable experience HUD")
+        review_hud_cb.setChecked(review_hud_enabled)
+        set_layout.addWidget(review_hud_cb)
+
+        xp_cb = QCheckBox("Enable floating XP")
+        xp_cb.setChecked(floating_xp_enabled)
+        set_layout.addWidget(xp_cb)
+
+        # Divider
+        if QFrame is not None:
+            div2 = QFrame()
+            div2.setFrameShape(QFrame.Shape.HLine)
+            div2.setFrameShadow(QFrame.Shadow.Sunken)
+            set_layout.addWidget(div2)
+
+        # Section header: Notifications
+        notif_title = QLabel("Notifications")
+        notif_title.setStyleSheet("font-weight: 600;")
+        set_layout.addWidget(notif_title)
+
+        popups_cb = QCheckBox("Enable achievements and level up pop ups")
+        popups_cb.setChecked(popups_enabled)
+        set_layout.addWidget(popups_cb)
+
+        def _persist_bool(name: str, val: bool):
+            try:
+                SETTINGS.set(name, bool(val))
+            except Exception:
+                pass
 
-    xp_cb.stateChanged.connect(lambda _=None: _apply_xp_enabled(bool(xp_cb.isChecked())))
-    popups_cb.stateChanged.connect(lambda _=None: _apply_popups_enabled(bool(popups_cb.isChecked())))
-    review_hud_cb.stateChanged.connect(lambda _=None: _apply_review_hud_enabled(bool(review_hud_cb.isChecked())))
-
-    # Developer Mode controls: master toggle, reveals debug/diagnostics
-    dev_block = QWidget()
-    dev_layout = QVBoxLayout(dev_block)
-    dev_layout.setContentsMargins(0, 8, 0, 0)
-    dev_layout.setSpacing(6)
-    dev_title = QLabel("Developer Mode")
-    dev_title.setStyleSheet("font-weight: 600;")
-    dev_layout.addWidget(dev_title)
-    dev_row = QWidget()
-    drl = QHBoxLayout(dev_row)
-    drl.setContentsMargins(0, 0, 0, 0)
-    drl.setSpacing(8)
-    dev_toggle = QCheckBox("Enable developer mode (turns on debug logs)")
-    dev_enabled = False
-    try:
-        if mw and getattr(mw, 'col', None):
-            dev_enabled = bool(mw.col.get_config("ankiscape_developer_mode", False))
-            # Back-compat: migrate previous key if set
-            if not dev_enabled and bool(mw.col.get_config("ankiscape_debug_enabled", False)):
-                dev_enabled = True
-                mw.col.set_config("ankiscape_developer_mode", True)
-    except Exception:
+        def _apply_xp_enabled(flag: bool):
+            _persist_bool("floating_xp_enabled", flag)
+
+        def _apply_popups_enabled(flag: bool):
+            _persist_bool("popups_enabled", flag)
+
+        def _apply_review_hud_enabled(flag: bool):
+            _persist_bool("review_hud_enabled", flag)
+            try:
+                hud = get_review_hud()
+                if not flag:
+                    if hud is not None and hasattr(hud, "hide"):
+                        hud.hide()
+                else:
+                    # If enabled, attempt to refresh HUD position/visibility
+                    if hud is not None and hasattr(hud, "show"):
+                        hud.show()
+            except Exception:
+                pass
+
+        xp_cb.stateChanged.connect(lambda _=None: _apply_xp_enabled(bool(xp_cb.isChecked())))
+        popups_cb.stateChanged.connect(lambda _=None: _apply_popups_enabled(bool(popups_cb.isChecked())))
+        review_hud_cb.stateChanged.connect(lambda _=None: _apply_review_hud_enabled(bool(review_hud_cb.isChecked())))
+
+        # Developer Mode controls: master toggle, reveals debug/diagnostics
+        dev_block = QWidget()
+        dev_layout = QVBoxLayout(dev_block)
+        dev_layout.setContentsMargins(0, 8, 0, 0)
+        dev_layout.setSpacing(6)
+        dev_title = QLabel("Developer Mode")
+        dev_title.setStyleSheet("font-weight: 600;")
+        dev_layout.addWidget(dev_title)
+        dev_row = QWidget()
+        drl = QHBoxLayout(dev_row)
+        drl.setContentsMargins(0, 0, 0, 0)
+        drl.setSpacing(8)
+        dev_toggle = QCheckBox("Enable developer mode (turns on debug logs)")
         dev_enabled = False
-    dev_toggle.setChecked(dev_enabled)
-    drl.addWidget(dev_toggle)
-    drl.addStretch(1)
-    dev_layout.addWidget(dev_row)
-
-    # Inner panel (shown only when developer mode enabled)
-    dev_inner = QWidget()
-    dev_inner_layout = QVBoxLayout(dev_inner)
-    dev_inner_layout.setContentsMargins(12, 6, 0, 0)
-    dev_inner_layout.setSpacing(6)
-    # Row: Clear Logs + Run Tests
-    tools_row = QWidget()
-    trl = QHBoxLayout(tools_row)
-    trl.setContentsMargins(0, 0, 0, 0)
-    trl.setSpacing(8)
-    clear_btn = QPushButton("Clear Logs")
-    run_tests_btn = QPushButton("Run Unit Tests")
-    trl.addWidget(clear_btn)
-    trl.addWidget(run_tests_btn)
-    trl.addStretch(1)
-    dev_inner_layout.addWidget(tools_row)
-
-    def _apply_dev_enabled(flag: bool):
         try:
             if mw and getattr(mw, 'col', None):
-                mw.col.set_config("ankiscape_developer_mode", bool(flag))
+                dev_enabled = bool(mw.col.get_config("ankiscape_developer_mode", False))
+                # Back-compat: migrate previous key if set
+                if not dev_enabled and bool(mw.col.get_config("ankiscape_debug_enabled", False)):
+                    dev_enabled = True
+                    mw.col.set_config("ankiscape_developer_mode", True)
         except Exception:
-            pass
-        # Tie developer mode to debug enablement
-        try:
+            dev_enabled = False
+        dev_toggle.setChecked(dev_enabled)
+        drl.addWidget(dev_toggle)
+        drl.addStretch(1)
+        dev_layout.addWidget(dev_row)
+
+        # Inner panel (shown only when developer mode enabled)
+        dev_inner = QWidget()
+        dev_inner_layout = QVBoxLayout(dev_inner)
+        dev_inner_layout.setContentsMargins(12, 6, 0, 0)
+        dev_inner_layout.setSpacing(6)
+        # Row: Clear Logs + Run Tests
+        tools_row = QWidget()
+        trl = QHBoxLayout(tools_row)
+        trl.setContentsMargins(0, 0, 0, 0)
+        trl.setSpacing(8)
+        clear_btn = QPushButton("Clear Logs")
+        run_tests_btn = QPushButton("Run Unit Tests")
+        trl.addWidget(clear_btn)
+        trl.addWidget(run_tests_btn)
+        trl.addStretch(1)
+        dev_inner_layout.addWidget(tools_row)
+
+        def _apply_dev_enabled(flag: bool):
             try:
-                from .debug import set_debug_enabled  # type: ignore
+                if mw and getattr(mw, 'col', None):
+                    mw.col.set_config("ankiscape_developer_mode", bool(flag))
             except Exception:
-                from debug import set_debug_enabled  # type: ignore
-            set_debug_enabled(bool(flag))
-        except Exception:
-            pass
-        # Show/Hide inner panel
-        try:
-            dev_inner.setVisible(bool(flag))
-        except Exception:
-            pass
-        if flag:
-            _debug_log("developer_mode: enabled via UI")
-    dev_toggle.stateChanged.connect(lambda _=None: _apply_dev_enabled(bool(dev_toggle.isChecked())))
-
-    def _clear_logs():
-        try:
-            # Remove base and rotated files
-            base = os.path.join(os.path.dirname(__file__), "ankiscape_debug.log")
-            paths = [base] + [f"{base}.{i}" for i in range(1, 6)]
-            removed_any = False
-            for p in paths:
+                pass
+            # Tie developer mode to debug enablement
+            try:
                 try:
-                    if os.path.exists(p):
-                        os.remove(p)
-                        removed_any = True
+                    from .debug import set_debug_enabled  # type: ignore
                 except Exception:
-                    pass
-            # Feedback: lightweight message box
+                    from debug import set_debug_enabled  # type: ignore
+                set_debug_enabled(bool(flag))
+            except Exception:
+                pass
+            # Show/Hide inner panel
             try:
-                msg = QMessageBox(mw)
-                msg.setIcon(QMessageBox.Icon.Information)
-                msg.setWindowTitle("Logs cleared")
-                msg.setText("Debug logs have been cleared." if removed_any else "No log files found to clear.")
-                msg.setStandardButtons(QMessageBox.StandardButton.Ok)
-                msg.exec()
+                dev_inner.setVisible(bool(flag))
             except Exception:
                 pass
-        except Exception:
-            pass
-    clear_btn.clicked.connect(_clear_logs)
+            if flag:
+                _debug_log("developer_mode: enabled via UI")
+        dev_toggle.stateChanged.connect(lambda _=None: _apply_dev_enabled(bool(dev_toggle.isChecked())))
 
-    def _run_tests_and_log():
-        # Run tests in-process to avoid OS handlers opening files with Anki app.
-        try:
-            _debug_log("developer_mode: running unit tests via UI (in-process)")
-            import sys, io, unittest, traceback
-            root = os.path.dirname(os.path.abspath(__file__))
-            if root not in sys.path:
-                sys.path.insert(0, root)
-            loader = unittest.TestLoader()
-            suite = loader.discover(start_dir=os.path.join(root, "tests"), pattern="test_*.py")
-            buf = io.StringIO()
-            runner = unittest.TextTestRunner(stream=buf, verbosity=2)
-            result = runner.run(suite)
-            output = buf.getvalue()
-            code = 0 if result.wasSuccessful() else 1
-            for line in output.splitlines():
-                _debug_log(f"tests: {line}")
-            _debug_log(f"developer_mode: tests finished rc={code}, failures={len(result.failures)}, errors={len(result.errors)}")
-            # User feedback
-            msg = QMessageBox(mw)
-            msg.setIcon(QMessageBox.Icon.Information if code == 0 else QMessageBox.Icon.Warning)
-            msg.setWindowTitle("Unit Tests Result")
-            msg.setText("All tests passed." if code == 0 else "Some tests failed. See debug log for details.")
-            msg.setStandardButtons(QMessageBox.StandardButton.Ok)
-            msg.exec()
-        except Exception:
+        def _clear_logs():
             try:
-                _debug_log("developer_mode: test run failed with exception")
-                _debug_log(traceback.format_exc())
+                # Remove base and rotated files
+                base = os.path.join(os.path.dirname(__file__), "ankiscape_debug.log")
+                paths = [base] + [f"{base}.{i}" for i in range(1, 6)]
+                removed_any = False
+                for p in paths:
+                    try:
+                        if os.path.exists(p):
+                            os.remove(p)
+                            removed_any = True
+                    except Exception:
+                        pass
+                # Feedback: lightweight message box
+                try:
+                    msg = QMessageBox(mw)
+                    msg.setIcon(QMessageBox.Icon.Information)
+                    msg.setWindowTitle("Logs cleared")
+                    msg.setText("Debug logs have been cleared." if removed_any else "No log files found to clear.")
+                    msg.setStandardButtons(QMessageBox.StandardButton.Ok)
+                    msg.exec()
+                except Exception:
+                    pass
             except Exception:
                 pass
-    run_tests_btn.clicked.connect(_run_tests_and_log)
-
-    dev_inner.setVisible(dev_enabled)
-    dev_layout.addWidget(dev_inner)
-    set_layout.addWidget(dev_block)
+        clear_btn.clicked.connect(_clear_logs)
 
-    tabs.addTab(settings_tab, "Settings")
-    # Set Settings icon if present
-    try:
-        settings_icon = os.path.join(current_dir, "icon", "settings_icon.png")
-        if os.path.exists(settings_icon):
-            tabs.setTabIcon(tabs.indexOf(settings_tab), QIcon(settings_icon))
-    except Exception:
-        pass
-    tabs.setTabToolTip(tabs.indexOf(settings_tab), "Configure widget, experience HUD, notifications, and developer tools")
+        def _run_tests_and_log():
+            # Run tests in-process to avoid OS handlers opening files with Anki app.
+            try:
+                _debug_log("developer_mode: running unit tests via UI (in-process)")
+                import sys, io, unittest, traceback
+                root = os.path.dirname(os.path.abspath(__file__))
+                if root not in sys.path:
+                    sys.path.insert(0, root)
+                loader = unittest.TestLoader()
+                suite = loader.discover(start_dir=os.path.join(root, "tests"), pattern="test_*.py")
+                buf = io.StringIO()
+                runner = unittest.TextTestRunner(stream=buf, verbosity=2)
+                result = runner.run(suite)
+                output = buf.getvalue()
+                code = 0 if result.wasSuccessful() else 1
+                for line in output.splitlines():
+                    _debug_log(f"tests: {line}")
+                _debug_log(f"developer_mode: tests finished rc={code}, failures={len(result.failures)}, errors={len(result.errors)}")
+                # User feedback
+                msg = QMessageBox(mw)
+                msg.setIcon(QMessageBox.Icon.Information if code == 0 else QMessageBox.Icon.Warning)
+                msg.setWindowTitle("Unit Tests Result")
+                msg.setText("All tests passed." if code == 0 else "Some tests failed. See debug log for details.")
+                msg.setStandardButtons(QMessageBox.StandardButton.Ok)
+                msg.exec()
+            except Exception:
+                try:
+                    _debug_log("developer_mode: test run failed with exception")
+                    _debug_log(traceback.format_exc())
+                except Exception:
+                    pass
+        run_tests_btn.clicked.connect(_run_tests_and_log)
+
+        dev_inner.setVisible(dev_enabled)
+        dev_layout.addWidget(dev_inner)
+        set_layout.addWidget(dev_block)
+        return settings_tab
+    _add_lazy_tab("Settings", _build_settings_tab, "settings_icon.png", "Configure widget, experience HUD, notifications, and developer tools")
+    # Prefetch the active skill's tab first, then the Bank
+    skill_tab_index = {
+        "Mining": mining_index,
+        "Woodcutting": wood_index,
+        "Smithing": smith_index,
+        "Crafting": craft_index,
+    }
+    lazy_tabs.likely = [i for i in (skill_tab_index.get(current_skill), bank_index) if i is not None]
 
     layout.addWidget(tabs)
 
@@ -1648,9 +2003,23 @@ def show_main_menu(
     f_layout.addWidget(close)
     layout.addWidget(footer)
     dialog.setLayout(layout)
-    _debug_log("ui.show_main_menu: about to exec")
-    dialog.exec()
-    _debug_log("ui.show_main_menu: dialog closed")
+    # Prefetch the likely next tab once the window has painted
+    try:
+        QTimer.singleShot(MENU_PREFETCH_DELAY_MS, _prefetch_tab)
+    except Exception:
+        pass
+    model = MenuViewModel()
+    model.update(player_data, current_skill)
+    _MAIN_MENU_CTX["menu"] = {
+        "dialog": dialog,
+        "player_data": player_data,
+        "state": state,
+        "model": model,
+        "refreshers": refreshers,
+        "release_timer": release_timer,
+    }
+    _debug_log("ui.show_main_menu: showing")
+    dialog.show()
 
 
 def show_tree_selection_dialog(current_tree: str, woodcutting_level: int, TREE_DATA: dict, TREE_IMAGES: dict) -> Optional[str]:
@@ -1673,8 +2042,7 @@ def show_tree_selection_dialog(current_tree: str, woodcutting_level: int, TREE_D
         tree_layout = QVBoxLayout(tree_widget)
 
         tree_image = QLabel()
-        pixmap = QPixmap(TREE_IMAGES[tree_name])
-        tree_image.setPixmap(pixmap.scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio))
+        set_label_image(tree_image, TREE_IMAGES[tree_name], 64)
         tree_layout.addWidget(tree_image, alignment=Qt.AlignmentFlag.AlignCenter)
 
         tree_info = QLabel(f"{tree_name}\nLevel: {tree_data['level']}")
@@ -1736,8 +2104,7 @@ def show_ore_selection_dialog(current_ore: str, mining_level: int, ORE_DATA: dic
         ore_layout = QVBoxLayout(ore_widget)
 
         ore_image = QLabel()
-        pixmap = QPixmap(ORE_IMAGES[ore])
-        ore_image.setPixmap(pixmap.scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio))
+        set_label_image(ore_image, ORE_IMAGES[ore], 64)
         ore_layout.addWidget(ore_image, alignment=Qt.AlignmentFlag.AlignCenter)
 
         ore_info = QLabel(f"{ore}\nLevel: {data['level']}")
@@ -1798,8 +2165,7 @@ def show_bar_selection_dialog(current_bar: str, smithing_level: int, BAR_DATA: d
         bar_layout = QVBoxLayout(bar_widget)
 
         bar_image = QLabel()
-        pixmap = QPixmap(BAR_IMAGES[bar_name])
-        bar_image.setPixmap(pixmap.scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio))
+        set_label_image(bar_image, BAR_IMAGES[bar_name], 64)
         bar_layout.addWidget(bar_image, alignment=Qt.AlignmentFlag.AlignCenter)
 
         bar_info = QLabel(f"{bar_name}\nLevel: {bar_data['level']}")
@@ -1868,8 +2234,7 @@ def show_craft_selection_dialog(current_craft: str, crafting_level: int, invento
         item_layout = QVBoxLayout(item_widget)
 
         item_image = QLabel()
-        pixmap = QPixmap(CRAFTED_ITEM_IMAGES.get(item, ""))
-        item_image.setPixmap(pixmap.scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio))
+        set_label_image(item_image, CRAFTED_ITEM_IMAGES.get(item, ""), 64)
         item_layout.addWidget(item_image, alignment=Qt.AlignmentFlag.AlignCenter)
 
         item_info = QLabel(f"{item}\nLevel: {data['level']}")
@@ -1965,6 +2330,15 @@ def show_review_popup():
     return
 
 
+# Inventory categories listed under each skill in the Stats dialog
+_STATS_SKILL_CATEGORIES = {
+    "Mining": ("Ores", "Gems"),
+    "Woodcutting": ("Logs",),
+    "Smithing": ("Bars",),
+    "Crafting": ("Crafted",),
+}
+
+
 def show_stats(player_data: dict, current_skill: str):
     """Render the Stats dialog using provided player_data and current_skill."""
     try:
@@ -2044,14 +2418,14 @@ def show_stats(player_data: dict, current_skill: str):
             stats_layout.addWidget(create_label("Total Experience:"), 1, 0)
             stats_layout.addWidget(create_label(f"{exp:,}", True), 1, 1)
 
+            curve = get_level_curve(EXP_TABLE)
             if level < 99:
-                exp_to_next = round(max(0, EXP_TABLE[level] - exp), 1)
+                exp_to_next = round(curve.xp_to_next(level, exp), 1)
                 stats_layout.addWidget(create_label("Experience to Next Level:"), 2, 0)
                 stats_layout.addWidget(create_label(f"{exp_to_next:,}", True), 2, 1)
 
             progress_bar = QProgressBar()
-            progress_percentage = (exp - EXP_TABLE[level - 1]) / (EXP_TABLE[level] - EXP_TABLE[level - 1]) * 100
-            progress_bar.setValue(int(progress_percentage))
+            progress_bar.setValue(curve.progress(level, exp)[0])
             progress_bar.setFormat("")
             progress_bar.setStyleSheet(
                 """
@@ -2072,35 +2446,9 @@ def show_stats(player_data: dict, current_skill: str):
             scroll_layout.addLayout(stats_layout)
 
             scroll_layout.addWidget(create_label(f"{skill_name} Inventory", True))
-            inventory_layout = QGridLayout()
-            inventory_layout.setColumnStretch(1, 1)
-            inventory_layout.setHorizontalSpacing(15)
-            inventory_layout.setVerticalSpacing(10)
-
-            row = 0
-            for item, amount in player_data.get("inventory", {}).items():
-                if (
-                    (skill_name == "Mining" and (item in ORE_DATA or item in GEM_DATA))
-                    or (skill_name == "Woodcutting" and item in TREE_DATA)
-                    or (skill_name == "Smithing" and item in BAR_DATA)
-                    or (skill_name == "Crafting" and item in CRAFTING_DATA)
-                ):
-                    item_image = QLabel()
-                    pixmap = QPixmap(
-                        ORE_IMAGES.get(item)
-                        or TREE_IMAGES.get(item)
-                        or BAR_IMAGES.get(item)
-                        or GEM_IMAGES.get(item)
-                        or CRAFTED_ITEM_IMAGES.get(item)
-                    )
-                    item_image.setPixmap(pixmap.scaled(32, 32, Qt.AspectRatioMode.KeepAspectRatio))
-                    inventory_layout.addWidget(item_image, row, 0)
-
-                    inventory_layout.addWidget(create_label(item), row, 1)
-                    inventory_layout.addWidget(create_label(str(amount), True), row, 2)
-                    row += 1
-
-            scroll_layout.addLayout(inventory_layout)
+            inventory_view, _ = views.make_bank_view(inventory_model, _STATS_SKILL_CATEGORIES[skill_name], scroll_content)
+            inventory_view.setMinimumHeight(views.ROW_HEIGHT * 6)
+            scroll_layout.addWidget(inventory_view)
 
             scroll_content.setLayout(scroll_layout)
             scroll_area.setWidget(scroll_content)
@@ -2108,6 +2456,8 @@ def show_stats(player_data: dict, current_skill: str):
             tab.setLayout(tab_layout)
             return tab
 
+        # One inventory model shared by the per-skill views
+        inventory_model = views.BankModel(player_data, _screen_dpr(), dialog)
         tabs.addTab(create_skill_tab("Mining"), "Mining")
         tabs.addTab(create_skill_tab("Woodcutting"), "Woodcutting")
         tabs.addTab(create_skill_tab("Smithing"), "Smithing")
@@ -2176,65 +2526,14 @@ def show_achievements(player_data: dict):
         """
     )
 
-    difficulties = ["Easy", "Moderate", "Difficult", "Very Challenging"]
-
-    for difficulty in difficulties:
+    dpr = _screen_dpr()
+    for difficulty, names in views.achievement_groups(ACHIEVEMENTS).items():
+        if not names:
+            continue
         tab = QWidget()
         tab_layout = QVBoxLayout()
-        scroll_area = QScrollArea()
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout()
-
-        for achievement, data in ACHIEVEMENTS.items():
-            if data["difficulty"] == difficulty:
-                achievement_widget = QWidget()
-                achievement_layout = QHBoxLayout()
-
-                icon_label = QLabel()
-                icon_path = os.path.join(current_dir, "icon", f"{achievement.lower().replace(' ', '_')}.png")
-                if os.path.exists(icon_path):
-                    pixmap = QPixmap(icon_path)
-                else:
-                    pixmap = QPixmap(os.path.join(current_dir, "icon", "achievement_icon.png"))
-                icon_label.setPixmap(pixmap.scaled(40, 40, Qt.AspectRatioMode.KeepAspectRatio))
-                achievement_layout.addWidget(icon_label)
-
-                info_widget = QWidget()
-                info_layout = QVBoxLayout()
-                name_label = QLabel(achievement)
-                name_label.setStyleSheet("font-weight: bold; color: #333333; font-size: 16px;")
-                desc_label = QLabel(data["description"])
-                desc_label.setWordWrap(True)
-                desc_label.setStyleSheet("color: #666666; font-size: 14px;")
-                info_layout.addWidget(name_label)
-                info_layout.addWidget(desc_label)
-                info_widget.setLayout(info_layout)
-                achievement_layout.addWidget(info_widget, stretch=1)
-
-                completed = achievement in player_data["completed_achievements"]
-                status_label = QLabel("✓" if completed else "")
-                status_label.setStyleSheet("color: #4CAF50; font-size: 24px; font-weight: bold;")
-                achievement_layout.addWidget(status_label)
-
-                achievement_widget.setLayout(achievement_layout)
-                achievement_widget.setStyleSheet(
-                    f"""
-                    background-color: {'#e8f5e9' if completed else 'white'};
-                    border: 1px solid #e0e0e0;
-                    border-radius: 8px;
-                    padding: 12px;
-                    margin-bottom: 8px;
-                    """
-                )
-
-                scroll_layout.addWidget(achievement_widget)
-
-        scroll_widget.setLayout(scroll_layout)
-        scroll_area.setWidget(scroll_widget)
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("border: none;")
-
-        tab_layout.addWidget(scroll_area)
+        model = views.AchievementModel(player_data, names, dpr, parent=tab)
+        tab_layout.addWidget(views.make_achievement_view(model, tab))
         tab.setLayout(tab_layout)
         tabs.addTab(tab, difficulty)
 
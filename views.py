@@ -0,0 +1,460 @@
+"""views.py - Model/view widgets for the inventory (Bank) and achievement lists.
+
+InventoryRows keeps the sorted list of held items and turns inventory changes
+into row operations (insert, remove, change), so a view only repaints the rows
+that changed. BankModel exposes it to Qt as a QAbstractListModel; BankFilterProxy
+filters by category and text; BankDelegate paints icon, name and count.
+
+Achievements are grouped by difficulty once (achievement_groups); each
+difficulty tab shows an AchievementModel painted by AchievementDelegate, and
+AchievementRows reports which rows a newly completed achievement touches.
+
+Icons are requested from the shared image service when a row is first painted,
+so opening a list costs only its visible rows. InventoryRows, AchievementRows
+and achievement_groups have no Qt dependency; the models, proxy and delegates
+need Qt.
+"""
+import os
+from bisect import bisect_left
+
+try:
+    from aqt.qt import (  # type: ignore
+        Qt,
+        QAbstractListModel,
+        QColor,
+        QModelIndex,
+        QPainter,
+        QRect,
+        QRectF,
+        QSize,
+        QSortFilterProxyModel,
+        QStyle,
+        QStyledItemDelegate,
+    )
+    HAS_QT = True
+except Exception:
+    HAS_QT = False
+
+try:
+    from .constants import ACHIEVEMENTS, ITEM_CATEGORY, ITEM_IMAGES, current_dir
+    from .images import IMAGES, path_exists
+    from .logic_pure import achievement_progress
+except Exception:
+    from constants import ACHIEVEMENTS, ITEM_CATEGORY, ITEM_IMAGES, current_dir  # type: ignore
+    from images import IMAGES, path_exists  # type: ignore
+    from logic_pure import achievement_progress  # type: ignore
+
+try:
+    from .debug import debug_log as _debug_log  # type: ignore
+except Exception:
+    try:
+        from debug import debug_log as _debug_log  # type: ignore
+    except Exception:
+        def _debug_log(msg: str) -> None:
+            pass
+
+# Logical size of item icons in inventory lists
+ICON_SIZE = 28
+ROW_HEIGHT = 36
+OTHER_CATEGORY = "Other"
+
+ACHIEVEMENT_DIFFICULTIES = ("Easy", "Moderate", "Difficult", "Very Challenging")
+ACHIEVEMENT_ICON_SIZE = 32
+ACHIEVEMENT_ROW_HEIGHT = 64
+
+
+def item_category(name: str) -> str:
+    return ITEM_CATEGORY.get(name, OTHER_CATEGORY)
+
+
+class InventoryRows:
+    """Sorted names of items held (count > 0) with their counts.
+
+    sync(inventory, keys) applies changes and returns the row operations in
+    the order they were applied:
+        ("remove", row) / ("insert", row) / ("change", row)
+    before(op, row) and after(op, row), when given, are called around each
+    operation (for Qt's beginInsertRows/endInsertRows pairs). With keys (the
+    item names that may have changed, e.g. a delta's keys) the cost is
+    proportional to len(keys); without them the whole inventory is compared.
+    """
+
+    def __init__(self):
+        self.names = []
+        self.counts = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def row_of(self, name: str):
+        row = bisect_left(self.names, name)
+        if row < len(self.names) and self.names[row] == name:
+            return row
+        return None
+
+    def sync(self, inventory: dict, keys=None, before=None, after=None) -> list:
+        if keys is None:
+            keys = set(self.counts) | set(inventory)
+        ops = []
+        for name in sorted(keys):
+            count = inventory.get(name, 0) or 0
+            old = self.counts.get(name)
+            if count > 0 and old is None:
+                op = ("insert", bisect_left(self.names, name))
+            elif count <= 0 and old is not None:
+                op = ("remove", self.row_of(name))
+            elif old is not None and count != old:
+                op = ("change", self.row_of(name))
+            else:
+                continue
+            if before is not None:
+                before(*op)
+            if op[0] == "insert":
+                self.names.insert(op[1], name)
+                self.counts[name] = count
+            elif op[0] == "remove":
+                del self.names[op[1]]
+                del self.counts[name]
+            else:
+                self.counts[name] = count
+            if after is not None:
+                after(*op)
+            ops.append(op)
+        return ops
+
+
+_ACHIEVEMENT_GROUPS = {}
+
+
+def achievement_groups(achievements=ACHIEVEMENTS) -> dict:
+    """{difficulty: [names in definition order]}, built once per achievements table.
+    Known difficulties come first in ACHIEVEMENT_DIFFICULTIES order."""
+    entry = _ACHIEVEMENT_GROUPS.get(id(achievements))
+    if entry is None or entry[0] is not achievements:
+        groups = {d: [] for d in ACHIEVEMENT_DIFFICULTIES}
+        for name, data in achievements.items():
+            groups.setdefault(data.get("difficulty", OTHER_CATEGORY), []).append(name)
+        # Keep a reference to the table so its id cannot be reused while cached
+        entry = (achievements, groups)
+        _ACHIEVEMENT_GROUPS[id(achievements)] = entry
+    return entry[1]
+
+
+def achievement_icon_path(name: str) -> str:
+    """icon/<name>.png when the add-on ships one, else the generic achievement icon."""
+    path = os.path.join(current_dir, "icon", f"{name.lower().replace(' ', '_')}.png")
+    if not path_exists(path):
+        path = os.path.join(current_dir, "icon", "achievement_icon.png")
+    return path
+
+
+class AchievementRows:
+    """Rows of one achievement list plus the completed state last shown.
+
+    sync(completed) records the current completed names and returns the rows
+    whose state changed, so completing an achievement updates one row.
+    """
+
+    def __init__(self, names):
+        self.names = list(names)
+        self._row = {name: i for i, name in enumerate(self.names)}
+        self.completed = set()
+
+    def __len__(self):
+        return len(self.names)
+
+    def sync(self, completed) -> list:
+        completed = {name for name in completed if name in self._row}
+        changed = sorted(self._row[name] for name in completed ^ self.completed)
+        self.completed = completed
+        return changed
+
+
+if HAS_QT:
+    NameRole = Qt.ItemDataRole.UserRole + 1
+    CountRole = Qt.ItemDataRole.UserRole + 2
+    CategoryRole = Qt.ItemDataRole.UserRole + 3
+
+    class BankModel(QAbstractListModel):
+        """Live view of player_data["inventory"]; call refresh() after it changes."""
+
+        def __init__(self, player_data: dict, dpr: float = 1.0, parent=None):
+            super().__init__(parent)
+            self.player_data = player_data
+            self.dpr = dpr
+            self.rows = InventoryRows()
+            self.rows.sync(player_data.get("inventory", {}))
+
+        def rowCount(self, parent=QModelIndex()):
+            return 0 if parent.isValid() else len(self.rows)
+
+        def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+            if not index.isValid() or index.row() >= len(self.rows):
+                return None
+            name = self.rows.names[index.row()]
+            if role == Qt.ItemDataRole.DisplayRole:
+                return f"{name} x{self.rows.counts[name]}"
+            if role == NameRole:
+                return name
+            if role == CountRole:
+                return self.rows.counts[name]
+            if role == CategoryRole:
+                return item_category(name)
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return f"{name} ({item_category(name)})"
+            if role == Qt.ItemDataRole.DecorationRole:
+                return self._icon(name)
+            return None
+
+        def _icon(self, name: str):
+            """Cached pixmap, or a placeholder while the icon decodes off the GUI thread."""
+            path = ITEM_IMAGES.get(name)
+            if not path:
+                return None
+            pm = IMAGES.request(path, ICON_SIZE, self.dpr, lambda _pm, n=name: self._icon_ready(n))
+            return pm if pm is not None else IMAGES.placeholder(ICON_SIZE, self.dpr)
+
+        def _icon_ready(self, name: str) -> None:
+            row = self.rows.row_of(name)
+            if row is not None:
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+        def refresh(self, keys=None) -> int:
+            """Apply inventory changes (optionally only for keys); returns the number of row operations."""
+            ops = self.rows.sync(self.player_data.get("inventory", {}), keys, self._before, self._after)
+            return len(ops)
+
+        def _before(self, op: str, row: int) -> None:
+            if op == "insert":
+                self.beginInsertRows(QModelIndex(), row, row)
+            elif op == "remove":
+                self.beginRemoveRows(QModelIndex(), row, row)
+
+        def _after(self, op: str, row: int) -> None:
+            if op == "insert":
+                self.endInsertRows()
+            elif op == "remove":
+                self.endRemoveRows()
+            else:
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, CountRole])
+
+    class BankFilterProxy(QSortFilterProxyModel):
+        """Filters BankModel rows by category (a set, empty for all) and a name substring."""
+
+        def __init__(self, parent=None):
+            super().__init__(parent)
+            self._categories = frozenset()
+            self._text = ""
+
+        def set_categories(self, categories) -> None:
+            self._categories = frozenset(c for c in (categories or ()) if c)
+            self.invalidateFilter()
+
+        def set_text(self, text: str) -> None:
+            self._text = (text or "").strip().lower()
+            self.invalidateFilter()
+
+        def filterAcceptsRow(self, source_row, source_parent):
+            index = self.sourceModel().index(source_row, 0, source_parent)
+            if self._categories and index.data(CategoryRole) not in self._categories:
+                return False
+            return not self._text or self._text in (index.data(NameRole) or "").lower()
+
+    class BankDelegate(QStyledItemDelegate):
+        """Paints one inventory row: icon, name and a right-aligned count."""
+
+        def sizeHint(self, option, index):
+            return QSize(option.rect.width(), ROW_HEIGHT)
+
+        def paint(self, painter, option, index):
+            style = option.widget.style() if option.widget is not None else None
+            if style is not None:
+                style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, option.widget)
+            rect = option.rect.adjusted(6, 0, -10, 0)
+            painter.save()
+            try:
+                pm = index.data(Qt.ItemDataRole.DecorationRole)
+                if pm is not None:
+                    top = rect.top() + (rect.height() - ICON_SIZE) // 2
+                    painter.drawPixmap(QRect(rect.left(), top, ICON_SIZE, ICON_SIZE), pm)
+                selected = bool(option.state & QStyle.StateFlag.State_Selected)
+                color = option.palette.highlightedText() if selected else option.palette.text()
+                painter.setPen(color.color())
+                text_rect = rect.adjusted(ICON_SIZE + 8, 0, 0, 0)
+                count = f"{index.data(CountRole):,}"
+                font = painter.font()
+                font.setBold(True)
+                painter.setFont(font)
+                count_w = painter.fontMetrics().horizontalAdvance(count)
+                painter.drawText(text_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, count)
+                font.setBold(False)
+                painter.setFont(font)
+                name_rect = text_rect.adjusted(0, 0, -(count_w + 12), 0)
+                name = painter.fontMetrics().elidedText(index.data(NameRole) or "", Qt.TextElideMode.ElideRight, name_rect.width())
+                painter.drawText(name_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, name)
+            except Exception as e:
+                _debug_log(f"views: painting bank row failed: {e}")
+            finally:
+                painter.restore()
+
+    def make_bank_view(model, categories=(), parent=None):
+        """QListView over a filter proxy of model, with uniform rows so only visible rows are laid out.
+        Returns (view, proxy)."""
+        from aqt.qt import QListView  # type: ignore
+
+        proxy = BankFilterProxy(parent)
+        proxy.setSourceModel(model)
+        proxy.set_categories(categories)
+        view = QListView(parent)
+        view.setModel(proxy)
+        view.setItemDelegate(BankDelegate(view))
+        view.setUniformItemSizes(True)
+        view.setAlternatingRowColors(True)
+        view.setSelectionMode(QListView.SelectionMode.SingleSelection)
+        view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        return view, proxy
+
+    DescriptionRole = Qt.ItemDataRole.UserRole + 4
+    CompletedRole = Qt.ItemDataRole.UserRole + 5
+    ProgressRole = Qt.ItemDataRole.UserRole + 6
+
+    class AchievementModel(QAbstractListModel):
+        """One difficulty's achievements for player_data; call refresh() after progress or completion changes."""
+
+        def __init__(self, player_data: dict, names, dpr: float = 1.0, achievements=ACHIEVEMENTS, parent=None):
+            super().__init__(parent)
+            self.player_data = player_data
+            self.achievements = achievements
+            self.dpr = dpr
+            self.rows = AchievementRows(names)
+            self.rows.sync(player_data.get("completed_achievements", []))
+
+        def rowCount(self, parent=QModelIndex()):
+            return 0 if parent.isValid() else len(self.rows)
+
+        def completed_count(self) -> int:
+            return len(self.rows.completed)
+
+        def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+            if not index.isValid() or index.row() >= len(self.rows):
+                return None
+            name = self.rows.names[index.row()]
+            if role in (Qt.ItemDataRole.DisplayRole, NameRole):
+                return name
+            if role == DescriptionRole:
+                return self.achievements[name].get("description", "")
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return f"{name}: {self.achievements[name].get('description', '')}"
+            if role == CompletedRole:
+                return name in self.rows.completed
+            if role == ProgressRole:
+                # Computed for painted rows only
+                if name in self.rows.completed:
+                    return None
+                return achievement_progress(self.player_data, self.achievements[name])
+            if role == Qt.ItemDataRole.DecorationRole:
+                path = achievement_icon_path(name)
+                pm = IMAGES.request(path, ACHIEVEMENT_ICON_SIZE, self.dpr, lambda _pm, r=index.row(): self._row_changed(r))
+                return pm if pm is not None else IMAGES.placeholder(ACHIEVEMENT_ICON_SIZE, self.dpr)
+            return None
+
+        def _row_changed(self, row: int, roles=None) -> None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, roles or [])
+
+        def refresh(self, progress: bool = True) -> list:
+            """Update rows whose completed state changed; with progress, repaint progress bars too.
+            Returns the changed rows."""
+            changed = self.rows.sync(self.player_data.get("completed_achievements", []))
+            for row in changed:
+                self._row_changed(row, [CompletedRole, ProgressRole])
+            if progress and len(self.rows):
+                # One range notification; views only repaint the rows on screen
+                self.dataChanged.emit(self.index(0), self.index(len(self.rows) - 1), [ProgressRole])
+            return changed
+
+    class AchievementDelegate(QStyledItemDelegate):
+        """Paints an achievement card: icon, title, description, ✓ or a progress bar."""
+
+        _DONE = QColor(76, 175, 80)
+
+        def sizeHint(self, option, index):
+            return QSize(option.rect.width(), ACHIEVEMENT_ROW_HEIGHT)
+
+        def paint(self, painter, option, index):
+            painter.save()
+            try:
+                completed = bool(index.data(CompletedRole))
+                card = QRectF(option.rect.adjusted(2, 3, -2, -3))
+                painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+                base = option.palette.base().color()
+                fill = QColor(base)
+                if completed:
+                    # Tint toward green, readable on light and dark palettes
+                    fill = QColor(
+                        (base.red() * 5 + self._DONE.red()) // 6,
+                        (base.green() * 5 + self._DONE.green()) // 6,
+                        (base.blue() * 5 + self._DONE.blue()) // 6,
+                    )
+                painter.setPen(option.palette.mid().color())
+                painter.setBrush(fill)
+                painter.drawRoundedRect(card, 6, 6)
+
+                inner = option.rect.adjusted(12, 8, -12, -8)
+                pm = index.data(Qt.ItemDataRole.DecorationRole)
+                if pm is not None:
+                    top = inner.top() + (inner.height() - ACHIEVEMENT_ICON_SIZE) // 2
+                    painter.drawPixmap(QRect(inner.left(), top, ACHIEVEMENT_ICON_SIZE, ACHIEVEMENT_ICON_SIZE), pm)
+                text_left = inner.left() + ACHIEVEMENT_ICON_SIZE + 10
+                status_w = 28
+                text_w = max(0, inner.right() - status_w - text_left)
+                font = painter.font()
+                line_h = painter.fontMetrics().height()
+
+                font.setBold(True)
+                painter.setFont(font)
+                painter.setPen(option.palette.text().color())
+                title = painter.fontMetrics().elidedText(index.data(NameRole) or "", Qt.TextElideMode.ElideRight, text_w)
+                painter.drawText(QRect(text_left, inner.top(), text_w, line_h), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, title)
+                font.setBold(False)
+                painter.setFont(font)
+                desc = painter.fontMetrics().elidedText(index.data(DescriptionRole) or "", Qt.TextElideMode.ElideRight, text_w)
+                painter.drawText(QRect(text_left, inner.top() + line_h, text_w, line_h), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, desc)
+
+                if completed:
+                    font.setBold(True)
+                    font.setPointSizeF(font.pointSizeF() * 1.3)
+                    painter.setFont(font)
+                    painter.setPen(self._DONE)
+                    painter.drawText(QRect(inner.right() - status_w, inner.top(), status_w, inner.height()), Qt.AlignmentFlag.AlignCenter, "✓")
+                else:
+                    progress = index.data(ProgressRole)
+                    if progress and progress[1] > 0:
+                        value, target = progress
+                        bar = QRectF(text_left, inner.bottom() - 4, text_w, 4)
+                        painter.setPen(Qt.PenStyle.NoPen)
+                        painter.setBrush(option.palette.mid().color())
+                        painter.drawRoundedRect(bar, 2, 2)
+                        if value > 0:
+                            painter.setBrush(self._DONE)
+                            painter.drawRoundedRect(QRectF(bar.left(), bar.top(), bar.width() * value / target, bar.height()), 2, 2)
+            except Exception as e:
+                _debug_log(f"views: painting achievement row failed: {e}")
+            finally:
+                painter.restore()
+
+    def make_achievement_view(model, parent=None):
+        """QListView of achievement cards with uniform rows; only visible rows are painted."""
+        from aqt.qt import QListView  # type: ignore
+
+        view = QListView(parent)
+        view.setModel(model)
+        view.setItemDelegate(AchievementDelegate(view))
+        view.setUniformItemSizes(True)
+        view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        view.setFrameShape(QListView.Shape.NoFrame)
+        return view
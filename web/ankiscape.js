@@ -0,0 +1,191 @@
+/* AnkiScape button for the reviewer, overview and deck browser.
+ *
+ * Loaded once per page as a cached web export (see injectors.register_web_assets).
+ * Python then drives it with a single small call per state change:
+ *     ankiscape.apply({page: "reviewer" | "overview" | "deckbrowser", pos: "left" | "right", enabled: true, debug: false})
+ * apply() does nothing when the state is unchanged and the button is still in the page.
+ * ankiscape.command(cmd, args, callback) sends a structured bridge command (see bridge.py),
+ * e.g. ankiscape.command("select", {kind: "ore", name: "Iron ore"}).
+ *
+ * Logging is off unless Python passed debug: true (developer mode). When on, entries
+ * are buffered and sent as one "ankiscape_logbatch:<json>" message on a timer, when
+ * the buffer fills, or when the page is hidden/unloaded.
+ */
+(function () {
+    "use strict";
+    if (window.ankiscape) {
+        return;
+    }
+
+    var script = document.currentScript;
+    var ICON = script && script.src ? script.src.replace(/web\/ankiscape\.js(\?.*)?$/, "icon/stats_icon.png") : "";
+    var lastKey = null;
+    var LOG_FLUSH_MS = 2000;
+    var LOG_MAX_BATCH = 50;
+    var logBuffer = null;  // null while logging is disabled
+    var logTimer = null;
+
+    function send(cmd, callback) {
+        try { pycmd(cmd, callback); } catch (e) {}
+    }
+
+    function command(cmd, args, callback) {
+        send("ankiscape:" + JSON.stringify({ cmd: cmd, args: args === undefined ? null : args }), callback);
+    }
+
+    function flushLogs() {
+        if (logTimer !== null) {
+            clearTimeout(logTimer);
+            logTimer = null;
+        }
+        if (!logBuffer || !logBuffer.length) {
+            return;
+        }
+        var batch = logBuffer;
+        logBuffer = [];
+        send("ankiscape_logbatch:" + JSON.stringify(batch));
+    }
+
+    function log(msg) {
+        if (logBuffer === null) {
+            return;
+        }
+        logBuffer.push([Date.now(), String(msg)]);
+        if (logBuffer.length >= LOG_MAX_BATCH) {
+            flushLogs();
+        } else if (logTimer === null) {
+            logTimer = setTimeout(flushLogs, LOG_FLUSH_MS);
+        }
+    }
+
+    function setLogging(enabled) {
+        if (enabled && logBuffer === null) {
+            logBuffer = [];
+        } else if (!enabled && logBuffer !== null) {
+            flushLogs();
+            logBuffer = null;
+        }
+    }
+
+    window.addEventListener("pagehide", flushLogs);
+    window.addEventListener("beforeunload", flushLogs);
+
+    function button(page) {
+        var btn = document.getElementById("ankiscape-btn");
+        if (!btn) {
+            btn = document.createElement("a");
+            btn.id = "ankiscape-btn";
+            btn.href = "#";
+        }
+        // Styling comes from ankiscape.css; drop inline styles from server-rendered markup
+        btn.removeAttribute("style");
+        btn.title = "AnkiScape";
+        btn.setAttribute("aria-label", "AnkiScape");
+        var img = btn.querySelector("img");
+        if (!img) {
+            btn.textContent = "";
+            img = document.createElement("img");
+            img.alt = "AnkiScape";
+            btn.appendChild(img);
+        }
+        img.removeAttribute("style");
+        if (!img.getAttribute("src") && ICON) {
+            img.src = ICON;
+        }
+        if (!btn.dataset.ankiscapeBound) {
+            btn.addEventListener("click", function (ev) {
+                ev.preventDefault();
+                log("click_" + page);
+                send("ankiscape_open_menu");
+                return false;
+            });
+            btn.dataset.ankiscapeBound = "1";
+        }
+        return btn;
+    }
+
+    function removeFloating() {
+        var wrap = document.getElementById("ankiscape-float");
+        if (wrap && wrap.parentElement) {
+            wrap.parentElement.removeChild(wrap);
+        }
+    }
+
+    function showFloating(page, pos) {
+        var wrap = document.getElementById("ankiscape-float");
+        if (!wrap) {
+            wrap = document.createElement("div");
+            wrap.id = "ankiscape-float";
+            document.body.appendChild(wrap);
+        }
+        wrap.className = pos === "left" ? "ankiscape-left" : "ankiscape-right";
+        var btn = button(page);
+        if (btn.parentElement !== wrap) {
+            wrap.appendChild(btn);
+        }
+        log(page + "_floating_inserted");
+    }
+
+    function insertAfter(anchor, btn) {
+        if (anchor.nextSibling) {
+            anchor.parentElement.insertBefore(btn, anchor.nextSibling);
+        } else {
+            anchor.parentElement.appendChild(btn);
+        }
+    }
+
+    function placeInDeckBrowser(state) {
+        var elems = Array.from(document.querySelectorAll("a,button"));
+        // Prefer the bottom action links, then the top bar, then the links footer
+        var actions = elems.filter(function (e) {
+            return /(Get Shared|Create Deck|Import)/i.test((e.textContent || "").trim());
+        });
+        if (actions.length && actions[actions.length - 1].parentElement) {
+            insertAfter(actions[actions.length - 1], button("deckbrowser"));
+            log("after_last_action(" + actions.length + ")");
+            return;
+        }
+        var topAnchors = elems.filter(function (e) {
+            return /(Decks|Add|Browse|Stats|Sync)/i.test((e.textContent || "").trim());
+        });
+        if (topAnchors.length && topAnchors[topAnchors.length - 1].parentElement) {
+            insertAfter(topAnchors[topAnchors.length - 1], button("deckbrowser"));
+            log("inserted_topnav(" + topAnchors.length + ")");
+            return;
+        }
+        var footer = document.querySelector(".links") || document.querySelector("#links");
+        if (footer) {
+            footer.appendChild(button("deckbrowser"));
+            log("inserted_selector");
+            return;
+        }
+        if (state.enabled) {
+            showFloating("deckbrowser", state.pos);
+        }
+    }
+
+    function apply(state) {
+        state = state || {};
+        setLogging(!!state.debug);
+        var key = [state.page, state.pos, !!state.enabled].join("|");
+        var present = !!document.getElementById("ankiscape-btn");
+        if (key === lastKey && (present || !state.enabled)) {
+            return false;
+        }
+        lastKey = key;
+        try {
+            if (state.page === "deckbrowser") {
+                placeInDeckBrowser(state);
+            } else if (state.enabled) {
+                showFloating(state.page, state.pos);
+            } else {
+                removeFloating();
+            }
+        } catch (e) {
+            log((state.page || "page") + "_js_error");
+        }
+        return true;
+    }
+
+    window.ankiscape = { apply: apply, command: command };
+})();